@@ -0,0 +1,54 @@
+"""
+Alembic migration: Add keyset pagination indexes for vehicle listings.
+
+Vehicle listings page by (sort value, id) instead of OFFSET. These partial
+indexes over active vehicles let Postgres seek directly to the next page for
+the default year sort and the price sort.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2024-01-08 10:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers, used by Alembic
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Upgrade database schema to add keyset pagination indexes.
+
+    Creates (year, id) and (base_price, id) indexes restricted to vehicles
+    that are not soft deleted.
+    """
+    op.create_index(
+        'ix_vehicles_year_id_active',
+        'vehicles',
+        ['year', 'id'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+    op.create_index(
+        'ix_vehicles_base_price_id_active',
+        'vehicles',
+        ['base_price', 'id'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Downgrade database schema by removing keyset pagination indexes.
+    """
+    op.drop_index('ix_vehicles_base_price_id_active', table_name='vehicles')
+    op.drop_index('ix_vehicles_year_id_active', table_name='vehicles')
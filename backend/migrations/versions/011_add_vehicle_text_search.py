@@ -0,0 +1,109 @@
+"""
+Alembic migration: Add indexed text search for vehicle filtering.
+
+Vehicle search filtered make and model with leading-wildcard ILIKE and body
+style and fuel type with ILIKE, none of which could use the existing btree
+indexes. This migration enables pg_trgm and adds trigram GIN indexes for
+substring matching, a generated tsvector column with a GIN index for free-text
+queries, and lower() expression indexes for normalized equality on the
+enumerated fields.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2024-01-08 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers, used by Alembic
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "to_tsvector('simple', coalesce(make, '') || ' ' || coalesce(model, '') "
+    "|| ' ' || coalesce(trim, '') || ' ' || coalesce(body_style, ''))"
+)
+
+
+def upgrade() -> None:
+    """
+    Upgrade database schema to add vehicle text search indexes.
+
+    Enables the pg_trgm extension, adds the generated search_vector column
+    and creates trigram, full-text and normalized equality indexes.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        'vehicles',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+            comment='Generated full-text search vector',
+        ),
+    )
+
+    op.create_index(
+        'ix_vehicles_make_trgm',
+        'vehicles',
+        ['make'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'make': 'gin_trgm_ops'},
+    )
+
+    op.create_index(
+        'ix_vehicles_model_trgm',
+        'vehicles',
+        ['model'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'model': 'gin_trgm_ops'},
+    )
+
+    op.create_index(
+        'ix_vehicles_search_vector',
+        'vehicles',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+    op.create_index(
+        'ix_vehicles_body_style_lower',
+        'vehicles',
+        [sa.text('lower(body_style)')],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+    op.create_index(
+        'ix_vehicles_fuel_type_lower',
+        'vehicles',
+        [sa.text('lower(fuel_type)')],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Downgrade database schema by removing vehicle text search indexes.
+
+    The pg_trgm extension is left installed because other objects may
+    depend on it.
+    """
+    op.drop_index('ix_vehicles_fuel_type_lower', table_name='vehicles')
+    op.drop_index('ix_vehicles_body_style_lower', table_name='vehicles')
+    op.drop_index('ix_vehicles_search_vector', table_name='vehicles')
+    op.drop_index('ix_vehicles_model_trgm', table_name='vehicles')
+    op.drop_index('ix_vehicles_make_trgm', table_name='vehicles')
+    op.drop_column('vehicles', 'search_vector')
@@ -0,0 +1,73 @@
+"""
+Alembic migration: Add containment and range indexes for vehicle specifications.
+
+Specification filters are now a single JSONB containment (@>) predicate plus
+typed range predicates on numeric keys. This migration replaces the default
+jsonb_ops GIN index with a smaller jsonb_path_ops GIN index, which supports
+@> only and nothing queries the key-existence operators. It also adds integer
+expression indexes on the horsepower and MPG keys used by range filters.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2024-01-08 16:45:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers, used by Alembic
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Specification keys with range filter indexes
+RANGE_INDEXED_KEYS = ('horsepower', 'mpg_city', 'mpg_highway')
+
+
+def upgrade() -> None:
+    """
+    Upgrade database schema to add specification indexes.
+
+    Creates the jsonb_path_ops GIN index and per-key integer expression
+    indexes, then drops the superseded jsonb_ops GIN index.
+    """
+    op.create_index(
+        'ix_vehicles_specifications_path_ops',
+        'vehicles',
+        ['specifications'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'specifications': 'jsonb_path_ops'},
+    )
+
+    for key in RANGE_INDEXED_KEYS:
+        op.create_index(
+            f'ix_vehicles_spec_{key}',
+            'vehicles',
+            [sa.text(f"((specifications ->> '{key}')::integer)")],
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+        )
+
+    op.execute('DROP INDEX IF EXISTS ix_vehicles_specifications_gin')
+
+
+def downgrade() -> None:
+    """
+    Downgrade database schema by restoring the jsonb_ops GIN index.
+    """
+    op.create_index(
+        'ix_vehicles_specifications_gin',
+        'vehicles',
+        ['specifications'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+    for key in reversed(RANGE_INDEXED_KEYS):
+        op.drop_index(f'ix_vehicles_spec_{key}', table_name='vehicles')
+
+    op.drop_index('ix_vehicles_specifications_path_ops', table_name='vehicles')
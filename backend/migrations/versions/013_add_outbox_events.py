@@ -0,0 +1,87 @@
+"""
+Alembic migration: Add transactional outbox for search and cache sync.
+
+Vehicle and inventory changes now record an outbox event in the same
+transaction instead of calling Elasticsearch inline. This migration creates
+the outbox_events table with a partial index over pending events, which is
+the only set the relay scans, and an index on processed_at for retention
+cleanup.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2024-01-09 10:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers, used by Alembic
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Upgrade database schema to add the outbox table.
+
+    Creates outbox_events with a pending-event index matching the relay's
+    claim query.
+    """
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('aggregate_type', sa.String(length=20), nullable=False),
+        sa.Column('aggregate_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('event_type', sa.String(length=20), nullable=False),
+        sa.Column(
+            'payload',
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'available_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('attempts', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+    op.create_index(
+        'ix_outbox_events_pending',
+        'outbox_events',
+        ['available_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('processed_at IS NULL'),
+    )
+    op.create_index(
+        'ix_outbox_events_processed_at',
+        'outbox_events',
+        ['processed_at'],
+        unique=False,
+        postgresql_where=sa.text('processed_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Downgrade database schema by removing the outbox table.
+    """
+    op.drop_index('ix_outbox_events_processed_at', table_name='outbox_events')
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events')
+    op.drop_table('outbox_events')
@@ -0,0 +1,82 @@
+"""
+Alembic migration: Add precomputed vehicle facet counts.
+
+Deployments without Elasticsearch had to scan the vehicles table to count
+makes, models, body styles, fuel types, drivetrains and price buckets. This
+migration creates the vehicle_facet_counts materialized view, which holds
+one row per combination of those dimensions and model year with its vehicle
+count and price statistics. Faceted navigation aggregates this much smaller
+view instead of the table. The unique index over the grain columns allows
+REFRESH MATERIALIZED VIEW CONCURRENTLY, so refreshes never block readers.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2024-01-10 09:15:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# Revision identifiers, used by Alembic
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Width of the price buckets; matches the Elasticsearch price histogram
+PRICE_BUCKET_INTERVAL = 5000
+
+GRAIN_COLUMNS = (
+    'make',
+    'model',
+    'year',
+    'body_style',
+    'fuel_type',
+    'drivetrain',
+    'price_bucket',
+)
+
+
+def upgrade() -> None:
+    """
+    Upgrade database schema to add the facet counts view.
+
+    Creates and populates vehicle_facet_counts over non-deleted vehicles
+    and adds the unique grain index required for concurrent refreshes.
+    """
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW vehicle_facet_counts AS
+        SELECT
+            make,
+            model,
+            year,
+            body_style,
+            fuel_type,
+            drivetrain,
+            floor(base_price / {PRICE_BUCKET_INTERVAL}) * {PRICE_BUCKET_INTERVAL}
+                AS price_bucket,
+            count(*) AS vehicle_count,
+            min(base_price) AS price_min,
+            max(base_price) AS price_max,
+            sum(base_price) AS price_sum
+        FROM vehicles
+        WHERE deleted_at IS NULL
+        GROUP BY 1, 2, 3, 4, 5, 6, 7
+        WITH DATA
+    """)
+
+    op.create_index(
+        'ux_vehicle_facet_counts_grain',
+        'vehicle_facet_counts',
+        list(GRAIN_COLUMNS),
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """
+    Downgrade database schema by removing the facet counts view.
+    """
+    op.drop_index('ux_vehicle_facet_counts_grain', table_name='vehicle_facet_counts')
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS vehicle_facet_counts')
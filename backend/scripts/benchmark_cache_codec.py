@@ -0,0 +1,179 @@
+"""
+Benchmark cache payload codecs per key family.
+
+Encodes representative payloads for each vehicle cache key family with every
+available serializer/compression combination and reports encode and decode
+time and stored size. With --redis-url, each payload is also written to Redis
+and MEMORY USAGE is reported for the key.
+
+Usage:
+    python scripts/benchmark_cache_codec.py [--iterations N] [--redis-url URL]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.cache.codec import CacheCodec  # noqa: E402
+
+SERIALIZERS = ["json", "orjson", "msgpack"]
+COMPRESSIONS = ["none", "zstd", "lz4"]
+
+
+def make_vehicle(index: int) -> dict[str, Any]:
+    """Build a vehicle detail payload shaped like VehicleResponse."""
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "id": str(uuid.uuid4()),
+        "make": ["Toyota", "Honda", "Ford", "BMW"][index % 4],
+        "model": f"Model {index % 12}",
+        "year": 2020 + index % 5,
+        "trim": "Limited",
+        "body_style": "suv",
+        "fuel_type": "hybrid",
+        "base_price": 28500.0 + index * 125,
+        "msrp": 31000.0 + index * 125,
+        "vin": f"1HGBH41JXMN{index:06d}",
+        "specifications": {
+            "engine_type": "2.5L I4 Hybrid",
+            "horsepower": 219,
+            "torque": 163,
+            "transmission": "eCVT",
+            "drivetrain": "AWD",
+            "fuel_economy_city": 41,
+            "fuel_economy_highway": 38,
+            "seating_capacity": 5,
+        },
+        "dimensions": {
+            "length": 180.9,
+            "width": 73.0,
+            "height": 67.0,
+            "wheelbase": 105.9,
+            "ground_clearance": 8.1,
+            "cargo_capacity": 37.6,
+            "curb_weight": 3710,
+        },
+        "features": {
+            "standard": [f"Standard feature {i}" for i in range(20)],
+            "optional": [f"Optional package {i}" for i in range(8)],
+            "safety": [f"Safety system {i}" for i in range(10)],
+            "technology": [f"Technology {i}" for i in range(10)],
+        },
+        "custom_attributes": {"color_options": ["white", "black", "silver"]},
+        "is_active": True,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def make_payloads() -> dict[str, Any]:
+    """Build one representative payload per key family."""
+    vehicles = [make_vehicle(i) for i in range(50)]
+    return {
+        "detail": vehicles[0],
+        "list": {
+            "items": vehicles,
+            "total": 1200,
+            "page": 1,
+            "page_size": 50,
+            "total_pages": 24,
+        },
+        "search": {
+            "results": [
+                {k: v[k] for k in ("id", "make", "model", "year", "base_price")}
+                for v in vehicles[:20]
+            ],
+            "facets": {"make": {"Toyota": 420, "Honda": 380, "Ford": 250}},
+            "metadata": {"total_results": 1050, "took_ms": 12},
+        },
+        "inventory": {"vehicle_id": vehicles[0]["id"], "available": 12, "reserved": 3},
+        "price_range": {"min_price": 18990.0, "max_price": 84500.0},
+    }
+
+
+def available_codecs() -> list[CacheCodec]:
+    """Build every codec combination whose backends are installed."""
+    codecs = []
+    for serializer in SERIALIZERS:
+        for compression in COMPRESSIONS:
+            try:
+                codecs.append(CacheCodec(serializer, compression, compression_threshold=0))
+            except ImportError:
+                continue
+    return codecs
+
+
+def time_codec(codec: CacheCodec, payload: Any, iterations: int) -> tuple[float, float, int]:
+    """
+    Measure mean encode and decode time for a payload.
+
+    Returns:
+        Encode microseconds, decode microseconds and encoded size in bytes
+    """
+    encoded = codec.encode(payload)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        codec.encode(payload)
+    encode_us = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        codec.decode(encoded)
+    decode_us = (time.perf_counter() - start) / iterations * 1e6
+
+    return encode_us, decode_us, len(encoded)
+
+
+async def redis_memory_usage(redis_url: str, payload: bytes) -> Optional[int]:
+    """Write a payload to a scratch key and return MEMORY USAGE for it."""
+    import redis.asyncio as redis
+
+    client = redis.from_url(redis_url)
+    key = f"benchmark:codec:{uuid.uuid4()}"
+    try:
+        await client.set(key, payload, ex=60)
+        return await client.memory_usage(key)
+    finally:
+        await client.delete(key)
+        await client.aclose()
+
+
+def main() -> None:
+    """Run the benchmark and print a table per key family."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    header = f"{'codec':<18}{'encode us':>12}{'decode us':>12}{'bytes':>10}"
+    if args.redis_url:
+        header += f"{'redis mem':>12}"
+
+    for family, payload in make_payloads().items():
+        print(f"\n== {family} ==")
+        print(header)
+        for codec in codecs:
+            encode_us, decode_us, size = time_codec(codec, payload, args.iterations)
+            row = (
+                f"{codec.serializer + '+' + codec.compression:<18}"
+                f"{encode_us:>12.1f}{decode_us:>12.1f}{size:>10}"
+            )
+            if args.redis_url:
+                memory = asyncio.run(
+                    redis_memory_usage(args.redis_url, codec.encode(payload))
+                )
+                row += f"{memory:>12}"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
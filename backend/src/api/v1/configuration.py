@@ -14,11 +14,16 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import CurrentActiveUser, DatabaseSession
+from src.cache.local_cache import get_tiered_cache
+from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.database.models.user import User
 from src.schemas.configuration import (
+    ConfigurationCompletionRequest,
     ConfigurationRequest,
     ConfigurationResponse,
+    IncrementalValidationRequest,
+    IncrementalValidationResult,
     OptionSelection,
     PackageSelection,
     PricingBreakdown,
@@ -48,7 +53,19 @@ async def get_configuration_service(
     Returns:
         ConfigurationService instance
     """
-    return ConfigurationService(session=session, enable_caching=True)
+    tiered_cache = None
+    if get_settings().local_cache_enabled:
+        try:
+            tiered_cache = await get_tiered_cache()
+        except Exception as e:
+            logger.warning(
+                "Local cache unavailable, using Redis only",
+                error=str(e),
+            )
+
+    return ConfigurationService(
+        session=session, enable_caching=True, tiered_cache=tiered_cache
+    )
 
 
 ConfigService = Annotated[
@@ -223,6 +240,144 @@ async def validate_configuration(
         ) from e
 
 
+@router.post(
+    "/{vehicle_id}/validate/incremental",
+    response_model=IncrementalValidationResult,
+    status_code=status.HTTP_200_OK,
+    summary="Validate configuration changes",
+    description="Validate options added or removed since the previous validation, returning disabled and required options",
+)
+async def validate_configuration_changes(
+    vehicle_id: UUID,
+    request: IncrementalValidationRequest,
+    service: ConfigService,
+) -> IncrementalValidationResult:
+    """
+    Validate changes to a configuration.
+
+    Args:
+        vehicle_id: Vehicle identifier
+        request: State token of the previous validation and the changes
+        service: Configuration service
+
+    Returns:
+        Validation result with the next state token and the options the UI
+        should disable or mark as required
+
+    Raises:
+        HTTPException: 400 for invalid tokens or validation errors, 500 for
+            service errors
+    """
+    try:
+        result = await service.validate_configuration_changes(
+            vehicle_id=vehicle_id,
+            state_token=request.state_token,
+            added_option_ids=request.added_options,
+            removed_option_ids=request.removed_options,
+            added_package_ids=request.added_packages,
+            removed_package_ids=request.removed_packages,
+            selected_option_ids=request.selected_options,
+            selected_package_ids=request.selected_packages,
+            trim=request.trim,
+            year=request.year,
+        )
+
+        return IncrementalValidationResult(
+            is_valid=result["is_valid"],
+            errors=result["errors"],
+            state_token=result["state_token"],
+            selected_options=result["selected_options"],
+            selected_packages=result["selected_packages"],
+            disabled_options=result["disabled_options"],
+            required_options=result["required_options"],
+        )
+
+    except ConfigurationServiceError as e:
+        logger.error(
+            "Configuration change validation failed",
+            vehicle_id=str(vehicle_id),
+            error=str(e),
+            error_context=e.context,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    except Exception as e:
+        logger.error(
+            "Unexpected error during change validation",
+            vehicle_id=str(vehicle_id),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to validate configuration changes",
+        ) from e
+
+
+@router.post(
+    "/{vehicle_id}/complete",
+    response_model=dict,
+    status_code=status.HTTP_200_OK,
+    summary="Complete configuration",
+    description="Find the cheapest valid completions of a partial selection and count the valid configurations extending it",
+)
+async def complete_configuration(
+    vehicle_id: UUID,
+    request: ConfigurationCompletionRequest,
+    service: ConfigService,
+) -> dict:
+    """
+    Find the cheapest valid completions of a configuration.
+
+    Args:
+        vehicle_id: Vehicle identifier
+        request: Partial selection and number of completions
+        service: Configuration service
+
+    Returns:
+        Completions in ascending price order with full pricing, and the
+        number of valid configurations extending the selection
+
+    Raises:
+        HTTPException: 404 if vehicle not found, 500 for service errors
+    """
+    try:
+        return await service.complete_configuration(
+            vehicle_id=vehicle_id,
+            selected_option_ids=request.selected_options,
+            selected_package_ids=request.selected_packages,
+            trim=request.trim,
+            year=request.year,
+            region=request.region,
+            limit=request.limit,
+        )
+
+    except ConfigurationServiceError as e:
+        logger.error(
+            "Configuration completion failed",
+            vehicle_id=str(vehicle_id),
+            error=str(e),
+            error_context=e.context,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Vehicle not found: {vehicle_id}",
+        ) from e
+    except Exception as e:
+        logger.error(
+            "Unexpected error completing configuration",
+            vehicle_id=str(vehicle_id),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to complete configuration",
+        ) from e
+
+
 @router.post(
     "/{vehicle_id}/price",
     response_model=PricingBreakdown,
@@ -238,6 +393,7 @@ async def calculate_pricing(
     region: Optional[str] = None,
     include_tax: bool = True,
     include_destination: bool = True,
+    dealer_id: Optional[UUID] = None,
 ) -> PricingBreakdown:
     """
     Calculate configuration pricing.
@@ -250,6 +406,7 @@ async def calculate_pricing(
         region: Region code for tax calculation
         include_tax: Include tax in total
         include_destination: Include destination charge in total
+        dealer_id: Dealer whose price overrides apply
 
     Returns:
         Detailed pricing breakdown
@@ -276,6 +433,7 @@ async def calculate_pricing(
             region=region,
             include_tax=include_tax,
             include_destination=include_destination,
+            dealer_id=dealer_id,
         )
 
         pricing = PricingBreakdown(
@@ -73,6 +73,7 @@ async def save_configuration(
         )
 
         await db.commit()
+        await service.record_share_token(saved_config.share_token)
 
         logger.info(
             "Configuration saved successfully",
@@ -522,6 +523,7 @@ async def generate_share_link(
         )
 
         await db.commit()
+        await service.record_share_token(share_token)
 
         share_url = f"/shared/{share_token}"
 
@@ -14,7 +14,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import DatabaseSession, OptionalUser
+from src.cache.negative_cache import NegativeCache, get_negative_cache
 from src.cache.redis_client import RedisClient, get_redis_client
+from src.cache.single_flight import SingleFlight, get_single_flight
+from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.schemas.search import (
     SearchResponse,
@@ -29,7 +32,15 @@ from src.schemas.vehicles import (
     VehicleSearchRequest as VehicleSearchRequestLegacy,
     VehicleUpdate,
 )
+from src.services.cache.access_recorder import (
+    VehicleAccessRecorder,
+    get_access_recorder,
+)
 from src.services.cache.vehicle_cache import VehicleCache, get_vehicle_cache
+from src.services.search.autocomplete import (
+    AutocompleteIndex,
+    get_autocomplete_index,
+)
 from src.services.search.elasticsearch_client import (
     ElasticsearchClient,
     get_elasticsearch_client,
@@ -56,6 +67,8 @@ router = APIRouter(prefix="/vehicles", tags=["vehicles"])
 async def get_vehicle_service(
     db: DatabaseSession,
     cache_client: Annotated[RedisClient, Depends(get_redis_client)],
+    single_flight: Annotated[SingleFlight, Depends(get_single_flight)],
+    negative_cache: Annotated[NegativeCache, Depends(get_negative_cache)],
 ) -> VehicleService:
     """
     Dependency for vehicle service initialization.
@@ -63,27 +76,44 @@ async def get_vehicle_service(
     Args:
         db: Database session
         cache_client: Redis cache client
+        single_flight: Process-wide coalescer for cache misses
+        negative_cache: Cache of vehicle IDs and VINs known not to exist
 
     Returns:
         Initialized vehicle service
     """
-    return VehicleService(session=db, cache_client=cache_client)
+    return VehicleService(
+        session=db,
+        cache_client=cache_client,
+        single_flight=single_flight,
+        negative_cache=negative_cache,
+    )
 
 
 async def get_search_service(
     es_client: Annotated[ElasticsearchClient, Depends(get_elasticsearch_client)],
+    vehicle_cache: Annotated[VehicleCache, Depends(get_vehicle_cache)],
+    autocomplete: Annotated[AutocompleteIndex, Depends(get_autocomplete_index)],
 ) -> VehicleSearchService:
     """
     Dependency for vehicle search service initialization.
 
     Args:
         es_client: Elasticsearch client
+        vehicle_cache: Vehicle cache for search pages and facets
+        autocomplete: In-process make/model suggestion index
 
     Returns:
         Initialized vehicle search service
     """
+    settings = get_settings()
     vehicle_index = VehicleIndex(client=es_client)
-    return VehicleSearchService(client=es_client, index=vehicle_index)
+    return VehicleSearchService(
+        client=es_client,
+        index=vehicle_index,
+        cache=vehicle_cache if settings.search_cache_enabled else None,
+        autocomplete=autocomplete if settings.autocomplete_enabled else None,
+    )
 
 
 @router.get(
@@ -102,6 +132,17 @@ async def list_vehicles(
     page_size: Annotated[
         int, Query(ge=1, le=100, description="Items per page")
     ] = 20,
+    cursor: Annotated[
+        str | None,
+        Query(max_length=512, description="next_cursor of the previous page"),
+    ] = None,
+    total_mode: Annotated[
+        str,
+        Query(
+            pattern="^(exact|estimated)$",
+            description="Count matches exactly or use a cheaper estimate",
+        ),
+    ] = "exact",
     make: Annotated[str | None, Query(max_length=100)] = None,
     model: Annotated[str | None, Query(max_length=100)] = None,
     year_min: Annotated[int | None, Query(ge=1900, le=2100)] = None,
@@ -110,6 +151,12 @@ async def list_vehicles(
     fuel_type: Annotated[str | None, Query(max_length=50)] = None,
     price_min: Annotated[float | None, Query(ge=0)] = None,
     price_max: Annotated[float | None, Query(ge=0)] = None,
+    horsepower_min: Annotated[int | None, Query(ge=0, le=2000)] = None,
+    horsepower_max: Annotated[int | None, Query(ge=0, le=2000)] = None,
+    mpg_city_min: Annotated[int | None, Query(ge=0, le=200)] = None,
+    mpg_city_max: Annotated[int | None, Query(ge=0, le=200)] = None,
+    mpg_highway_min: Annotated[int | None, Query(ge=0, le=200)] = None,
+    mpg_highway_max: Annotated[int | None, Query(ge=0, le=200)] = None,
     sort_by: Annotated[str | None, Query(max_length=50)] = None,
     sort_order: Annotated[
         str, Query(pattern="^(asc|desc)$")
@@ -125,6 +172,8 @@ async def list_vehicles(
         current_user: Optional authenticated user
         page: Page number (1-indexed)
         page_size: Number of items per page
+        cursor: Keyset cursor continuing a previous page (overrides page)
+        total_mode: exact or estimated total count
         make: Filter by manufacturer
         model: Filter by model name
         year_min: Minimum year filter
@@ -133,6 +182,12 @@ async def list_vehicles(
         fuel_type: Filter by fuel type
         price_min: Minimum price filter
         price_max: Maximum price filter
+        horsepower_min: Minimum horsepower filter
+        horsepower_max: Maximum horsepower filter
+        mpg_city_min: Minimum city MPG filter
+        mpg_city_max: Maximum city MPG filter
+        mpg_highway_min: Minimum highway MPG filter
+        mpg_highway_max: Maximum highway MPG filter
         sort_by: Field to sort by
         sort_order: Sort order (asc or desc)
 
@@ -152,8 +207,16 @@ async def list_vehicles(
             "fuel_type": fuel_type,
             "price_min": price_min,
             "price_max": price_max,
+            "horsepower_min": horsepower_min,
+            "horsepower_max": horsepower_max,
+            "mpg_city_min": mpg_city_min,
+            "mpg_city_max": mpg_city_max,
+            "mpg_highway_min": mpg_highway_min,
+            "mpg_highway_max": mpg_highway_max,
             "page": page,
             "page_size": page_size,
+            "cursor": cursor,
+            "total_mode": total_mode,
             "sort_by": sort_by,
             "sort_order": sort_order,
         }
@@ -179,8 +242,16 @@ async def list_vehicles(
             fuel_type=fuel_type,
             price_min=price_min,
             price_max=price_max,
+            horsepower_min=horsepower_min,
+            horsepower_max=horsepower_max,
+            mpg_city_min=mpg_city_min,
+            mpg_city_max=mpg_city_max,
+            mpg_highway_min=mpg_highway_min,
+            mpg_highway_max=mpg_highway_max,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            total_mode=total_mode,
             sort_by=sort_by,
             sort_order=sort_order,
         )
@@ -249,7 +320,7 @@ async def search_vehicles(
     response: Response,
     search_request: VehicleSearchRequest,
     search_service: Annotated[VehicleSearchService, Depends(get_search_service)],
-    vehicle_cache: Annotated[VehicleCache, Depends(get_vehicle_cache)],
+    access_recorder: Annotated[VehicleAccessRecorder, Depends(get_access_recorder)],
     current_user: OptionalUser,
 ) -> SearchResponse:
     """
@@ -259,7 +330,7 @@ async def search_vehicles(
         response: FastAPI response object for headers
         search_request: Search request with query, filters, and pagination
         search_service: Vehicle search service instance
-        vehicle_cache: Vehicle cache service instance
+        access_recorder: Recorder for vehicle popularity counts
         current_user: Optional authenticated user
 
     Returns:
@@ -269,27 +340,7 @@ async def search_vehicles(
         HTTPException: 400 for invalid queries, 500 for search errors
     """
     try:
-        filters = {
-            "query": search_request.query,
-            "page": search_request.page,
-            "limit": search_request.limit,
-            "include_facets": search_request.include_facets,
-        }
-
-        if search_request.query:
-            cached_results = await vehicle_cache.get_search_results(
-                search_request.query, filters
-            )
-            if cached_results is not None:
-                response.headers["X-Cache"] = "HIT"
-                response.headers["Cache-Control"] = "public, max-age=1800"
-                logger.info(
-                    "Search results served from cache",
-                    query=search_request.query,
-                    user_id=str(current_user.id) if current_user else None,
-                )
-                return SearchResponse(**cached_results)
-
+        # Result pages and facets are cached by the search service
         if search_request.include_facets:
             result = await search_service.faceted_search(search_request)
             
@@ -343,14 +394,11 @@ async def search_vehicles(
                 suggestions=[],
             )
 
-        if search_request.query:
-            await vehicle_cache.set_search_results(
-                search_request.query,
-                search_response.model_dump(mode="json"),
-                filters,
-            )
+        access_recorder.record_many(
+            (item.id for item in search_response.results),
+            weight=VehicleAccessRecorder.SEARCH_IMPRESSION_WEIGHT,
+        )
 
-        response.headers["X-Cache"] = "MISS"
         response.headers["Cache-Control"] = "public, max-age=1800"
 
         return search_response
@@ -417,13 +465,13 @@ async def search_vehicles(
 async def get_search_suggestions(
     response: Response,
     query: Annotated[str, Query(min_length=2, max_length=100, description="Search prefix")],
+    search_service: Annotated[VehicleSearchService, Depends(get_search_service)],
+    current_user: OptionalUser,
     field: Annotated[
         str,
         Query(pattern="^(make|model|body_style)$", description="Field to get suggestions for")
     ] = "make",
     limit: Annotated[int, Query(ge=1, le=20, description="Maximum suggestions")] = 5,
-    search_service: Annotated[VehicleSearchService, Depends(get_search_service)],
-    current_user: OptionalUser,
 ) -> SearchSuggestionResponse:
     """
     Get search suggestions for autocomplete.
@@ -431,10 +479,10 @@ async def get_search_suggestions(
     Args:
         response: FastAPI response object for headers
         query: Search prefix (minimum 2 characters)
-        field: Field to get suggestions for (make, model, or body_style)
-        limit: Maximum number of suggestions to return
         search_service: Vehicle search service instance
         current_user: Optional authenticated user
+        field: Field to get suggestions for (make, model, or body_style)
+        limit: Maximum number of suggestions to return
 
     Returns:
         List of search suggestions
@@ -443,9 +491,9 @@ async def get_search_suggestions(
         HTTPException: 400 for invalid queries, 500 for search errors
     """
     try:
-        suggestions = await search_service.suggest(prefix=query, field=field)
-        
-        suggestions = suggestions[:limit]
+        suggestions = await search_service.suggest(
+            prefix=query, field=field, limit=limit
+        )
         
         response.headers["Cache-Control"] = "public, max-age=1800"
         
@@ -521,6 +569,7 @@ async def get_vehicle(
     vehicle_id: UUID,
     service: Annotated[VehicleService, Depends(get_vehicle_service)],
     vehicle_cache: Annotated[VehicleCache, Depends(get_vehicle_cache)],
+    access_recorder: Annotated[VehicleAccessRecorder, Depends(get_access_recorder)],
     current_user: OptionalUser,
     include_inventory: Annotated[
         bool, Query(description="Include inventory information")
@@ -534,6 +583,7 @@ async def get_vehicle(
         vehicle_id: Vehicle unique identifier
         service: Vehicle service instance
         vehicle_cache: Vehicle cache service instance
+        access_recorder: Recorder for vehicle popularity counts
         current_user: Optional authenticated user
         include_inventory: Whether to include inventory data
 
@@ -554,6 +604,7 @@ async def get_vehicle(
                 vehicle_id=str(vehicle_id),
                 user_id=str(current_user.id) if current_user else None,
             )
+            access_recorder.record(vehicle_id)
             return cached_vehicle
 
         result = await service.get_vehicle(
@@ -562,6 +613,7 @@ async def get_vehicle(
         )
 
         await vehicle_cache.set_vehicle_detail(vehicle_id, result)
+        access_recorder.record(vehicle_id)
 
         response.headers["X-Cache"] = "MISS"
         response.headers["Cache-Control"] = "public, max-age=86400"
@@ -0,0 +1,254 @@
+"""
+Serialization and compression codecs for cached payloads.
+
+Cached values were historically stored as plain JSON text. This module keeps
+that format as the baseline and adds binary framings for faster serializers
+and compression. Framed entries start with a version byte (never the first
+byte of JSON text) followed by a flags byte naming the serializer and
+compression, so every deployment can decode entries written by any other
+regardless of its own codec configuration.
+
+Rollout: uncompressed JSON written by the json or orjson serializers stays
+unframed, so it is readable by deployments that predate this module. Enable
+msgpack or compression only once all readers run a codec-aware release.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+logger = get_logger(__name__)
+
+
+class CodecError(ValueError):
+    """Raised when a cached payload cannot be encoded or decoded."""
+
+
+class CacheCodec:
+    """
+    Encode and decode cached values.
+
+    Attributes:
+        serializer: Serializer name (json, orjson or msgpack)
+        compression: Compression name (none, zstd or lz4)
+        compression_threshold: Minimum serialized size that gets compressed
+    """
+
+    # First byte of framed entries; JSON text never starts with a control byte
+    FORMAT_VERSION = 0x01
+
+    # Flags byte layout: low nibble serializer, high nibble compression
+    SERIALIZER_IDS = {"json": 0, "orjson": 0, "msgpack": 1}
+    COMPRESSION_IDS = {"none": 0, "zstd": 1, "lz4": 2}
+
+    def __init__(
+        self,
+        serializer: str = "json",
+        compression: str = "none",
+        compression_threshold: int = 4096,
+        compression_level: int = 3,
+    ):
+        """
+        Initialize codec.
+
+        Args:
+            serializer: Serializer name (json, orjson or msgpack)
+            compression: Compression name (none, zstd or lz4)
+            compression_threshold: Minimum serialized size that gets compressed
+            compression_level: Level passed to the compression backend
+
+        Raises:
+            ValueError: If a name is unknown
+            ImportError: If the backend package is not installed
+        """
+        if serializer not in self.SERIALIZER_IDS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if compression not in self.COMPRESSION_IDS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        self._require(serializer, {"orjson": orjson, "msgpack": msgpack})
+        self._require(compression, {"zstd": zstandard, "lz4": lz4_frame})
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._compression_level = compression_level
+
+    @staticmethod
+    def _require(name: str, modules: dict[str, Any]) -> None:
+        """Raise if the package backing a codec option is missing."""
+        if name in modules and modules[name] is None:
+            raise ImportError(
+                f"Cache codec option '{name}' requires the {name} package"
+            )
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "CacheCodec":
+        """
+        Build the configured codec, falling back to stdlib JSON.
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            Codec instance
+        """
+        try:
+            return cls(
+                serializer=settings.cache_serializer,
+                compression=settings.cache_compression,
+                compression_threshold=settings.cache_compression_threshold_bytes,
+                compression_level=settings.cache_compression_level,
+            )
+        except ImportError as e:
+            logger.warning(
+                "Cache codec backend unavailable, using stdlib JSON",
+                error=str(e),
+            )
+            return cls()
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a value for storage.
+
+        Args:
+            value: JSON-compatible value
+
+        Returns:
+            UTF-8 JSON text, or a framed binary payload
+
+        Raises:
+            CodecError: If the value cannot be serialized
+        """
+        try:
+            body = self._serialize(value)
+        except (TypeError, ValueError) as e:
+            raise CodecError(f"Failed to serialize cache value: {e}") from e
+
+        compression = "none"
+        if self.compression != "none" and len(body) >= self.compression_threshold:
+            body = self._compress(body)
+            compression = self.compression
+
+        if self.serializer != "msgpack" and compression == "none":
+            # Unframed JSON stays readable by pre-codec deployments
+            return body
+
+        flags = self.SERIALIZER_IDS[self.serializer] | (
+            self.COMPRESSION_IDS[compression] << 4
+        )
+        return bytes((self.FORMAT_VERSION, flags)) + body
+
+    def decode(self, raw: Union[str, bytes]) -> Any:
+        """
+        Decode a stored payload written by any codec configuration.
+
+        Args:
+            raw: Stored payload
+
+        Returns:
+            Decoded value
+
+        Raises:
+            CodecError: If the payload is corrupt or uses an unknown format
+        """
+        if isinstance(raw, str):
+            raw = raw.encode()
+
+        try:
+            if not raw or raw[0] >= 0x20 or raw[0] in (0x09, 0x0A, 0x0D):
+                return self._loads_json(raw)
+
+            if raw[0] != self.FORMAT_VERSION or len(raw) < 2:
+                raise CodecError(f"Unknown cache payload version: {raw[0]}")
+
+            flags = raw[1]
+            body = self._decompress(raw[2:], flags >> 4)
+            if flags & 0x0F == self.SERIALIZER_IDS["msgpack"]:
+                if msgpack is None:
+                    raise CodecError("msgpack payload but msgpack is not installed")
+                return msgpack.unpackb(body, raw=False)
+            return self._loads_json(body)
+
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"Failed to decode cache payload: {e}") from e
+
+    def _serialize(self, value: Any) -> bytes:
+        """Serialize a value with the configured serializer."""
+        if self.serializer == "msgpack":
+            return msgpack.packb(value, use_bin_type=True)
+        if self.serializer == "orjson":
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(value).encode()
+
+    @staticmethod
+    def _loads_json(body: bytes) -> Any:
+        """Parse JSON with orjson when available."""
+        if orjson is not None:
+            return orjson.loads(body)
+        return json.loads(body)
+
+    def _compress(self, body: bytes) -> bytes:
+        """Compress a serialized body with the configured backend."""
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=self._compression_level).compress(
+                body
+            )
+        return lz4_frame.compress(body, compression_level=self._compression_level)
+
+    @classmethod
+    def _decompress(cls, body: bytes, compression_id: int) -> bytes:
+        """Decompress a body according to its flags."""
+        if compression_id == cls.COMPRESSION_IDS["none"]:
+            return body
+        if compression_id == cls.COMPRESSION_IDS["zstd"]:
+            if zstandard is None:
+                raise CodecError("zstd payload but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(body)
+        if compression_id == cls.COMPRESSION_IDS["lz4"]:
+            if lz4_frame is None:
+                raise CodecError("lz4 payload but lz4 is not installed")
+            return lz4_frame.decompress(body)
+        raise CodecError(f"Unknown cache compression id: {compression_id}")
+
+
+_default_codec: Optional[CacheCodec] = None
+
+
+def get_default_codec() -> CacheCodec:
+    """
+    Get the codec configured in application settings.
+
+    Returns:
+        Shared codec instance
+    """
+    global _default_codec
+
+    if _default_codec is None:
+        _default_codec = CacheCodec.from_settings(get_settings())
+
+    return _default_codec
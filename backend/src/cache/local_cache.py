@@ -0,0 +1,618 @@
+"""
+In-process L1 cache layered in front of the Redis client.
+
+This module provides a bounded LRU cache with per-entry TTL and an approximate
+byte budget, plus a two-tier wrapper that serves hot keys from process memory
+before falling back to Redis. Cross-pod consistency is maintained by
+broadcasting invalidations over Redis pub/sub so every replica evicts its
+local copy.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+from src.cache import metrics
+from src.cache.codec import CodecError
+from src.cache.redis_client import RedisClient, get_redis_client
+from src.core.config import get_settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def vehicle_tag(vehicle_id: Any) -> str:
+    """
+    Build the invalidation tag for all entries derived from a vehicle.
+
+    Args:
+        vehicle_id: Vehicle identifier
+
+    Returns:
+        Tag string shared by detail and option catalog entries
+    """
+    return f"vehicle:{vehicle_id}"
+
+
+def make_tag(make: str) -> str:
+    """
+    Build the invalidation tag for entries scoped to a vehicle make.
+
+    Args:
+        make: Vehicle manufacturer
+
+    Returns:
+        Case-insensitive make tag
+    """
+    return f"make:{make.strip().lower()}"
+
+
+def dealer_tag(dealer_id: Any) -> str:
+    """
+    Build the invalidation tag for entries derived from a dealer's settings.
+
+    Args:
+        dealer_id: Dealer identifier
+
+    Returns:
+        Tag string shared by the dealer's cached price tables
+    """
+    return f"dealer:{dealer_id}"
+
+
+@dataclass
+class _LocalEntry:
+    """Single L1 cache entry."""
+
+    value: Any
+    size: int
+    expires_at: float
+    tags: frozenset[str] = field(default_factory=frozenset)
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with TTL and byte budget.
+
+    Entries are evicted in least-recently-used order once either the entry
+    count or the approximate payload size exceeds its limit. Entries may carry
+    tags so that every key derived from one entity can be evicted together.
+    The cache is intended for use from a single event loop and performs no
+    locking.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entries: int,
+        default_ttl: float,
+    ):
+        """
+        Initialize local cache.
+
+        Args:
+            max_bytes: Maximum total approximate payload size in bytes
+            max_entries: Maximum number of entries
+            default_ttl: Default entry lifetime in seconds
+        """
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._default_ttl = default_ttl
+
+        self._entries: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._current_bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def current_bytes(self) -> int:
+        """Approximate payload size currently held."""
+        return self._current_bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get value by key, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        size: int,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> bool:
+        """
+        Store value with approximate size and optional tags.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Approximate payload size in bytes
+            ttl: Lifetime in seconds (capped at the default TTL)
+            tags: Invalidation tags for the entry
+
+        Returns:
+            True if stored, False if the value exceeds the byte budget
+        """
+        if size > self._max_bytes:
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+
+        lifetime = self._default_ttl if ttl is None else min(ttl, self._default_ttl)
+        entry = _LocalEntry(
+            value=value,
+            size=size,
+            expires_at=time.monotonic() + lifetime,
+            tags=frozenset(tags),
+        )
+        self._entries[key] = entry
+        self._current_bytes += size
+        for tag in entry.tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while (
+            self._current_bytes > self._max_bytes
+            or len(self._entries) > self._max_entries
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+        return True
+
+    def delete(self, *keys: str) -> int:
+        """
+        Delete entries by key.
+
+        Args:
+            *keys: Keys to delete
+
+        Returns:
+            Number of entries removed
+        """
+        count = 0
+        for key in keys:
+            if key in self._entries:
+                self._remove(key)
+                count += 1
+        self._invalidations += count
+        return count
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every entry carrying any of the given tags.
+
+        Args:
+            *tags: Tags to invalidate
+
+        Returns:
+            Number of entries removed
+        """
+        keys: set[str] = set()
+        for tag in tags:
+            keys.update(self._tags.get(tag, ()))
+        return self.delete(*keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._tags.clear()
+        self._current_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove entry and its tag index references."""
+        entry = self._entries.pop(key)
+        self._current_bytes -= entry.size
+        for tag in entry.tags:
+            tagged = self._tags.get(tag)
+            if tagged is not None:
+                tagged.discard(key)
+                if not tagged:
+                    del self._tags[tag]
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get L1 cache statistics.
+
+        Returns:
+            Dictionary with hit rate, occupancy and eviction counts
+        """
+        lookups = self._hits + self._misses
+        hit_rate = self._hits / lookups * 100 if lookups > 0 else 0.0
+
+        return {
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
+            "hit_rate_percent": round(hit_rate, 2),
+            "entries": len(self._entries),
+            "bytes": self._current_bytes,
+            "max_bytes": self._max_bytes,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "invalidations": self._invalidations,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset L1 cache statistics."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+
+class TieredCache:
+    """
+    Two-tier cache combining an in-process L1 with Redis as L2.
+
+    Reads are served from L1 when possible and otherwise from Redis, with the
+    decoded payload promoted into L1. Writes go to both tiers. Invalidations
+    remove the entries locally and are broadcast over Redis pub/sub so other
+    replicas evict their L1 copies as well. Values returned from L1 are
+    shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        local_cache: LocalCache,
+        channel: Optional[str] = None,
+    ):
+        """
+        Initialize tiered cache.
+
+        Args:
+            redis_client: Connected Redis client used as L2
+            local_cache: In-process L1 cache
+            channel: Pub/sub channel for invalidation broadcasts
+        """
+        self._redis = redis_client
+        self._local = local_cache
+        self._channel = channel or get_settings().local_cache_invalidation_channel
+        self._instance_id = uuid.uuid4().hex
+        self._listener_task: Optional[asyncio.Task] = None
+
+    @property
+    def local(self) -> LocalCache:
+        """In-process L1 cache."""
+        return self._local
+
+    @property
+    def redis(self) -> RedisClient:
+        """Redis client used as L2."""
+        return self._redis
+
+    async def get_json(
+        self, key: str, tags: Iterable[str] = ()
+    ) -> Optional[dict[str, Any]]:
+        """
+        Get JSON value from L1, falling back to Redis.
+
+        Args:
+            key: Cache key
+            tags: Invalidation tags applied when promoting into L1
+
+        Returns:
+            Decoded value or None if absent in both tiers
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        value = self._local.get(key)
+        if value is not None:
+            metrics.record_lookup(key, "hit", tier="local")
+            return value
+
+        raw = await self._redis.get_raw(key)
+        if raw is None:
+            return None
+
+        value = self._redis.codec.decode(raw)
+        self._local.set(key, value, size=len(raw), tags=tags)
+        return value
+
+    async def get_many_json(
+        self,
+        keys: Iterable[str],
+        tags: Optional[dict[str, Iterable[str]]] = None,
+    ) -> dict[str, Optional[Any]]:
+        """
+        Get several JSON values, reading L1 first and the rest with one MGET.
+
+        Args:
+            keys: Cache keys
+            tags: Invalidation tags per key applied when promoting into L1
+
+        Returns:
+            Dictionary mapping keys to decoded values (None if absent)
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        tags = tags or {}
+        result: dict[str, Optional[Any]] = {}
+        remote_keys = []
+
+        for key in keys:
+            value = self._local.get(key)
+            result[key] = value
+            if value is None:
+                remote_keys.append(key)
+            else:
+                metrics.record_lookup(key, "hit", tier="local")
+
+        if not remote_keys:
+            return result
+
+        raw_values = await self._redis.get_many(*remote_keys, raw=True)
+        for key, raw in raw_values.items():
+            if raw is None:
+                continue
+            try:
+                value = self._redis.codec.decode(raw)
+            except CodecError as e:
+                logger.error("Failed to decode JSON from cache", key=key, error=str(e))
+                continue
+            result[key] = value
+            self._local.set(key, value, size=len(raw), tags=tags.get(key, ()))
+
+        return result
+
+    async def set_json(
+        self,
+        key: str,
+        value: dict[str, Any],
+        ex: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> bool:
+        """
+        Write JSON value to Redis and L1.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ex: Expiration time in seconds
+            tags: Invalidation tags registered in both tiers
+
+        Returns:
+            True if the Redis write succeeded
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        raw = self._redis.codec.encode(value)
+        tags = list(tags)
+        success = await self._redis.set(key, raw, ex=ex, tags=tags or None)
+        if success:
+            self._local.set(key, value, size=len(raw), ttl=ex, tags=tags)
+        return success
+
+    async def invalidate(
+        self,
+        keys: Iterable[str] = (),
+        tags: Iterable[str] = (),
+        delete_remote: bool = True,
+        clear_local: bool = False,
+    ) -> int:
+        """
+        Invalidate entries in both tiers and notify other replicas.
+
+        Args:
+            keys: Keys to invalidate
+            tags: Tags to invalidate
+            delete_remote: Also delete the keys and tagged keys from Redis
+            clear_local: Drop every L1 entry here and on the other replicas
+
+        Returns:
+            Number of Redis keys deleted
+        """
+        keys = list(keys)
+        tags = list(tags)
+
+        if clear_local:
+            self._local.clear()
+        else:
+            self._local.delete(*keys)
+            self._local.invalidate_tags(*tags)
+
+        deleted = 0
+        if delete_remote and keys:
+            deleted += await self._redis.delete(*keys)
+        if delete_remote and tags:
+            deleted += await self._redis.invalidate_tags(*tags)
+
+        await self._broadcast(keys, tags, clear=clear_local)
+        return deleted
+
+    async def _broadcast(
+        self, keys: list[str], tags: list[str], clear: bool = False
+    ) -> None:
+        """Publish invalidation message for other replicas."""
+        if not keys and not tags and not clear:
+            return
+
+        payload: dict[str, Any] = {
+            "origin": self._instance_id,
+            "keys": keys,
+            "tags": tags,
+        }
+        if clear:
+            payload["clear"] = True
+        message = json.dumps(payload)
+        try:
+            await self._redis.publish(self._channel, message)
+        except Exception as e:
+            logger.warning(
+                "Failed to broadcast cache invalidation",
+                channel=self._channel,
+                error=str(e),
+            )
+
+    def handle_invalidation_message(self, data: str) -> int:
+        """
+        Apply an invalidation broadcast received from pub/sub.
+
+        Args:
+            data: Raw message payload
+
+        Returns:
+            Number of L1 entries evicted
+        """
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed cache invalidation message")
+            return 0
+
+        if payload.get("origin") == self._instance_id:
+            return 0
+
+        if payload.get("clear"):
+            evicted = len(self._local)
+            self._local.clear()
+            return evicted
+
+        evicted = self._local.delete(*payload.get("keys", []))
+        evicted += self._local.invalidate_tags(*payload.get("tags", []))
+        return evicted
+
+    async def _listen(self) -> None:
+        """Consume invalidation broadcasts until cancelled."""
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._redis.pubsub()
+                await pubsub.subscribe(self._channel)
+                logger.info(
+                    "Subscribed to cache invalidation channel",
+                    channel=self._channel,
+                )
+
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_invalidation_message(message["data"])
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Messages may have been missed; drop L1 rather than serve stale data
+                self._local.clear()
+                logger.error(
+                    "Cache invalidation listener failed",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                await asyncio.sleep(1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    def start_listener(self) -> None:
+        """Start background pub/sub listener if not already running."""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        """Stop background pub/sub listener."""
+        if self._listener_task is None:
+            return
+
+        self._listener_task.cancel()
+        try:
+            await self._listener_task
+        except asyncio.CancelledError:
+            pass
+        self._listener_task = None
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """
+        Get hit/miss statistics for both tiers.
+
+        Returns:
+            Dictionary with separate L1 and L2 statistics
+        """
+        return {
+            "l1": self._local.get_stats(),
+            "l2": self._redis.get_cache_stats(),
+        }
+
+
+_tiered_cache: Optional[TieredCache] = None
+
+
+async def get_tiered_cache() -> TieredCache:
+    """
+    Get or create global tiered cache instance.
+
+    Returns:
+        Singleton tiered cache with its invalidation listener running
+
+    Raises:
+        ConnectionError: If Redis connection fails
+    """
+    global _tiered_cache
+
+    if _tiered_cache is None:
+        settings = get_settings()
+        local_cache = LocalCache(
+            max_bytes=settings.local_cache_max_bytes,
+            max_entries=settings.local_cache_max_entries,
+            default_ttl=settings.local_cache_ttl_seconds,
+        )
+        _tiered_cache = TieredCache(await get_redis_client(), local_cache)
+        _tiered_cache.start_listener()
+
+    return _tiered_cache
+
+
+async def close_tiered_cache() -> None:
+    """
+    Stop the global tiered cache listener and drop L1 contents.
+    """
+    global _tiered_cache
+
+    if _tiered_cache is not None:
+        await _tiered_cache.stop_listener()
+        _tiered_cache.local.clear()
+        _tiered_cache = None
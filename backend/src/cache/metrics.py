@@ -0,0 +1,213 @@
+"""
+Prometheus metrics for the caching layer.
+
+The per-process counters behind get_cache_stats and friends reset on restart
+and cannot be summed across pods. This module records the same signals as
+Prometheus metrics labelled by key family, so hit ratios, Redis latency and
+payload sizes can be aggregated and used to size TTLs.
+
+A key family is the stable prefix of a cache key with the application
+namespace removed: ``autoselect:vehicles:detail:<id>`` belongs to
+``vehicles:detail`` and ``pricing:<hash>`` to ``pricing``. Only alphabetic
+segments are used so that IDs and hashes never become label values.
+
+When several worker processes share a host, set PROMETHEUS_MULTIPROC_DIR
+so the endpoint aggregates every worker. Without prometheus_client
+installed every recording function is a no-op.
+"""
+
+import os
+import re
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from src.core.logging import get_logger
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+except ImportError:  # pragma: no cover - optional dependency
+    Counter = None
+
+logger = get_logger(__name__)
+
+# Application namespace prepended by CacheKeyManager
+KEY_NAMESPACE = "autoselect"
+
+# Prefixes whose second segment names the family
+TWO_LEVEL_PREFIXES = frozenset({"vehicles", "negative", "bloom", "lock"})
+
+OTHER_FAMILY = "other"
+
+_SEGMENT = re.compile(r"^[a-z_]+$")
+
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+SIZE_BUCKETS = (
+    64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+)
+
+if Counter is not None:
+    CACHE_OPERATION_SECONDS = Histogram(
+        "cache_operation_duration_seconds",
+        "Latency of Redis cache operations",
+        ["operation", "family"],
+        buckets=LATENCY_BUCKETS,
+    )
+    CACHE_LOOKUPS = Counter(
+        "cache_lookups_total",
+        "Cache lookups by outcome; stale and early_refresh entries were also hits",
+        ["family", "tier", "result"],
+    )
+    CACHE_PAYLOAD_BYTES = Histogram(
+        "cache_payload_bytes",
+        "Serialized size of cached payloads",
+        ["family", "direction"],
+        buckets=SIZE_BUCKETS,
+    )
+    CACHE_WARMING_CYCLES = Counter(
+        "cache_warming_cycles_total",
+        "Cache warming cycles by outcome",
+        ["result"],
+    )
+    CACHE_WARMING_VEHICLES = Counter(
+        "cache_warming_vehicles_total",
+        "Vehicles written to the cache by warming cycles",
+    )
+    CACHE_WARMING_SECONDS = Histogram(
+        "cache_warming_duration_seconds",
+        "Duration of cache warming cycles",
+        buckets=(1, 5, 15, 30, 60, 120, 300, 600),
+    )
+
+
+def key_family(key: str) -> str:
+    """
+    Get the metrics family of a cache key.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Family label such as ``vehicles:list`` or ``pricing``
+    """
+    parts = key.split(":", 3)
+    if parts[0] == KEY_NAMESPACE:
+        parts = parts[1:]
+
+    if not parts or not _SEGMENT.match(parts[0]):
+        return OTHER_FAMILY
+
+    if parts[0] in TWO_LEVEL_PREFIXES and len(parts) > 1:
+        if _SEGMENT.match(parts[1]):
+            return f"{parts[0]}:{parts[1]}"
+
+    return parts[0]
+
+
+@contextmanager
+def track_operation(operation: str, key: str) -> Iterator[None]:
+    """
+    Time a Redis operation, including failed ones.
+
+    Args:
+        operation: Operation name (get, set, mget, ...)
+        key: Cache key, or the first key of a batch
+    """
+    if Counter is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        CACHE_OPERATION_SECONDS.labels(operation, key_family(key)).observe(
+            time.perf_counter() - started
+        )
+
+
+def record_lookup(key: str, result: str, tier: str = "redis") -> None:
+    """
+    Count a cache lookup outcome.
+
+    Args:
+        key: Cache key
+        result: Outcome (hit or miss)
+        tier: Cache tier that answered (redis or local)
+    """
+    if Counter is not None:
+        CACHE_LOOKUPS.labels(key_family(key), tier, result).inc()
+
+
+def record_family_lookup(family: str, result: str, tier: str = "redis") -> None:
+    """
+    Count a cache lookup outcome for an already-resolved family.
+
+    Args:
+        family: Family label
+        result: Outcome (hit, miss, stale or early_refresh)
+        tier: Cache tier that answered (redis or local)
+    """
+    if Counter is not None:
+        CACHE_LOOKUPS.labels(family, tier, result).inc()
+
+
+def observe_payload(key: str, size: int, direction: str) -> None:
+    """
+    Record the size of a payload read from or written to the cache.
+
+    Args:
+        key: Cache key
+        size: Payload size in bytes
+        direction: read or write
+    """
+    if Counter is not None:
+        CACHE_PAYLOAD_BYTES.labels(key_family(key), direction).observe(size)
+
+
+def record_warming_cycle(success: bool, vehicles: int, duration: float) -> None:
+    """
+    Record a finished cache warming cycle.
+
+    Args:
+        success: Whether the cycle completed
+        vehicles: Vehicles warmed
+        duration: Cycle duration in seconds
+    """
+    if Counter is None:
+        return
+
+    CACHE_WARMING_CYCLES.labels("success" if success else "failure").inc()
+    CACHE_WARMING_VEHICLES.inc(vehicles)
+    CACHE_WARMING_SECONDS.observe(duration)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Render all registered metrics in the Prometheus text format.
+
+    Returns:
+        Tuple of (payload, content type)
+
+    Raises:
+        RuntimeError: If prometheus_client is not installed
+    """
+    if Counter is None:
+        raise RuntimeError("prometheus_client is not installed")
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
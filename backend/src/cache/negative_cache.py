@@ -0,0 +1,513 @@
+"""
+Negative lookup caching for vehicle IDs, VINs and share tokens.
+
+Lookups for identifiers that do not exist always reached Postgres, which made
+them cheap to abuse. This module answers "known missing" from Redis in two
+ways. Confirmed misses are remembered under short-lived marker keys. VINs
+and share tokens are also tracked in Bloom filters kept as Redis bitmaps, so
+a value the filter has never seen is rejected without a database query.
+
+Bloom filters cannot remove entries, so deleted values stay in the filter
+and fall through to the database (and then to a marker key) until the next
+periodic rebuild drops them. Values written outside the services that call
+record_created, such as bulk imports, are picked up by the same rebuild.
+Services call record_created after their transaction commits. Every Redis
+failure degrades to "not known missing", and a filter that may have missed
+a created value is dropped, so lookups fall back to the database rather
+than rejecting values that exist.
+"""
+
+import hashlib
+import math
+from typing import Any, AsyncIterator, Iterable, Optional, Union
+
+from src.cache.redis_client import RedisClient, get_redis_client
+from src.core.config import get_settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class BloomFilter:
+    """
+    Bloom filter stored as a Redis bitmap.
+
+    Bit 0 is a readiness sentinel set only by a full rebuild. A filter
+    whose key is missing or was evicted therefore reads as not ready, and a
+    filter that is not ready never reports a value absent. Rebuilds load a
+    separate bitmap and rename it over the live one, so the live filter
+    stays usable while a rebuild runs.
+    """
+
+    SENTINEL_OFFSET = 0
+
+    # Values written per BITFIELD call during a rebuild
+    REBUILD_BATCH_SIZE = 1000
+
+    def __init__(self, key: str, capacity: int, error_rate: float):
+        """
+        Initialize filter sized for an expected number of values.
+
+        Args:
+            key: Bitmap key
+            capacity: Expected number of values
+            error_rate: Target false-positive rate at capacity
+        """
+        self.key = key
+        self.build_key = f"{key}:build"
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+
+    def offsets(self, value: str) -> list[int]:
+        """
+        Get the bit offsets of a value using double hashing.
+
+        Args:
+            value: Value to hash
+
+        Returns:
+            Bit offsets, all above the sentinel bit
+        """
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [1 + (h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    async def might_contain(self, redis: RedisClient, value: str) -> bool:
+        """
+        Check whether a value may be in the filter.
+
+        Args:
+            redis: Redis client
+            value: Value to check
+
+        Returns:
+            False only if the filter is ready and the value was never added
+        """
+        bits = await redis.getbits(
+            self.key, [self.SENTINEL_OFFSET, *self.offsets(value)]
+        )
+        if not bits[0]:
+            return True
+        return all(bits[1:])
+
+    async def add(self, redis: RedisClient, *values: str) -> None:
+        """
+        Add values to the filter.
+
+        Values are also written to the bitmap of a rebuild in progress. That
+        write comes first, so a value is in the live filter after the swap
+        whichever side of the rename it lands on.
+
+        Args:
+            redis: Redis client
+            *values: Values to add
+        """
+        offsets = [offset for value in values for offset in self.offsets(value)]
+        if await redis.exists(self.build_key):
+            await redis.setbits(self.build_key, offsets)
+        await redis.setbits(self.key, offsets)
+
+    async def discard(self, redis: RedisClient) -> None:
+        """
+        Drop the live filter so it reads as not ready until the next rebuild.
+
+        Args:
+            redis: Redis client
+        """
+        await redis.delete(self.key)
+
+    async def rebuild(
+        self,
+        redis: RedisClient,
+        values: Union[Iterable[str], AsyncIterator[str]],
+    ) -> int:
+        """
+        Replace the filter contents with the given values.
+
+        The values are loaded into a separate bitmap that replaces the live
+        one with RENAME once complete. The build bitmap exists before the
+        values are read, so values added concurrently by add() are written
+        to it and survive the swap.
+
+        Args:
+            redis: Redis client
+            values: Every value that currently exists
+
+        Returns:
+            Number of values added
+        """
+        await redis.delete(self.build_key)
+        await redis.setbits(self.build_key, [self.SENTINEL_OFFSET])
+
+        count = 0
+        batch: list[str] = []
+
+        async def add_batch() -> None:
+            nonlocal count
+            await redis.setbits(
+                self.build_key,
+                [offset for value in batch for offset in self.offsets(value)],
+            )
+            count += len(batch)
+            batch.clear()
+
+        if hasattr(values, "__aiter__"):
+            async for value in values:
+                batch.append(value)
+                if len(batch) >= self.REBUILD_BATCH_SIZE:
+                    await add_batch()
+        else:
+            for value in values:
+                batch.append(value)
+                if len(batch) >= self.REBUILD_BATCH_SIZE:
+                    await add_batch()
+
+        if batch:
+            await add_batch()
+
+        await redis.rename(self.build_key, self.key)
+        return count
+
+
+class NegativeCache:
+    """
+    Remember identifiers that are known not to exist.
+
+    Provides a pre-lookup check combining Bloom filters and marker keys,
+    marker writes for confirmed misses, and hooks keeping both consistent
+    when values are created.
+    """
+
+    KEY_PREFIX = "negative"
+    FILTER_KEY_PREFIX = "bloom"
+    REBUILD_LOCK_PREFIX = "lock:bloom"
+
+    # Lookup namespaces
+    VEHICLE_ID = "vehicle_id"
+    VIN = "vin"
+    SHARE_TOKEN = "share_token"
+
+    # Namespaces whose values are also tracked in a Bloom filter
+    FILTERED_NAMESPACES = (VIN, SHARE_TOKEN)
+
+    def __init__(
+        self,
+        redis_client: Optional[RedisClient] = None,
+        ttl: Optional[int] = None,
+        filter_capacity: Optional[int] = None,
+        filter_error_rate: Optional[float] = None,
+        rebuild_interval: Optional[int] = None,
+    ):
+        """
+        Initialize negative cache.
+
+        Args:
+            redis_client: Redis client instance (uses global if None)
+            ttl: Lifetime of missing markers in seconds
+            filter_capacity: Expected values per Bloom filter
+            filter_error_rate: Target Bloom filter false-positive rate
+            rebuild_interval: Minimum seconds between filter rebuilds
+        """
+        settings = get_settings()
+        self._redis_client = redis_client
+        self.ttl = ttl or settings.negative_cache_ttl_seconds
+        self.rebuild_interval = (
+            rebuild_interval or settings.lookup_filter_rebuild_interval_seconds
+        )
+        self._filters = {
+            namespace: BloomFilter(
+                f"{self.FILTER_KEY_PREFIX}:{namespace}",
+                capacity=filter_capacity or settings.lookup_filter_capacity,
+                error_rate=filter_error_rate or settings.lookup_filter_error_rate,
+            )
+            for namespace in self.FILTERED_NAMESPACES
+        }
+        # Filters that could not be discarded after a failed add
+        self._pending_discards: set[str] = set()
+        self._stats = {
+            "filter_rejections": 0,
+            "marker_hits": 0,
+            "markers_written": 0,
+            "filter_rebuilds": 0,
+            "errors": 0,
+        }
+
+    async def _get_redis_client(self) -> RedisClient:
+        """
+        Get Redis client instance.
+
+        Returns:
+            Redis client instance
+
+        Raises:
+            ConnectionError: If Redis connection fails
+        """
+        if self._redis_client is None:
+            self._redis_client = await get_redis_client()
+        return self._redis_client
+
+    @staticmethod
+    def _normalize(namespace: str, value: Any) -> str:
+        """Normalize a value the way its lookup compares it."""
+        value = str(value)
+        if namespace == NegativeCache.VIN:
+            return value.strip().upper()
+        return value
+
+    def _make_key(self, namespace: str, value: str) -> str:
+        """
+        Build the marker key of a missing value.
+
+        Args:
+            namespace: Lookup namespace
+            value: Normalized value
+
+        Returns:
+            Marker key
+        """
+        return f"{self.KEY_PREFIX}:{namespace}:{value}"
+
+    def _make_created_key(self, namespace: str, value: str) -> str:
+        """
+        Build the key recording that a value was just created.
+
+        Args:
+            namespace: Lookup namespace
+            value: Normalized value
+
+        Returns:
+            Created key
+        """
+        return f"{self.KEY_PREFIX}:created:{namespace}:{value}"
+
+    async def is_missing(self, namespace: str, value: Any) -> bool:
+        """
+        Check whether a value is known not to exist.
+
+        Args:
+            namespace: Lookup namespace
+            value: Looked-up value
+
+        Returns:
+            True if the lookup can be answered as not found without a query
+        """
+        value = self._normalize(namespace, value)
+
+        try:
+            redis = await self._get_redis_client()
+
+            if namespace in self._pending_discards:
+                await self._discard_filter(namespace)
+                bloom = None
+            else:
+                bloom = self._filters.get(namespace)
+
+            if bloom is not None and not await bloom.might_contain(redis, value):
+                self._stats["filter_rejections"] += 1
+                logger.debug("Lookup rejected by filter", namespace=namespace)
+                return True
+
+            if await redis.exists(self._make_key(namespace, value)):
+                self._stats["marker_hits"] += 1
+                logger.debug("Lookup answered by missing marker", namespace=namespace)
+                return True
+
+            return False
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(
+                "Negative cache check failed",
+                namespace=namespace,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return False
+
+    async def mark_missing(self, namespace: str, value: Any) -> None:
+        """
+        Remember that a lookup found nothing.
+
+        A lookup that queried the database before a create committed may
+        write its marker after record_created cleared markers; the marker is
+        removed again if the value was created meanwhile.
+
+        Args:
+            namespace: Lookup namespace
+            value: Looked-up value
+        """
+        value = self._normalize(namespace, value)
+
+        try:
+            redis = await self._get_redis_client()
+            key = self._make_key(namespace, value)
+            await redis.set(key, "1", ex=self.ttl)
+            if await redis.exists(self._make_created_key(namespace, value)):
+                await redis.delete(key)
+                return
+            self._stats["markers_written"] += 1
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(
+                "Failed to write missing marker",
+                namespace=namespace,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    async def record_created(self, namespace: str, *values: Any) -> None:
+        """
+        Make newly created values visible to lookups.
+
+        Adds the values to the namespace filter and removes any missing
+        markers. Call this after the values are committed, so a concurrent
+        rebuild either reads them or receives them from add(). If the filter
+        cannot be updated it is dropped, together with its rebuild lock, so
+        lookups fall through to the database until the next rebuild.
+
+        Args:
+            namespace: Lookup namespace
+            *values: Created values
+        """
+        normalized = [self._normalize(namespace, value) for value in values]
+        if not normalized:
+            return
+
+        bloom = self._filters.get(namespace)
+
+        try:
+            redis = await self._get_redis_client()
+
+            await redis.set_many(
+                {self._make_created_key(namespace, value): "1" for value in normalized},
+                ex=self.ttl,
+            )
+
+            if bloom is not None:
+                await bloom.add(redis, *normalized)
+
+            await redis.delete(
+                *(self._make_key(namespace, value) for value in normalized)
+            )
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(
+                "Failed to record created lookup values",
+                namespace=namespace,
+                count=len(normalized),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            if bloom is not None:
+                await self._discard_filter(namespace)
+
+    async def _discard_filter(self, namespace: str) -> None:
+        """
+        Drop a filter that may lack created values and allow a rebuild.
+
+        If Redis is unavailable the filter is skipped by this process, and
+        the discard retried on its lookups, until it succeeds.
+
+        Args:
+            namespace: Filtered lookup namespace
+        """
+        try:
+            redis = await self._get_redis_client()
+            await self._filters[namespace].discard(redis)
+            await redis.delete(f"{self.REBUILD_LOCK_PREFIX}:{namespace}")
+            self._pending_discards.discard(namespace)
+            logger.warning("Lookup filter discarded", namespace=namespace)
+
+        except Exception as e:
+            self._pending_discards.add(namespace)
+            self._stats["errors"] += 1
+            logger.error(
+                "Failed to discard lookup filter",
+                namespace=namespace,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    async def rebuild_filter(
+        self,
+        namespace: str,
+        values: Union[Iterable[str], AsyncIterator[str]],
+    ) -> Optional[int]:
+        """
+        Rebuild a namespace filter unless another process rebuilt it recently.
+
+        A Redis lock held for the rebuild interval ensures one rebuild per
+        interval across all processes.
+
+        Args:
+            namespace: Filtered lookup namespace
+            values: Every value that currently exists
+
+        Returns:
+            Number of values added, or None if the rebuild was skipped
+
+        Raises:
+            ConnectionError: If Redis connection fails
+            RedisError: If the rebuild fails
+        """
+        bloom = self._filters[namespace]
+        redis = await self._get_redis_client()
+
+        lock_key = f"{self.REBUILD_LOCK_PREFIX}:{namespace}"
+        token = await redis.acquire_lock(lock_key, self.rebuild_interval * 1000)
+        if token is None:
+            logger.debug("Lookup filter rebuilt recently, skipping", namespace=namespace)
+            return None
+
+        try:
+            count = await bloom.rebuild(
+                redis,
+                (self._normalize(namespace, value) async for value in values)
+                if hasattr(values, "__aiter__")
+                else (self._normalize(namespace, value) for value in values),
+            )
+        except Exception:
+            await redis.release_lock(lock_key, token)
+            raise
+
+        self._stats["filter_rebuilds"] += 1
+        logger.info(
+            "Lookup filter rebuilt",
+            namespace=namespace,
+            count=count,
+            num_bits=bloom.num_bits,
+            num_hashes=bloom.num_hashes,
+        )
+        return count
+
+    def get_statistics(self) -> dict[str, Any]:
+        """
+        Get negative cache statistics.
+
+        Returns:
+            Dictionary containing short-circuit and error counts
+        """
+        return dict(self._stats)
+
+
+_negative_cache: Optional[NegativeCache] = None
+
+
+async def get_negative_cache() -> NegativeCache:
+    """
+    Get or create global negative cache instance.
+
+    Returns:
+        Singleton negative cache instance
+    """
+    global _negative_cache
+
+    if _negative_cache is None:
+        _negative_cache = NegativeCache()
+
+    return _negative_cache
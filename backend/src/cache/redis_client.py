@@ -7,13 +7,14 @@ utilities. Supports async operations for high-performance caching.
 """
 
 import asyncio
-import json
+import uuid
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Optional, Union
+from typing import Any, AsyncIterator, Iterable, Optional, Union
 
 import redis.asyncio as redis
 from redis.asyncio import ConnectionPool, Redis
 from redis.asyncio.retry import Retry
+from redis.client import NEVER_DECODE
 from redis.backoff import ExponentialBackoff
 from redis.exceptions import (
     ConnectionError,
@@ -21,6 +22,8 @@ from redis.exceptions import (
     TimeoutError,
 )
 
+from src.cache import metrics
+from src.cache.codec import CacheCodec, CodecError, get_default_codec
 from src.core.config import get_settings
 from src.core.logging import get_logger
 
@@ -36,6 +39,12 @@ class RedisClient:
     connection management, retry logic, and comprehensive error handling.
     """
 
+    # Prefix for tag sets tracking the keys written under each tag
+    TAG_KEY_PREFIX = "tag"
+
+    # Number of keys removed per UNLINK call during tag invalidation
+    TAG_INVALIDATION_BATCH_SIZE = 500
+
     def __init__(
         self,
         url: Optional[str] = None,
@@ -44,6 +53,7 @@ class RedisClient:
         socket_connect_timeout: float = 5.0,
         retry_on_timeout: bool = True,
         health_check_interval: int = 30,
+        codec: Optional[CacheCodec] = None,
     ):
         """
         Initialize Redis client with connection pool.
@@ -55,6 +65,7 @@ class RedisClient:
             socket_connect_timeout: Socket connection timeout in seconds
             retry_on_timeout: Enable automatic retry on timeout
             health_check_interval: Health check interval in seconds
+            codec: Codec for JSON payloads (defaults to settings)
         """
         self._url = url or settings.redis_url
         self._max_connections = max_connections or settings.redis_max_connections
@@ -62,6 +73,7 @@ class RedisClient:
         self._socket_connect_timeout = socket_connect_timeout
         self._retry_on_timeout = retry_on_timeout
         self._health_check_interval = health_check_interval
+        self._codec = codec or get_default_codec()
 
         self._pool: Optional[ConnectionPool] = None
         self._client: Optional[Redis] = None
@@ -77,8 +89,15 @@ class RedisClient:
             url=self._sanitize_url(self._url),
             max_connections=self._max_connections,
             socket_timeout=socket_timeout,
+            serializer=self._codec.serializer,
+            compression=self._codec.compression,
         )
 
+    @property
+    def codec(self) -> CacheCodec:
+        """Codec used for JSON payloads."""
+        return self._codec
+
     @staticmethod
     def _sanitize_url(url: str) -> str:
         """
@@ -246,13 +265,57 @@ class RedisClient:
 
         try:
             self._total_operations += 1
-            value = await self._client.get(key)
-            
+            with metrics.track_operation("get", key):
+                value = await self._client.get(key)
+
             if value is not None:
                 self._cache_hits += 1
+                metrics.record_lookup(key, "hit")
+                metrics.observe_payload(key, len(value), "read")
             else:
                 self._cache_misses += 1
-            
+                metrics.record_lookup(key, "miss")
+
+            logger.debug("Redis GET operation", key=key, found=value is not None)
+            return value
+
+        except RedisError as e:
+            logger.error("Redis GET operation failed", key=key, error=str(e))
+            raise
+
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Get value from Redis by key without decoding it to text.
+
+        Used for codec payloads, which may be binary.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Raw cached bytes or None if key doesn't exist
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        self._ensure_connected()
+
+        try:
+            self._total_operations += 1
+            with metrics.track_operation("get", key):
+                value = await self._client.execute_command(
+                    "GET", key, **{NEVER_DECODE: True}
+                )
+
+            if value is not None:
+                self._cache_hits += 1
+                metrics.record_lookup(key, "hit")
+                metrics.observe_payload(key, len(value), "read")
+            else:
+                self._cache_misses += 1
+                metrics.record_lookup(key, "miss")
+
             logger.debug("Redis GET operation", key=key, found=value is not None)
             return value
 
@@ -268,6 +331,7 @@ class RedisClient:
         px: Optional[int] = None,
         nx: bool = False,
         xx: bool = False,
+        tags: Optional[Iterable[str]] = None,
     ) -> bool:
         """
         Set value in Redis with optional expiration.
@@ -279,6 +343,7 @@ class RedisClient:
             px: Expiration time in milliseconds
             nx: Only set if key doesn't exist
             xx: Only set if key exists
+            tags: Invalidation tags to register the key under
 
         Returns:
             True if operation succeeded, False otherwise
@@ -291,7 +356,19 @@ class RedisClient:
 
         try:
             self._total_operations += 1
-            result = await self._client.set(key, value, ex=ex, px=px, nx=nx, xx=xx)
+            with metrics.track_operation("set", key):
+                if tags:
+                    async with self._client.pipeline(transaction=True) as pipe:
+                        pipe.set(key, value, ex=ex, px=px, nx=nx, xx=xx)
+                        self._queue_tag_registration(pipe, key, tags, ex=ex, px=px)
+                        results = await pipe.execute()
+                    result = results[0]
+                else:
+                    result = await self._client.set(
+                        key, value, ex=ex, px=px, nx=nx, xx=xx
+                    )
+            if isinstance(value, (str, bytes)):
+                metrics.observe_payload(key, len(value), "write")
             logger.debug(
                 "Redis SET operation",
                 key=key,
@@ -299,6 +376,7 @@ class RedisClient:
                 px=px,
                 nx=nx,
                 xx=xx,
+                tags=list(tags) if tags else None,
                 success=bool(result),
             )
             return bool(result)
@@ -325,7 +403,8 @@ class RedisClient:
 
         try:
             self._total_operations += 1
-            count = await self._client.delete(*keys)
+            with metrics.track_operation("delete", keys[0] if keys else ""):
+                count = await self._client.delete(*keys)
             logger.debug("Redis DELETE operation", keys=keys, count=count)
             return count
 
@@ -464,6 +543,131 @@ class RedisClient:
             logger.error("Redis DECR operation failed", key=key, error=str(e))
             raise
 
+    async def zrevrange(
+        self, key: str, start: int, end: int, withscores: bool = False
+    ) -> list[Any]:
+        """
+        Get sorted set members by rank, highest score first.
+
+        Args:
+            key: Sorted set key
+            start: First rank (inclusive)
+            end: Last rank (inclusive, -1 for the last member)
+            withscores: Return (member, score) tuples instead of members
+
+        Returns:
+            List of members or (member, score) tuples
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        self._ensure_connected()
+
+        try:
+            self._total_operations += 1
+            members = await self._client.zrevrange(
+                key, start, end, withscores=withscores
+            )
+            logger.debug("Redis ZREVRANGE operation", key=key, count=len(members))
+            return members
+
+        except RedisError as e:
+            logger.error("Redis ZREVRANGE operation failed", key=key, error=str(e))
+            raise
+
+    async def getbits(self, key: str, offsets: Iterable[int]) -> list[int]:
+        """
+        Read several bits of a bitmap with a single BITFIELD command.
+
+        Args:
+            key: Bitmap key
+            offsets: Bit offsets to read
+
+        Returns:
+            Bit values in offset order (0 for a missing key)
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        self._ensure_connected()
+
+        args: list[Any] = []
+        for offset in offsets:
+            args.extend(("GET", "u1", offset))
+        if not args:
+            return []
+
+        try:
+            self._total_operations += 1
+            bits = await self._client.execute_command("BITFIELD", key, *args)
+            logger.debug("Redis BITFIELD GET operation", key=key, count=len(bits))
+            return bits
+
+        except RedisError as e:
+            logger.error("Redis BITFIELD GET operation failed", key=key, error=str(e))
+            raise
+
+    async def setbits(self, key: str, offsets: Iterable[int]) -> None:
+        """
+        Set several bits of a bitmap with a single BITFIELD command.
+
+        Args:
+            key: Bitmap key
+            offsets: Bit offsets to set to 1
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        self._ensure_connected()
+
+        args: list[Any] = []
+        for offset in offsets:
+            args.extend(("SET", "u1", offset, 1))
+        if not args:
+            return
+
+        try:
+            self._total_operations += 1
+            await self._client.execute_command("BITFIELD", key, *args)
+            logger.debug("Redis BITFIELD SET operation", key=key, count=len(args) // 4)
+
+        except RedisError as e:
+            logger.error("Redis BITFIELD SET operation failed", key=key, error=str(e))
+            raise
+
+    async def rename(self, source: str, destination: str) -> None:
+        """
+        Atomically replace a key with another one.
+
+        Args:
+            source: Key to rename
+            destination: Key to overwrite
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If the source key does not exist or the operation fails
+        """
+        self._ensure_connected()
+
+        try:
+            self._total_operations += 1
+            await self._client.rename(source, destination)
+            logger.debug(
+                "Redis RENAME operation", source=source, destination=destination
+            )
+
+        except RedisError as e:
+            logger.error(
+                "Redis RENAME operation failed",
+                source=source,
+                destination=destination,
+                error=str(e),
+            )
+            raise
+
     @asynccontextmanager
     async def pipeline(self) -> AsyncIterator[redis.client.Pipeline]:
         """
@@ -504,15 +708,15 @@ class RedisClient:
         Raises:
             ConnectionError: If Redis is not connected
             RedisError: If Redis operation fails
-            json.JSONDecodeError: If value is not valid JSON
+            CodecError: If value cannot be decoded
         """
-        value = await self.get(key)
+        value = await self.get_raw(key)
         if value is None:
             return None
-        
+
         try:
-            return json.loads(value)
-        except json.JSONDecodeError as e:
+            return self._codec.decode(value)
+        except CodecError as e:
             logger.error("Failed to decode JSON from cache", key=key, error=str(e))
             raise
 
@@ -522,6 +726,7 @@ class RedisClient:
         value: dict[str, Any],
         ex: Optional[int] = None,
         px: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
     ) -> bool:
         """
         Set JSON value in Redis with optional expiration.
@@ -531,6 +736,7 @@ class RedisClient:
             value: Dictionary to cache as JSON
             ex: Expiration time in seconds
             px: Expiration time in milliseconds
+            tags: Invalidation tags to register the key under
 
         Returns:
             True if operation succeeded, False otherwise
@@ -538,21 +744,25 @@ class RedisClient:
         Raises:
             ConnectionError: If Redis is not connected
             RedisError: If Redis operation fails
-            TypeError: If value is not JSON serializable
+            CodecError: If value cannot be serialized
         """
         try:
-            json_value = json.dumps(value)
-            return await self.set(key, json_value, ex=ex, px=px)
-        except (TypeError, ValueError) as e:
+            payload = self._codec.encode(value)
+        except CodecError as e:
             logger.error("Failed to serialize value to JSON", key=key, error=str(e))
             raise
 
-    async def get_many(self, *keys: str) -> dict[str, Optional[str]]:
+        return await self.set(key, payload, ex=ex, px=px, tags=tags)
+
+    async def get_many(
+        self, *keys: str, raw: bool = False
+    ) -> dict[str, Optional[Union[str, bytes]]]:
         """
         Get multiple values from Redis by keys.
 
         Args:
             *keys: Cache keys to retrieve
+            raw: Return undecoded bytes, as needed for codec payloads
 
         Returns:
             Dictionary mapping keys to their values (None if key doesn't exist)
@@ -563,33 +773,87 @@ class RedisClient:
         """
         self._ensure_connected()
 
+        if not keys:
+            return {}
+
         try:
             self._total_operations += len(keys)
-            values = await self._client.mget(*keys)
-            
+            with metrics.track_operation("mget", keys[0]):
+                if raw:
+                    values = await self._client.execute_command(
+                        "MGET", *keys, **{NEVER_DECODE: True}
+                    )
+                else:
+                    values = await self._client.mget(*keys)
+
             result = dict(zip(keys, values))
+            for key, value in result.items():
+                if value is None:
+                    metrics.record_lookup(key, "miss")
+                else:
+                    metrics.record_lookup(key, "hit")
+                    metrics.observe_payload(key, len(value), "read")
             hits = sum(1 for v in values if v is not None)
             self._cache_hits += hits
             self._cache_misses += len(keys) - hits
-            
-            logger.debug("Redis MGET operation", keys=keys, found=hits)
+
+            logger.debug("Redis MGET operation", count=len(keys), found=hits)
             return result
 
         except RedisError as e:
-            logger.error("Redis MGET operation failed", keys=keys, error=str(e))
+            logger.error("Redis MGET operation failed", count=len(keys), error=str(e))
             raise
 
+    async def get_many_json(self, *keys: str) -> dict[str, Optional[Any]]:
+        """
+        Get multiple JSON values from Redis with a single MGET.
+
+        Values that fail to decode are logged and returned as None so that
+        one corrupt entry does not fail the whole batch.
+
+        Args:
+            *keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary mapping keys to decoded values (None if missing)
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        values = await self.get_many(*keys, raw=True)
+
+        result: dict[str, Optional[Any]] = {}
+        for key, value in values.items():
+            if value is None:
+                result[key] = None
+                continue
+            try:
+                result[key] = self._codec.decode(value)
+            except CodecError as e:
+                logger.error("Failed to decode JSON from cache", key=key, error=str(e))
+                result[key] = None
+
+        return result
+
     async def set_many(
         self,
         mapping: dict[str, Union[str, bytes, int, float]],
         ex: Optional[int] = None,
+        ttls: Optional[dict[str, int]] = None,
+        tags: Optional[dict[str, Iterable[str]]] = None,
     ) -> bool:
         """
         Set multiple key-value pairs in Redis.
 
+        Writes with expirations or tags are sent as a single pipeline, so
+        any number of keys costs one round trip.
+
         Args:
             mapping: Dictionary of key-value pairs to set
             ex: Expiration time in seconds (applied to all keys)
+            ttls: Per-key expiration in seconds, overriding ex
+            tags: Per-key invalidation tags to register
 
         Returns:
             True if all operations succeeded
@@ -600,18 +864,40 @@ class RedisClient:
         """
         self._ensure_connected()
 
+        if not mapping:
+            return True
+
+        ttls = ttls or {}
+        tags = tags or {}
+
         try:
             self._total_operations += len(mapping)
-            
-            if ex is None:
-                result = await self._client.mset(mapping)
+            for key, value in mapping.items():
+                if isinstance(value, (str, bytes)):
+                    metrics.observe_payload(key, len(value), "write")
+
+            if ex is None and not ttls and not tags:
+                with metrics.track_operation("mset", next(iter(mapping))):
+                    result = await self._client.mset(mapping)
                 logger.debug("Redis MSET operation", count=len(mapping))
                 return result
             else:
-                async with self.pipeline() as pipe:
-                    for key, value in mapping.items():
-                        pipe.set(key, value, ex=ex)
-                logger.debug("Redis MSET with expiration", count=len(mapping), ex=ex)
+                with metrics.track_operation("mset", next(iter(mapping))):
+                    async with self.pipeline() as pipe:
+                        for key, value in mapping.items():
+                            key_ex = ttls.get(key, ex)
+                            pipe.set(key, value, ex=key_ex)
+                            if tags.get(key):
+                                self._queue_tag_registration(
+                                    pipe, key, tags[key], ex=key_ex
+                                )
+                logger.debug(
+                    "Redis MSET with expiration",
+                    count=len(mapping),
+                    ex=ex,
+                    per_key_ttls=len(ttls),
+                    tagged=len(tags),
+                )
                 return True
 
         except RedisError as e:
@@ -622,6 +908,9 @@ class RedisClient:
         """
         Delete all keys matching a pattern.
 
+        Walks the whole keyspace with SCAN; prefer invalidate_tags for
+        cache invalidation on hot paths.
+
         Args:
             pattern: Redis key pattern (e.g., "vehicle:*")
 
@@ -651,6 +940,254 @@ class RedisClient:
             logger.error("Redis DELETE pattern failed", pattern=pattern, error=str(e))
             raise
 
+    @classmethod
+    def tag_key(cls, tag: str) -> str:
+        """
+        Get the Redis key of the set tracking keys written under a tag.
+
+        Args:
+            tag: Invalidation tag
+
+        Returns:
+            Tag set key
+        """
+        return f"{cls.TAG_KEY_PREFIX}:{tag}"
+
+    def _queue_tag_registration(
+        self,
+        pipe: redis.client.Pipeline,
+        key: str,
+        tags: Iterable[str],
+        ex: Optional[int] = None,
+        px: Optional[int] = None,
+    ) -> None:
+        """
+        Queue commands registering a key in its tag sets.
+
+        Tag sets expire no earlier than their longest-lived member so that
+        they never outlive the need to invalidate it by much.
+
+        Args:
+            pipe: Pipeline to queue commands on
+            key: Cache key being written
+            tags: Invalidation tags
+            ex: Key expiration in seconds
+            px: Key expiration in milliseconds
+        """
+        ttl_ms = px if px is not None else (ex * 1000 if ex is not None else None)
+
+        for tag in tags:
+            tag_key = self.tag_key(tag)
+            pipe.sadd(tag_key, key)
+            if ttl_ms is None:
+                pipe.persist(tag_key)
+            else:
+                pipe.pexpire(tag_key, ttl_ms, nx=True)
+                pipe.pexpire(tag_key, ttl_ms, gt=True)
+
+    async def tag_keys(
+        self,
+        key_tags: dict[str, Iterable[str]],
+        ex: Optional[int] = None,
+    ) -> None:
+        """
+        Register already written keys under invalidation tags.
+
+        Used after bulk writes that bypass set(), such as pipelined cache
+        warming.
+
+        Args:
+            key_tags: Mapping of cache key to its invalidation tags
+            ex: Expiration of the registered keys in seconds
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        self._ensure_connected()
+
+        if not key_tags:
+            return
+
+        try:
+            self._total_operations += 1
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, tags in key_tags.items():
+                    self._queue_tag_registration(pipe, key, tags, ex=ex)
+                await pipe.execute()
+            logger.debug("Redis tag registration", count=len(key_tags))
+
+        except RedisError as e:
+            logger.error(
+                "Redis tag registration failed", count=len(key_tags), error=str(e)
+            )
+            raise
+
+    async def invalidate_tags(
+        self,
+        *tags: str,
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """
+        Delete every key registered under the given tags.
+
+        Each tag set is read and removed atomically, then its members are
+        removed with batched UNLINK calls so memory is reclaimed off the
+        main Redis thread.
+
+        Args:
+            *tags: Invalidation tags
+            batch_size: Keys per UNLINK call (defaults to class setting)
+
+        Returns:
+            Number of keys deleted
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        self._ensure_connected()
+
+        if not tags:
+            return 0
+
+        batch_size = batch_size or self.TAG_INVALIDATION_BATCH_SIZE
+
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                for tag in tags:
+                    pipe.smembers(self.tag_key(tag))
+                pipe.unlink(*(self.tag_key(tag) for tag in tags))
+                results = await pipe.execute()
+
+            keys: set[str] = set()
+            for members in results[:-1]:
+                keys.update(members)
+
+            members_list = list(keys)
+            count = 0
+            for i in range(0, len(members_list), batch_size):
+                batch = members_list[i : i + batch_size]
+                self._total_operations += 1
+                count += await self._client.unlink(*batch)
+
+            logger.debug(
+                "Redis tag invalidation",
+                tags=tags,
+                members=len(members_list),
+                count=count,
+            )
+            return count
+
+        except RedisError as e:
+            logger.error("Redis tag invalidation failed", tags=tags, error=str(e))
+            raise
+
+    # Deletes the lock only if it is still held by the caller's token
+    _RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+    async def acquire_lock(self, key: str, ttl_ms: int) -> Optional[str]:
+        """
+        Try to acquire a short-lived lock.
+
+        Args:
+            key: Lock key
+            ttl_ms: Lock lifetime in milliseconds
+
+        Returns:
+            Ownership token if the lock was acquired, None otherwise
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        self._ensure_connected()
+
+        token = uuid.uuid4().hex
+        try:
+            self._total_operations += 1
+            acquired = await self._client.set(key, token, px=ttl_ms, nx=True)
+            logger.debug("Redis lock acquire", key=key, acquired=bool(acquired))
+            return token if acquired else None
+
+        except RedisError as e:
+            logger.error("Redis lock acquire failed", key=key, error=str(e))
+            raise
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        """
+        Release a lock previously acquired with acquire_lock.
+
+        Args:
+            key: Lock key
+            token: Ownership token returned by acquire_lock
+
+        Returns:
+            True if the lock was released, False if it had expired or
+            been taken over
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        self._ensure_connected()
+
+        try:
+            self._total_operations += 1
+            released = await self._client.eval(
+                self._RELEASE_LOCK_SCRIPT, 1, key, token
+            )
+            logger.debug("Redis lock release", key=key, released=bool(released))
+            return bool(released)
+
+        except RedisError as e:
+            logger.error("Redis lock release failed", key=key, error=str(e))
+            raise
+
+    async def publish(self, channel: str, message: str) -> int:
+        """
+        Publish message to a Redis pub/sub channel.
+
+        Args:
+            channel: Channel name
+            message: Message payload
+
+        Returns:
+            Number of subscribers that received the message
+
+        Raises:
+            ConnectionError: If Redis is not connected
+            RedisError: If Redis operation fails
+        """
+        self._ensure_connected()
+
+        try:
+            receivers = await self._client.publish(channel, message)
+            logger.debug("Redis PUBLISH operation", channel=channel, receivers=receivers)
+            return receivers
+
+        except RedisError as e:
+            logger.error("Redis PUBLISH operation failed", channel=channel, error=str(e))
+            raise
+
+    def pubsub(self) -> redis.client.PubSub:
+        """
+        Create Redis pub/sub handle sharing the client connection pool.
+
+        Returns:
+            Pub/sub object for subscribing to channels
+
+        Raises:
+            ConnectionError: If Redis is not connected
+        """
+        self._ensure_connected()
+        return self._client.pubsub(ignore_subscribe_messages=True)
+
     def get_cache_stats(self) -> dict[str, Any]:
         """
         Get cache performance statistics.
@@ -786,8 +1323,10 @@ async def get_redis_client() -> RedisClient:
     global _redis_client
 
     if _redis_client is None:
-        _redis_client = RedisClient()
-        await _redis_client.connect()
+        # Only keep a connected client, so a failed connect is retried
+        client = RedisClient()
+        await client.connect()
+        _redis_client = client
 
     return _redis_client
 
@@ -0,0 +1,290 @@
+"""
+Request coalescing (single-flight) for cache-aside misses.
+
+When a hot cache key expires, every concurrent request misses at once and
+runs the same backend query. This module collapses those misses: within a
+process, concurrent callers for the same key await one shared task, and
+across processes a short-lived Redis lock elects a single loader while the
+others poll the cache briefly before falling back to loading themselves.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from src.cache.redis_client import RedisClient, get_redis_client
+from src.core.config import get_settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent loads of the same cache key.
+
+    The in-process layer always applies. The cross-process lock is only used
+    when a Redis client is configured or can be obtained from the client
+    factory, and any Redis failure degrades to an uncoordinated load rather
+    than failing the request.
+    """
+
+    LOCK_KEY_PREFIX = "lock:fill"
+
+    # Seconds between attempts to obtain a Redis client from the factory
+    REDIS_RETRY_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        redis_client: Optional[RedisClient] = None,
+        lock_ttl_ms: int = 5000,
+        wait_timeout: float = 2.0,
+        poll_interval: float = 0.05,
+        redis_client_factory: Optional[Callable[[], Awaitable[RedisClient]]] = None,
+    ):
+        """
+        Initialize single-flight coordinator.
+
+        Args:
+            redis_client: Redis client for cross-process locks (optional)
+            lock_ttl_ms: Lifetime of the fill lock in milliseconds
+            wait_timeout: Seconds non-leaders wait for the cache to be filled
+            poll_interval: Seconds between cache polls while waiting
+            redis_client_factory: Obtains a Redis client when none is set,
+                retried at most every REDIS_RETRY_INTERVAL seconds
+        """
+        self._redis = redis_client
+        self._redis_client_factory = redis_client_factory
+        self._next_redis_attempt = 0.0
+        self._lock_ttl_ms = lock_ttl_ms
+        self._wait_timeout = wait_timeout
+        self._poll_interval = poll_interval
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._stats = {
+            "leaders": 0,
+            "coalesced": 0,
+            "lock_waits": 0,
+            "lock_wait_hits": 0,
+        }
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently being loaded in this process."""
+        return len(self._in_flight)
+
+    async def _get_redis(self) -> Optional[RedisClient]:
+        """
+        Get the Redis client, obtaining one from the factory if needed.
+
+        Returns:
+            Redis client, or None while Redis is unavailable
+        """
+        if self._redis is not None or self._redis_client_factory is None:
+            return self._redis
+
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._next_redis_attempt:
+            return None
+
+        try:
+            self._redis = await self._redis_client_factory()
+            logger.info("Redis available, single-flight coordinating across pods")
+        except Exception as e:
+            self._next_redis_attempt = loop.time() + self.REDIS_RETRY_INTERVAL
+            logger.debug(
+                "Redis still unavailable for single-flight",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+        return self._redis
+
+    def _make_lock_key(self, key: str) -> str:
+        """
+        Build the Redis lock key guarding a cache key fill.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Lock key
+        """
+        return f"{self.LOCK_KEY_PREFIX}:{key}"
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once for all concurrent callers with the same key.
+
+        The first caller starts fn as a task; callers arriving while it is in
+        flight share its result or exception. A caller being cancelled does
+        not cancel the shared task.
+
+        Args:
+            key: Coalescing key
+            fn: Coroutine factory producing the value
+
+        Returns:
+            Value produced by fn
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._stats["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            self._stats["leaders"] += 1
+            task.add_done_callback(lambda done: self._on_done(key, done))
+
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Future) -> None:
+        """Forget a finished task and mark its exception as observed."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def load(
+        self,
+        key: str,
+        read_cache: Callable[[], Awaitable[Optional[T]]],
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Load a missed cache key with in-process and cross-process coalescing.
+
+        The loader is expected to populate the cache itself so that waiters
+        in other processes can observe the value through read_cache.
+
+        Args:
+            key: Cache key that missed
+            read_cache: Coroutine factory reading the cached value
+            loader: Coroutine factory loading and caching the value
+
+        Returns:
+            Loaded or cached value
+        """
+        return await self.do(key, lambda: self._load_once(key, read_cache, loader))
+
+    async def _load_once(
+        self,
+        key: str,
+        read_cache: Callable[[], Awaitable[Optional[T]]],
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Load a key as the in-process leader, coordinating across pods."""
+        redis = await self._get_redis()
+        if redis is None:
+            return await loader()
+
+        lock_key = self._make_lock_key(key)
+        try:
+            token = await redis.acquire_lock(lock_key, self._lock_ttl_ms)
+        except Exception as e:
+            logger.warning(
+                "Fill lock unavailable, loading without coordination",
+                key=key,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return await loader()
+
+        if token is None:
+            cached = await self._wait_for_fill(key, read_cache)
+            if cached is not None:
+                return cached
+            return await loader()
+
+        try:
+            # Another pod may have filled the key between our miss and the lock
+            cached = await read_cache()
+            if cached is not None:
+                return cached
+            return await loader()
+        finally:
+            try:
+                await redis.release_lock(lock_key, token)
+            except Exception as e:
+                logger.warning(
+                    "Failed to release fill lock",
+                    key=key,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+    async def _wait_for_fill(
+        self,
+        key: str,
+        read_cache: Callable[[], Awaitable[Optional[T]]],
+    ) -> Optional[T]:
+        """
+        Poll the cache while another process loads the key.
+
+        Args:
+            key: Cache key being filled
+            read_cache: Coroutine factory reading the cached value
+
+        Returns:
+            Cached value, or None if it did not appear in time
+        """
+        self._stats["lock_waits"] += 1
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._wait_timeout
+
+        while loop.time() < deadline:
+            await asyncio.sleep(self._poll_interval)
+            cached = await read_cache()
+            if cached is not None:
+                self._stats["lock_wait_hits"] += 1
+                return cached
+
+        logger.debug("Fill wait timed out, loading directly", key=key)
+        return None
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with leader, coalesced and lock wait counts
+        """
+        return {**self._stats, "in_flight": self.in_flight}
+
+
+# Global single-flight coordinator
+_single_flight: Optional[SingleFlight] = None
+
+
+async def get_single_flight() -> SingleFlight:
+    """
+    Get or create global single-flight coordinator.
+
+    If Redis is unavailable the coordinator coalesces in process only and
+    keeps trying to obtain a client, so it coordinates across processes
+    again once Redis recovers.
+
+    Returns:
+        Singleton single-flight coordinator
+    """
+    global _single_flight
+
+    if _single_flight is None:
+        settings = get_settings()
+        try:
+            redis_client = await get_redis_client()
+        except Exception as e:
+            logger.warning(
+                "Redis unavailable, single-flight limited to this process",
+                error=str(e),
+            )
+            redis_client = None
+
+        _single_flight = SingleFlight(
+            redis_client=redis_client,
+            lock_ttl_ms=settings.single_flight_lock_ttl_ms,
+            wait_timeout=settings.single_flight_wait_timeout_seconds,
+            redis_client_factory=get_redis_client,
+        )
+
+    return _single_flight
@@ -110,6 +110,174 @@ class Settings(BaseSettings):
         description="Maximum Redis connection pool size",
     )
 
+    # Cache Payload Encoding Configuration
+    cache_serializer: Literal["json", "orjson", "msgpack"] = Field(
+        default="orjson",
+        description="Serializer for cached JSON payloads",
+    )
+
+    cache_compression: Literal["none", "zstd", "lz4"] = Field(
+        default="none",
+        description="Compression applied to large cached payloads",
+    )
+
+    cache_compression_threshold_bytes: int = Field(
+        default=4096,
+        ge=0,
+        description="Serialized payload size above which compression is applied",
+    )
+
+    cache_compression_level: int = Field(
+        default=3,
+        ge=0,
+        le=22,
+        description="Compression level passed to the compression backend",
+    )
+
+    # In-process (L1) Cache Configuration
+    local_cache_enabled: bool = Field(
+        default=False,
+        description="Enable in-process L1 cache in front of Redis",
+    )
+
+    local_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1024,
+        description="Maximum approximate payload size held by the L1 cache",
+    )
+
+    local_cache_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum number of entries held by the L1 cache",
+    )
+
+    local_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=1,
+        le=3600,
+        description="Upper bound on L1 cache entry lifetime in seconds",
+    )
+
+    local_cache_invalidation_channel: str = Field(
+        default="autoselect:cache:invalidate",
+        description="Redis pub/sub channel for cross-pod L1 invalidation",
+    )
+
+    # Cache Miss Coalescing Configuration
+    single_flight_lock_ttl_ms: int = Field(
+        default=5000,
+        ge=100,
+        le=60000,
+        description="Lifetime of the Redis lock held while repopulating a key",
+    )
+
+    single_flight_wait_timeout_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=30.0,
+        description="How long non-leaders wait for a key before loading it themselves",
+    )
+
+    # Vehicle Cache Freshness Configuration
+    vehicle_cache_stale_ttl: dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Stale-while-revalidate window in seconds per vehicle cache key "
+            "family (list, detail, search, facets, inventory, price_range); "
+            "families not listed use hard TTLs"
+        ),
+    )
+
+    vehicle_cache_xfetch_beta: float = Field(
+        default=1.0,
+        gt=0.0,
+        le=10.0,
+        description="Early-expiration aggressiveness for soft-TTL cache entries",
+    )
+
+    # Negative Lookup Caching Configuration
+    negative_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=1,
+        le=3600,
+        description="How long a confirmed missing ID, VIN or share token is remembered",
+    )
+
+    lookup_filter_capacity: int = Field(
+        default=1_000_000,
+        ge=1000,
+        description="Expected number of VINs or share tokens per Bloom filter",
+    )
+
+    lookup_filter_error_rate: float = Field(
+        default=0.01,
+        gt=0.0,
+        lt=0.5,
+        description="Target false-positive rate of the lookup Bloom filters",
+    )
+
+    lookup_filter_rebuild_interval_seconds: int = Field(
+        default=6 * 3600,
+        ge=60,
+        description=(
+            "Interval between rebuilds that drop deleted entries from the filters"
+        ),
+    )
+
+    # Compiled Configuration Rules Cache
+    compiled_rules_cache_max_entries: int = Field(
+        default=2000,
+        ge=1,
+        description=(
+            "Maximum number of vehicles whose compiled option rules are kept in "
+            "process"
+        ),
+    )
+
+    compiled_rules_ttl_seconds: int = Field(
+        default=300,
+        ge=1,
+        le=86400,
+        description=(
+            "Lifetime of compiled option rules, bounding staleness on other instances"
+        ),
+    )
+
+    # Configuration Solver
+    configuration_solver_time_budget_ms: int = Field(
+        default=250,
+        ge=10,
+        le=10000,
+        description="Time each configuration completion search or count may run",
+    )
+
+    configuration_solver_max_completions: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Maximum number of priced completions returned per request",
+    )
+
+    # Dealer Price Overlays
+    dealer_price_cache_max_entries: int = Field(
+        default=1000,
+        ge=1,
+        description=(
+            "Maximum number of dealers whose price overrides are kept in process"
+        ),
+    )
+
+    dealer_price_ttl_seconds: int = Field(
+        default=60,
+        ge=1,
+        le=86400,
+        description=(
+            "Lifetime of cached dealer price overrides, bounding staleness on other "
+            "instances"
+        ),
+    )
+
     # JWT Configuration
     jwt_algorithm: str = Field(
         default="HS256",
@@ -190,6 +358,137 @@ class Settings(BaseSettings):
         description="Enable Elasticsearch search functionality",
     )
 
+    search_reindex_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Documents per bulk request during a full reindex",
+    )
+
+    search_reindex_workers: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Concurrent bulk requests during a full reindex",
+    )
+
+    search_reindex_queue_size: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Bulk batches buffered ahead of the reindex workers",
+    )
+
+    search_track_total_hits: int = Field(
+        default=10000,
+        ge=0,
+        le=1000000,
+        description=(
+            "Matches counted exactly before a search total becomes a lower bound"
+        ),
+    )
+
+    search_cache_enabled: bool = Field(
+        default=True,
+        description="Cache search result pages and facets in Redis",
+    )
+
+    search_cache_price_bucket: int = Field(
+        default=500,
+        ge=0,
+        le=100000,
+        description="Price bucket width facet price bounds are widened to (0 disables)",
+    )
+
+    search_cursor_keep_alive: str = Field(
+        default="2m",
+        pattern=r"^\d+[smh]$",
+        description="How long a search cursor's point-in-time stays open between pages",
+    )
+
+    autocomplete_enabled: bool = Field(
+        default=True,
+        description="Serve make/model suggestions from an in-process index",
+    )
+
+    autocomplete_refresh_interval: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=3600.0,
+        description=(
+            "Seconds between checks whether the autocomplete index needs a rebuild"
+        ),
+    )
+
+    autocomplete_max_age: float = Field(
+        default=900.0,
+        ge=10.0,
+        le=86400.0,
+        description=(
+            "Seconds after which the autocomplete index is rebuilt without catalog "
+            "changes"
+        ),
+    )
+
+    autocomplete_popular_vehicles: int = Field(
+        default=2000,
+        ge=0,
+        le=100000,
+        description="Most accessed vehicles whose access counts rank suggestions",
+    )
+
+    # Facet Counts Configuration (used when Elasticsearch is disabled)
+    facet_counts_min_interval: float = Field(
+        default=60.0,
+        ge=1.0,
+        le=86400.0,
+        description=(
+            "Minimum seconds between refreshes of the facet counts view after catalog "
+            "changes"
+        ),
+    )
+    facet_counts_max_age: float = Field(
+        default=3600.0,
+        ge=10.0,
+        le=86400.0,
+        description=(
+            "Seconds after which the facet counts view is refreshed without catalog "
+            "changes"
+        ),
+    )
+
+    # Outbox Relay Configuration
+    outbox_relay_enabled: bool = Field(
+        default=True,
+        description=(
+            "Run the outbox relay that syncs catalog changes to search and cache"
+        ),
+    )
+    outbox_batch_size: int = Field(
+        default=200,
+        ge=1,
+        le=5000,
+        description="Outbox events claimed per relay batch",
+    )
+    outbox_poll_interval: float = Field(
+        default=1.0,
+        ge=0.05,
+        le=60.0,
+        description="Seconds the relay sleeps when the outbox is empty",
+    )
+    outbox_max_backoff: int = Field(
+        default=300,
+        ge=1,
+        le=86400,
+        description="Maximum retry delay in seconds for failed outbox events",
+    )
+    outbox_retention_hours: int = Field(
+        default=24,
+        ge=1,
+        le=720,
+        description="Hours processed outbox events are kept before cleanup",
+    )
+
     # Stripe Payment Configuration
     stripe_publishable_key: str = Field(
         default="pk_test_default_key",
@@ -21,6 +21,7 @@ from src.database.models.user import User
 from src.database.models.vehicle import Vehicle, VehicleConfiguration
 from src.database.models.order import Order
 from src.database.models.inventory import InventoryItem
+from src.database.models.outbox import OutboxEvent
 
 __all__ = [
     "Base",
@@ -37,4 +38,5 @@ __all__ = [
     "VehicleConfiguration",
     "Order",
     "InventoryItem",
+    "OutboxEvent",
 ]
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""
+Transactional outbox for propagating catalog changes to search and cache.
+
+Vehicle and inventory writes add an OutboxEvent in the same transaction as
+the change itself, so an event exists if and only if the change committed.
+The outbox relay drains pending events in id order and applies them to
+Elasticsearch and the cache, retrying failed events with backoff.
+"""
+
+import enum
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+
+
+class OutboxAggregate(str, enum.Enum):
+    """Kind of record an outbox event describes."""
+
+    VEHICLE = "vehicle"
+    INVENTORY = "inventory"
+
+
+class OutboxEventType(str, enum.Enum):
+    """Change recorded by an outbox event."""
+
+    UPSERTED = "upserted"
+    DELETED = "deleted"
+
+
+class OutboxEvent(Base):
+    """
+    Pending change notification written alongside a catalog change.
+
+    Events carry identifiers only. The relay reads the current row when it
+    applies an event, so replaying an event is idempotent and a burst of
+    changes to one vehicle collapses into a single document write.
+    """
+
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+        comment="Monotonic event id, the relay drains in this order",
+    )
+
+    aggregate_type: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="Changed record kind (vehicle or inventory)",
+    )
+
+    aggregate_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=False,
+        comment="Changed record id",
+    )
+
+    event_type: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="Change kind (upserted or deleted)",
+    )
+
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        server_default=text("'{}'::jsonb"),
+        comment="Extra identifiers, e.g. the vehicle of an inventory item",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Commit-time timestamp used for lag metrics",
+    )
+
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Earliest time the relay picks the event up (retry backoff)",
+    )
+
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the event was applied, NULL while pending",
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Failed delivery attempts",
+    )
+
+    last_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Error of the last failed attempt",
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_outbox_events_pending",
+            "available_at",
+            "id",
+            postgresql_where=text("processed_at IS NULL"),
+        ),
+        Index(
+            "ix_outbox_events_processed_at",
+            "processed_at",
+            postgresql_where=text("processed_at IS NOT NULL"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of outbox event."""
+        return (
+            f"<OutboxEvent(id={self.id}, aggregate={self.aggregate_type}:"
+            f"{self.aggregate_id}, event={self.event_type})>"
+        )
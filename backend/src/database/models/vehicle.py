@@ -16,14 +16,23 @@ from sqlalchemy import (
     Numeric,
     Index,
     CheckConstraint,
+    Computed,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base import AuditedModel
 
 
+# Text indexed by Vehicle.search_vector. The 'simple' configuration keeps
+# brand and model names unstemmed.
+SEARCH_VECTOR_EXPRESSION = (
+    "to_tsvector('simple', coalesce(make, '') || ' ' || coalesce(model, '') "
+    "|| ' ' || coalesce(trim, '') || ' ' || coalesce(body_style, ''))"
+)
+
+
 class Vehicle(AuditedModel):
     """
     Vehicle model for inventory management.
@@ -54,6 +63,7 @@ class Vehicle(AuditedModel):
         cargo_capacity: Cargo capacity in cubic feet
         towing_capacity: Towing capacity in pounds
         specifications: JSONB field for flexible specification storage
+        search_vector: Generated full-text vector over make, model, trim and body style
         base_price: Base price before options and configurations
         msrp: Manufacturer's Suggested Retail Price
         invoice_price: Dealer invoice price
@@ -202,6 +212,14 @@ class Vehicle(AuditedModel):
         comment="Vehicle specifications in JSONB format",
     )
 
+    # Full-text search vector maintained by the database
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        nullable=True,
+        comment="Generated full-text search vector",
+    )
+
     # Pricing
     base_price: Mapped[Decimal] = mapped_column(
         Numeric(precision=10, scale=2),
@@ -261,11 +279,28 @@ class Vehicle(AuditedModel):
             "year",
             "make",
         ),
-        # GIN index for JSONB specifications search
+        # GIN index for JSONB specifications containment (@>) search
         Index(
-            "ix_vehicles_specifications_gin",
+            "ix_vehicles_specifications_path_ops",
             "specifications",
             postgresql_using="gin",
+            postgresql_ops={"specifications": "jsonb_path_ops"},
+        ),
+        # Expression indexes for range filters on hot specification keys
+        Index(
+            "ix_vehicles_spec_horsepower",
+            text("((specifications ->> 'horsepower')::integer)"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_vehicles_spec_mpg_city",
+            text("((specifications ->> 'mpg_city')::integer)"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_vehicles_spec_mpg_highway",
+            text("((specifications ->> 'mpg_highway')::integer)"),
+            postgresql_where=text("deleted_at IS NULL"),
         ),
         # Index for price range queries
         Index(
@@ -298,6 +333,49 @@ class Vehicle(AuditedModel):
             "year",
             "base_price",
         ),
+        # Trigram indexes for substring matching on free-text fields
+        Index(
+            "ix_vehicles_make_trgm",
+            "make",
+            postgresql_using="gin",
+            postgresql_ops={"make": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_vehicles_model_trgm",
+            "model",
+            postgresql_using="gin",
+            postgresql_ops={"model": "gin_trgm_ops"},
+        ),
+        # GIN index for full-text search
+        Index(
+            "ix_vehicles_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        # Normalized equality indexes for enumerated filters
+        Index(
+            "ix_vehicles_body_style_lower",
+            text("lower(body_style)"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_vehicles_fuel_type_lower",
+            text("lower(fuel_type)"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Keyset pagination indexes for the year and price sorts
+        Index(
+            "ix_vehicles_year_id_active",
+            "year",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_vehicles_base_price_id_active",
+            "base_price",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
         # Check constraints for data validation
         CheckConstraint(
             "length(make) >= 1",
@@ -13,7 +13,7 @@ from typing import AsyncIterator
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
@@ -28,6 +28,9 @@ from src.api.v1.payments import router as payments_router
 from src.api.v1.recommendations import router as recommendations_router
 from src.api.v1.saved_configurations import router as saved_configurations_router
 from src.api.v1.vehicles import router as vehicles_router
+from src.cache.local_cache import close_tiered_cache
+from src.cache.metrics import render_metrics
+from src.cache.negative_cache import NegativeCache, get_negative_cache
 from src.core.config import get_settings
 from src.core.logging import (
     clear_context,
@@ -37,7 +40,12 @@ from src.core.logging import (
     set_request_id,
 )
 from src.core.security import get_csp_headers
+from src.services.cache.access_recorder import (
+    close_access_recorder,
+    get_access_recorder,
+)
 from src.database.connection import get_db_session
+from src.services.outbox.relay import close_outbox_relay, get_outbox_relay
 
 # Configure logging before application initialization
 configure_logging()
@@ -124,6 +132,85 @@ async def update_recommendation_models():
         await asyncio.sleep(3600)  # Run every hour
 
 
+async def refresh_lookup_filters():
+    """
+    Background task to rebuild the VIN and share token Bloom filters.
+
+    Checks every five minutes; the negative cache's rebuild lock limits
+    actual rebuilds to one per configured interval across all instances.
+    """
+    from src.services.saved_configurations.service import SavedConfigurationService
+    from src.services.vehicles.repository import VehicleRepository
+
+    while True:
+        try:
+            negative_cache = await get_negative_cache()
+            async with get_db_session() as session:
+                await negative_cache.rebuild_filter(
+                    NegativeCache.VIN, VehicleRepository(session).stream_vins()
+                )
+            async with get_db_session() as session:
+                await negative_cache.rebuild_filter(
+                    NegativeCache.SHARE_TOKEN,
+                    SavedConfigurationService(session).stream_share_tokens(),
+                )
+        except Exception as e:
+            logger.error(
+                "Failed to rebuild lookup filters",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+        await asyncio.sleep(300)  # Run every 5 minutes
+
+
+async def refresh_autocomplete_index():
+    """
+    Background task to keep the autocomplete index current.
+
+    Rebuilds the index when the outbox relay has marked it stale or it has
+    exceeded its maximum age; the first iteration builds it at startup.
+    """
+    from src.services.search.autocomplete import get_autocomplete_index
+
+    settings = get_settings()
+    while True:
+        try:
+            autocomplete = await get_autocomplete_index()
+            if autocomplete.needs_refresh():
+                await autocomplete.refresh()
+        except Exception as e:
+            logger.error(
+                "Failed to refresh autocomplete index",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+        await asyncio.sleep(settings.autocomplete_refresh_interval)
+
+
+async def refresh_facet_counts():
+    """
+    Background task to keep the facet counts view current.
+
+    Used when Elasticsearch is disabled. Refreshes the materialized view
+    when the outbox relay has marked it stale or it has exceeded its
+    maximum age.
+    """
+    from src.services.vehicles.facet_counts import get_facet_count_refresher
+
+    while True:
+        try:
+            refresher = await get_facet_count_refresher()
+            if refresher.needs_refresh():
+                await refresher.refresh()
+        except Exception as e:
+            logger.error(
+                "Failed to refresh facet counts",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+        await asyncio.sleep(30)  # Check every 30 seconds
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
@@ -156,6 +243,20 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     cart_cleanup_task = asyncio.create_task(cleanup_expired_carts())
     reservation_cleanup_task = asyncio.create_task(cleanup_expired_reservations())
     recommendation_update_task = asyncio.create_task(update_recommendation_models())
+    lookup_filter_task = asyncio.create_task(refresh_lookup_filters())
+    autocomplete_task = (
+        asyncio.create_task(refresh_autocomplete_index())
+        if settings.autocomplete_enabled
+        else None
+    )
+    facet_counts_task = (
+        asyncio.create_task(refresh_facet_counts())
+        if not settings.elasticsearch_enabled
+        else None
+    )
+    await (await get_access_recorder()).start()
+    if settings.outbox_relay_enabled:
+        await (await get_outbox_relay()).start()
     logger.info("Background tasks started for cart, reservation cleanup, and recommendation model updates")
 
     yield
@@ -167,6 +268,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         cart_cleanup_task.cancel()
         reservation_cleanup_task.cancel()
         recommendation_update_task.cancel()
+        lookup_filter_task.cancel()
         try:
             await cart_cleanup_task
         except asyncio.CancelledError:
@@ -179,8 +281,23 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             await recommendation_update_task
         except asyncio.CancelledError:
             pass
+        try:
+            await lookup_filter_task
+        except asyncio.CancelledError:
+            pass
+        for optional_task in (autocomplete_task, facet_counts_task):
+            if optional_task is None:
+                continue
+            optional_task.cancel()
+            try:
+                await optional_task
+            except asyncio.CancelledError:
+                pass
         logger.info("Background tasks stopped")
         # Cleanup resources here
+        await close_outbox_relay()
+        await close_access_recorder()
+        await close_tiered_cache()
         logger.info("Resources cleaned up successfully")
 
 
@@ -466,6 +583,32 @@ async def liveness_check() -> dict[str, str]:
     }
 
 
+@app.get(
+    "/metrics",
+    tags=["Health"],
+    summary="Prometheus metrics endpoint",
+    response_description="Metrics in the Prometheus text format",
+    include_in_schema=False,
+)
+async def metrics_endpoint() -> Response:
+    """
+    Expose cache and process metrics for Prometheus scraping.
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+    """
+    try:
+        payload, content_type = render_metrics()
+    except RuntimeError as e:
+        logger.warning("Metrics unavailable", error=str(e))
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable", "detail": str(e)},
+        )
+
+    return Response(content=payload, media_type=content_type)
+
+
 # Include authentication router
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["Authentication"])
 
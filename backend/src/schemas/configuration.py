@@ -326,6 +326,163 @@ class ValidationResult(BaseModel):
     }
 
 
+class IncrementalValidationRequest(BaseModel):
+    """Schema for validating changes to a previously validated configuration."""
+
+    state_token: Optional[str] = Field(
+        None,
+        description="Token returned by the previous validation; omit to start",
+        max_length=65536,
+    )
+    selected_options: list[UUID] = Field(
+        default_factory=list,
+        description="Starting option selection when no state token is given",
+        max_length=100,
+    )
+    selected_packages: list[UUID] = Field(
+        default_factory=list,
+        description="Starting package selection when no state token is given",
+        max_length=20,
+    )
+    added_options: list[UUID] = Field(
+        default_factory=list,
+        description="Options added since the previous validation",
+        max_length=100,
+    )
+    removed_options: list[UUID] = Field(
+        default_factory=list,
+        description="Options removed since the previous validation",
+        max_length=100,
+    )
+    added_packages: list[UUID] = Field(
+        default_factory=list,
+        description="Packages added since the previous validation",
+        max_length=20,
+    )
+    removed_packages: list[UUID] = Field(
+        default_factory=list,
+        description="Packages removed since the previous validation",
+        max_length=20,
+    )
+    trim: Optional[str] = Field(
+        None,
+        description="Vehicle trim level when no state token is given",
+        max_length=50,
+    )
+    year: Optional[int] = Field(
+        None,
+        description="Vehicle model year when no state token is given",
+        ge=1900,
+        le=2100,
+    )
+
+    @model_validator(mode="after")
+    def validate_changes(self) -> "IncrementalValidationRequest":
+        """Validate that no option or package is both added and removed."""
+        if set(self.added_options) & set(self.removed_options):
+            raise ValueError("Options cannot be both added and removed")
+
+        if set(self.added_packages) & set(self.removed_packages):
+            raise ValueError("Packages cannot be both added and removed")
+
+        return self
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "state_token": "eyJ2IjoiMTIzZTQ1NjcifQ.3f1c9a0b6d2e4f7a",
+                "added_options": ["123e4567-e89b-12d3-a456-426614174010"],
+                "removed_options": [],
+                "added_packages": [],
+                "removed_packages": [],
+            }
+        }
+    }
+
+
+class IncrementalValidationResult(BaseModel):
+    """Schema for the result of an incremental configuration validation."""
+
+    is_valid: bool = Field(
+        ...,
+        description="Whether the configuration is valid",
+    )
+    errors: list[str] = Field(
+        default_factory=list,
+        description="List of validation error messages",
+    )
+    state_token: str = Field(
+        ...,
+        description="Token to send with the next change to this configuration",
+    )
+    selected_options: list[str] = Field(
+        default_factory=list,
+        description="Option selection after applying the changes",
+    )
+    selected_packages: list[str] = Field(
+        default_factory=list,
+        description="Package selection after applying the changes",
+    )
+    disabled_options: list[str] = Field(
+        default_factory=list,
+        description="Options that conflict with the selection and cannot be added",
+    )
+    required_options: list[str] = Field(
+        default_factory=list,
+        description="Options the selection requires that are not yet selected",
+    )
+
+
+class ConfigurationCompletionRequest(BaseModel):
+    """Schema for finding the cheapest valid completions of a selection."""
+
+    selected_options: list[UUID] = Field(
+        default_factory=list,
+        description="Options every completion must keep",
+        max_length=100,
+    )
+    selected_packages: list[UUID] = Field(
+        default_factory=list,
+        description="Packages every completion must keep",
+        max_length=20,
+    )
+    trim: Optional[str] = Field(
+        None,
+        description="Vehicle trim level",
+        max_length=50,
+    )
+    year: Optional[int] = Field(
+        None,
+        description="Vehicle model year",
+        ge=1900,
+        le=2100,
+    )
+    region: Optional[str] = Field(
+        None,
+        description="Region code for tax calculation",
+        max_length=10,
+    )
+    limit: int = Field(
+        5,
+        description="Maximum number of completions, cheapest first",
+        ge=1,
+        le=100,
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "selected_options": ["123e4567-e89b-12d3-a456-426614174010"],
+                "selected_packages": [],
+                "trim": "Sport",
+                "year": 2024,
+                "region": "CA",
+                "limit": 3,
+            }
+        }
+    }
+
+
 class ConfigurationRequest(BaseModel):
     """Schema for vehicle configuration request."""
 
@@ -414,6 +414,14 @@ class VehicleListResponse(BaseModel):
         ge=0,
         description="Total number of pages",
     )
+    total_is_estimate: bool = Field(
+        False,
+        description="Whether total is a planner estimate rather than an exact count",
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, absent on the last page",
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -452,9 +460,15 @@ class VehicleSearchRequest(BaseModel):
     transmission: Optional[str] = Field(None, max_length=100)
     seating_capacity_min: Optional[int] = Field(None, ge=1, le=20)
     seating_capacity_max: Optional[int] = Field(None, ge=1, le=20)
+    horsepower_min: Optional[int] = Field(None, ge=0, le=2000)
+    horsepower_max: Optional[int] = Field(None, ge=0, le=2000)
+    mpg_city_min: Optional[int] = Field(None, ge=0, le=200)
+    mpg_city_max: Optional[int] = Field(None, ge=0, le=200)
+    mpg_highway_min: Optional[int] = Field(None, ge=0, le=200)
+    mpg_highway_max: Optional[int] = Field(None, ge=0, le=200)
     custom_attributes: Optional[dict[str, Any]] = Field(
         None,
-        description="Filter by custom attributes",
+        description="Filter by specification values (matched by JSON type)",
     )
     search_query: Optional[str] = Field(
         None,
@@ -476,6 +490,16 @@ class VehicleSearchRequest(BaseModel):
         le=100,
         description="Items per page",
     )
+    cursor: Optional[str] = Field(
+        None,
+        max_length=4096,
+        description="Cursor from a previous page's next_cursor; overrides page",
+    )
+    total_mode: str = Field(
+        "exact",
+        pattern="^(exact|estimated)$",
+        description="Count matches exactly or use a cheaper estimate",
+    )
     sort_by: Optional[str] = Field(
         None,
         max_length=50,
@@ -507,8 +531,31 @@ class VehicleSearchRequest(BaseModel):
                     "seating_capacity_min cannot be greater than seating_capacity_max"
                 )
 
+        for key, (low, high) in self.spec_ranges().items():
+            if low is not None and high is not None and low > high:
+                raise ValueError(f"{key}_min cannot be greater than {key}_max")
+
         return self
 
+    def spec_ranges(self) -> dict[str, tuple[Optional[int], Optional[int]]]:
+        """
+        Get the requested specification range filters.
+
+        Returns:
+            Inclusive (min, max) bounds keyed by specification key, only for
+            keys with at least one bound
+        """
+        ranges = {
+            "horsepower": (self.horsepower_min, self.horsepower_max),
+            "mpg_city": (self.mpg_city_min, self.mpg_city_max),
+            "mpg_highway": (self.mpg_highway_min, self.mpg_highway_max),
+        }
+        return {
+            key: bounds
+            for key, bounds in ranges.items()
+            if bounds != (None, None)
+        }
+
     @field_validator("search_query")
     @classmethod
     def validate_search_query(cls, v: Optional[str]) -> Optional[str]:
@@ -0,0 +1,344 @@
+"""
+Vehicle access recording for popularity-driven cache warming.
+
+This module records vehicle detail views and search impressions into the
+Redis sorted sets that CacheWarmingService reads. Increments are buffered in
+process memory and flushed periodically with one pipelined round trip, so
+recording adds no Redis latency to request handling. Counts are kept in
+hourly buckets that are merged with ZUNIONSTORE into a rolling popularity
+window and an exponentially decayed trending window.
+"""
+
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from src.cache.redis_client import RedisClient, get_redis_client
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class VehicleAccessRecorder:
+    """
+    Buffered recorder of vehicle access counts.
+
+    Provides a non-blocking record call for request handlers and a
+    background flush loop that writes hourly buckets and rebuilds the
+    aggregated popularity and trending sorted sets.
+    """
+
+    # Aggregated sorted sets read by CacheWarmingService
+    ACCESS_COUNTS_KEY = "vehicle:access_counts"
+    TRENDING_COUNTS_KEY = "vehicle:trending_counts"
+
+    # Hourly bucket sorted sets
+    BUCKET_KEY_PREFIX = "vehicle:access_counts:hour"
+
+    # Window configuration
+    POPULAR_WINDOW_HOURS = 24
+    TRENDING_WINDOW_HOURS = 6
+    TRENDING_DECAY = 0.5  # weight multiplier per hour of age
+
+    # Flush configuration
+    DEFAULT_FLUSH_INTERVAL = 5.0  # seconds
+    DEFAULT_MAX_BUFFERED_KEYS = 10000
+    DEFAULT_AGGREGATE_INTERVAL = 60.0  # seconds between window rebuilds
+
+    # Weight of a search result impression relative to a detail view
+    SEARCH_IMPRESSION_WEIGHT = 0.1
+
+    def __init__(
+        self,
+        redis_client: Optional[RedisClient] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_buffered_keys: int = DEFAULT_MAX_BUFFERED_KEYS,
+        aggregate_interval: float = DEFAULT_AGGREGATE_INTERVAL,
+    ):
+        """
+        Initialize access recorder.
+
+        Args:
+            redis_client: Redis client instance (uses global if None)
+            flush_interval: Seconds between background flushes
+            max_buffered_keys: Distinct vehicles buffered before an early flush
+            aggregate_interval: Seconds between popularity window rebuilds
+        """
+        self._redis_client = redis_client
+        self._flush_interval = flush_interval
+        self._max_buffered_keys = max_buffered_keys
+        self._aggregate_interval = aggregate_interval
+        self._buffer: Counter[str] = Counter()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._early_flush_task: Optional[asyncio.Task] = None
+        self._last_aggregate: Optional[datetime] = None
+        self._is_running = False
+        self._stats = {
+            "recorded": 0,
+            "flushes": 0,
+            "flushed_keys": 0,
+            "failed_flushes": 0,
+            "aggregations": 0,
+        }
+
+    async def _get_redis_client(self) -> RedisClient:
+        """
+        Get Redis client instance.
+
+        Returns:
+            Redis client instance
+
+        Raises:
+            ConnectionError: If Redis connection fails
+        """
+        if self._redis_client is None:
+            self._redis_client = await get_redis_client()
+        return self._redis_client
+
+    @classmethod
+    def bucket_key(cls, hour: datetime) -> str:
+        """
+        Get the sorted set key of an hourly bucket.
+
+        Args:
+            hour: Any time within the bucket hour (UTC)
+
+        Returns:
+            Bucket key
+        """
+        return f"{cls.BUCKET_KEY_PREFIX}:{hour.strftime('%Y%m%d%H')}"
+
+    def record(self, vehicle_id: UUID | str, weight: float = 1.0) -> None:
+        """
+        Record one access to a vehicle.
+
+        Never touches Redis; the increment is flushed in the background.
+
+        Args:
+            vehicle_id: Vehicle identifier
+            weight: Access weight (1.0 for a detail view)
+        """
+        self._buffer[str(vehicle_id)] += weight
+        self._stats["recorded"] += 1
+
+        if len(self._buffer) >= self._max_buffered_keys:
+            self._schedule_early_flush()
+
+    def record_many(
+        self, vehicle_ids: Iterable[UUID | str], weight: float = 1.0
+    ) -> None:
+        """
+        Record accesses to several vehicles, such as a page of search results.
+
+        Args:
+            vehicle_ids: Vehicle identifiers
+            weight: Access weight per vehicle
+        """
+        for vehicle_id in vehicle_ids:
+            self.record(vehicle_id, weight)
+
+    def _schedule_early_flush(self) -> None:
+        """Flush ahead of schedule when the buffer is full."""
+        if self._early_flush_task is not None and not self._early_flush_task.done():
+            return
+        try:
+            self._early_flush_task = asyncio.get_running_loop().create_task(
+                self.flush()
+            )
+        except RuntimeError:
+            # No running loop; the next scheduled flush picks it up
+            pass
+
+    async def flush(self, now: Optional[datetime] = None) -> int:
+        """
+        Write buffered increments to the current hourly bucket.
+
+        Rebuilds the aggregated windows when the aggregate interval has
+        elapsed. On failure the increments are returned to the buffer.
+
+        Args:
+            now: Current time (UTC), for testing
+
+        Returns:
+            Number of distinct vehicles flushed
+        """
+        async with self._flush_lock:
+            if not self._buffer and not self._aggregate_due(now):
+                return 0
+
+            now = now or datetime.now(timezone.utc)
+            pending, self._buffer = self._buffer, Counter()
+            aggregate = self._aggregate_due(now)
+
+            try:
+                redis = await self._get_redis_client()
+                async with redis.pipeline() as pipe:
+                    if pending:
+                        bucket = self.bucket_key(now)
+                        for vehicle_id, count in pending.items():
+                            pipe.zincrby(bucket, count, vehicle_id)
+                        pipe.expire(
+                            bucket,
+                            int(
+                                timedelta(
+                                    hours=self.POPULAR_WINDOW_HOURS + 1
+                                ).total_seconds()
+                            ),
+                        )
+                    if aggregate:
+                        self._queue_aggregation(pipe, now)
+
+            except Exception as e:
+                self._buffer.update(pending)
+                self._stats["failed_flushes"] += 1
+                logger.error(
+                    "Failed to flush vehicle access counts",
+                    pending=len(pending),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                return 0
+
+            if aggregate:
+                self._last_aggregate = now
+                self._stats["aggregations"] += 1
+            self._stats["flushes"] += 1
+            self._stats["flushed_keys"] += len(pending)
+
+            logger.debug(
+                "Vehicle access counts flushed",
+                vehicles=len(pending),
+                aggregated=aggregate,
+            )
+
+            return len(pending)
+
+    def _aggregate_due(self, now: Optional[datetime]) -> bool:
+        """Check whether the aggregated windows should be rebuilt."""
+        if self._last_aggregate is None:
+            return True
+        now = now or datetime.now(timezone.utc)
+        elapsed = (now - self._last_aggregate).total_seconds()
+        return elapsed >= self._aggregate_interval
+
+    def _queue_aggregation(self, pipe: Any, now: datetime) -> None:
+        """
+        Queue ZUNIONSTORE commands rebuilding the aggregated windows.
+
+        The popularity window sums the last POPULAR_WINDOW_HOURS buckets.
+        The trending window weights each bucket by TRENDING_DECAY per hour
+        of age so that recent activity dominates.
+
+        Args:
+            pipe: Pipeline to queue commands on
+            now: Current time (UTC)
+        """
+        popular = [
+            self.bucket_key(now - timedelta(hours=age))
+            for age in range(self.POPULAR_WINDOW_HOURS)
+        ]
+        pipe.zunionstore(self.ACCESS_COUNTS_KEY, popular)
+
+        trending = {
+            self.bucket_key(now - timedelta(hours=age)): self.TRENDING_DECAY**age
+            for age in range(self.TRENDING_WINDOW_HOURS)
+        }
+        pipe.zunionstore(self.TRENDING_COUNTS_KEY, trending)
+
+    async def _flush_loop(self) -> None:
+        """Background loop flushing the buffer at a fixed interval."""
+        while self._is_running:
+            try:
+                await asyncio.sleep(self._flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(
+                    "Error in access recorder flush loop",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+    async def start(self) -> None:
+        """
+        Start the background flush loop.
+
+        Raises:
+            RuntimeError: If recorder is already running
+        """
+        if self._is_running:
+            raise RuntimeError("Access recorder is already running")
+
+        self._is_running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+        logger.info(
+            "Vehicle access recorder started",
+            flush_interval=self._flush_interval,
+        )
+
+    async def stop(self) -> None:
+        """
+        Stop the background flush loop and flush remaining increments.
+        """
+        if not self._is_running:
+            return
+
+        self._is_running = False
+
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+
+        await self.flush()
+
+        logger.info("Vehicle access recorder stopped")
+
+    def get_statistics(self) -> dict[str, Any]:
+        """
+        Get access recorder statistics.
+
+        Returns:
+            Dictionary containing recording and flush statistics
+        """
+        return {
+            **self._stats,
+            "buffered_keys": len(self._buffer),
+            "is_running": self._is_running,
+        }
+
+
+_access_recorder: Optional[VehicleAccessRecorder] = None
+
+
+async def get_access_recorder() -> VehicleAccessRecorder:
+    """
+    Get or create global vehicle access recorder instance.
+
+    Returns:
+        Singleton access recorder instance
+    """
+    global _access_recorder
+
+    if _access_recorder is None:
+        _access_recorder = VehicleAccessRecorder()
+
+    return _access_recorder
+
+
+async def close_access_recorder() -> None:
+    """
+    Stop the global access recorder, flushing buffered increments.
+    """
+    global _access_recorder
+
+    if _access_recorder is not None:
+        await _access_recorder.stop()
+        _access_recorder = None
@@ -11,12 +11,15 @@ from datetime import datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID
 
+from src.cache import metrics
 from src.cache.redis_client import get_redis_client
 from src.core.logging import get_logger
 from src.database.connection import get_session
 from src.schemas.vehicles import VehicleResponse
+from src.services.cache.access_recorder import VehicleAccessRecorder
 from src.services.cache.vehicle_cache import VehicleCache, get_vehicle_cache
 from src.services.vehicles.repository import VehicleRepository
+from src.services.vehicles.service import VehicleService
 
 logger = get_logger(__name__)
 
@@ -33,7 +36,7 @@ class CacheWarmingService:
     # Warming configuration
     DEFAULT_TOP_VEHICLES_COUNT = 100
     DEFAULT_WARMING_INTERVAL = 3600  # 1 hour
-    DEFAULT_BATCH_SIZE = 10
+    DEFAULT_BATCH_SIZE = 500
     DEFAULT_BATCH_DELAY = 0.1  # seconds between batches
 
     # Access pattern thresholds
@@ -112,13 +115,13 @@ class CacheWarmingService:
         redis = await get_redis_client()
 
         try:
-            access_key = "vehicle:access_counts"
-            popular_vehicles = await redis.client.zrevrange(
+            access_key = VehicleAccessRecorder.ACCESS_COUNTS_KEY
+            popular_vehicles = await redis.zrevrange(
                 access_key, 0, limit - 1, withscores=True
             )
 
             vehicle_ids = [
-                (UUID(vid.decode()), int(score))
+                (UUID(vid), int(score))
                 for vid, score in popular_vehicles
             ]
 
@@ -156,13 +159,13 @@ class CacheWarmingService:
         redis = await get_redis_client()
 
         try:
-            trending_key = "vehicle:trending_counts"
-            trending_vehicles = await redis.client.zrevrange(
+            trending_key = VehicleAccessRecorder.TRENDING_COUNTS_KEY
+            trending_vehicles = await redis.zrevrange(
                 trending_key, 0, limit - 1, withscores=True
             )
 
             vehicle_ids = [
-                (UUID(vid.decode()), int(score))
+                (UUID(vid), int(score))
                 for vid, score in trending_vehicles
             ]
 
@@ -245,38 +248,19 @@ class CacheWarmingService:
 
         try:
             async with get_session() as session:
-                repository = VehicleRepository(session)
+                vehicles = await VehicleRepository(session).get_many_by_ids(
+                    vehicle_ids
+                )
+                to_response = VehicleService(session=session)._to_response
 
-                for vehicle_id in vehicle_ids:
+                for vehicle in vehicles:
                     try:
-                        vehicle = await repository.get_by_id(
-                            vehicle_id, include_inventory=True
-                        )
-
-                        if vehicle:
-                            vehicle_response = VehicleResponse(
-                                id=vehicle.id,
-                                make=vehicle.make,
-                                model=vehicle.model,
-                                year=vehicle.year,
-                                trim=vehicle.trim,
-                                body_style=vehicle.body_style,
-                                fuel_type=vehicle.fuel_type,
-                                base_price=vehicle.base_price,
-                                msrp=vehicle.msrp,
-                                vin=vehicle.vin,
-                                specifications=vehicle.specifications or {},
-                                features=vehicle.features or {},
-                                custom_attributes=vehicle.custom_attributes or {},
-                                created_at=vehicle.created_at,
-                                updated_at=vehicle.updated_at,
-                            )
-                            vehicle_data[vehicle_id] = vehicle_response
+                        vehicle_data[vehicle.id] = to_response(vehicle)
 
                     except Exception as e:
                         logger.warning(
                             "Failed to load vehicle data",
-                            vehicle_id=str(vehicle_id),
+                            vehicle_id=str(vehicle.id),
                             error=str(e),
                         )
                         continue
@@ -520,6 +504,7 @@ class CacheWarmingService:
             self._stats["warming_cycles"] += 1
             self._stats["vehicles_warmed"] += total_warmed
             self._stats["last_warming_time"] = start_time
+            metrics.record_warming_cycle(True, total_warmed, duration)
 
             avg_duration = self._stats["average_warming_duration"]
             cycles = self._stats["warming_cycles"]
@@ -538,6 +523,9 @@ class CacheWarmingService:
 
         except Exception as e:
             self._stats["failed_warmings"] += 1
+            metrics.record_warming_cycle(
+                False, 0, (datetime.utcnow() - start_time).total_seconds()
+            )
             logger.error(
                 "Cache warming cycle failed",
                 error=str(e),
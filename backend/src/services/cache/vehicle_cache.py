@@ -7,23 +7,54 @@ Implements cache-aside pattern for optimal performance and data consistency.
 """
 
 import asyncio
-import json
+import math
+import random
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Iterable, Optional
 from uuid import UUID
 
+from src.cache import metrics
+from src.cache.local_cache import (
+    TieredCache,
+    get_tiered_cache,
+    make_tag,
+    vehicle_tag,
+)
 from src.cache.redis_client import (
     CacheKeyManager,
     RedisClient,
     get_cache_key_manager,
     get_redis_client,
 )
+from src.cache.single_flight import SingleFlight, get_single_flight
+from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.schemas.vehicles import VehicleListResponse, VehicleResponse
+from src.services.cache import cache_keys
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class FreshnessPolicy:
+    """
+    Soft-TTL settings for one cache key family.
+
+    Entries are considered fresh for the family TTL (the soft TTL) and are
+    kept in Redis for stale_ttl seconds longer, during which get-or-load
+    reads serve them while a background task refreshes them.
+
+    Attributes:
+        stale_ttl: Seconds an entry may be served after its soft TTL
+        beta: Early-refresh aggressiveness; values above 1 refresh earlier
+    """
+
+    stale_ttl: int
+    beta: float = 1.0
+
+
 class VehicleCache:
     """
     Vehicle-specific caching service with cache-aside pattern.
@@ -37,8 +68,10 @@ class VehicleCache:
     VEHICLE_LIST_TTL = 3600  # 1 hour for vehicle lists
     VEHICLE_DETAIL_TTL = 86400  # 24 hours for individual vehicles
     SEARCH_RESULTS_TTL = 1800  # 30 minutes for search results
+    SEARCH_FACETS_TTL = 7200  # 2 hours for search facet aggregations
     INVENTORY_TTL = 300  # 5 minutes for inventory data
     PRICE_RANGE_TTL = 3600  # 1 hour for price range queries
+    WARMING_TTL_JITTER = 0.1  # up to +10% TTL on bulk-warmed entries
 
     # Cache key prefixes
     LIST_PREFIX = "vehicles:list"
@@ -47,10 +80,39 @@ class VehicleCache:
     INVENTORY_PREFIX = "vehicles:inventory"
     PRICE_RANGE_PREFIX = "vehicles:price_range"
 
+    # Invalidation tags for each key family
+    LIST_TAG = "vehicle_lists"
+    DETAIL_TAG = "vehicle_details"
+    SEARCH_TAG = "vehicle_search"
+    INVENTORY_TAG = "vehicle_inventory"
+    PRICE_RANGE_TAG = "vehicle_price_ranges"
+
+    # Key families used to configure freshness policies
+    LIST_FAMILY = "list"
+    DETAIL_FAMILY = "detail"
+    SEARCH_FAMILY = "search"
+    FACETS_FAMILY = "facets"
+    INVENTORY_FAMILY = "inventory"
+    PRICE_RANGE_FAMILY = "price_range"
+
+    # Marker identifying soft-TTL envelopes stored in Redis
+    ENVELOPE_KEY = "__swr__"
+
+    # Recompute time assumed for entries written without a measured one
+    DEFAULT_COMPUTE_TIME = 0.05
+
+    # Lifetime of the lock held by a background refresh
+    REFRESH_LOCK_PREFIX = "lock:refresh"
+    REFRESH_LOCK_TTL_MS = 10000
+
     def __init__(
         self,
         redis_client: Optional[RedisClient] = None,
         key_manager: Optional[CacheKeyManager] = None,
+        tiered_cache: Optional[TieredCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        freshness_policies: Optional[dict[str, FreshnessPolicy]] = None,
+        search_key_manager: Optional[cache_keys.CacheKeyManager] = None,
     ):
         """
         Initialize vehicle cache service.
@@ -58,20 +120,41 @@ class VehicleCache:
         Args:
             redis_client: Redis client instance (uses global if None)
             key_manager: Cache key manager (uses global if None)
+            tiered_cache: Optional L1/L2 cache used for vehicle details
+            single_flight: Optional coalescer for concurrent cache misses
+            freshness_policies: Soft-TTL policies keyed by key family;
+                families without a policy use hard TTLs only
+            search_key_manager: Key manager for hashed search facet keys
+                (uses global if None)
         """
         self._redis_client = redis_client
         self._key_manager = key_manager or get_cache_key_manager()
+        self._search_key_manager = (
+            search_key_manager or cache_keys.get_cache_key_manager()
+        )
+        self._tiered_cache = tiered_cache
+        self._single_flight = single_flight
+        self._freshness_policies = dict(freshness_policies or {})
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
         self._cache_stats = {
             "hits": 0,
             "misses": 0,
             "invalidations": 0,
             "warming_operations": 0,
         }
+        self._freshness_stats = {
+            "stale_hits": 0,
+            "early_expirations": 0,
+            "background_refreshes": 0,
+            "refresh_failures": 0,
+        }
 
         logger.info(
             "Vehicle cache service initialized",
             list_ttl=self.VEHICLE_LIST_TTL,
             detail_ttl=self.VEHICLE_DETAIL_TTL,
+            local_cache_enabled=tiered_cache is not None,
+            soft_ttl_families=sorted(self._freshness_policies),
         )
 
     async def _get_redis_client(self) -> RedisClient:
@@ -88,6 +171,105 @@ class VehicleCache:
             self._redis_client = await get_redis_client()
         return self._redis_client
 
+    def _wrap_entry(
+        self,
+        family: str,
+        value: Any,
+        ttl: int,
+        compute_time: Optional[float] = None,
+    ) -> Any:
+        """
+        Wrap a value in a soft-TTL envelope if its family has a policy.
+
+        Args:
+            family: Cache key family
+            value: JSON-serializable value
+            ttl: Soft TTL in seconds
+            compute_time: Seconds taken to produce the value
+
+        Returns:
+            Envelope dictionary, or the value unchanged
+        """
+        if family not in self._freshness_policies:
+            return value
+
+        return {
+            self.ENVELOPE_KEY: 1,
+            "value": value,
+            "stored_at": time.time(),
+            "soft_ttl": ttl,
+            "compute_time": compute_time or self.DEFAULT_COMPUTE_TIME,
+        }
+
+    def _hard_ttl(self, family: str, ttl: int) -> int:
+        """
+        Get the Redis expiration for an entry of a key family.
+
+        Args:
+            family: Cache key family
+            ttl: Soft TTL in seconds
+
+        Returns:
+            Soft TTL plus the family's stale window
+        """
+        policy = self._freshness_policies.get(family)
+        return ttl + policy.stale_ttl if policy else ttl
+
+    def _unwrap_entry(self, family: str, raw: Any) -> tuple[Any, bool]:
+        """
+        Unwrap a cached value and decide whether it needs refreshing.
+
+        Uses probabilistic early expiration (XFetch): an entry is due once
+        now - compute_time * beta * ln(rand) passes its soft expiry, so
+        refreshes of hot keys spread out ahead of the deadline instead of
+        all landing on it.
+
+        Args:
+            family: Cache key family
+            raw: Value as read from the cache
+
+        Returns:
+            Tuple of (value, needs_refresh)
+        """
+        if not isinstance(raw, dict) or self.ENVELOPE_KEY not in raw:
+            return raw, False
+
+        policy = self._freshness_policies.get(family)
+        beta = policy.beta if policy else 1.0
+        soft_expiry = raw["stored_at"] + raw["soft_ttl"]
+        now = time.time()
+
+        if now >= soft_expiry:
+            metrics.record_family_lookup(f"vehicles:{family}", "stale")
+            return raw["value"], True
+
+        gap = -raw["compute_time"] * beta * math.log(1.0 - random.random())
+        if now + gap >= soft_expiry:
+            self._freshness_stats["early_expirations"] += 1
+            metrics.record_family_lookup(f"vehicles:{family}", "early_refresh")
+            return raw["value"], True
+
+        return raw["value"], False
+
+    def _read_fresh(self, family: str, raw: Any) -> Any:
+        """
+        Unwrap a cached value, treating entries due for refresh as misses.
+
+        Plain getters have no loader to refresh with, so an entry past its
+        (probabilistic) soft expiry makes the caller recompute it.
+
+        Args:
+            family: Cache key family
+            raw: Value as read from the cache
+
+        Returns:
+            Cached value, or None if missing or due for refresh
+        """
+        if raw is None:
+            return None
+        value, needs_refresh = self._unwrap_entry(family, raw)
+        return None if needs_refresh else value
+
     def _make_list_key(self, filters: Optional[dict[str, Any]] = None) -> str:
         """
         Generate cache key for vehicle list queries.
@@ -110,6 +292,33 @@ class VehicleCache:
         filter_str = ":".join(filter_parts) if filter_parts else "all"
         return self._key_manager.make_key(self.LIST_PREFIX, filter_str)
 
+    @staticmethod
+    def _make_tags(
+        family_tag: str,
+        filters: Optional[dict[str, Any]] = None,
+        vehicle_id: Optional[UUID] = None,
+        make: Optional[str] = None,
+    ) -> list[str]:
+        """
+        Build invalidation tags for a cache entry.
+
+        Args:
+            family_tag: Tag of the key family the entry belongs to
+            filters: Optional filter parameters (tagged by make if present)
+            vehicle_id: Optional vehicle the entry is derived from
+            make: Optional vehicle make the entry is scoped to
+
+        Returns:
+            List of invalidation tags
+        """
+        tags = [family_tag]
+        if vehicle_id is not None:
+            tags.append(vehicle_tag(vehicle_id))
+        make = make or (filters or {}).get("make")
+        if make:
+            tags.append(make_tag(str(make)))
+        return tags
+
     def _make_detail_key(self, vehicle_id: UUID) -> str:
         """
         Generate cache key for vehicle detail.
@@ -144,6 +353,21 @@ class VehicleCache:
 
         return self._key_manager.make_key(*key_parts)
 
+    def _make_facets_key(
+        self, query: str, filters: Optional[dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate cache key for search facets.
+
+        Args:
+            query: Search query string
+            filters: Optional filter parameters
+
+        Returns:
+            Cache key for search facets
+        """
+        return self._search_key_manager.search_facets_key(query, filters)
+
     def _make_inventory_key(self, vehicle_id: UUID) -> str:
         """
         Generate cache key for vehicle inventory.
@@ -196,6 +420,7 @@ class VehicleCache:
 
         try:
             cached_data = await redis.get_json(cache_key)
+            cached_data = self._read_fresh(self.LIST_FAMILY, cached_data)
 
             if cached_data is not None:
                 self._cache_stats["hits"] += 1
@@ -228,6 +453,7 @@ class VehicleCache:
         data: VehicleListResponse,
         filters: Optional[dict[str, Any]] = None,
         ttl: Optional[int] = None,
+        compute_time: Optional[float] = None,
     ) -> bool:
         """
         Cache vehicle list with TTL.
@@ -236,6 +462,7 @@ class VehicleCache:
             data: Vehicle list response to cache
             filters: Optional filter parameters
             ttl: Time-to-live in seconds (uses default if None)
+            compute_time: Seconds taken to produce the data (for early refresh)
 
         Returns:
             True if cached successfully, False otherwise
@@ -248,8 +475,15 @@ class VehicleCache:
         ttl = ttl or self.VEHICLE_LIST_TTL
 
         try:
-            cache_data = data.model_dump(mode="json")
-            success = await redis.set_json(cache_key, cache_data, ex=ttl)
+            cache_data = self._wrap_entry(
+                self.LIST_FAMILY, data.model_dump(mode="json"), ttl, compute_time
+            )
+            success = await redis.set_json(
+                cache_key,
+                cache_data,
+                ex=self._hard_ttl(self.LIST_FAMILY, ttl),
+                tags=self._make_tags(self.LIST_TAG, filters=filters),
+            )
 
             if success:
                 logger.debug(
@@ -292,7 +526,13 @@ class VehicleCache:
         cache_key = self._make_detail_key(vehicle_id)
 
         try:
-            cached_data = await redis.get_json(cache_key)
+            if self._tiered_cache is not None:
+                cached_data = await self._tiered_cache.get_json(
+                    cache_key, tags=[vehicle_tag(vehicle_id)]
+                )
+            else:
+                cached_data = await redis.get_json(cache_key)
+            cached_data = self._read_fresh(self.DETAIL_FAMILY, cached_data)
 
             if cached_data is not None:
                 self._cache_stats["hits"] += 1
@@ -321,11 +561,101 @@ class VehicleCache:
             )
             return None
 
+    async def get_vehicle_details_many(
+        self,
+        vehicle_ids: Iterable[UUID],
+        loader: Optional[
+            Callable[[list[UUID]], Awaitable[list[VehicleResponse]]]
+        ] = None,
+    ) -> dict[UUID, VehicleResponse]:
+        """
+        Get several vehicle details with one cache round trip.
+
+        Hits are read with a single MGET (after L1 when enabled). Misses are
+        passed to loader in one call and backfilled with one pipeline, so the
+        cost does not grow with the number of vehicles.
+
+        Args:
+            vehicle_ids: Vehicle UUIDs (duplicates are ignored)
+            loader: Coroutine loading missing vehicles in bulk (optional)
+
+        Returns:
+            Dictionary mapping found vehicle IDs to vehicle responses
+
+        Raises:
+            Exception: Any error raised by loader
+        """
+        unique_ids = list(dict.fromkeys(vehicle_ids))
+        if not unique_ids:
+            return {}
+
+        keys = {
+            vehicle_id: self._make_detail_key(vehicle_id) for vehicle_id in unique_ids
+        }
+        details: dict[UUID, VehicleResponse] = {}
+
+        try:
+            if self._tiered_cache is not None:
+                cached = await self._tiered_cache.get_many_json(
+                    keys.values(),
+                    tags={key: [vehicle_tag(vid)] for vid, key in keys.items()},
+                )
+            else:
+                redis = await self._get_redis_client()
+                cached = await redis.get_many_json(*keys.values())
+
+            for vehicle_id, key in keys.items():
+                data = self._read_fresh(self.DETAIL_FAMILY, cached.get(key))
+                if data is not None:
+                    details[vehicle_id] = VehicleResponse(**data)
+
+        except Exception as e:
+            logger.error(
+                "Failed to get vehicle details from cache",
+                count=len(unique_ids),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+        missing = [vid for vid in unique_ids if vid not in details]
+        self._cache_stats["hits"] += len(details)
+        self._cache_stats["misses"] += len(missing)
+
+        logger.debug(
+            "Vehicle details multi-get",
+            requested=len(unique_ids),
+            hits=len(details),
+            misses=len(missing),
+        )
+
+        if not missing or loader is None:
+            return details
+
+        loaded = await loader(missing)
+        for vehicle in loaded:
+            details[vehicle.id] = vehicle
+
+        if loaded:
+            try:
+                await self._set_vehicle_details_bulk(
+                    [vehicle.id for vehicle in loaded], loaded
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to backfill vehicle details",
+                    count=len(loaded),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+        return details
+
     async def set_vehicle_detail(
         self,
         vehicle_id: UUID,
         data: VehicleResponse,
         ttl: Optional[int] = None,
+        compute_time: Optional[float] = None,
     ) -> bool:
         """
         Cache vehicle detail with TTL.
@@ -334,6 +664,7 @@ class VehicleCache:
             vehicle_id: Vehicle UUID
             data: Vehicle response to cache
             ttl: Time-to-live in seconds (uses default if None)
+            compute_time: Seconds taken to produce the data (for early refresh)
 
         Returns:
             True if cached successfully, False otherwise
@@ -346,8 +677,21 @@ class VehicleCache:
         ttl = ttl or self.VEHICLE_DETAIL_TTL
 
         try:
-            cache_data = data.model_dump(mode="json")
-            success = await redis.set_json(cache_key, cache_data, ex=ttl)
+            cache_data = self._wrap_entry(
+                self.DETAIL_FAMILY, data.model_dump(mode="json"), ttl, compute_time
+            )
+            expire = self._hard_ttl(self.DETAIL_FAMILY, ttl)
+            tags = self._make_tags(
+                self.DETAIL_TAG, vehicle_id=vehicle_id, make=data.make
+            )
+            if self._tiered_cache is not None:
+                success = await self._tiered_cache.set_json(
+                    cache_key, cache_data, ex=expire, tags=tags
+                )
+            else:
+                success = await redis.set_json(
+                    cache_key, cache_data, ex=expire, tags=tags
+                )
 
             if success:
                 logger.debug(
@@ -396,6 +740,7 @@ class VehicleCache:
 
         try:
             cached_data = await redis.get_json(cache_key)
+            cached_data = self._read_fresh(self.SEARCH_FAMILY, cached_data)
 
             if cached_data is not None:
                 self._cache_stats["hits"] += 1
@@ -430,6 +775,7 @@ class VehicleCache:
         data: dict[str, Any],
         filters: Optional[dict[str, Any]] = None,
         ttl: Optional[int] = None,
+        compute_time: Optional[float] = None,
     ) -> bool:
         """
         Cache search results with TTL.
@@ -439,6 +785,7 @@ class VehicleCache:
             data: Search results to cache
             filters: Optional filter parameters
             ttl: Time-to-live in seconds (uses default if None)
+            compute_time: Seconds taken to produce the data (for early refresh)
 
         Returns:
             True if cached successfully, False otherwise
@@ -451,7 +798,12 @@ class VehicleCache:
         ttl = ttl or self.SEARCH_RESULTS_TTL
 
         try:
-            success = await redis.set_json(cache_key, data, ex=ttl)
+            success = await redis.set_json(
+                cache_key,
+                self._wrap_entry(self.SEARCH_FAMILY, data, ttl, compute_time),
+                ex=self._hard_ttl(self.SEARCH_FAMILY, ttl),
+                tags=self._make_tags(self.SEARCH_TAG, filters=filters),
+            )
 
             if success:
                 logger.debug(
@@ -479,6 +831,121 @@ class VehicleCache:
             )
             return False
 
+    async def get_search_facets(
+        self, query: str, filters: Optional[dict[str, Any]] = None
+    ) -> Optional[dict[str, Any]]:
+        """
+        Get cached search facets.
+
+        Args:
+            query: Search query string
+            filters: Optional filter parameters
+
+        Returns:
+            Cached facets or None if not cached
+
+        Raises:
+            ConnectionError: If Redis connection fails
+        """
+        redis = await self._get_redis_client()
+        cache_key = self._make_facets_key(query, filters)
+
+        try:
+            cached_data = await redis.get_json(cache_key)
+            cached_data = self._read_fresh(self.FACETS_FAMILY, cached_data)
+
+            if cached_data is not None:
+                self._cache_stats["hits"] += 1
+                logger.debug(
+                    "Search facets cache hit",
+                    cache_key=cache_key,
+                    query=query,
+                )
+                return cached_data
+
+            self._cache_stats["misses"] += 1
+            logger.debug(
+                "Search facets cache miss",
+                cache_key=cache_key,
+                query=query,
+            )
+            return None
+
+        except Exception as e:
+            logger.error(
+                "Failed to get search facets from cache",
+                cache_key=cache_key,
+                query=query,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
+
+    async def set_search_facets(
+        self,
+        query: str,
+        data: dict[str, Any],
+        filters: Optional[dict[str, Any]] = None,
+        ttl: Optional[int] = None,
+        compute_time: Optional[float] = None,
+    ) -> bool:
+        """
+        Cache search facets with TTL.
+
+        Facets share the search invalidation tag, so catalog changes clear
+        them together with result pages.
+
+        Args:
+            query: Search query string
+            data: Facets to cache
+            filters: Optional filter parameters
+            ttl: Time-to-live in seconds (uses default if None)
+            compute_time: Seconds taken to produce the data (for early refresh)
+
+        Returns:
+            True if cached successfully, False otherwise
+
+        Raises:
+            ConnectionError: If Redis connection fails
+        """
+        redis = await self._get_redis_client()
+        cache_key = self._make_facets_key(query, filters)
+        ttl = ttl or self.SEARCH_FACETS_TTL
+
+        try:
+            success = await redis.set_json(
+                cache_key,
+                self._wrap_entry(self.FACETS_FAMILY, data, ttl, compute_time),
+                ex=self._hard_ttl(self.FACETS_FAMILY, ttl),
+                tags=self._make_tags(self.SEARCH_TAG, filters=filters),
+            )
+
+            if success:
+                logger.debug(
+                    "Search facets cached",
+                    cache_key=cache_key,
+                    query=query,
+                    ttl=ttl,
+                )
+            else:
+                logger.warning(
+                    "Failed to cache search facets",
+                    cache_key=cache_key,
+                    query=query,
+                )
+
+            return success
+
+        except Exception as e:
+            logger.error(
+                "Failed to set search facets in cache",
+                cache_key=cache_key,
+                query=query,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return False
+
     async def get_inventory_data(self, vehicle_id: UUID) -> Optional[dict[str, Any]]:
         """
         Get cached inventory data.
@@ -497,6 +964,7 @@ class VehicleCache:
 
         try:
             cached_data = await redis.get_json(cache_key)
+            cached_data = self._read_fresh(self.INVENTORY_FAMILY, cached_data)
 
             if cached_data is not None:
                 self._cache_stats["hits"] += 1
@@ -530,6 +998,7 @@ class VehicleCache:
         vehicle_id: UUID,
         data: dict[str, Any],
         ttl: Optional[int] = None,
+        compute_time: Optional[float] = None,
     ) -> bool:
         """
         Cache inventory data with TTL.
@@ -538,6 +1007,7 @@ class VehicleCache:
             vehicle_id: Vehicle UUID
             data: Inventory data to cache
             ttl: Time-to-live in seconds (uses default if None)
+            compute_time: Seconds taken to produce the data (for early refresh)
 
         Returns:
             True if cached successfully, False otherwise
@@ -550,7 +1020,12 @@ class VehicleCache:
         ttl = ttl or self.INVENTORY_TTL
 
         try:
-            success = await redis.set_json(cache_key, data, ex=ttl)
+            success = await redis.set_json(
+                cache_key,
+                self._wrap_entry(self.INVENTORY_FAMILY, data, ttl, compute_time),
+                ex=self._hard_ttl(self.INVENTORY_FAMILY, ttl),
+                tags=self._make_tags(self.INVENTORY_TAG, vehicle_id=vehicle_id),
+            )
 
             if success:
                 logger.debug(
@@ -598,6 +1073,7 @@ class VehicleCache:
 
         try:
             cached_data = await redis.get_json(cache_key)
+            cached_data = self._read_fresh(self.PRICE_RANGE_FAMILY, cached_data)
 
             if cached_data is not None:
                 self._cache_stats["hits"] += 1
@@ -630,6 +1106,7 @@ class VehicleCache:
         data: dict[str, Any],
         filters: Optional[dict[str, Any]] = None,
         ttl: Optional[int] = None,
+        compute_time: Optional[float] = None,
     ) -> bool:
         """
         Cache price range data with TTL.
@@ -638,6 +1115,7 @@ class VehicleCache:
             data: Price range data to cache
             filters: Optional filter parameters
             ttl: Time-to-live in seconds (uses default if None)
+            compute_time: Seconds taken to produce the data (for early refresh)
 
         Returns:
             True if cached successfully, False otherwise
@@ -650,7 +1128,12 @@ class VehicleCache:
         ttl = ttl or self.PRICE_RANGE_TTL
 
         try:
-            success = await redis.set_json(cache_key, data, ex=ttl)
+            success = await redis.set_json(
+                cache_key,
+                self._wrap_entry(self.PRICE_RANGE_FAMILY, data, ttl, compute_time),
+                ex=self._hard_ttl(self.PRICE_RANGE_FAMILY, ttl),
+                tags=self._make_tags(self.PRICE_RANGE_TAG, filters=filters),
+            )
 
             if success:
                 logger.debug(
@@ -675,6 +1158,368 @@ class VehicleCache:
             )
             return False
 
+    async def get_or_load_vehicle_detail(
+        self,
+        vehicle_id: UUID,
+        loader: Callable[[], Awaitable[VehicleResponse]],
+        refresh_loader: Optional[Callable[[], Awaitable[VehicleResponse]]] = None,
+    ) -> VehicleResponse:
+        """
+        Get vehicle detail, loading and caching it on a miss.
+
+        Concurrent misses for the same vehicle share a single load when a
+        single-flight coordinator is configured.
+
+        Args:
+            vehicle_id: Vehicle UUID
+            loader: Coroutine factory loading the vehicle from the source
+            refresh_loader: Loader safe to run after the request completes;
+                enables stale-while-revalidate for the detail family
+
+        Returns:
+            Cached or freshly loaded vehicle response
+        """
+        cache_key = self._make_detail_key(vehicle_id)
+
+        async def read_raw() -> Any:
+            if self._tiered_cache is not None:
+                return await self._tiered_cache.get_json(
+                    cache_key, tags=[vehicle_tag(vehicle_id)]
+                )
+            redis = await self._get_redis_client()
+            return await redis.get_json(cache_key)
+
+        async def write(data: VehicleResponse, compute_time: float) -> bool:
+            return await self.set_vehicle_detail(
+                vehicle_id, data, compute_time=compute_time
+            )
+
+        return await self._get_or_load(
+            self.DETAIL_FAMILY,
+            cache_key,
+            read_raw=read_raw,
+            parse=lambda value: VehicleResponse(**value),
+            read_cache=lambda: self.get_vehicle_detail(vehicle_id),
+            write=write,
+            loader=loader,
+            refresh_loader=refresh_loader,
+        )
+
+    async def get_or_load_vehicle_list(
+        self,
+        filters: Optional[dict[str, Any]],
+        loader: Callable[[], Awaitable[VehicleListResponse]],
+        refresh_loader: Optional[
+            Callable[[], Awaitable[VehicleListResponse]]
+        ] = None,
+    ) -> VehicleListResponse:
+        """
+        Get vehicle list, loading and caching it on a miss.
+
+        Concurrent misses for the same filters share a single load when a
+        single-flight coordinator is configured.
+
+        Args:
+            filters: Filter parameters identifying the list
+            loader: Coroutine factory loading the list from the source
+            refresh_loader: Loader safe to run after the request completes;
+                enables stale-while-revalidate for the list family
+
+        Returns:
+            Cached or freshly loaded vehicle list response
+        """
+        cache_key = self._make_list_key(filters)
+
+        async def write(data: VehicleListResponse, compute_time: float) -> bool:
+            return await self.set_vehicle_list(
+                data, filters, compute_time=compute_time
+            )
+
+        return await self._get_or_load(
+            self.LIST_FAMILY,
+            cache_key,
+            read_raw=lambda: self._read_raw(cache_key),
+            parse=lambda value: VehicleListResponse(**value),
+            read_cache=lambda: self.get_vehicle_list(filters),
+            write=write,
+            loader=loader,
+            refresh_loader=refresh_loader,
+        )
+
+    async def get_or_load_search_results(
+        self,
+        query: str,
+        filters: Optional[dict[str, Any]],
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+        refresh_loader: Optional[Callable[[], Awaitable[dict[str, Any]]]] = None,
+    ) -> dict[str, Any]:
+        """
+        Get search results, loading and caching them on a miss.
+
+        Args:
+            query: Search query string
+            filters: Optional filter parameters
+            loader: Coroutine factory running the search
+            refresh_loader: Loader safe to run after the request completes;
+                enables stale-while-revalidate for the search family
+
+        Returns:
+            Cached or freshly loaded search results
+        """
+        cache_key = self._make_search_key(query, filters)
+
+        async def write(data: dict[str, Any], compute_time: float) -> bool:
+            return await self.set_search_results(
+                query, data, filters, compute_time=compute_time
+            )
+
+        return await self._get_or_load(
+            self.SEARCH_FAMILY,
+            cache_key,
+            read_raw=lambda: self._read_raw(cache_key),
+            parse=lambda value: value,
+            read_cache=lambda: self.get_search_results(query, filters),
+            write=write,
+            loader=loader,
+            refresh_loader=refresh_loader,
+        )
+
+    async def get_or_load_search_facets(
+        self,
+        query: str,
+        filters: Optional[dict[str, Any]],
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+        refresh_loader: Optional[Callable[[], Awaitable[dict[str, Any]]]] = None,
+    ) -> dict[str, Any]:
+        """
+        Get search facets, loading and caching them on a miss.
+
+        Args:
+            query: Search query string
+            filters: Optional filter parameters
+            loader: Coroutine factory running the facet aggregations
+            refresh_loader: Loader safe to run after the request completes;
+                enables stale-while-revalidate for the facets family
+
+        Returns:
+            Cached or freshly loaded facets
+        """
+        cache_key = self._make_facets_key(query, filters)
+
+        async def write(data: dict[str, Any], compute_time: float) -> bool:
+            return await self.set_search_facets(
+                query, data, filters, compute_time=compute_time
+            )
+
+        return await self._get_or_load(
+            self.FACETS_FAMILY,
+            cache_key,
+            read_raw=lambda: self._read_raw(cache_key),
+            parse=lambda value: value,
+            read_cache=lambda: self.get_search_facets(query, filters),
+            write=write,
+            loader=loader,
+            refresh_loader=refresh_loader,
+        )
+
+    async def get_or_load_inventory_data(
+        self,
+        vehicle_id: UUID,
+        loader: Callable[[], Awaitable[dict[str, Any]]],
+        refresh_loader: Optional[Callable[[], Awaitable[dict[str, Any]]]] = None,
+    ) -> dict[str, Any]:
+        """
+        Get inventory data, loading and caching it on a miss.
+
+        Args:
+            vehicle_id: Vehicle UUID
+            loader: Coroutine factory loading inventory data
+            refresh_loader: Loader safe to run after the request completes;
+                enables stale-while-revalidate for the inventory family
+
+        Returns:
+            Cached or freshly loaded inventory data
+        """
+        cache_key = self._make_inventory_key(vehicle_id)
+
+        async def write(data: dict[str, Any], compute_time: float) -> bool:
+            return await self.set_inventory_data(
+                vehicle_id, data, compute_time=compute_time
+            )
+
+        return await self._get_or_load(
+            self.INVENTORY_FAMILY,
+            cache_key,
+            read_raw=lambda: self._read_raw(cache_key),
+            parse=lambda value: value,
+            read_cache=lambda: self.get_inventory_data(vehicle_id),
+            write=write,
+            loader=loader,
+            refresh_loader=refresh_loader,
+        )
+
+    async def _read_raw(self, cache_key: str) -> Any:
+        """
+        Read a cached value from Redis without unwrapping it.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Raw cached value or None
+        """
+        redis = await self._get_redis_client()
+        return await redis.get_json(cache_key)
+
+    async def _get_or_load(
+        self,
+        family: str,
+        cache_key: str,
+        read_raw: Callable[[], Awaitable[Any]],
+        parse: Callable[[Any], Any],
+        read_cache: Callable[[], Awaitable[Any]],
+        write: Callable[[Any, float], Awaitable[bool]],
+        loader: Callable[[], Awaitable[Any]],
+        refresh_loader: Optional[Callable[[], Awaitable[Any]]],
+    ) -> Any:
+        """
+        Serve a cache entry, refreshing or loading it as needed.
+
+        Fresh entries are returned directly. Entries past their soft expiry
+        are returned immediately while a single background task refreshes
+        them, provided a refresh loader is available; otherwise they are
+        reloaded in line like a miss.
+
+        Args:
+            family: Cache key family
+            cache_key: Cache key
+            read_raw: Coroutine factory reading the raw cached value
+            parse: Converts a cached value into the returned type
+            read_cache: Coroutine factory for waiters polling a fill
+            write: Coroutine writing a loaded value with its compute time
+            loader: Coroutine factory loading the value in line
+            refresh_loader: Coroutine factory for background refreshes
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        try:
+            raw = await read_raw()
+        except Exception as e:
+            logger.error(
+                "Failed to read cache entry",
+                cache_key=cache_key,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raw = None
+
+        if raw is not None:
+            value, needs_refresh = self._unwrap_entry(family, raw)
+            if not needs_refresh:
+                self._cache_stats["hits"] += 1
+                return parse(value)
+
+            if refresh_loader is not None:
+                self._cache_stats["hits"] += 1
+                self._freshness_stats["stale_hits"] += 1
+                self._schedule_refresh(cache_key, write, refresh_loader)
+                return parse(value)
+
+        self._cache_stats["misses"] += 1
+
+        async def load_and_cache() -> Any:
+            started = time.monotonic()
+            data = await loader()
+            await write(data, time.monotonic() - started)
+            return data
+
+        return await self._load_coalesced(cache_key, read_cache, load_and_cache)
+
+    def _schedule_refresh(
+        self,
+        cache_key: str,
+        write: Callable[[Any, float], Awaitable[bool]],
+        refresh_loader: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """
+        Start a background refresh unless one is already running here.
+
+        Args:
+            cache_key: Cache key to refresh
+            write: Coroutine writing the refreshed value
+            refresh_loader: Coroutine factory loading the value
+        """
+        if cache_key in self._refresh_tasks:
+            return
+
+        task = asyncio.create_task(
+            self._refresh_entry(cache_key, write, refresh_loader)
+        )
+        self._refresh_tasks[cache_key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(cache_key, None))
+
+    async def _refresh_entry(
+        self,
+        cache_key: str,
+        write: Callable[[Any, float], Awaitable[bool]],
+        refresh_loader: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """
+        Refresh a stale entry, skipping it if another pod already is.
+
+        Args:
+            cache_key: Cache key to refresh
+            write: Coroutine writing the refreshed value
+            refresh_loader: Coroutine factory loading the value
+        """
+        lock_key = f"{self.REFRESH_LOCK_PREFIX}:{cache_key}"
+
+        try:
+            redis = await self._get_redis_client()
+            token = await redis.acquire_lock(lock_key, self.REFRESH_LOCK_TTL_MS)
+            if token is None:
+                return
+
+            try:
+                started = time.monotonic()
+                data = await refresh_loader()
+                await write(data, time.monotonic() - started)
+                self._freshness_stats["background_refreshes"] += 1
+                logger.debug("Stale cache entry refreshed", cache_key=cache_key)
+            finally:
+                await redis.release_lock(lock_key, token)
+
+        except Exception as e:
+            self._freshness_stats["refresh_failures"] += 1
+            logger.warning(
+                "Background cache refresh failed",
+                cache_key=cache_key,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    async def _load_coalesced(
+        self,
+        cache_key: str,
+        read_cache: Callable[[], Awaitable[Any]],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run a cache fill, coalescing concurrent misses when enabled.
+
+        Args:
+            cache_key: Cache key that missed
+            read_cache: Coroutine factory reading the cached value
+            loader: Coroutine factory loading and caching the value
+
+        Returns:
+            Loaded or cached value
+        """
+        if self._single_flight is None:
+            return await loader()
+        return await self._single_flight.load(cache_key, read_cache, loader)
+
     async def invalidate_vehicle(self, vehicle_id: UUID) -> int:
         """
         Invalidate all cache entries for a specific vehicle.
@@ -694,7 +1539,14 @@ class VehicleCache:
             detail_key = self._make_detail_key(vehicle_id)
             inventory_key = self._make_inventory_key(vehicle_id)
 
-            count = await redis.delete(detail_key, inventory_key)
+            if self._tiered_cache is not None:
+                count = await self._tiered_cache.invalidate(
+                    keys=[detail_key, inventory_key],
+                    tags=[vehicle_tag(vehicle_id)],
+                )
+            else:
+                count = await redis.delete(detail_key, inventory_key)
+                count += await redis.invalidate_tags(vehicle_tag(vehicle_id))
             self._cache_stats["invalidations"] += count
 
             logger.info(
@@ -727,13 +1579,12 @@ class VehicleCache:
         redis = await self._get_redis_client()
 
         try:
-            pattern = self._key_manager.make_key(self.LIST_PREFIX, "*")
-            count = await redis.delete_pattern(pattern)
+            count = await redis.invalidate_tags(self.LIST_TAG)
             self._cache_stats["invalidations"] += count
 
             logger.info(
                 "Vehicle list caches invalidated",
-                pattern=pattern,
+                tag=self.LIST_TAG,
                 keys_deleted=count,
             )
 
@@ -760,13 +1611,12 @@ class VehicleCache:
         redis = await self._get_redis_client()
 
         try:
-            pattern = self._key_manager.make_key(self.SEARCH_PREFIX, "*")
-            count = await redis.delete_pattern(pattern)
+            count = await redis.invalidate_tags(self.SEARCH_TAG)
             self._cache_stats["invalidations"] += count
 
             logger.info(
                 "Search result caches invalidated",
-                pattern=pattern,
+                tag=self.SEARCH_TAG,
                 keys_deleted=count,
             )
 
@@ -784,6 +1634,8 @@ class VehicleCache:
         """
         Invalidate all vehicle-related caches.
 
+        With a tiered cache every replica is told to drop its L1 as well.
+
         Returns:
             Total number of cache entries invalidated
 
@@ -791,20 +1643,21 @@ class VehicleCache:
             ConnectionError: If Redis connection fails
         """
         redis = await self._get_redis_client()
+        tags = [
+            self.LIST_TAG,
+            self.DETAIL_TAG,
+            self.SEARCH_TAG,
+            self.INVENTORY_TAG,
+            self.PRICE_RANGE_TAG,
+        ]
 
         try:
-            patterns = [
-                self._key_manager.make_key(self.LIST_PREFIX, "*"),
-                self._key_manager.make_key(self.DETAIL_PREFIX, "*"),
-                self._key_manager.make_key(self.SEARCH_PREFIX, "*"),
-                self._key_manager.make_key(self.INVENTORY_PREFIX, "*"),
-                self._key_manager.make_key(self.PRICE_RANGE_PREFIX, "*"),
-            ]
-
-            total_count = 0
-            for pattern in patterns:
-                count = await redis.delete_pattern(pattern)
-                total_count += count
+            if self._tiered_cache is not None:
+                total_count = await self._tiered_cache.invalidate(
+                    tags=tags, clear_local=True
+                )
+            else:
+                total_count = await redis.invalidate_tags(*tags)
 
             self._cache_stats["invalidations"] += total_count
 
@@ -823,6 +1676,49 @@ class VehicleCache:
             )
             return 0
 
+    async def invalidate_make(self, make: str) -> int:
+        """
+        Invalidate cache entries scoped to a vehicle make.
+
+        Removes detail entries of that make as well as list, search and
+        price range entries filtered by it.
+
+        Args:
+            make: Vehicle manufacturer
+
+        Returns:
+            Number of cache entries invalidated
+
+        Raises:
+            ConnectionError: If Redis connection fails
+        """
+        redis = await self._get_redis_client()
+        tag = make_tag(make)
+
+        try:
+            if self._tiered_cache is not None:
+                count = await self._tiered_cache.invalidate(tags=[tag])
+            else:
+                count = await redis.invalidate_tags(tag)
+            self._cache_stats["invalidations"] += count
+
+            logger.info(
+                "Vehicle make caches invalidated",
+                make=make,
+                keys_deleted=count,
+            )
+
+            return count
+
+        except Exception as e:
+            logger.error(
+                "Failed to invalidate vehicle make caches",
+                make=make,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return 0
+
     async def warm_cache_for_vehicles(
         self, vehicle_ids: list[UUID], vehicle_data: list[VehicleResponse]
     ) -> int:
@@ -845,19 +1741,13 @@ class VehicleCache:
                 "vehicle_ids and vehicle_data must have the same length"
             )
 
-        redis = await self._get_redis_client()
+        if not vehicle_ids:
+            return 0
+
         success_count = 0
 
         try:
-            async with redis.pipeline() as pipe:
-                for vehicle_id, data in zip(vehicle_ids, vehicle_data):
-                    cache_key = self._make_detail_key(vehicle_id)
-                    cache_data = data.model_dump(mode="json")
-                    pipe.set(
-                        cache_key,
-                        json.dumps(cache_data),
-                        ex=self.VEHICLE_DETAIL_TTL,
-                    )
+            await self._set_vehicle_details_bulk(vehicle_ids, vehicle_data)
 
             success_count = len(vehicle_ids)
             self._cache_stats["warming_operations"] += success_count
@@ -865,7 +1755,6 @@ class VehicleCache:
             logger.info(
                 "Cache warmed for vehicles",
                 count=success_count,
-                vehicle_ids=[str(vid) for vid in vehicle_ids],
             )
 
             return success_count
@@ -878,6 +1767,45 @@ class VehicleCache:
             )
             return success_count
 
+    async def _set_vehicle_details_bulk(
+        self, vehicle_ids: list[UUID], vehicle_data: list[VehicleResponse]
+    ) -> None:
+        """
+        Write vehicle details with one pipelined round trip.
+
+        Each key gets up to WARMING_TTL_JITTER extra TTL so that entries
+        written together do not all expire together.
+
+        Args:
+            vehicle_ids: Vehicle UUIDs
+            vehicle_data: Corresponding vehicle response data
+
+        Raises:
+            ConnectionError: If Redis connection fails
+            RedisError: If the pipeline fails
+        """
+        redis = await self._get_redis_client()
+
+        mapping = {}
+        ttls = {}
+        key_tags = {}
+        for vehicle_id, data in zip(vehicle_ids, vehicle_data):
+            cache_key = self._make_detail_key(vehicle_id)
+            ttl = int(
+                self.VEHICLE_DETAIL_TTL
+                * (1 + random.uniform(0, self.WARMING_TTL_JITTER))
+            )
+            entry = self._wrap_entry(
+                self.DETAIL_FAMILY, data.model_dump(mode="json"), ttl
+            )
+            mapping[cache_key] = redis.codec.encode(entry)
+            ttls[cache_key] = self._hard_ttl(self.DETAIL_FAMILY, ttl)
+            key_tags[cache_key] = self._make_tags(
+                self.DETAIL_TAG, vehicle_id=vehicle_id, make=data.make
+            )
+
+        await redis.set_many(mapping, ttls=ttls, tags=key_tags)
+
     async def get_cache_statistics(self) -> dict[str, Any]:
         """
         Get cache performance statistics.
@@ -900,7 +1828,7 @@ class VehicleCache:
                 else 0.0
             )
 
-            return {
+            statistics = {
                 "cache_hits": self._cache_stats["hits"],
                 "cache_misses": self._cache_stats["misses"],
                 "hit_rate_percent": round(hit_rate, 2),
@@ -909,6 +1837,17 @@ class VehicleCache:
                 "redis_stats": redis_stats,
             }
 
+            if self._tiered_cache is not None:
+                statistics["tier_stats"] = self._tiered_cache.get_cache_stats()
+
+            if self._single_flight is not None:
+                statistics["single_flight"] = self._single_flight.get_stats()
+
+            if self._freshness_policies:
+                statistics["freshness"] = dict(self._freshness_stats)
+
+            return statistics
+
         except Exception as e:
             logger.error(
                 "Failed to get cache statistics",
@@ -951,6 +1890,21 @@ async def get_vehicle_cache() -> VehicleCache:
     global _vehicle_cache
 
     if _vehicle_cache is None:
-        _vehicle_cache = VehicleCache()
+        settings = get_settings()
+        tiered_cache = None
+        if settings.local_cache_enabled:
+            tiered_cache = await get_tiered_cache()
+        freshness_policies = {
+            family: FreshnessPolicy(
+                stale_ttl=stale_ttl, beta=settings.vehicle_cache_xfetch_beta
+            )
+            for family, stale_ttl in settings.vehicle_cache_stale_ttl.items()
+            if stale_ttl > 0
+        }
+        _vehicle_cache = VehicleCache(
+            tiered_cache=tiered_cache,
+            single_flight=await get_single_flight(),
+            freshness_policies=freshness_policies,
+        )
 
     return _vehicle_cache
\ No newline at end of file
@@ -34,12 +34,14 @@ from src.services.cart.inventory_reservation import (
     get_reservation_service,
 )
 from src.services.cart.repository import CartRepository
+from src.services.cache.vehicle_cache import VehicleCache, get_vehicle_cache
 from src.services.cart.session_manager import (
     CartSessionError,
     CartSessionManager,
     get_cart_session_manager,
 )
 from src.services.configuration.pricing_engine import PricingEngine
+from src.services.vehicles.service import VehicleService
 
 logger = get_logger(__name__)
 
@@ -108,6 +110,7 @@ class CartService:
         session_manager: Optional[CartSessionManager] = None,
         reservation_service: Optional[InventoryReservationService] = None,
         pricing_engine: Optional[PricingEngine] = None,
+        vehicle_cache: Optional[VehicleCache] = None,
     ):
         """
         Initialize cart service.
@@ -117,12 +120,14 @@ class CartService:
             session_manager: Optional cart session manager
             reservation_service: Optional inventory reservation service
             pricing_engine: Optional pricing engine
+            vehicle_cache: Optional vehicle cache for item details
         """
         self.session = session
         self.repository = CartRepository(session)
         self._session_manager = session_manager
         self._reservation_service = reservation_service
         self._pricing_engine = pricing_engine
+        self._vehicle_cache = vehicle_cache
 
         logger.info(
             "Cart service initialized",
@@ -148,6 +153,19 @@ class CartService:
             self._pricing_engine = PricingEngine()
         return self._pricing_engine
 
+    async def _get_vehicle_cache(self) -> Optional[VehicleCache]:
+        """Get vehicle cache instance, or None if the cache is unavailable."""
+        if self._vehicle_cache is None:
+            try:
+                self._vehicle_cache = await get_vehicle_cache()
+            except Exception as e:
+                logger.warning(
+                    "Vehicle cache unavailable, reading cart vehicles from database",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+        return self._vehicle_cache
+
     async def _get_or_create_cart(
         self,
         user_id: Optional[uuid.UUID] = None,
@@ -345,9 +363,16 @@ class CartService:
                     session_id=session_id,
                 )
 
+            vehicle_service = VehicleService(
+                self.session, vehicle_cache=await self._get_vehicle_cache()
+            )
+            vehicles = await vehicle_service.get_vehicles_by_ids(
+                [item.vehicle_id for item in cart.items]
+            )
+
             cart_items = []
             for item in cart.items:
-                vehicle = await self.session.get(Vehicle, item.vehicle_id)
+                vehicle = vehicles.get(item.vehicle_id)
                 if not vehicle:
                     continue
 
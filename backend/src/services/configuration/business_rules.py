@@ -5,21 +5,36 @@ This module implements the ConfigurationRulesEngine for validating vehicle
 configurations against complex business rules including option compatibility,
 package requirements, and configuration completeness. Provides detailed error
 reporting and comprehensive validation logic.
+
+Validation runs against rules compiled into bitsets (see constraint_graph),
+which are cached per vehicle when the engine is given a cache.
 """
 
 import uuid
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from decimal import Decimal
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache.local_cache import LocalCache, vehicle_tag
 from src.core.logging import get_logger
 from src.database.models.vehicle_option import VehicleOption
 from src.database.models.package import Package
+from src.services.configuration.constraint_graph import (
+    CompiledRules,
+    Selection,
+    compile_rules,
+    compiled_rules_key,
+    iter_bits,
+)
+from src.services.configuration.validation_state import ValidationState
 
 logger = get_logger(__name__)
 
+OptionRules = Union[list[VehicleOption], CompiledRules]
+PackageRules = Union[list[Package], CompiledRules]
+
 
 class ConfigurationValidationError(Exception):
     """Exception raised when configuration validation fails."""
@@ -57,17 +72,28 @@ class ConfigurationRulesEngine:
 
     Attributes:
         session: Database session for querying options and packages
+        compiled_cache: Cache of compiled rules per vehicle (optional)
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        compiled_cache: Optional[LocalCache] = None,
+    ):
         """
         Initialize configuration rules engine.
 
         Args:
             session: Database session for querying options and packages
+            compiled_cache: Cache of compiled rules per vehicle; rules are
+                compiled on every validation when omitted
         """
         self.session = session
-        logger.info("Configuration rules engine initialized")
+        self.compiled_cache = compiled_cache
+        logger.info(
+            "Configuration rules engine initialized",
+            compiled_cache_enabled=compiled_cache is not None,
+        )
 
     async def validate_configuration(
         self,
@@ -104,9 +130,9 @@ class ConfigurationRulesEngine:
             year=year,
         )
 
-        # Load all options for vehicle
-        options = await self._load_vehicle_options(vehicle_id)
-        if not options:
+        # Load compiled option and package rules for vehicle
+        rules = await self.get_compiled_rules(vehicle_id)
+        if rules is None:
             errors.append(f"No options found for vehicle {vehicle_id}")
             logger.warning(
                 "No options found for vehicle",
@@ -114,43 +140,40 @@ class ConfigurationRulesEngine:
             )
             return False, errors
 
-        # Load all packages for vehicle
-        packages = await self._load_vehicle_packages(vehicle_id)
-
         # Validate required options
         required_errors = await self.check_required_options(
-            options, selected_option_ids
+            rules, selected_option_ids
         )
         errors.extend(required_errors)
 
         # Validate mutual exclusivity
         exclusivity_errors = await self.check_mutually_exclusive(
-            options, selected_option_ids
+            rules, selected_option_ids
         )
         errors.extend(exclusivity_errors)
 
         # Validate option dependencies
         dependency_errors = await self.check_option_dependencies(
-            options, selected_option_ids
+            rules, selected_option_ids
         )
         errors.extend(dependency_errors)
 
         # Validate package requirements
         package_errors = await self.validate_package_requirements(
-            packages, selected_package_ids, selected_option_ids
+            rules, selected_package_ids, selected_option_ids
         )
         errors.extend(package_errors)
 
         # Validate package compatibility with trim and year
-        if packages:
+        if rules.package_ids:
             compatibility_errors = await self.validate_package_compatibility(
-                packages, selected_package_ids, trim, year
+                rules, selected_package_ids, trim, year
             )
             errors.extend(compatibility_errors)
 
         # Validate configuration completeness
         completeness_errors = await self.validate_configuration_completeness(
-            options, selected_option_ids, selected_package_ids
+            rules, selected_option_ids, selected_package_ids
         )
         errors.extend(completeness_errors)
 
@@ -173,36 +196,250 @@ class ConfigurationRulesEngine:
 
         return is_valid, errors
 
+    async def validate_incremental(
+        self,
+        vehicle_id: uuid.UUID,
+        selected_option_ids: list[uuid.UUID],
+        selected_package_ids: list[uuid.UUID],
+        trim: Optional[str] = None,
+        year: Optional[int] = None,
+        previous: Optional[ValidationState] = None,
+    ) -> tuple[ValidationState, list[uuid.UUID], list[uuid.UUID]]:
+        """
+        Validate a configuration, rechecking only constraints that changed.
+
+        Constraints of options and packages whose selection differs from the
+        previous state, and of options and packages with an edge to them,
+        are rechecked; the errors of all other constraints are carried over.
+        Everything is checked when there is no previous state or it was
+        validated with other rules, trim or year. The resulting errors
+        equal those of validate_configuration.
+
+        Args:
+            vehicle_id: Vehicle ID to validate configuration for
+            selected_option_ids: List of selected option IDs
+            selected_package_ids: List of selected package IDs
+            trim: Vehicle trim level
+            year: Vehicle model year
+            previous: State returned by the previous validation
+
+        Returns:
+            Tuple of (state, disabled_option_ids, required_option_ids) where
+            disabled options can no longer be added and required options
+            still have to be selected
+
+        Raises:
+            ConfigurationValidationError: If the vehicle has no options
+        """
+        rules = await self.get_compiled_rules(vehicle_id)
+        if rules is None:
+            message = f"No options found for vehicle {vehicle_id}"
+            raise ConfigurationValidationError(
+                message, errors=[message], vehicle_id=vehicle_id
+            )
+
+        selection = rules.encode(selected_option_ids)
+        package_mask = rules.encode_packages(selected_package_ids)
+
+        reusable = (
+            previous is not None
+            and previous.vehicle_id == vehicle_id
+            and previous.fingerprint == rules.fingerprint
+            and previous.trim == trim
+            and previous.year == year
+        )
+
+        if reusable:
+            before = rules.encode(previous.option_ids)
+            changed = selection.mask ^ before.mask
+            changed_packages = package_mask ^ rules.encode_packages(
+                previous.package_ids
+            )
+
+            stale_options = changed
+            stale_dependencies = changed
+            stale_packages = changed_packages
+            for index in iter_bits(changed):
+                stale_options |= rules.conflicts[index]
+                stale_dependencies |= rules.required_by[index]
+                stale_packages |= rules.option_packages[index]
+
+            # Edges to ids outside the catalog are not in the bitsets
+            if selection.unknown_ids != before.unknown_ids:
+                for index in rules.open_options:
+                    stale_options |= 1 << index
+                    stale_dependencies |= 1 << index
+                for index in rules.open_packages:
+                    stale_packages |= 1 << index
+
+            exclusivity_errors = dict(previous.exclusivity_errors)
+            dependency_errors = dict(previous.dependency_errors)
+            package_errors = dict(previous.package_errors)
+            compatibility_errors = dict(previous.compatibility_errors)
+        else:
+            stale_options = stale_dependencies = (1 << len(rules.option_ids)) - 1
+            stale_packages = changed_packages = (1 << len(rules.package_ids)) - 1
+            exclusivity_errors = {}
+            dependency_errors = {}
+            package_errors = {}
+            compatibility_errors = {}
+
+        for index in iter_bits(stale_options):
+            exclusivity_errors.pop(index, None)
+            if selection.mask >> index & 1:
+                errors = self._exclusivity_errors(rules, index, selection)
+                if errors:
+                    exclusivity_errors[index] = tuple(errors)
+
+        for index in iter_bits(stale_dependencies):
+            dependency_errors.pop(index, None)
+            if selection.mask >> index & 1:
+                errors = self._dependency_errors(rules, index, selection)
+                if errors:
+                    dependency_errors[index] = tuple(errors)
+
+        for index in iter_bits(stale_packages):
+            package_errors.pop(index, None)
+            if package_mask >> index & 1:
+                errors = self._package_requirement_errors(rules, index, selection)
+                if errors:
+                    package_errors[index] = tuple(errors)
+
+        for index in iter_bits(changed_packages):
+            compatibility_errors.pop(index, None)
+            if package_mask >> index & 1:
+                errors = rules.package_compatibility_errors(index, trim, year)
+                if errors:
+                    compatibility_errors[index] = tuple(errors)
+
+        state = ValidationState(
+            vehicle_id=vehicle_id,
+            fingerprint=rules.fingerprint,
+            option_ids=tuple(selected_option_ids),
+            package_ids=tuple(selected_package_ids),
+            trim=trim,
+            year=year,
+            required_errors=tuple(
+                await self.check_required_options(rules, selected_option_ids)
+            ),
+            exclusivity_errors=exclusivity_errors,
+            dependency_errors=dependency_errors,
+            package_errors=package_errors,
+            compatibility_errors=compatibility_errors,
+            completeness_errors=tuple(
+                await self.validate_configuration_completeness(
+                    rules, selected_option_ids, selected_package_ids
+                )
+            ),
+        )
+
+        disabled = rules.disabled_mask(selection.mask)
+        required = rules.implied_mask(selection.mask, package_mask)
+
+        logger.info(
+            "Incremental configuration validation completed",
+            vehicle_id=str(vehicle_id),
+            reused_state=reusable,
+            rechecked_options=(stale_options | stale_dependencies).bit_count(),
+            rechecked_packages=stale_packages.bit_count(),
+            is_valid=state.is_valid,
+        )
+
+        return (
+            state,
+            [rules.option_ids[index] for index in iter_bits(disabled)],
+            [rules.option_ids[index] for index in iter_bits(required)],
+        )
+
+    async def get_compiled_rules(
+        self, vehicle_id: uuid.UUID
+    ) -> Optional[CompiledRules]:
+        """
+        Get the compiled option and package rules of a vehicle.
+
+        Rules are served from the compiled cache when present, otherwise
+        loaded from the database, compiled and cached under the vehicle's
+        invalidation tag.
+
+        Args:
+            vehicle_id: Vehicle ID
+
+        Returns:
+            Compiled rules, or None if the vehicle has no options
+        """
+        cache_key = compiled_rules_key(vehicle_id)
+        if self.compiled_cache is not None:
+            rules = self.compiled_cache.get(cache_key)
+            if rules is not None:
+                return rules
+
+        options = await self._load_vehicle_options(vehicle_id)
+        if not options:
+            return None
+        packages = await self._load_vehicle_packages(vehicle_id)
+
+        rules = compile_rules(vehicle_id, options, packages)
+        if self.compiled_cache is not None:
+            self.compiled_cache.set(
+                cache_key,
+                rules,
+                size=rules.approximate_size,
+                tags=[vehicle_tag(vehicle_id)],
+            )
+
+        logger.debug(
+            "Compiled vehicle option rules",
+            vehicle_id=str(vehicle_id),
+            option_count=len(rules.option_ids),
+            package_count=len(rules.package_ids),
+        )
+
+        return rules
+
+    def invalidate_compiled_rules(self, vehicle_id: uuid.UUID) -> bool:
+        """
+        Drop the cached compiled rules of a vehicle.
+
+        Args:
+            vehicle_id: Vehicle whose options or packages changed
+
+        Returns:
+            True if cached rules were dropped
+        """
+        if self.compiled_cache is None:
+            return False
+        return self.compiled_cache.delete(compiled_rules_key(vehicle_id)) > 0
+
     async def check_required_options(
         self,
-        options: list[VehicleOption],
+        options: OptionRules,
         selected_option_ids: list[uuid.UUID],
     ) -> list[str]:
         """
         Check that all required options are selected.
 
         Args:
-            options: List of all vehicle options
+            options: List of all vehicle options, or their compiled rules
             selected_option_ids: List of selected option IDs
 
         Returns:
             List of error messages for missing required options
         """
         errors = []
-        required_options = [opt for opt in options if opt.is_required]
+        rules = self._compile_options(options)
+        selection = rules.encode(selected_option_ids)
 
-        for option in required_options:
-            if option.id not in selected_option_ids:
-                errors.append(
-                    f"Required option '{option.name}' (category: {option.category}) "
-                    f"must be selected"
-                )
-                logger.warning(
-                    "Required option not selected",
-                    option_id=str(option.id),
-                    option_name=option.name,
-                    category=option.category,
-                )
+        for index in iter_bits(rules.required_mask & ~selection.mask):
+            errors.append(
+                f"Required option '{rules.option_names[index]}' "
+                f"(category: {rules.option_categories[index]}) must be selected"
+            )
+            logger.warning(
+                "Required option not selected",
+                option_id=str(rules.option_ids[index]),
+                option_name=rules.option_names[index],
+                category=rules.option_categories[index],
+            )
 
         if errors:
             logger.info(
@@ -214,47 +451,25 @@ class ConfigurationRulesEngine:
 
     async def check_mutually_exclusive(
         self,
-        options: list[VehicleOption],
+        options: OptionRules,
         selected_option_ids: list[uuid.UUID],
     ) -> list[str]:
         """
         Check for mutually exclusive option conflicts.
 
         Args:
-            options: List of all vehicle options
+            options: List of all vehicle options, or their compiled rules
             selected_option_ids: List of selected option IDs
 
         Returns:
             List of error messages for mutual exclusivity violations
         """
         errors = []
-        selected_options = [opt for opt in options if opt.id in selected_option_ids]
+        rules = self._compile_options(options)
+        selection = rules.encode(selected_option_ids)
 
-        for option in selected_options:
-            if not option.mutually_exclusive_with:
-                continue
-
-            for exclusive_id in option.mutually_exclusive_with:
-                if exclusive_id in selected_option_ids:
-                    exclusive_option = next(
-                        (opt for opt in options if opt.id == exclusive_id),
-                        None,
-                    )
-                    exclusive_name = (
-                        exclusive_option.name if exclusive_option else str(exclusive_id)
-                    )
-
-                    errors.append(
-                        f"Option '{option.name}' is mutually exclusive with "
-                        f"'{exclusive_name}' - only one can be selected"
-                    )
-                    logger.warning(
-                        "Mutually exclusive options conflict",
-                        option_id=str(option.id),
-                        option_name=option.name,
-                        exclusive_option_id=str(exclusive_id),
-                        exclusive_option_name=exclusive_name,
-                    )
+        for index in iter_bits(selection.mask):
+            errors.extend(self._exclusivity_errors(rules, index, selection))
 
         if errors:
             logger.info(
@@ -266,47 +481,25 @@ class ConfigurationRulesEngine:
 
     async def check_option_dependencies(
         self,
-        options: list[VehicleOption],
+        options: OptionRules,
         selected_option_ids: list[uuid.UUID],
     ) -> list[str]:
         """
         Check that all option dependencies are satisfied.
 
         Args:
-            options: List of all vehicle options
+            options: List of all vehicle options, or their compiled rules
             selected_option_ids: List of selected option IDs
 
         Returns:
             List of error messages for missing dependencies
         """
         errors = []
-        selected_options = [opt for opt in options if opt.id in selected_option_ids]
-
-        for option in selected_options:
-            if not option.required_options:
-                continue
+        rules = self._compile_options(options)
+        selection = rules.encode(selected_option_ids)
 
-            for required_id in option.required_options:
-                if required_id not in selected_option_ids:
-                    required_option = next(
-                        (opt for opt in options if opt.id == required_id),
-                        None,
-                    )
-                    required_name = (
-                        required_option.name if required_option else str(required_id)
-                    )
-
-                    errors.append(
-                        f"Option '{option.name}' requires '{required_name}' "
-                        f"to be selected"
-                    )
-                    logger.warning(
-                        "Option dependency not satisfied",
-                        option_id=str(option.id),
-                        option_name=option.name,
-                        required_option_id=str(required_id),
-                        required_option_name=required_name,
-                    )
+        for index in iter_bits(selection.mask):
+            errors.extend(self._dependency_errors(rules, index, selection))
 
         if errors:
             logger.info(
@@ -318,7 +511,7 @@ class ConfigurationRulesEngine:
 
     async def validate_package_requirements(
         self,
-        packages: list[Package],
+        packages: PackageRules,
         selected_package_ids: list[uuid.UUID],
         selected_option_ids: list[uuid.UUID],
     ) -> list[str]:
@@ -326,7 +519,7 @@ class ConfigurationRulesEngine:
         Validate that package requirements are met.
 
         Args:
-            packages: List of all vehicle packages
+            packages: List of all vehicle packages, or the compiled rules
             selected_package_ids: List of selected package IDs
             selected_option_ids: List of selected option IDs
 
@@ -334,25 +527,11 @@ class ConfigurationRulesEngine:
             List of error messages for package requirement violations
         """
         errors = []
-        selected_packages = [pkg for pkg in packages if pkg.id in selected_package_ids]
-
-        for package in selected_packages:
-            missing_options = []
-            for option_id in package.included_options:
-                if option_id not in selected_option_ids:
-                    missing_options.append(str(option_id))
-
-            if missing_options:
-                errors.append(
-                    f"Package '{package.name}' requires all included options "
-                    f"to be selected. Missing options: {', '.join(missing_options)}"
-                )
-                logger.warning(
-                    "Package requirements not met",
-                    package_id=str(package.id),
-                    package_name=package.name,
-                    missing_option_count=len(missing_options),
-                )
+        rules = self._compile_packages(packages)
+        selection = rules.encode(selected_option_ids)
+
+        for index in rules.selected_packages(selected_package_ids):
+            errors.extend(self._package_requirement_errors(rules, index, selection))
 
         if errors:
             logger.info(
@@ -364,7 +543,7 @@ class ConfigurationRulesEngine:
 
     async def validate_package_compatibility(
         self,
-        packages: list[Package],
+        packages: PackageRules,
         selected_package_ids: list[uuid.UUID],
         trim: Optional[str] = None,
         year: Optional[int] = None,
@@ -373,7 +552,7 @@ class ConfigurationRulesEngine:
         Validate package compatibility with trim and year.
 
         Args:
-            packages: List of all vehicle packages
+            packages: List of all vehicle packages, or the compiled rules
             selected_package_ids: List of selected package IDs
             trim: Vehicle trim level
             year: Vehicle model year
@@ -382,12 +561,20 @@ class ConfigurationRulesEngine:
             List of error messages for compatibility violations
         """
         errors = []
-        selected_packages = [pkg for pkg in packages if pkg.id in selected_package_ids]
 
-        for package in selected_packages:
-            is_valid, package_errors = package.validate_compatibility(trim, year)
-            if not is_valid:
-                errors.extend(package_errors)
+        if isinstance(packages, CompiledRules):
+            for index in packages.selected_packages(selected_package_ids):
+                errors.extend(
+                    packages.package_compatibility_errors(index, trim, year)
+                )
+        else:
+            selected_packages = [
+                pkg for pkg in packages if pkg.id in selected_package_ids
+            ]
+            for package in selected_packages:
+                is_valid, package_errors = package.validate_compatibility(trim, year)
+                if not is_valid:
+                    errors.extend(package_errors)
 
         if errors:
             logger.info(
@@ -399,7 +586,7 @@ class ConfigurationRulesEngine:
 
     async def validate_configuration_completeness(
         self,
-        options: list[VehicleOption],
+        options: OptionRules,
         selected_option_ids: list[uuid.UUID],
         selected_package_ids: list[uuid.UUID],
     ) -> list[str]:
@@ -407,7 +594,7 @@ class ConfigurationRulesEngine:
         Validate that configuration is complete and coherent.
 
         Args:
-            options: List of all vehicle options
+            options: List of all vehicle options, or their compiled rules
             selected_option_ids: List of selected option IDs
             selected_package_ids: List of selected package IDs
 
@@ -441,7 +628,7 @@ class ConfigurationRulesEngine:
             )
 
         # Check for invalid option IDs
-        valid_option_ids = {opt.id for opt in options}
+        valid_option_ids = self._compile_options(options).option_index
         invalid_option_ids = [
             opt_id for opt_id in selected_option_ids if opt_id not in valid_option_ids
         ]
@@ -531,6 +718,160 @@ class ConfigurationRulesEngine:
 
         return is_valid, errors
 
+    @staticmethod
+    def _compile_options(options: OptionRules) -> CompiledRules:
+        """
+        Compile an ad hoc option list unless already compiled.
+
+        Args:
+            options: Vehicle options or compiled rules
+
+        Returns:
+            Compiled rules
+        """
+        if isinstance(options, CompiledRules):
+            return options
+        return compile_rules(None, options)
+
+    @staticmethod
+    def _compile_packages(packages: PackageRules) -> CompiledRules:
+        """
+        Compile an ad hoc package list unless already compiled.
+
+        Args:
+            packages: Vehicle packages or compiled rules
+
+        Returns:
+            Compiled rules
+        """
+        if isinstance(packages, CompiledRules):
+            return packages
+        return compile_rules(None, (), packages)
+
+    @staticmethod
+    def _exclusivity_errors(
+        rules: CompiledRules, index: int, selection: Selection
+    ) -> list[str]:
+        """
+        Check the mutual exclusivity edges of one selected option.
+
+        Args:
+            rules: Compiled rules
+            index: Catalog position of the selected option
+            selection: Encoded selection
+
+        Returns:
+            Error messages for conflicting selected options
+        """
+        if not rules.excludes[index] & selection.mask and not (
+            selection.unknown_ids and index in rules.open_options
+        ):
+            return []
+
+        errors = []
+        option_name = rules.option_names[index]
+        for exclusive_id in rules.exclusive_ids[index]:
+            if not selection.contains(rules, exclusive_id):
+                continue
+
+            exclusive_name = rules.option_name(exclusive_id)
+            errors.append(
+                f"Option '{option_name}' is mutually exclusive with "
+                f"'{exclusive_name}' - only one can be selected"
+            )
+            logger.warning(
+                "Mutually exclusive options conflict",
+                option_id=str(rules.option_ids[index]),
+                option_name=option_name,
+                exclusive_option_id=str(exclusive_id),
+                exclusive_option_name=exclusive_name,
+            )
+
+        return errors
+
+    @staticmethod
+    def _dependency_errors(
+        rules: CompiledRules, index: int, selection: Selection
+    ) -> list[str]:
+        """
+        Check the requirement edges of one selected option.
+
+        Args:
+            rules: Compiled rules
+            index: Catalog position of the selected option
+            selection: Encoded selection
+
+        Returns:
+            Error messages for required options that are not selected
+        """
+        if (
+            not rules.requires[index] & ~selection.mask
+            and index not in rules.open_options
+        ):
+            return []
+
+        errors = []
+        option_name = rules.option_names[index]
+        for required_id in rules.required_ids[index]:
+            if selection.contains(rules, required_id):
+                continue
+
+            required_name = rules.option_name(required_id)
+            errors.append(
+                f"Option '{option_name}' requires '{required_name}' "
+                f"to be selected"
+            )
+            logger.warning(
+                "Option dependency not satisfied",
+                option_id=str(rules.option_ids[index]),
+                option_name=option_name,
+                required_option_id=str(required_id),
+                required_option_name=required_name,
+            )
+
+        return errors
+
+    @staticmethod
+    def _package_requirement_errors(
+        rules: CompiledRules, index: int, selection: Selection
+    ) -> list[str]:
+        """
+        Check that the options of one selected package are selected.
+
+        Args:
+            rules: Compiled rules
+            index: Catalog position of the selected package
+            selection: Encoded selection
+
+        Returns:
+            Error message listing missing included options, if any
+        """
+        if (
+            not rules.package_includes[index] & ~selection.mask
+            and index not in rules.open_packages
+        ):
+            return []
+
+        missing_options = [
+            str(option_id)
+            for option_id in rules.package_included_ids[index]
+            if not selection.contains(rules, option_id)
+        ]
+        if not missing_options:
+            return []
+
+        logger.warning(
+            "Package requirements not met",
+            package_id=str(rules.package_ids[index]),
+            package_name=rules.package_names[index],
+            missing_option_count=len(missing_options),
+        )
+        return [
+            f"Package '{rules.package_names[index]}' requires all included "
+            f"options to be selected. Missing options: "
+            f"{', '.join(missing_options)}"
+        ]
+
     async def _load_vehicle_options(
         self, vehicle_id: uuid.UUID
     ) -> list[VehicleOption]:
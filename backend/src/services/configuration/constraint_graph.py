@@ -0,0 +1,480 @@
+"""
+Compiled option constraint graph for configuration validation.
+
+The option rules of a vehicle (required options, mutual exclusivity,
+option dependencies and package contents) are compiled once into an
+immutable CompiledRules instance. Options are numbered by their position in
+the catalog and every set of options is a Python int used as a bitset, so
+validating a selection costs a few bitwise operations per selected option
+instead of list scans. Compiled rules hold plain copies of the catalog
+data rather than ORM instances, which lets them be cached per vehicle
+beyond the session that loaded them.
+"""
+
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+from src.cache.local_cache import LocalCache, vehicle_tag
+from src.core.config import get_settings
+from src.database.models.package import Package
+from src.database.models.vehicle_option import VehicleOption
+
+# Byte budget of the process-wide compiled rules cache
+COMPILED_RULES_CACHE_BYTES = 32 * 1024 * 1024
+
+# Approximate in-memory size of one compiled option or package
+_ENTRY_SIZE_BYTES = 512
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """
+    Iterate the indexes of the set bits of a mask in ascending order.
+
+    Args:
+        mask: Bitset
+
+    Yields:
+        Index of each set bit
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+@dataclass(frozen=True)
+class Selection:
+    """
+    Selected option ids encoded against compiled rules.
+
+    Attributes:
+        mask: Bitset of selected catalog options
+        unknown_ids: Selected ids that are not catalog options
+    """
+
+    mask: int
+    unknown_ids: frozenset[uuid.UUID] = field(default_factory=frozenset)
+
+    def contains(self, rules: "CompiledRules", option_id: uuid.UUID) -> bool:
+        """
+        Check whether an option id is selected.
+
+        Args:
+            rules: Rules the selection was encoded against
+            option_id: Option id
+
+        Returns:
+            True if the id is selected
+        """
+        index = rules.option_index.get(option_id)
+        if index is None:
+            return option_id in self.unknown_ids
+        return bool(self.mask >> index & 1)
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """
+    Immutable option and package rules of one vehicle.
+
+    Per-option tuples are indexed by catalog position. Edges naming ids that
+    are not catalog options are kept as ids alongside the bitsets so that
+    validation reports them exactly as the uncompiled checks did.
+
+    Attributes:
+        vehicle_id: Vehicle the rules belong to (None for ad hoc rules)
+        option_ids: Option ids in catalog order
+        option_index: Option id to catalog position
+        option_names: Option names
+        option_categories: Option categories
+        required_mask: Options that must always be selected
+        excludes: Options each option declares mutually exclusive
+        conflicts: Options each option cannot be combined with, in either
+            direction of the exclusivity edges
+        requires: Options each option directly requires
+        requires_closure: Options each option requires, transitively
+        required_by: Options directly requiring each option
+        exclusive_ids: Declared mutually exclusive ids, in declaration order
+        required_ids: Declared required ids, in declaration order
+        open_options: Options with edges naming ids outside the catalog
+        option_packages: Packages including each option
+        package_ids: Package ids in catalog order
+        package_index: Package id to catalog position
+        package_names: Package names
+        package_includes: Options each package includes
+        package_included_ids: Included option ids, in declaration order
+        open_packages: Packages including ids outside the catalog
+        package_trims: Compatible trims (empty means any trim)
+        package_years: Compatible model years (empty means any year)
+        fingerprint: Digest of the catalog data, identifying this version
+            of the rules
+    """
+
+    vehicle_id: Optional[uuid.UUID]
+    option_ids: tuple[uuid.UUID, ...]
+    option_index: dict[uuid.UUID, int]
+    option_names: tuple[str, ...]
+    option_categories: tuple[str, ...]
+    required_mask: int
+    excludes: tuple[int, ...]
+    conflicts: tuple[int, ...]
+    requires: tuple[int, ...]
+    requires_closure: tuple[int, ...]
+    required_by: tuple[int, ...]
+    exclusive_ids: tuple[tuple[uuid.UUID, ...], ...]
+    required_ids: tuple[tuple[uuid.UUID, ...], ...]
+    open_options: frozenset[int]
+    option_packages: tuple[int, ...]
+    package_ids: tuple[uuid.UUID, ...]
+    package_index: dict[uuid.UUID, int]
+    package_names: tuple[str, ...]
+    package_includes: tuple[int, ...]
+    package_included_ids: tuple[tuple[uuid.UUID, ...], ...]
+    open_packages: frozenset[int]
+    package_trims: tuple[frozenset[str], ...]
+    package_years: tuple[frozenset[int], ...]
+    fingerprint: str
+
+    @property
+    def approximate_size(self) -> int:
+        """Approximate in-memory size in bytes, for cache accounting."""
+        return _ENTRY_SIZE_BYTES * (len(self.option_ids) + len(self.package_ids) + 1)
+
+    def encode(self, option_ids: Iterable[uuid.UUID]) -> Selection:
+        """
+        Encode selected option ids as a bitset.
+
+        Args:
+            option_ids: Selected option ids
+
+        Returns:
+            Encoded selection
+        """
+        mask = 0
+        unknown: set[uuid.UUID] = set()
+        for option_id in option_ids:
+            index = self.option_index.get(option_id)
+            if index is None:
+                unknown.add(option_id)
+            else:
+                mask |= 1 << index
+        return Selection(mask=mask, unknown_ids=frozenset(unknown))
+
+    def encode_packages(self, package_ids: Iterable[uuid.UUID]) -> int:
+        """
+        Encode selected package ids as a bitset over catalog packages.
+
+        Args:
+            package_ids: Selected package ids
+
+        Returns:
+            Bitset of selected packages; unknown ids are ignored
+        """
+        mask = 0
+        for package_id in package_ids:
+            index = self.package_index.get(package_id)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    def disabled_mask(self, selected_mask: int) -> int:
+        """
+        Get unselected options that cannot be added to a selection.
+
+        An option is disabled when it, or any option it transitively
+        requires, is mutually exclusive with a selected option.
+
+        Args:
+            selected_mask: Bitset of selected options
+
+        Returns:
+            Bitset of disabled options
+        """
+        blocked = 0
+        for index in iter_bits(selected_mask):
+            blocked |= self.conflicts[index]
+
+        disabled = 0
+        if blocked:
+            for index in range(len(self.option_ids)):
+                bit = 1 << index
+                if bit & selected_mask:
+                    continue
+                if (bit | self.requires_closure[index]) & blocked:
+                    disabled |= bit
+        return disabled
+
+    def implied_mask(self, selected_mask: int, package_mask: int = 0) -> int:
+        """
+        Get unselected options that a selection requires.
+
+        Covers required options, options included by selected packages, and
+        everything selected or included options transitively require.
+
+        Args:
+            selected_mask: Bitset of selected options
+            package_mask: Bitset of selected packages
+
+        Returns:
+            Bitset of options that still have to be selected
+        """
+        implied = self.required_mask
+        for index in iter_bits(package_mask):
+            implied |= self.package_includes[index]
+
+        needed = selected_mask | implied
+        for index in iter_bits(needed):
+            implied |= self.requires_closure[index]
+
+        return implied & ~selected_mask
+
+    def option_name(self, option_id: uuid.UUID) -> str:
+        """
+        Get the display name of an option id.
+
+        Args:
+            option_id: Option id
+
+        Returns:
+            Option name, or the id itself if it is not a catalog option
+        """
+        index = self.option_index.get(option_id)
+        return self.option_names[index] if index is not None else str(option_id)
+
+    def selected_packages(self, package_ids: Iterable[uuid.UUID]) -> list[int]:
+        """
+        Get catalog positions of selected packages in catalog order.
+
+        Args:
+            package_ids: Selected package ids
+
+        Returns:
+            Sorted package positions; unknown ids are ignored
+        """
+        return list(iter_bits(self.encode_packages(package_ids)))
+
+    def package_compatibility_errors(
+        self,
+        index: int,
+        trim: Optional[str] = None,
+        year: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Check a package against trim and year like Package.validate_compatibility.
+
+        Args:
+            index: Package catalog position
+            trim: Vehicle trim level
+            year: Vehicle model year
+
+        Returns:
+            Compatibility error messages
+        """
+        errors = []
+        name = self.package_names[index]
+        trims = self.package_trims[index]
+        years = self.package_years[index]
+
+        if trim is not None and trims and trim not in trims:
+            errors.append(f"Package '{name}' is not compatible with trim '{trim}'")
+        if year is not None and years and year not in years:
+            errors.append(f"Package '{name}' is not compatible with year {year}")
+
+        return errors
+
+
+def _transitive_closure(direct: list[int]) -> list[int]:
+    """
+    Compute the transitive closure of requirement edges.
+
+    Args:
+        direct: Directly required options of each option
+
+    Returns:
+        Transitively required options of each option; cycles are allowed
+    """
+    closure = list(direct)
+    changed = True
+    while changed:
+        changed = False
+        for index, mask in enumerate(closure):
+            expanded = mask
+            for required in iter_bits(mask):
+                expanded |= closure[required]
+            if expanded != mask:
+                closure[index] = expanded
+                changed = True
+    return closure
+
+
+def compile_rules(
+    vehicle_id: Optional[uuid.UUID],
+    options: Iterable[VehicleOption],
+    packages: Iterable[Package] = (),
+) -> CompiledRules:
+    """
+    Compile the option and package rules of a vehicle.
+
+    Args:
+        vehicle_id: Vehicle the rules belong to
+        options: Vehicle options in catalog order
+        packages: Vehicle packages in catalog order
+
+    Returns:
+        Compiled rules
+    """
+    options = list(options)
+    packages = list(packages)
+
+    option_index: dict[uuid.UUID, int] = {}
+    for index, option in enumerate(options):
+        option_index.setdefault(option.id, index)
+
+    def to_mask(ids: Iterable[uuid.UUID]) -> int:
+        mask = 0
+        for option_id in ids:
+            index = option_index.get(option_id)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    exclusive_ids = tuple(tuple(opt.mutually_exclusive_with or ()) for opt in options)
+    required_ids = tuple(tuple(opt.required_options or ()) for opt in options)
+
+    excludes = [to_mask(ids) for ids in exclusive_ids]
+    conflicts = list(excludes)
+    for index, mask in enumerate(excludes):
+        for other in iter_bits(mask):
+            conflicts[other] |= 1 << index
+
+    requires = [to_mask(ids) for ids in required_ids]
+    required_by = [0] * len(options)
+    for index, mask in enumerate(requires):
+        for other in iter_bits(mask):
+            required_by[other] |= 1 << index
+
+    package_index: dict[uuid.UUID, int] = {}
+    for index, package in enumerate(packages):
+        package_index.setdefault(package.id, index)
+    package_included_ids = tuple(
+        tuple(package.included_options or ()) for package in packages
+    )
+    package_includes = [to_mask(ids) for ids in package_included_ids]
+    option_packages = [0] * len(options)
+    for index, mask in enumerate(package_includes):
+        for option in iter_bits(mask):
+            option_packages[option] |= 1 << index
+
+    package_trims = [sorted(package.trim_compatibility or ()) for package in packages]
+    package_years = [
+        sorted(package.model_year_compatibility or ()) for package in packages
+    ]
+    catalog = json.dumps(
+        [
+            [
+                [str(opt.id), opt.name, opt.category, bool(opt.is_required)]
+                for opt in options
+            ],
+            exclusive_ids,
+            required_ids,
+            [[str(package.id), package.name] for package in packages],
+            package_included_ids,
+            package_trims,
+            package_years,
+        ],
+        default=str,
+    )
+
+    return CompiledRules(
+        vehicle_id=vehicle_id,
+        option_ids=tuple(opt.id for opt in options),
+        option_index=option_index,
+        option_names=tuple(opt.name for opt in options),
+        option_categories=tuple(opt.category for opt in options),
+        required_mask=to_mask(opt.id for opt in options if opt.is_required),
+        excludes=tuple(excludes),
+        conflicts=tuple(conflicts),
+        requires=tuple(requires),
+        requires_closure=tuple(_transitive_closure(requires)),
+        required_by=tuple(required_by),
+        exclusive_ids=exclusive_ids,
+        required_ids=required_ids,
+        open_options=frozenset(
+            index
+            for index, ids in enumerate(zip(exclusive_ids, required_ids))
+            if any(option_id not in option_index for option_id in ids[0] + ids[1])
+        ),
+        option_packages=tuple(option_packages),
+        package_ids=tuple(package.id for package in packages),
+        package_index=package_index,
+        package_names=tuple(package.name for package in packages),
+        package_includes=tuple(package_includes),
+        package_included_ids=package_included_ids,
+        open_packages=frozenset(
+            index
+            for index, ids in enumerate(package_included_ids)
+            if any(option_id not in option_index for option_id in ids)
+        ),
+        package_trims=tuple(frozenset(trims) for trims in package_trims),
+        package_years=tuple(frozenset(years) for years in package_years),
+        fingerprint=hashlib.sha256(catalog.encode()).hexdigest()[:16],
+    )
+
+
+def compiled_rules_key(vehicle_id: uuid.UUID) -> str:
+    """
+    Build the cache key of a vehicle's compiled rules.
+
+    Args:
+        vehicle_id: Vehicle id
+
+    Returns:
+        Cache key
+    """
+    return f"compiled_rules:{vehicle_id}"
+
+
+_compiled_rules_cache: Optional[LocalCache] = None
+
+
+def get_compiled_rules_cache() -> LocalCache:
+    """
+    Get or create the process-wide compiled rules cache.
+
+    Entries are tagged with vehicle_tag() so they can be evicted together
+    with the rest of a vehicle's cached data.
+
+    Returns:
+        Singleton local cache instance
+    """
+    global _compiled_rules_cache
+
+    if _compiled_rules_cache is None:
+        settings = get_settings()
+        _compiled_rules_cache = LocalCache(
+            max_bytes=COMPILED_RULES_CACHE_BYTES,
+            max_entries=settings.compiled_rules_cache_max_entries,
+            default_ttl=settings.compiled_rules_ttl_seconds,
+        )
+
+    return _compiled_rules_cache
+
+
+def invalidate_compiled_rules(*vehicle_ids: uuid.UUID) -> int:
+    """
+    Evict compiled rules of vehicles from the process-wide cache.
+
+    Args:
+        *vehicle_ids: Vehicles whose options or packages changed
+
+    Returns:
+        Number of entries evicted
+    """
+    if _compiled_rules_cache is None:
+        return 0
+    return _compiled_rules_cache.invalidate_tags(
+        *(vehicle_tag(vehicle_id) for vehicle_id in vehicle_ids)
+    )
@@ -0,0 +1,421 @@
+"""
+Dealer price overlays for the pricing engine.
+
+Dealers override option and package prices through DealerOptionConfig and
+DealerPackageConfig rows, optionally restricted to a region and an
+effective date range. The resolver loads every override of a dealer with
+one query per table and compiles the currently effective ones into an
+immutable DealerPriceTable of id-to-cents maps, so pricing a configuration
+for a dealer costs dictionary lookups instead of per-option queries.
+
+Tables are cached in process under the dealer's invalidation tag and a tag
+per contributing configuration row; DealerManagementService evicts them on
+writes. A table also expires when the next override starts or ends.
+"""
+
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Iterable, Optional, Union
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.local_cache import LocalCache, dealer_tag
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.database.models.dealer_configuration import (
+    DealerOptionConfig,
+    DealerPackageConfig,
+)
+
+logger = get_logger(__name__)
+
+# Byte budget of the process-wide dealer price cache
+DEALER_PRICE_CACHE_BYTES = 16 * 1024 * 1024
+
+# Approximate in-memory size of one price override
+_ENTRY_SIZE_BYTES = 160
+
+DealerConfig = Union[DealerOptionConfig, DealerPackageConfig]
+
+# Prices in cents by item id, per lower-cased region ("" for all regions)
+PriceMap = dict[str, dict[uuid.UUID, int]]
+
+
+def dealer_prices_key(dealer_id: uuid.UUID) -> str:
+    """
+    Build the cache key of a dealer's price table.
+
+    Args:
+        dealer_id: Dealer identifier
+
+    Returns:
+        Cache key
+    """
+    return f"dealer_prices:{dealer_id}"
+
+
+def dealer_config_tag(config_id: uuid.UUID) -> str:
+    """
+    Build the invalidation tag of one dealer configuration row.
+
+    Args:
+        config_id: Dealer option or package configuration identifier
+
+    Returns:
+        Tag carried by every price table the row contributed to
+    """
+    return f"dealer_config:{config_id}"
+
+
+def _utc(value: datetime) -> datetime:
+    """Normalize a datetime to naive UTC, as returned by datetime.utcnow()."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@dataclass(frozen=True)
+class DealerPriceTable:
+    """
+    Effective price overrides of one dealer.
+
+    Attributes:
+        dealer_id: Dealer identifier
+        option_cents: Option prices in cents per region
+        package_cents: Package prices in cents per region
+        version: Digest of the overrides, for price cache keys
+        config_ids: Configuration rows the overrides came from
+        expires_at: Next time an override starts or ends (naive UTC)
+    """
+
+    dealer_id: uuid.UUID
+    option_cents: PriceMap
+    package_cents: PriceMap
+    version: str
+    config_ids: frozenset[uuid.UUID] = frozenset()
+    expires_at: Optional[datetime] = None
+
+    @property
+    def approximate_size(self) -> int:
+        """Approximate in-memory size in bytes, for cache accounting."""
+        entries = sum(len(prices) for prices in self.option_cents.values()) + sum(
+            len(prices) for prices in self.package_cents.values()
+        )
+        return _ENTRY_SIZE_BYTES * (entries + 1)
+
+    @property
+    def cache_token(self) -> str:
+        """Token identifying this version of the dealer's prices."""
+        return f"dealer={self.dealer_id}@{self.version}"
+
+    def option_price(
+        self, option_id: uuid.UUID, region: Optional[str] = None
+    ) -> Optional[Decimal]:
+        """
+        Get the dealer's price for an option.
+
+        Args:
+            option_id: Vehicle option identifier
+            region: Region being priced
+
+        Returns:
+            Override price, or None if the dealer does not override it
+        """
+        return self._lookup(self.option_cents, option_id, region)
+
+    def package_price(
+        self, package_id: uuid.UUID, region: Optional[str] = None
+    ) -> Optional[Decimal]:
+        """
+        Get the dealer's price for a package.
+
+        Args:
+            package_id: Package identifier
+            region: Region being priced
+
+        Returns:
+            Override price, or None if the dealer does not override it
+        """
+        return self._lookup(self.package_cents, package_id, region)
+
+    @staticmethod
+    def _lookup(
+        prices: PriceMap, item_id: uuid.UUID, region: Optional[str]
+    ) -> Optional[Decimal]:
+        """
+        Look up an override, preferring one restricted to the region.
+
+        Args:
+            prices: Prices in cents per region
+            item_id: Option or package identifier
+            region: Region being priced
+
+        Returns:
+            Override price, or None if not overridden
+        """
+        cents = None
+        if region:
+            cents = prices.get(region.lower(), {}).get(item_id)
+        if cents is None:
+            cents = prices.get("", {}).get(item_id)
+        return None if cents is None else Decimal(cents).scaleb(-2)
+
+
+def _compile_prices(
+    configs: Iterable[DealerConfig],
+    item_id_field: str,
+    now: datetime,
+) -> tuple[PriceMap, set[uuid.UUID], Optional[datetime]]:
+    """
+    Compile override rows into prices in cents per region.
+
+    Rows that have not started yet only bound the table's lifetime; among
+    rows in effect for the same item and region the latest start wins.
+
+    Args:
+        configs: Available configuration rows with a custom price
+        item_id_field: Attribute holding the option or package id
+        now: Current time (naive UTC)
+
+    Returns:
+        Tuple of (prices, contributing row ids, next boundary time)
+    """
+    prices: PriceMap = {}
+    starts: dict[tuple[str, uuid.UUID], datetime] = {}
+    config_ids: set[uuid.UUID] = set()
+    expires_at: Optional[datetime] = None
+
+    for config in configs:
+        effective_from = _utc(config.effective_from)
+        effective_to = _utc(config.effective_to) if config.effective_to else None
+        if effective_to is not None and effective_to <= now:
+            continue
+
+        config_ids.add(config.id)
+        boundary = effective_from if effective_from > now else effective_to
+        if boundary is not None and (expires_at is None or boundary < expires_at):
+            expires_at = boundary
+        if effective_from > now:
+            continue
+
+        region = (config.region or "").lower()
+        item_id = getattr(config, item_id_field)
+        key = (region, item_id)
+        if key in starts and starts[key] >= effective_from:
+            continue
+
+        starts[key] = effective_from
+        prices.setdefault(region, {})[item_id] = int(
+            Decimal(config.custom_price).scaleb(2).to_integral_value()
+        )
+
+    return prices, config_ids, expires_at
+
+
+def build_price_table(
+    dealer_id: uuid.UUID,
+    option_configs: Iterable[DealerOptionConfig],
+    package_configs: Iterable[DealerPackageConfig],
+    now: Optional[datetime] = None,
+) -> DealerPriceTable:
+    """
+    Build the effective price table of a dealer.
+
+    Args:
+        dealer_id: Dealer identifier
+        option_configs: Dealer option rows with a custom price
+        package_configs: Dealer package rows with a custom price
+        now: Current time (defaults to datetime.utcnow())
+
+    Returns:
+        Price table
+    """
+    now = _utc(now) if now is not None else datetime.utcnow()
+    option_cents, option_config_ids, option_expiry = _compile_prices(
+        option_configs, "option_id", now
+    )
+    package_cents, package_config_ids, package_expiry = _compile_prices(
+        package_configs, "package_id", now
+    )
+    expiries = [expiry for expiry in (option_expiry, package_expiry) if expiry]
+
+    canonical = json.dumps(
+        [
+            {
+                region: sorted((str(item), cents) for item, cents in items.items())
+                for region, items in prices.items()
+            }
+            for prices in (option_cents, package_cents)
+        ],
+        sort_keys=True,
+    )
+    return DealerPriceTable(
+        dealer_id=dealer_id,
+        option_cents=option_cents,
+        package_cents=package_cents,
+        version=hashlib.sha256(canonical.encode()).hexdigest()[:16],
+        config_ids=frozenset(option_config_ids | package_config_ids),
+        expires_at=min(expiries) if expiries else None,
+    )
+
+
+class DealerPriceResolver:
+    """
+    Loads and caches dealer price tables.
+
+    Attributes:
+        session: Database session for queries
+        cache: Local cache of price tables
+    """
+
+    def __init__(self, session: AsyncSession, cache: Optional[LocalCache] = None):
+        """
+        Initialize dealer price resolver.
+
+        Args:
+            session: Database session for queries
+            cache: Local cache of price tables (process-wide if None)
+        """
+        self.session = session
+        self.cache = cache if cache is not None else get_dealer_price_cache()
+
+    async def get_price_table(self, dealer_id: uuid.UUID) -> DealerPriceTable:
+        """
+        Get the effective price table of a dealer.
+
+        Tables are served from the cache when present, otherwise loaded with
+        one query per configuration table and cached until invalidated or
+        until the next override starts or ends.
+
+        Args:
+            dealer_id: Dealer identifier
+
+        Returns:
+            Price table (empty if the dealer overrides nothing)
+        """
+        cache_key = dealer_prices_key(dealer_id)
+        table = self.cache.get(cache_key)
+        if table is not None:
+            return table
+
+        now = datetime.utcnow()
+        option_configs = await self._load_configs(DealerOptionConfig, dealer_id, now)
+        package_configs = await self._load_configs(
+            DealerPackageConfig, dealer_id, now
+        )
+        table = build_price_table(dealer_id, option_configs, package_configs, now)
+
+        ttl = None
+        if table.expires_at is not None:
+            ttl = max((table.expires_at - now).total_seconds(), 0.0)
+        self.cache.set(
+            cache_key,
+            table,
+            size=table.approximate_size,
+            ttl=ttl,
+            tags=[
+                dealer_tag(dealer_id),
+                *(dealer_config_tag(config_id) for config_id in table.config_ids),
+            ],
+        )
+
+        logger.debug(
+            "Loaded dealer price table",
+            dealer_id=str(dealer_id),
+            option_overrides=sum(len(p) for p in table.option_cents.values()),
+            package_overrides=sum(len(p) for p in table.package_cents.values()),
+        )
+
+        return table
+
+    async def _load_configs(
+        self,
+        model: type[DealerConfig],
+        dealer_id: uuid.UUID,
+        now: datetime,
+    ) -> list[DealerConfig]:
+        """
+        Load a dealer's available price overrides that have not ended.
+
+        Args:
+            model: DealerOptionConfig or DealerPackageConfig
+            dealer_id: Dealer identifier
+            now: Current time
+
+        Returns:
+            Configuration rows
+        """
+        stmt = select(model).where(
+            and_(
+                model.dealer_id == dealer_id,
+                model.is_available.is_(True),
+                model.custom_price.is_not(None),
+                or_(model.effective_to.is_(None), model.effective_to > now),
+            )
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+
+_dealer_price_cache: Optional[LocalCache] = None
+
+
+def get_dealer_price_cache() -> LocalCache:
+    """
+    Get or create the process-wide dealer price cache.
+
+    Returns:
+        Singleton local cache instance
+    """
+    global _dealer_price_cache
+
+    if _dealer_price_cache is None:
+        settings = get_settings()
+        _dealer_price_cache = LocalCache(
+            max_bytes=DEALER_PRICE_CACHE_BYTES,
+            max_entries=settings.dealer_price_cache_max_entries,
+            default_ttl=settings.dealer_price_ttl_seconds,
+        )
+
+    return _dealer_price_cache
+
+
+def invalidate_dealer_prices(*dealer_ids: uuid.UUID) -> int:
+    """
+    Evict dealers' price tables from the process-wide cache.
+
+    Args:
+        *dealer_ids: Dealers whose configurations changed
+
+    Returns:
+        Number of entries evicted
+    """
+    if _dealer_price_cache is None:
+        return 0
+    return _dealer_price_cache.invalidate_tags(
+        *(dealer_tag(dealer_id) for dealer_id in dealer_ids)
+    )
+
+
+def invalidate_dealer_price_configs(*config_ids: uuid.UUID) -> int:
+    """
+    Evict price tables built from the given configuration rows.
+
+    Used when only the row id of a change is known, such as deletes.
+
+    Args:
+        *config_ids: Dealer option or package configuration identifiers
+
+    Returns:
+        Number of entries evicted
+    """
+    if _dealer_price_cache is None:
+        return 0
+    return _dealer_price_cache.invalidate_tags(
+        *(dealer_config_tag(config_id) for config_id in config_ids)
+    )
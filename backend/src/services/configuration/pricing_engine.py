@@ -9,17 +9,45 @@ support for regional pricing variations.
 
 import uuid
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from datetime import datetime, timedelta
 
 from src.core.logging import get_logger
 from src.cache.redis_client import RedisClient, get_redis_client
+from src.cache.single_flight import SingleFlight
 from src.database.models.vehicle import Vehicle
 from src.database.models.vehicle_option import VehicleOption
 from src.database.models.package import Package
+from src.services.configuration.price_overlay import (
+    DealerPriceResolver,
+    DealerPriceTable,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 logger = get_logger(__name__)
 
+# (vehicle, options, (package, included_options) pairs, region)
+BatchConfiguration = tuple[
+    Vehicle,
+    Optional[list[VehicleOption]],
+    Optional[list[tuple[Package, list[VehicleOption]]]],
+    Optional[str],
+]
+
+# Fixed-point units per dollar used by batch pricing. Prices are whole
+# cents and discount percentages whole hundredths of a percent, so package
+# discounts are whole micro-dollars and taxed totals whole units of
+# TAX_UNITS; every Decimal result of the scalar path is exact in them.
+CENTS = 100
+PERCENT_HUNDREDTHS = 100
+TAX_RATE_UNITS = 100_000
+MICROS = CENTS * PERCENT_HUNDREDTHS * 100
+TAX_UNITS = MICROS * TAX_RATE_UNITS
+
 
 class PricingError(Exception):
     """Base exception for pricing calculation errors."""
@@ -54,6 +82,9 @@ class PricingEngine:
     CACHE_TTL_SECONDS = 3600  # 1 hour
     CACHE_KEY_PREFIX = "pricing"
 
+    # Process-wide coalescer for concurrent calculations of the same price key
+    _shared_single_flight = SingleFlight()
+
     # Tax rates by region (can be moved to database/config)
     DEFAULT_TAX_RATE = Decimal("0.08")  # 8%
     REGIONAL_TAX_RATES = {
@@ -73,6 +104,8 @@ class PricingEngine:
         redis_client: Optional[RedisClient] = None,
         enable_caching: bool = True,
         default_region: str = "US",
+        single_flight: Optional[SingleFlight] = None,
+        price_resolver: Optional[DealerPriceResolver] = None,
     ):
         """
         Initialize pricing engine.
@@ -81,10 +114,15 @@ class PricingEngine:
             redis_client: Redis client for caching (optional)
             enable_caching: Enable price caching
             default_region: Default region for tax calculations
+            single_flight: Coalescer for price calculations (process-wide if
+                None)
+            price_resolver: Resolver of dealer price overrides (optional)
         """
         self._redis_client = redis_client
         self._enable_caching = enable_caching
         self._default_region = default_region
+        self._single_flight = single_flight or self._shared_single_flight
+        self._price_resolver = price_resolver
 
         logger.info(
             "Pricing engine initialized",
@@ -127,6 +165,21 @@ class PricingEngine:
         key_parts = [str(part) for part in parts if part is not None]
         return f"{self.CACHE_KEY_PREFIX}:{':'.join(key_parts)}"
 
+    def _make_cache_tags(self, vehicle_id: Optional[Any] = None) -> list[str]:
+        """
+        Generate invalidation tags for pricing data.
+
+        Args:
+            vehicle_id: Vehicle the price was calculated for
+
+        Returns:
+            Tags covering all pricing entries and the vehicle's entries
+        """
+        tags = [self.CACHE_KEY_PREFIX]
+        if vehicle_id:
+            tags.append(self._make_cache_key(vehicle_id))
+        return tags
+
     async def _get_cached_price(self, cache_key: str) -> Optional[dict[str, Any]]:
         """
         Get cached pricing data.
@@ -171,7 +224,10 @@ class PricingEngine:
 
         try:
             await redis.set_json(
-                cache_key, price_data, ex=self.CACHE_TTL_SECONDS
+                cache_key,
+                price_data,
+                ex=self.CACHE_TTL_SECONDS,
+                tags=self._make_cache_tags(price_data.get("vehicle_id")),
             )
             logger.debug("Cached pricing data", cache_key=cache_key)
         except Exception as e:
@@ -231,12 +287,19 @@ class PricingEngine:
 
         return base_price
 
-    def calculate_option_price(self, option: VehicleOption) -> Decimal:
+    def calculate_option_price(
+        self,
+        option: VehicleOption,
+        price_table: Optional[DealerPriceTable] = None,
+        region: Optional[str] = None,
+    ) -> Decimal:
         """
         Calculate single option price.
 
         Args:
             option: Vehicle option instance
+            price_table: Dealer price overrides (optional)
+            region: Region code for regional dealer overrides
 
         Returns:
             Option price
@@ -245,6 +308,10 @@ class PricingEngine:
             PricingValidationError: If option price is invalid
         """
         option_price = option.price
+        if price_table is not None:
+            dealer_price = price_table.option_price(option.id, region)
+            if dealer_price is not None:
+                option_price = dealer_price
         self._validate_price(option_price, "option_price")
 
         logger.debug(
@@ -257,13 +324,18 @@ class PricingEngine:
         return option_price
 
     def calculate_options_total(
-        self, options: list[VehicleOption]
+        self,
+        options: list[VehicleOption],
+        price_table: Optional[DealerPriceTable] = None,
+        region: Optional[str] = None,
     ) -> Decimal:
         """
         Calculate total price for multiple options.
 
         Args:
             options: List of vehicle options
+            price_table: Dealer price overrides (optional)
+            region: Region code for regional dealer overrides
 
         Returns:
             Total options price
@@ -273,7 +345,10 @@ class PricingEngine:
         """
         try:
             total = sum(
-                (self.calculate_option_price(opt) for opt in options),
+                (
+                    self.calculate_option_price(opt, price_table, region)
+                    for opt in options
+                ),
                 start=Decimal("0.00"),
             )
 
@@ -357,13 +432,52 @@ class PricingEngine:
         Returns:
             Package price after discount
 
+        Raises:
+            PricingCalculationError: If calculation fails
+        """
+        package_price, _ = self._calculate_package_pricing(package, included_options)
+        return package_price
+
+    def _calculate_package_pricing(
+        self,
+        package: Package,
+        included_options: list[VehicleOption],
+        price_table: Optional[DealerPriceTable] = None,
+        region: Optional[str] = None,
+    ) -> tuple[Decimal, Decimal]:
+        """
+        Calculate package price and the discount it applies.
+
+        A dealer price for the package replaces the discounted price; the
+        discount is then what the package saves over its options.
+
+        Args:
+            package: Package instance
+            included_options: Options included in package
+            price_table: Dealer price overrides (optional)
+            region: Region code for regional dealer overrides
+
+        Returns:
+            Tuple of (package price after discount, discount amount)
+
         Raises:
             PricingCalculationError: If calculation fails
         """
         try:
-            options_total = self.calculate_options_total(included_options)
-            discount = self.calculate_package_discount(package, options_total)
-            package_price = options_total - discount
+            options_total = self.calculate_options_total(
+                included_options, price_table, region
+            )
+            dealer_price = (
+                price_table.package_price(package.id, region)
+                if price_table is not None
+                else None
+            )
+            if dealer_price is not None:
+                package_price = dealer_price
+                discount = max(options_total - dealer_price, Decimal("0.00"))
+            else:
+                discount = self.calculate_package_discount(package, options_total)
+                package_price = options_total - discount
 
             self._validate_price(package_price, "package_price")
 
@@ -376,7 +490,7 @@ class PricingEngine:
                 final_price=float(package_price),
             )
 
-            return package_price
+            return package_price, discount
 
         except Exception as e:
             logger.error(
@@ -477,10 +591,14 @@ class PricingEngine:
         region: Optional[str] = None,
         include_tax: bool = True,
         include_destination: bool = True,
+        dealer_id: Optional[uuid.UUID] = None,
     ) -> dict[str, Any]:
         """
         Calculate total vehicle price with all components.
 
+        Concurrent calls for the same configuration share one cache lookup,
+        calculation and cache write, and receive the same result dictionary.
+
         Args:
             vehicle: Vehicle instance
             options: List of selected options
@@ -488,6 +606,7 @@ class PricingEngine:
             region: Region code for tax calculation
             include_tax: Include tax in total
             include_destination: Include destination charge in total
+            dealer_id: Dealer whose price overrides apply (optional)
 
         Returns:
             Dictionary with price breakdown
@@ -496,6 +615,10 @@ class PricingEngine:
             PricingCalculationError: If calculation fails
         """
         try:
+            price_table = None
+            if dealer_id is not None:
+                price_table = await self._get_price_table(dealer_id)
+
             # Generate cache key
             cache_key = self._make_cache_key(
                 str(vehicle.id),
@@ -504,110 +627,627 @@ class PricingEngine:
                 region,
                 include_tax,
                 include_destination,
+                price_table.cache_token if price_table else None,
             )
 
-            # Check cache
-            cached_result = await self._get_cached_price(cache_key)
-            if cached_result:
-                return cached_result
-
-            # Calculate base price
-            base_price = self.calculate_base_price(vehicle)
-
-            # Calculate options price
-            options_price = Decimal("0.00")
-            if options:
-                options_price = self.calculate_options_total(options)
-
-            # Calculate packages price
-            packages_price = Decimal("0.00")
-            packages_discount = Decimal("0.00")
-            if packages:
-                for package, included_options in packages:
-                    package_price = self.calculate_package_price(
-                        package, included_options
+            async def lookup() -> dict[str, Any]:
+                # Check cache
+                cached_result = await self._get_cached_price(cache_key)
+                if cached_result:
+                    return cached_result
+
+                result = self._price_configuration(
+                    vehicle,
+                    options,
+                    packages,
+                    region,
+                    include_tax,
+                    include_destination,
+                    calculated_at=datetime.utcnow().isoformat(),
+                    price_table=price_table,
+                )
+
+                # Cache result
+                await self._set_cached_price(cache_key, result)
+
+                logger.info(
+                    "Calculated total price",
+                    vehicle_id=str(vehicle.id),
+                    total=result["total"],
+                    options_count=len(options) if options else 0,
+                    packages_count=len(packages) if packages else 0,
+                    dealer_id=str(dealer_id) if dealer_id else None,
+                )
+
+                return result
+
+            return await self._single_flight.do(cache_key, lookup)
+
+        except PricingError:
+            raise
+        except Exception as e:
+            logger.error(
+                "Failed to calculate total price",
+                vehicle_id=str(vehicle.id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise PricingCalculationError(
+                "Failed to calculate total price",
+                vehicle_id=str(vehicle.id),
+            ) from e
+
+    async def _get_price_table(self, dealer_id: uuid.UUID) -> DealerPriceTable:
+        """
+        Get a dealer's price overrides.
+
+        Args:
+            dealer_id: Dealer identifier
+
+        Returns:
+            Dealer price table
+
+        Raises:
+            PricingCalculationError: If no price resolver is configured
+        """
+        if self._price_resolver is None:
+            raise PricingCalculationError(
+                "Dealer pricing is not available",
+                dealer_id=str(dealer_id),
+            )
+        return await self._price_resolver.get_price_table(dealer_id)
+
+    def _price_configuration(
+        self,
+        vehicle: Vehicle,
+        options: Optional[list[VehicleOption]],
+        packages: Optional[list[tuple[Package, list[VehicleOption]]]],
+        region: Optional[str],
+        include_tax: bool,
+        include_destination: bool,
+        calculated_at: str,
+        price_table: Optional[DealerPriceTable] = None,
+    ) -> dict[str, Any]:
+        """
+        Price one configuration in Decimal arithmetic.
+
+        Args:
+            vehicle: Vehicle instance
+            options: List of selected options
+            packages: List of (package, included_options) tuples
+            region: Region code for tax calculation
+            include_tax: Include tax in total
+            include_destination: Include destination charge in total
+            calculated_at: Timestamp recorded in the result
+            price_table: Dealer price overrides (optional)
+
+        Returns:
+            Dictionary with price breakdown
+
+        Raises:
+            PricingError: If a price or the total is invalid
+        """
+        # Calculate base price
+        base_price = self.calculate_base_price(vehicle)
+
+        # Calculate options price
+        options_price = Decimal("0.00")
+        if options:
+            options_price = self.calculate_options_total(options, price_table, region)
+
+        # Calculate packages price
+        packages_price = Decimal("0.00")
+        packages_discount = Decimal("0.00")
+        if packages:
+            for package, included_options in packages:
+                package_price, discount = self._calculate_package_pricing(
+                    package, included_options, price_table, region
+                )
+                packages_price += package_price
+                packages_discount += discount
+
+        # Calculate subtotal
+        subtotal = base_price + options_price + packages_price
+
+        # Calculate destination charge
+        destination_charge = Decimal("0.00")
+        if include_destination:
+            destination_charge = self.calculate_destination_charge(vehicle)
+
+        # Calculate tax
+        tax_amount = Decimal("0.00")
+        if include_tax:
+            taxable_amount = subtotal + destination_charge
+            tax_amount = self.calculate_tax(taxable_amount, region)
+
+        # Calculate total
+        total = subtotal + destination_charge + tax_amount
+
+        # Validate final total
+        self._validate_price(total, "total_price")
+
+        # Build result
+        result = {
+            "vehicle_id": str(vehicle.id),
+            "base_price": float(base_price),
+            "options_price": float(options_price),
+            "packages_price": float(packages_price),
+            "packages_discount": float(packages_discount),
+            "subtotal": float(subtotal),
+            "destination_charge": float(destination_charge),
+            "tax_amount": float(tax_amount),
+            "tax_rate": float(self.get_tax_rate(region)),
+            "total": float(total),
+            "region": region or self._default_region,
+            "calculated_at": calculated_at,
+            "breakdown": {
+                "base": float(base_price),
+                "options": float(options_price),
+                "packages": float(packages_price),
+                "destination": float(destination_charge),
+                "tax": float(tax_amount),
+            },
+        }
+
+        return result
+
+    def calculate_total_prices_batch(
+        self,
+        configurations: Sequence[BatchConfiguration],
+        include_tax: bool = True,
+        include_destination: bool = True,
+        price_table: Optional[DealerPriceTable] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Calculate total prices for many configurations at once.
+
+        Prices are converted once to integer fixed-point units and summed
+        with a sparse selection matrix (NumPy when installed, plain integers
+        otherwise), so results equal calculate_total_price exactly without
+        per-option Decimal arithmetic and logging. Configurations whose
+        prices do not fit the fixed-point units or fail validation are
+        priced by the scalar path, which raises its usual errors. Results
+        are not cached.
+
+        Dealer option prices replace list prices before the fixed-point
+        conversion; a dealer package price replaces the discounted package
+        price as in calculate_total_price.
+
+        Args:
+            configurations: (vehicle, options, packages, region) tuples with
+                the arguments of calculate_total_price
+            include_tax: Include tax in totals
+            include_destination: Include destination charges in totals
+            price_table: Dealer price overrides applied to every
+                configuration (optional); obtain it from the dealer price
+                resolver
+
+        Returns:
+            Price breakdowns in the order of configurations
+
+        Raises:
+            PricingError: If a configuration has an invalid price
+            PricingCalculationError: If calculation fails
+        """
+        try:
+            calculated_at = datetime.utcnow().isoformat()
+            max_cents = self._to_fixed_point(self.MAX_PRICE, CENTS)
+
+            # Distinct option prices form the columns of the selection matrix
+            columns: dict[tuple[Any, Any], Optional[int]] = {}
+            column_cents: list[int] = []
+
+            def column(option: VehicleOption, region: Optional[str]) -> Optional[int]:
+                price = option.price
+                if price_table is not None:
+                    dealer_price = price_table.option_price(option.id, region)
+                    if dealer_price is not None:
+                        price = dealer_price
+                key = (option.id, price)
+                if key not in columns:
+                    cents = self._to_fixed_point(price, CENTS)
+                    if cents is None or not 0 <= cents <= max_cents:
+                        columns[key] = None
+                    else:
+                        columns[key] = len(column_cents)
+                        column_cents.append(cents)
+                return columns[key]
+
+            # Tax rate of each region in fixed-point units and as reported
+            tax_rates: dict[Optional[str], tuple[Optional[int], float]] = {}
+            fallback: set[int] = set()
+            bases: list[int] = []
+            destinations: list[int] = []
+            rates: list[int] = []
+            option_rows: list[int] = []
+            option_columns: list[int] = []
+            package_rows: list[int] = []
+            package_discounts: list[int] = []
+            include_packages: list[int] = []
+            include_columns: list[int] = []
+            # Price and discount in micro-dollars of dealer-priced packages
+            dealer_package_prices: list[int] = []
+            dealer_package_discounts: list[int] = []
+
+            for row, (vehicle, options, packages, region) in enumerate(
+                configurations
+            ):
+                if region not in tax_rates:
+                    tax_rate = self.get_tax_rate(region)
+                    rate = self._to_fixed_point(tax_rate, TAX_RATE_UNITS)
+                    if rate is not None and not 0 <= rate <= TAX_RATE_UNITS:
+                        rate = None
+                    tax_rates[region] = (rate, float(tax_rate))
+                rate = tax_rates[region][0]
+
+                base = self._to_fixed_point(vehicle.base_price, CENTS)
+                destination = (
+                    self._to_fixed_point(vehicle.destination_charge, CENTS)
+                    if include_destination
+                    else 0
+                )
+                selected = [column(option, region) for option in options or ()]
+                discounts: list[Optional[int]] = []
+                included: list[list[Optional[int]]] = []
+                dealer_price = dealer_discount = 0
+                packages_eligible = True
+                for package, included_options in packages or ():
+                    package_columns = [
+                        column(option, region) for option in included_options
+                    ]
+                    package_override = (
+                        price_table.package_price(package.id, region)
+                        if price_table is not None
+                        else None
+                    )
+                    if package_override is None:
+                        discounts.append(
+                            self._to_fixed_point(
+                                package.discount_percentage, PERCENT_HUNDREDTHS
+                            )
+                        )
+                        included.append(package_columns)
+                        continue
+
+                    override_cents = self._to_fixed_point(package_override, CENTS)
+                    if (
+                        override_cents is None
+                        or not 0 <= override_cents <= max_cents
+                        or None in package_columns
+                    ):
+                        packages_eligible = False
+                        continue
+                    options_cents = sum(column_cents[c] for c in package_columns)
+                    packages_eligible &= options_cents <= max_cents
+                    dealer_price += override_cents * (MICROS // CENTS)
+                    dealer_discount += max(options_cents - override_cents, 0) * (
+                        MICROS // CENTS
                     )
-                    packages_price += package_price
 
-                    # Calculate discount saved
-                    options_total = self.calculate_options_total(
-                        included_options
+                eligible = (
+                    rate is not None
+                    and base is not None
+                    and 0 <= base <= max_cents
+                    and destination is not None
+                    and 0 <= destination <= max_cents
+                    and None not in selected
+                    and packages_eligible
+                    and all(
+                        discount is not None
+                        and 0 <= discount <= 100 * PERCENT_HUNDREDTHS
+                        for discount in discounts
                     )
-                    discount = self.calculate_package_discount(
-                        package, options_total
+                    and all(None not in package_columns for package_columns in included)
+                )
+                if not eligible:
+                    fallback.add(row)
+                    bases.append(0)
+                    destinations.append(0)
+                    rates.append(0)
+                    dealer_package_prices.append(0)
+                    dealer_package_discounts.append(0)
+                    continue
+
+                bases.append(base)
+                destinations.append(destination)
+                rates.append(rate)
+                dealer_package_prices.append(dealer_price)
+                dealer_package_discounts.append(dealer_discount)
+                option_rows.extend([row] * len(selected))
+                option_columns.extend(selected)
+                for discount, package_columns in zip(discounts, included):
+                    include_packages.extend(
+                        [len(package_rows)] * len(package_columns)
                     )
-                    packages_discount += discount
-
-            # Calculate subtotal
-            subtotal = base_price + options_price + packages_price
-
-            # Calculate destination charge
-            destination_charge = Decimal("0.00")
-            if include_destination:
-                destination_charge = self.calculate_destination_charge(vehicle)
-
-            # Calculate tax
-            tax_amount = Decimal("0.00")
-            if include_tax:
-                taxable_amount = subtotal + destination_charge
-                tax_amount = self.calculate_tax(taxable_amount, region)
-
-            # Calculate total
-            total = subtotal + destination_charge + tax_amount
-
-            # Validate final total
-            self._validate_price(total, "total_price")
-
-            # Build result
-            result = {
-                "vehicle_id": str(vehicle.id),
-                "base_price": float(base_price),
-                "options_price": float(options_price),
-                "packages_price": float(packages_price),
-                "packages_discount": float(packages_discount),
-                "subtotal": float(subtotal),
-                "destination_charge": float(destination_charge),
-                "tax_amount": float(tax_amount),
-                "tax_rate": float(self.get_tax_rate(region)),
-                "total": float(total),
-                "region": region or self._default_region,
-                "calculated_at": datetime.utcnow().isoformat(),
-                "breakdown": {
-                    "base": float(base_price),
-                    "options": float(options_price),
-                    "packages": float(packages_price),
-                    "destination": float(destination_charge),
-                    "tax": float(tax_amount),
-                },
-            }
-
-            # Cache result
-            await self._set_cached_price(cache_key, result)
+                    include_columns.extend(package_columns)
+                    package_rows.append(row)
+                    package_discounts.append(discount)
+
+            totals = self._fixed_point_totals(
+                len(configurations),
+                column_cents,
+                bases,
+                destinations,
+                rates,
+                (option_rows, option_columns),
+                (package_rows, package_discounts),
+                (include_packages, include_columns),
+                (dealer_package_prices, dealer_package_discounts),
+                include_tax,
+                max_cents,
+            )
+
+            results = []
+            for row, (vehicle, options, packages, region) in enumerate(
+                configurations
+            ):
+                if row in fallback or totals["invalid"][row]:
+                    fallback.add(row)
+                    results.append(
+                        self._price_configuration(
+                            vehicle,
+                            options,
+                            packages,
+                            region,
+                            include_tax,
+                            include_destination,
+                            calculated_at=calculated_at,
+                            price_table=price_table,
+                        )
+                    )
+                    continue
+
+                base_price = bases[row] / CENTS
+                options_price = totals["options"][row] / CENTS
+                packages_price = totals["packages"][row] / MICROS
+                destination_charge = destinations[row] / CENTS
+                tax_amount = totals["tax"][row] / TAX_UNITS
+                results.append(
+                    {
+                        "vehicle_id": str(vehicle.id),
+                        "base_price": base_price,
+                        "options_price": options_price,
+                        "packages_price": packages_price,
+                        "packages_discount": totals["discounts"][row] / MICROS,
+                        "subtotal": totals["subtotal"][row] / MICROS,
+                        "destination_charge": destination_charge,
+                        "tax_amount": tax_amount,
+                        "tax_rate": tax_rates[region][1],
+                        "total": totals["total"][row] / TAX_UNITS,
+                        "region": region or self._default_region,
+                        "calculated_at": calculated_at,
+                        "breakdown": {
+                            "base": base_price,
+                            "options": options_price,
+                            "packages": packages_price,
+                            "destination": destination_charge,
+                            "tax": tax_amount,
+                        },
+                    }
+                )
 
             logger.info(
-                "Calculated total price",
-                vehicle_id=str(vehicle.id),
-                total=float(total),
-                options_count=len(options) if options else 0,
-                packages_count=len(packages) if packages else 0,
+                "Calculated batch prices",
+                configuration_count=len(configurations),
+                scalar_count=len(fallback),
+                vectorized=np is not None,
+                dealer_id=str(price_table.dealer_id) if price_table else None,
             )
 
-            return result
+            return results
 
         except PricingError:
             raise
         except Exception as e:
             logger.error(
-                "Failed to calculate total price",
-                vehicle_id=str(vehicle.id),
+                "Failed to calculate batch prices",
+                configuration_count=len(configurations),
                 error=str(e),
                 error_type=type(e).__name__,
             )
             raise PricingCalculationError(
-                "Failed to calculate total price",
-                vehicle_id=str(vehicle.id),
+                "Failed to calculate batch prices",
+                configuration_count=len(configurations),
             ) from e
 
+    @staticmethod
+    def _to_fixed_point(value: Any, units: int) -> Optional[int]:
+        """
+        Convert a price or rate to whole fixed-point units.
+
+        Args:
+            value: Decimal value
+            units: Units per whole value
+
+        Returns:
+            Number of units, or None if the value is not a whole number of
+            units
+        """
+        try:
+            scaled = Decimal(value) * units
+        except (TypeError, ValueError, ArithmeticError):
+            return None
+
+        if not scaled.is_finite() or scaled != scaled.to_integral_value():
+            return None
+        return int(scaled)
+
+    def _fixed_point_totals(
+        self,
+        size: int,
+        column_cents: list[int],
+        bases: list[int],
+        destinations: list[int],
+        rates: list[int],
+        selections: tuple[list[int], list[int]],
+        packages: tuple[list[int], list[int]],
+        inclusions: tuple[list[int], list[int]],
+        dealer_packages: tuple[list[int], list[int]],
+        include_tax: bool,
+        max_cents: int,
+    ) -> dict[str, list[Any]]:
+        """
+        Sum fixed-point prices of configurations.
+
+        Args:
+            size: Number of configurations
+            column_cents: Price in cents of each option column
+            bases: Base price in cents per configuration
+            destinations: Destination charge in cents per configuration
+            rates: Tax rate in TAX_RATE_UNITS per configuration
+            selections: (configuration, column) of each selected option
+            packages: (configuration, discount hundredths) of each package
+            inclusions: (package, column) of each included option
+            dealer_packages: Price and discount in micro-dollars of the
+                dealer-priced packages per configuration
+            include_tax: Include tax in totals
+            max_cents: Maximum valid price in cents
+
+        Returns:
+            Lists per configuration of options and package totals, package
+            discounts, subtotals, tax and totals, and whether the scalar
+            path must price the configuration
+        """
+        option_rows, option_columns = selections
+        package_rows, package_discounts = packages
+        include_packages, include_columns = inclusions
+        dealer_prices, dealer_discounts = dealer_packages
+
+        if np is not None:
+            cents = np.asarray(column_cents, dtype=np.int64)
+            discounts = np.asarray(package_discounts, dtype=np.int64)
+            package_index = np.asarray(package_rows, dtype=np.intp)
+
+            options = np.zeros(size, dtype=np.int64)
+            np.add.at(
+                options,
+                np.asarray(option_rows, dtype=np.intp),
+                cents[np.asarray(option_columns, dtype=np.intp)],
+            )
+            package_cents = np.zeros(len(package_rows), dtype=np.int64)
+            np.add.at(
+                package_cents,
+                np.asarray(include_packages, dtype=np.intp),
+                cents[np.asarray(include_columns, dtype=np.intp)],
+            )
+
+            package_discount = package_cents * discounts
+            package_price = package_cents * (MICROS // CENTS) - package_discount
+            package_totals = np.asarray(dealer_prices, dtype=np.int64)
+            np.add.at(package_totals, package_index, package_price)
+            discount_totals = np.asarray(dealer_discounts, dtype=np.int64)
+            np.add.at(discount_totals, package_index, package_discount)
+            invalid_packages = np.zeros(size, dtype=bool)
+            np.logical_or.at(
+                invalid_packages, package_index, package_cents > max_cents
+            )
+
+            totals = self._combine_fixed_point(
+                np.asarray(bases, dtype=np.int64),
+                options,
+                package_totals,
+                np.asarray(destinations, dtype=np.int64),
+                np.asarray(rates, dtype=np.int64),
+                include_tax,
+                max_cents,
+            )
+            totals["invalid"] = totals["invalid"] | invalid_packages
+            totals["discounts"] = discount_totals
+            return {name: values.tolist() for name, values in totals.items()}
+
+        options_list = [0] * size
+        for row, column in zip(option_rows, option_columns):
+            options_list[row] += column_cents[column]
+
+        package_cents_list = [0] * len(package_rows)
+        for package, column in zip(include_packages, include_columns):
+            package_cents_list[package] += column_cents[column]
+
+        package_totals_list = list(dealer_prices)
+        discount_totals_list = list(dealer_discounts)
+        invalid_packages_list = [False] * size
+        for row, discount, cents in zip(
+            package_rows, package_discounts, package_cents_list
+        ):
+            package_totals_list[row] += cents * (MICROS // CENTS) - cents * discount
+            discount_totals_list[row] += cents * discount
+            invalid_packages_list[row] |= cents > max_cents
+
+        totals_list: dict[str, list[Any]] = {
+            "options": options_list,
+            "packages": package_totals_list,
+            "discounts": discount_totals_list,
+            "subtotal": [],
+            "tax": [],
+            "total": [],
+            "invalid": [],
+        }
+        for row in range(size):
+            row_totals = self._combine_fixed_point(
+                bases[row],
+                options_list[row],
+                package_totals_list[row],
+                destinations[row],
+                rates[row],
+                include_tax,
+                max_cents,
+            )
+            for name in ("subtotal", "tax", "total"):
+                totals_list[name].append(row_totals[name])
+            totals_list["invalid"].append(
+                row_totals["invalid"] or invalid_packages_list[row]
+            )
+        return totals_list
+
+    @staticmethod
+    def _combine_fixed_point(
+        bases: Any,
+        options: Any,
+        packages: Any,
+        destinations: Any,
+        rates: Any,
+        include_tax: bool,
+        max_cents: int,
+    ) -> dict[str, Any]:
+        """
+        Combine fixed-point components into subtotals, tax and totals.
+
+        Works elementwise on integers or NumPy arrays, so the vectorized
+        and pure Python batch paths share the arithmetic.
+
+        Args:
+            bases: Base prices in cents
+            options: Options totals in cents
+            packages: Package totals in micro-dollars
+            destinations: Destination charges in cents
+            rates: Tax rates in TAX_RATE_UNITS
+            include_tax: Include tax in totals
+            max_cents: Maximum valid price in cents
+
+        Returns:
+            Subtotals in micro-dollars, tax and totals in TAX_UNITS, and
+            whether a total exceeds the valid range
+        """
+        subtotal = (bases + options) * (MICROS // CENTS) + packages
+        taxable = subtotal + destinations * (MICROS // CENTS)
+        tax = taxable * rates if include_tax else taxable * 0
+        total = taxable * TAX_RATE_UNITS + tax
+
+        max_micros = max_cents * (MICROS // CENTS)
+        invalid = (
+            (options > max_cents)
+            | (taxable > max_micros)
+            | (total > max_micros * TAX_RATE_UNITS)
+        )
+        return {
+            "options": options,
+            "packages": packages,
+            "subtotal": subtotal,
+            "tax": tax,
+            "total": total,
+            "invalid": invalid,
+        }
+
     async def invalidate_cache(
         self, vehicle_id: Optional[uuid.UUID] = None
     ) -> int:
@@ -626,11 +1266,11 @@ class PricingEngine:
 
         try:
             if vehicle_id:
-                pattern = self._make_cache_key(str(vehicle_id), "*")
+                tag = self._make_cache_key(str(vehicle_id))
             else:
-                pattern = self._make_cache_key("*")
+                tag = self.CACHE_KEY_PREFIX
 
-            count = await redis.delete_pattern(pattern)
+            count = await redis.invalidate_tags(tag)
 
             logger.info(
                 "Invalidated pricing cache",
@@ -14,7 +14,9 @@ from typing import Any, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import get_settings
 from src.core.logging import get_logger
+from src.cache.local_cache import TieredCache, vehicle_tag
 from src.cache.redis_client import RedisClient, get_redis_client
 from src.database.models.vehicle import Vehicle
 from src.database.models.vehicle_option import VehicleOption
@@ -22,6 +24,13 @@ from src.database.models.package import Package
 from src.database.models.vehicle_configuration import VehicleConfiguration
 from src.services.configuration.repository import ConfigurationRepository
 from src.services.configuration.business_rules import ConfigurationRulesEngine
+from src.services.configuration.constraint_graph import get_compiled_rules_cache
+from src.services.configuration.price_overlay import DealerPriceResolver
+from src.services.configuration.solver import ConfigurationSolver
+from src.services.configuration.validation_state import (
+    decode_validation_state,
+    encode_validation_state,
+)
 from src.services.configuration.pricing_engine import (
     PricingEngine,
     PricingError,
@@ -68,6 +77,7 @@ class ConfigurationService:
         rules_engine: Business rules engine for validation
         pricing_engine: Pricing engine for calculations
         redis_client: Redis client for caching (optional)
+        tiered_cache: In-process L1 cache in front of Redis (optional)
     """
 
     # Cache configuration
@@ -82,6 +92,7 @@ class ConfigurationService:
         session: AsyncSession,
         redis_client: Optional[RedisClient] = None,
         enable_caching: bool = True,
+        tiered_cache: Optional[TieredCache] = None,
     ):
         """
         Initialize configuration service.
@@ -90,20 +101,34 @@ class ConfigurationService:
             session: Database session for queries
             redis_client: Redis client for caching (optional)
             enable_caching: Enable caching for performance
+            tiered_cache: L1/L2 cache for option catalogs (optional)
         """
         self.session = session
         self.repository = ConfigurationRepository(session)
-        self.rules_engine = ConfigurationRulesEngine(session)
+        # Compiled rules share the L1 cache when present so that vehicle
+        # invalidations broadcast to other instances evict them too
+        compiled_cache = None
+        if enable_caching:
+            compiled_cache = (
+                tiered_cache.local if tiered_cache is not None
+                else get_compiled_rules_cache()
+            )
+        self.rules_engine = ConfigurationRulesEngine(
+            session, compiled_cache=compiled_cache
+        )
         self.pricing_engine = PricingEngine(
             redis_client=redis_client,
             enable_caching=enable_caching,
+            price_resolver=DealerPriceResolver(session),
         )
         self._redis_client = redis_client
         self._enable_caching = enable_caching
+        self._tiered_cache = tiered_cache if enable_caching else None
 
         logger.info(
             "Configuration service initialized",
             enable_caching=enable_caching,
+            local_cache_enabled=self._tiered_cache is not None,
         )
 
     async def _get_redis_client(self) -> Optional[RedisClient]:
@@ -141,12 +166,15 @@ class ConfigurationService:
         key_parts = [str(part) for part in parts if part is not None]
         return f"{self.CACHE_KEY_PREFIX}:{':'.join(key_parts)}"
 
-    async def _get_cached_data(self, cache_key: str) -> Optional[dict[str, Any]]:
+    async def _get_cached_data(
+        self, cache_key: str, tags: tuple[str, ...] = ()
+    ) -> Optional[dict[str, Any]]:
         """
         Get cached data.
 
         Args:
             cache_key: Cache key
+            tags: L1 invalidation tags when the tiered cache is enabled
 
         Returns:
             Cached data or None
@@ -156,7 +184,10 @@ class ConfigurationService:
             return None
 
         try:
-            cached_data = await redis.get_json(cache_key)
+            if self._tiered_cache is not None:
+                cached_data = await self._tiered_cache.get_json(cache_key, tags=tags)
+            else:
+                cached_data = await redis.get_json(cache_key)
             if cached_data:
                 logger.debug("Cache hit", cache_key=cache_key)
                 return cached_data
@@ -170,7 +201,7 @@ class ConfigurationService:
         return None
 
     async def _set_cached_data(
-        self, cache_key: str, data: dict[str, Any]
+        self, cache_key: str, data: dict[str, Any], tags: tuple[str, ...] = ()
     ) -> None:
         """
         Cache data.
@@ -178,15 +209,21 @@ class ConfigurationService:
         Args:
             cache_key: Cache key
             data: Data to cache
+            tags: Invalidation tags to register the entry under
         """
         redis = await self._get_redis_client()
         if redis is None:
             return
 
         try:
-            await redis.set_json(
-                cache_key, data, ex=self.CACHE_TTL_SECONDS
-            )
+            if self._tiered_cache is not None:
+                await self._tiered_cache.set_json(
+                    cache_key, data, ex=self.CACHE_TTL_SECONDS, tags=tags
+                )
+            else:
+                await redis.set_json(
+                    cache_key, data, ex=self.CACHE_TTL_SECONDS, tags=tags or None
+                )
             logger.debug("Cached data", cache_key=cache_key)
         except Exception as e:
             logger.warning(
@@ -195,12 +232,12 @@ class ConfigurationService:
                 error=str(e),
             )
 
-    async def _invalidate_cache(self, pattern: str) -> int:
+    async def _invalidate_cache(self, *tags: str) -> int:
         """
-        Invalidate cache entries matching pattern.
+        Invalidate cache entries registered under the given tags.
 
         Args:
-            pattern: Cache key pattern
+            *tags: Invalidation tags
 
         Returns:
             Number of cache entries invalidated
@@ -210,17 +247,20 @@ class ConfigurationService:
             return 0
 
         try:
-            count = await redis.delete_pattern(pattern)
+            if self._tiered_cache is not None:
+                count = await self._tiered_cache.invalidate(tags=tags)
+            else:
+                count = await redis.invalidate_tags(*tags)
             logger.info(
                 "Invalidated cache entries",
-                pattern=pattern,
+                tags=tags,
                 count=count,
             )
             return count
         except Exception as e:
             logger.error(
                 "Failed to invalidate cache",
-                pattern=pattern,
+                tags=tags,
                 error=str(e),
             )
             return 0
@@ -252,8 +292,9 @@ class ConfigurationService:
                 category,
                 include_required_only,
             )
+            cache_tags = (vehicle_tag(vehicle_id),)
 
-            cached_data = await self._get_cached_data(cache_key)
+            cached_data = await self._get_cached_data(cache_key, cache_tags)
             if cached_data:
                 return cached_data
 
@@ -309,7 +350,7 @@ class ConfigurationService:
                 },
             }
 
-            await self._set_cached_data(cache_key, result)
+            await self._set_cached_data(cache_key, result, cache_tags)
 
             logger.info(
                 "Retrieved vehicle options",
@@ -397,6 +438,140 @@ class ConfigurationService:
                 vehicle_id=str(vehicle_id),
             ) from e
 
+    async def validate_configuration_changes(
+        self,
+        vehicle_id: uuid.UUID,
+        state_token: Optional[str] = None,
+        added_option_ids: Optional[list[uuid.UUID]] = None,
+        removed_option_ids: Optional[list[uuid.UUID]] = None,
+        added_package_ids: Optional[list[uuid.UUID]] = None,
+        removed_package_ids: Optional[list[uuid.UUID]] = None,
+        selected_option_ids: Optional[list[uuid.UUID]] = None,
+        selected_package_ids: Optional[list[uuid.UUID]] = None,
+        trim: Optional[str] = None,
+        year: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Validate changes to a previously validated configuration.
+
+        With a state token, the changes are applied to the selection the
+        token records and only the constraints they touch are rechecked.
+        Without one, the given selection, trim and year are validated from
+        scratch and a token for the next change is returned.
+
+        Args:
+            vehicle_id: Vehicle identifier
+            state_token: Token returned by the previous validation
+            added_option_ids: Options added since the previous validation
+            removed_option_ids: Options removed since the previous validation
+            added_package_ids: Packages added since the previous validation
+            removed_package_ids: Packages removed since the previous validation
+            selected_option_ids: Starting option selection without a token
+            selected_package_ids: Starting package selection without a token
+            trim: Vehicle trim level without a token
+            year: Vehicle model year without a token
+
+        Returns:
+            Dictionary with validation results, the next state token, and
+            the options that are disabled or still required
+
+        Raises:
+            ConfigurationServiceError: If the token is invalid or validation
+                fails
+        """
+        try:
+            previous = None
+            option_ids = list(selected_option_ids or [])
+            package_ids = list(selected_package_ids or [])
+
+            if state_token is not None:
+                previous = decode_validation_state(state_token)
+                if previous.vehicle_id != vehicle_id:
+                    raise ValueError(
+                        "Validation state token was issued for another vehicle"
+                    )
+                option_ids = list(previous.option_ids)
+                package_ids = list(previous.package_ids)
+                trim, year = previous.trim, previous.year
+
+            option_ids = self._apply_selection_changes(
+                option_ids, added_option_ids, removed_option_ids
+            )
+            package_ids = self._apply_selection_changes(
+                package_ids, added_package_ids, removed_package_ids
+            )
+
+            state, disabled_ids, required_ids = (
+                await self.rules_engine.validate_incremental(
+                    vehicle_id=vehicle_id,
+                    selected_option_ids=option_ids,
+                    selected_package_ids=package_ids,
+                    trim=trim,
+                    year=year,
+                    previous=previous,
+                )
+            )
+
+            result = {
+                "vehicle_id": str(vehicle_id),
+                "is_valid": state.is_valid,
+                "errors": state.errors,
+                "state_token": encode_validation_state(state),
+                "selected_options": [str(oid) for oid in option_ids],
+                "selected_packages": [str(pid) for pid in package_ids],
+                "disabled_options": [str(oid) for oid in disabled_ids],
+                "required_options": [str(oid) for oid in required_ids],
+                "trim": trim,
+                "year": year,
+                "validated_at": datetime.utcnow().isoformat(),
+            }
+
+            logger.info(
+                "Validated configuration changes",
+                vehicle_id=str(vehicle_id),
+                is_valid=state.is_valid,
+                error_count=len(result["errors"]),
+                incremental=previous is not None,
+            )
+
+            return result
+
+        except Exception as e:
+            logger.error(
+                "Failed to validate configuration changes",
+                vehicle_id=str(vehicle_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise ConfigurationServiceError(
+                "Failed to validate configuration changes",
+                vehicle_id=str(vehicle_id),
+            ) from e
+
+    @staticmethod
+    def _apply_selection_changes(
+        selected_ids: list[uuid.UUID],
+        added_ids: Optional[list[uuid.UUID]],
+        removed_ids: Optional[list[uuid.UUID]],
+    ) -> list[uuid.UUID]:
+        """
+        Apply added and removed ids to a selection, keeping its order.
+
+        Args:
+            selected_ids: Current selection
+            added_ids: Ids to append unless already selected
+            removed_ids: Ids to drop
+
+        Returns:
+            Updated selection
+        """
+        removed = set(removed_ids or ())
+        selection = [sid for sid in selected_ids if sid not in removed]
+        for added_id in added_ids or ():
+            if added_id not in selection:
+                selection.append(added_id)
+        return selection
+
     async def calculate_pricing(
         self,
         vehicle_id: uuid.UUID,
@@ -405,6 +580,7 @@ class ConfigurationService:
         region: Optional[str] = None,
         include_tax: bool = True,
         include_destination: bool = True,
+        dealer_id: Optional[uuid.UUID] = None,
     ) -> dict[str, Any]:
         """
         Calculate total pricing for configuration.
@@ -416,6 +592,7 @@ class ConfigurationService:
             region: Region code for tax calculation
             include_tax: Include tax in total
             include_destination: Include destination charge in total
+            dealer_id: Dealer whose price overrides apply (optional)
 
         Returns:
             Dictionary with pricing breakdown
@@ -459,6 +636,7 @@ class ConfigurationService:
                 region=region,
                 include_tax=include_tax,
                 include_destination=include_destination,
+                dealer_id=dealer_id,
             )
 
             logger.info(
@@ -485,6 +663,155 @@ class ConfigurationService:
                 vehicle_id=str(vehicle_id),
             ) from e
 
+    async def complete_configuration(
+        self,
+        vehicle_id: uuid.UUID,
+        selected_option_ids: list[uuid.UUID],
+        selected_package_ids: list[uuid.UUID],
+        trim: Optional[str] = None,
+        year: Optional[int] = None,
+        region: Optional[str] = None,
+        limit: int = 5,
+    ) -> dict[str, Any]:
+        """
+        Find the cheapest valid completions of a partial configuration.
+
+        Args:
+            vehicle_id: Vehicle identifier
+            selected_option_ids: Options the completion must keep
+            selected_package_ids: Packages the completion must keep
+            trim: Vehicle trim level
+            year: Vehicle model year
+            region: Region code for tax calculation
+            limit: Maximum number of completions (capped by settings)
+
+        Returns:
+            Dictionary with completions priced by the pricing engine in
+            ascending price order, the number of valid completions, and
+            whether the searches finished within their time budget
+
+        Raises:
+            ConfigurationServiceError: If the vehicle is not found or the
+                search fails
+        """
+        try:
+            from sqlalchemy import select
+
+            settings = get_settings()
+            limit = max(1, min(limit, settings.configuration_solver_max_completions))
+
+            stmt = select(Vehicle).where(Vehicle.id == vehicle_id)
+            result = await self.session.execute(stmt)
+            vehicle = result.scalar_one_or_none()
+
+            rules = await self.rules_engine.get_compiled_rules(vehicle_id)
+            if not vehicle or rules is None:
+                raise ConfigurationServiceError(
+                    "Vehicle not found or has no options",
+                    vehicle_id=str(vehicle_id),
+                )
+
+            options_by_id = {
+                option.id: option
+                for option in await self.repository.get_vehicle_options(vehicle_id)
+            }
+            option_prices = [
+                self.pricing_engine.calculate_option_price(options_by_id[option_id])
+                if option_id in options_by_id
+                else None
+                for option_id in rules.option_ids
+            ]
+
+            packages_data = []
+            if selected_package_ids:
+                for package in await self.repository.get_packages_by_ids(
+                    selected_package_ids
+                ):
+                    included_options = [
+                        options_by_id[option_id]
+                        for option_id in package.included_options
+                        if option_id in options_by_id
+                    ]
+                    packages_data.append((package, included_options))
+
+            solver = ConfigurationSolver(
+                rules,
+                option_prices,
+                time_budget=settings.configuration_solver_time_budget_ms / 1000,
+            )
+            propagation = solver.propagate(
+                selected_option_ids, selected_package_ids, trim, year
+            )
+
+            completions = []
+            search_complete = True
+            valid_count: Optional[int] = 0
+            if propagation is not None:
+                found, search_complete = solver.top_completions(propagation, limit)
+                valid_count = solver.count_completions(propagation)
+
+                for completion in found:
+                    pricing = await self.pricing_engine.calculate_total_price(
+                        vehicle=vehicle,
+                        options=[
+                            options_by_id[option_id]
+                            for option_id in completion.option_ids
+                        ],
+                        packages=packages_data,
+                        region=region,
+                    )
+                    completions.append(
+                        {
+                            "selected_options": [
+                                str(oid) for oid in completion.option_ids
+                            ],
+                            "added_options": [
+                                str(oid) for oid in completion.added_option_ids
+                            ],
+                            "total": pricing["total"],
+                            "pricing": pricing,
+                        }
+                    )
+
+            logger.info(
+                "Completed configuration",
+                vehicle_id=str(vehicle_id),
+                feasible=propagation is not None,
+                completion_count=len(completions),
+                valid_count=valid_count,
+                search_complete=search_complete,
+            )
+
+            return {
+                "vehicle_id": str(vehicle_id),
+                "feasible": propagation is not None,
+                "cheapest": completions[0] if completions else None,
+                "completions": completions,
+                "valid_configuration_count": valid_count,
+                "count_complete": valid_count is not None,
+                "search_complete": search_complete,
+                "selected_packages": [str(pid) for pid in selected_package_ids],
+                "trim": trim,
+                "year": year,
+                "region": region,
+            }
+
+        except ConfigurationServiceError:
+            raise
+        except PricingError:
+            raise
+        except Exception as e:
+            logger.error(
+                "Failed to complete configuration",
+                vehicle_id=str(vehicle_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise ConfigurationServiceError(
+                "Failed to complete configuration",
+                vehicle_id=str(vehicle_id),
+            ) from e
+
     async def save_configuration(
         self,
         vehicle_id: uuid.UUID,
@@ -566,7 +893,7 @@ class ConfigurationService:
             await self.session.commit()
 
             await self._invalidate_cache(
-                self._make_cache_key("user_configs", str(user_id), "*")
+                self._make_cache_key("user_configs", str(user_id))
             )
 
             result = {
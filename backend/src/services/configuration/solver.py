@@ -0,0 +1,470 @@
+"""
+Configuration space solver over compiled option rules.
+
+Given a partial selection, the solver finds the valid configurations that
+extend it: the cheapest completion, the N cheapest completions in price
+order, and the number of valid completions. It works on the bitsets of
+CompiledRules:
+
+- Propagation adds required options, the options of selected packages and
+  everything they transitively require, then discards options that conflict
+  with that forced set or can never be satisfied.
+- Completions are enumerated best-first from the forced set. Each
+  configuration is reached along exactly one path (options are added in
+  catalog order together with their requirements), so no configuration is
+  generated twice and, since option prices are non-negative, configurations
+  leave the heap in nondecreasing price order.
+- Counting splits the remaining options into independent groups (no
+  exclusivity or requirement edges between groups), counts each group by
+  include/exclude branching memoized on the undecided options, and
+  multiplies the counts.
+
+Every search runs under a time budget so it can back interactive requests;
+a search that runs out of time returns what it has found and says so.
+"""
+
+import heapq
+import time
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Optional, Sequence
+
+from src.core.logging import get_logger
+from src.services.configuration.constraint_graph import CompiledRules, iter_bits
+
+logger = get_logger(__name__)
+
+# Iterations between time budget checks
+_BUDGET_CHECK_INTERVAL = 256
+
+
+class SolverBudgetExceeded(Exception):
+    """Raised internally when a search runs out of its time budget."""
+
+
+@dataclass(frozen=True)
+class Completion:
+    """
+    Valid configuration extending a partial selection.
+
+    Attributes:
+        option_mask: Bitset of selected options
+        option_ids: Selected option ids in catalog order
+        added_option_ids: Options added to the partial selection
+        options_price: Sum of the selected options' prices
+    """
+
+    option_mask: int
+    option_ids: tuple[uuid.UUID, ...]
+    added_option_ids: tuple[uuid.UUID, ...]
+    options_price: Decimal
+
+
+@dataclass(frozen=True)
+class Propagation:
+    """
+    Options fixed and left open by a partial selection.
+
+    Attributes:
+        selected: Options of the partial selection
+        forced: Options every completion contains
+        free: Options a completion may add
+        has_packages: Whether packages are selected (an otherwise empty
+            configuration is then complete)
+    """
+
+    selected: int
+    forced: int
+    free: int
+    has_packages: bool
+
+
+class ConfigurationSolver:
+    """
+    Solver for valid completions of a partial configuration.
+
+    Attributes:
+        rules: Compiled rules of the vehicle
+        time_budget: Seconds each search may run
+    """
+
+    def __init__(
+        self,
+        rules: CompiledRules,
+        option_prices: Sequence[Optional[Decimal]],
+        time_budget: float,
+    ):
+        """
+        Initialize configuration solver.
+
+        Args:
+            rules: Compiled rules of the vehicle
+            option_prices: Price of each option by catalog position; None
+                marks an option that cannot be priced and is never added
+            time_budget: Seconds each search may run
+        """
+        self.rules = rules
+        self.time_budget = time_budget
+        self._prices = tuple(option_prices)
+        self._all = (1 << len(rules.option_ids)) - 1
+
+        # Options that can never be selected: unpriced options, options
+        # requiring ids outside the catalog, and everything requiring them
+        unavailable = 0
+        for index, required_ids in enumerate(rules.required_ids):
+            if self._prices[index] is None or any(
+                required_id not in rules.option_index for required_id in required_ids
+            ):
+                unavailable |= 1 << index
+        for index in range(len(rules.option_ids)):
+            if rules.requires_closure[index] & unavailable:
+                unavailable |= 1 << index
+        self._unavailable = unavailable
+
+        # Each option together with everything it transitively requires
+        self._with_closure = tuple(
+            (1 << index) | closure
+            for index, closure in enumerate(rules.requires_closure)
+        )
+
+        self._deadline = 0.0
+        self._steps = 0
+
+    def propagate(
+        self,
+        selected_option_ids: Iterable[uuid.UUID],
+        selected_package_ids: Iterable[uuid.UUID] = (),
+        trim: Optional[str] = None,
+        year: Optional[int] = None,
+    ) -> Optional[Propagation]:
+        """
+        Propagate a partial selection through the constraint graph.
+
+        Args:
+            selected_option_ids: Selected option IDs
+            selected_package_ids: Selected package IDs
+            trim: Vehicle trim level
+            year: Vehicle model year
+
+        Returns:
+            Forced and free options, or None if no completion is valid
+        """
+        rules = self.rules
+        selection = rules.encode(selected_option_ids)
+        if selection.unknown_ids:
+            return None
+
+        package_mask = rules.encode_packages(selected_package_ids)
+        forced = selection.mask | rules.required_mask
+        for index in iter_bits(package_mask):
+            if index in rules.open_packages or rules.package_compatibility_errors(
+                index, trim, year
+            ):
+                return None
+            forced |= rules.package_includes[index]
+
+        blocked = 0
+        for index in iter_bits(forced):
+            forced |= rules.requires_closure[index]
+        for index in iter_bits(forced):
+            blocked |= rules.conflicts[index]
+
+        if forced & (blocked | self._unavailable):
+            return None
+
+        free = 0
+        excluded = blocked | self._unavailable
+        for index in iter_bits(self._all & ~forced & ~excluded):
+            group = self._with_closure[index] & ~forced
+            if group & excluded or not self._conflict_free(group):
+                continue
+            free |= 1 << index
+
+        return Propagation(
+            selected=selection.mask,
+            forced=forced,
+            free=free,
+            has_packages=bool(package_mask),
+        )
+
+    def top_completions(
+        self, propagation: Propagation, limit: int
+    ) -> tuple[list[Completion], bool]:
+        """
+        Enumerate the cheapest valid completions in price order.
+
+        Args:
+            propagation: Result of propagate()
+            limit: Maximum number of completions
+
+        Returns:
+            Tuple of (completions, complete) where complete is False if the
+            time budget ran out before limit completions were found
+        """
+        self._start()
+        rules = self.rules
+        completions: list[Completion] = []
+
+        blocked = 0
+        for index in iter_bits(propagation.forced):
+            blocked |= rules.conflicts[index]
+
+        # (price, tie breaker, options, last chosen option, conflicts)
+        root_price = self._price_of(propagation.forced)
+        heap = [(root_price, 0, propagation.forced, -1, blocked)]
+        counter = 1
+
+        try:
+            while heap and len(completions) < limit:
+                price, _, mask, last, blocked = heapq.heappop(heap)
+                if mask or propagation.has_packages:
+                    completions.append(self._completion(propagation, mask, price))
+
+                for index in iter_bits(propagation.free >> (last + 1) << (last + 1)):
+                    self._tick()
+                    added = self._with_closure[index] & ~mask
+                    # Only the lowest new option may be chosen explicitly,
+                    # so every configuration has a single path
+                    if not added or added & ((1 << index) - 1) or added & blocked:
+                        continue
+
+                    child_blocked = blocked
+                    for option in iter_bits(added):
+                        child_blocked |= rules.conflicts[option]
+
+                    heapq.heappush(
+                        heap,
+                        (
+                            price + self._price_of(added),
+                            counter,
+                            mask | added,
+                            index,
+                            child_blocked,
+                        ),
+                    )
+                    counter += 1
+
+        except SolverBudgetExceeded:
+            logger.warning(
+                "Completion search ran out of time",
+                vehicle_id=str(rules.vehicle_id),
+                found=len(completions),
+                limit=limit,
+            )
+            return completions, False
+
+        return completions, True
+
+    def count_completions(self, propagation: Propagation) -> Optional[int]:
+        """
+        Count valid completions of a partial selection.
+
+        Args:
+            propagation: Result of propagate()
+
+        Returns:
+            Number of valid completions, or None if the time budget ran out
+        """
+        self._start()
+
+        try:
+            total = 1
+            for group in self._independent_groups(propagation.free):
+                total *= self._count_group(group, propagation.forced)
+        except SolverBudgetExceeded:
+            logger.warning(
+                "Completion count ran out of time",
+                vehicle_id=str(self.rules.vehicle_id),
+            )
+            return None
+
+        # The configuration must contain at least one option or package
+        if not propagation.forced and not propagation.has_packages:
+            total -= 1
+
+        return total
+
+    def _count_group(self, group: int, forced: int) -> int:
+        """
+        Count the valid subsets of one independent group of free options.
+
+        Args:
+            group: Bitset of the group's options
+            forced: Options every completion contains
+
+        Returns:
+            Number of valid subsets, including the empty one
+        """
+        rules = self.rules
+        order = list(iter_bits(group))
+        memo: dict[tuple[int, int, int], int] = {}
+
+        required_by = {index: self._requiring(index, group) for index in order}
+
+        # Options decided after each position; disallowing an option also
+        # disallows everything requiring it, so only these bits matter
+        suffix = [0] * (len(order) + 1)
+        for position in range(len(order) - 1, -1, -1):
+            suffix[position] = suffix[position + 1] | 1 << order[position]
+
+        def disallow(allowed: int, options: int) -> int:
+            for option in iter_bits(options & group):
+                allowed &= ~(1 << option) & ~required_by[option]
+            return allowed
+
+        def count(position: int, allowed: int, included: int) -> int:
+            if position == len(order):
+                return 1
+
+            key = (position, allowed & suffix[position], included & suffix[position])
+            if key in memo:
+                return memo[key]
+            self._tick()
+
+            index = order[position]
+            bit = 1 << index
+
+            if included & bit or not allowed & bit:
+                result = count(position + 1, allowed, included)
+            else:
+                # Leave the option out, and everything requiring it
+                result = count(position + 1, disallow(allowed, bit), included)
+
+                # Or take it with everything it requires
+                added = self._with_closure[index] & ~forced & ~included
+                if added & ~allowed == 0:
+                    conflicts = 0
+                    for option in iter_bits(added):
+                        conflicts |= rules.conflicts[option]
+                    if not conflicts & added:
+                        result += count(
+                            position + 1,
+                            disallow(allowed, conflicts),
+                            included | added,
+                        )
+
+            memo[key] = result
+            return result
+
+        return count(0, group, 0)
+
+    def _independent_groups(self, free: int) -> list[int]:
+        """
+        Split free options into groups without edges between them.
+
+        Args:
+            free: Bitset of free options
+
+        Returns:
+            Bitsets of the groups
+        """
+        rules = self.rules
+        groups = []
+        remaining = free
+
+        while remaining:
+            group = remaining & -remaining
+            frontier = group
+            while frontier:
+                neighbours = 0
+                for index in iter_bits(frontier):
+                    neighbours |= (
+                        rules.conflicts[index]
+                        | rules.requires_closure[index]
+                        | self._requiring(index, free)
+                    )
+                frontier = neighbours & free & ~group
+                group |= frontier
+            groups.append(group)
+            remaining &= ~group
+
+        return groups
+
+    def _requiring(self, index: int, within: int) -> int:
+        """
+        Get the options within a set that transitively require an option.
+
+        Args:
+            index: Catalog position of the required option
+            within: Bitset to search
+
+        Returns:
+            Bitset of requiring options
+        """
+        bit = 1 << index
+        requiring = 0
+        for option in iter_bits(within):
+            if self.rules.requires_closure[option] & bit:
+                requiring |= 1 << option
+        return requiring
+
+    def _conflict_free(self, mask: int) -> bool:
+        """
+        Check that no two options of a set are mutually exclusive.
+
+        Args:
+            mask: Bitset of options
+
+        Returns:
+            True if the options can be selected together
+        """
+        return not any(self.rules.conflicts[index] & mask for index in iter_bits(mask))
+
+    def _price_of(self, mask: int) -> Decimal:
+        """
+        Sum the prices of a set of options.
+
+        Args:
+            mask: Bitset of options
+
+        Returns:
+            Total price
+        """
+        return sum(
+            (self._prices[index] or Decimal("0.00") for index in iter_bits(mask)),
+            start=Decimal("0.00"),
+        )
+
+    def _completion(
+        self, propagation: Propagation, mask: int, price: Decimal
+    ) -> Completion:
+        """
+        Build a completion from a bitset.
+
+        Args:
+            propagation: Propagation the completion extends
+            mask: Bitset of selected options
+            price: Sum of option prices
+
+        Returns:
+            Completion
+        """
+        option_ids = self.rules.option_ids
+        return Completion(
+            option_mask=mask,
+            option_ids=tuple(option_ids[index] for index in iter_bits(mask)),
+            added_option_ids=tuple(
+                option_ids[index] for index in iter_bits(mask & ~propagation.selected)
+            ),
+            options_price=price,
+        )
+
+    def _start(self) -> None:
+        """Start the time budget of a search."""
+        self._deadline = time.monotonic() + self.time_budget
+        self._steps = 0
+
+    def _tick(self) -> None:
+        """
+        Count a search step, checking the time budget periodically.
+
+        Raises:
+            SolverBudgetExceeded: If the time budget ran out
+        """
+        self._steps += 1
+        if (
+            self._steps % _BUDGET_CHECK_INTERVAL == 0
+            and time.monotonic() > self._deadline
+        ):
+            raise SolverBudgetExceeded()
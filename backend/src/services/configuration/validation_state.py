@@ -0,0 +1,181 @@
+"""
+Validation state tokens for incremental configuration validation.
+
+Interactive configurators validate after every click. Instead of re-posting
+the whole selection, a client sends the token returned with its previous
+validation together with the options it added or removed. The token records
+the validated selection and the errors of every option and package
+constraint, keyed by catalog position, so the rules engine only rechecks
+the constraints touching the changed options and reuses the rest.
+
+Tokens are opaque to clients: they are URL-safe base64 JSON signed with the
+application secret key, so a client cannot vouch for errors it never had
+validated. A token is only reused against the same version of a vehicle's
+rules (see CompiledRules.fingerprint).
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.core.config import get_settings
+
+# Length of the hex HMAC-SHA256 signature appended to tokens
+SIGNATURE_LENGTH = 32
+
+
+class InvalidValidationStateError(ValueError):
+    """Raised when a validation state token is malformed or not signed by us."""
+
+
+ErrorMap = dict[int, tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class ValidationState:
+    """
+    Validated selection with the errors of each constraint.
+
+    Attributes:
+        vehicle_id: Vehicle the selection configures
+        fingerprint: Fingerprint of the rules the selection was validated with
+        option_ids: Selected option ids
+        package_ids: Selected package ids
+        trim: Vehicle trim level
+        year: Vehicle model year
+        required_errors: Missing required option errors
+        exclusivity_errors: Mutual exclusivity errors per option position
+        dependency_errors: Option dependency errors per option position
+        package_errors: Package requirement errors per package position
+        compatibility_errors: Trim and year errors per package position
+        completeness_errors: Configuration completeness errors
+    """
+
+    vehicle_id: uuid.UUID
+    fingerprint: str
+    option_ids: tuple[uuid.UUID, ...]
+    package_ids: tuple[uuid.UUID, ...]
+    trim: Optional[str] = None
+    year: Optional[int] = None
+    required_errors: tuple[str, ...] = ()
+    exclusivity_errors: ErrorMap = field(default_factory=dict)
+    dependency_errors: ErrorMap = field(default_factory=dict)
+    package_errors: ErrorMap = field(default_factory=dict)
+    compatibility_errors: ErrorMap = field(default_factory=dict)
+    completeness_errors: tuple[str, ...] = ()
+
+    @property
+    def errors(self) -> list[str]:
+        """Error messages in the order full validation reports them."""
+        errors = list(self.required_errors)
+        for error_map in (
+            self.exclusivity_errors,
+            self.dependency_errors,
+            self.package_errors,
+            self.compatibility_errors,
+        ):
+            for position in sorted(error_map):
+                errors.extend(error_map[position])
+        errors.extend(self.completeness_errors)
+        return errors
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the selection has no errors."""
+        return not self.errors
+
+
+def _sign(payload: bytes) -> str:
+    """
+    Sign a token payload with the application secret key.
+
+    Args:
+        payload: Encoded payload
+
+    Returns:
+        Hex signature
+    """
+    key = get_settings().secret_key.encode()
+    return hmac.new(key, payload, hashlib.sha256).hexdigest()[:SIGNATURE_LENGTH]
+
+
+def _encode_errors(error_map: ErrorMap) -> dict[str, list[str]]:
+    return {str(position): list(errors) for position, errors in error_map.items()}
+
+
+def _decode_errors(raw: dict[str, list[str]]) -> ErrorMap:
+    return {int(position): tuple(errors) for position, errors in raw.items()}
+
+
+def encode_validation_state(state: ValidationState) -> str:
+    """
+    Encode a validation state as an opaque signed token.
+
+    Args:
+        state: Validation state
+
+    Returns:
+        URL-safe token string
+    """
+    payload = {
+        "v": str(state.vehicle_id),
+        "f": state.fingerprint,
+        "o": [str(option_id) for option_id in state.option_ids],
+        "p": [str(package_id) for package_id in state.package_ids],
+        "t": state.trim,
+        "y": state.year,
+        "rq": list(state.required_errors),
+        "x": _encode_errors(state.exclusivity_errors),
+        "d": _encode_errors(state.dependency_errors),
+        "pr": _encode_errors(state.package_errors),
+        "pc": _encode_errors(state.compatibility_errors),
+        "c": list(state.completeness_errors),
+    }
+    raw = base64.urlsafe_b64encode(
+        json.dumps(payload, separators=(",", ":")).encode()
+    ).rstrip(b"=")
+    return f"{raw.decode()}.{_sign(raw)}"
+
+
+def decode_validation_state(token: str) -> ValidationState:
+    """
+    Decode and verify a validation state token.
+
+    Args:
+        token: Token returned with a previous validation
+
+    Returns:
+        Decoded validation state
+
+    Raises:
+        InvalidValidationStateError: If the token is malformed or its
+            signature does not match
+    """
+    raw, _, signature = token.rpartition(".")
+    if not raw or not hmac.compare_digest(_sign(raw.encode()), signature):
+        raise InvalidValidationStateError("Invalid validation state token")
+
+    try:
+        padded = raw + "=" * (-len(raw) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return ValidationState(
+            vehicle_id=uuid.UUID(payload["v"]),
+            fingerprint=payload["f"],
+            option_ids=tuple(uuid.UUID(option_id) for option_id in payload["o"]),
+            package_ids=tuple(uuid.UUID(package_id) for package_id in payload["p"]),
+            trim=payload["t"],
+            year=payload["y"],
+            required_errors=tuple(payload["rq"]),
+            exclusivity_errors=_decode_errors(payload["x"]),
+            dependency_errors=_decode_errors(payload["d"]),
+            package_errors=_decode_errors(payload["pr"]),
+            compatibility_errors=_decode_errors(payload["pc"]),
+            completeness_errors=tuple(payload["c"]),
+        )
+    except (binascii.Error, ValueError, TypeError, KeyError, AttributeError) as e:
+        raise InvalidValidationStateError("Malformed validation state token") from e
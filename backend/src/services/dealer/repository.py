@@ -17,8 +17,10 @@ from sqlalchemy.orm import selectinload
 
 from src.core.logging import get_logger
 from src.database.models.inventory import InventoryItem, InventoryStatus
+from src.database.models.outbox import OutboxAggregate, OutboxEventType
 from src.database.models.vehicle import Vehicle
 from src.database.models.user import User, UserRole
+from src.services.outbox.repository import OutboxRepository
 
 logger = get_logger(__name__)
 
@@ -42,6 +44,7 @@ class DealerInventoryRepository:
             session: Async database session
         """
         self.session = session
+        self.outbox = OutboxRepository(session)
 
     async def get_dealer_inventory(
         self,
@@ -261,6 +264,7 @@ class DealerInventoryRepository:
                     )
 
                     await self.session.execute(stmt)
+                    self._record_inventory_change(item)
                     success_count += 1
 
                     logger.debug(
@@ -299,6 +303,20 @@ class DealerInventoryRepository:
             )
             raise
 
+    def _record_inventory_change(self, item: InventoryItem) -> None:
+        """
+        Record an outbox event so search and cache pick up the change.
+
+        Args:
+            item: Changed inventory item
+        """
+        self.outbox.add(
+            OutboxAggregate.INVENTORY,
+            item.id,
+            OutboxEventType.UPSERTED,
+            payload={"vehicle_id": str(item.vehicle_id)},
+        )
+
     async def update_stock_level(
         self,
         inventory_id: uuid.UUID,
@@ -362,6 +380,7 @@ class DealerInventoryRepository:
             )
 
             await self.session.execute(stmt)
+            self._record_inventory_change(item)
             await self.session.commit()
 
             # Refresh item
@@ -22,6 +22,10 @@ from src.database.models.dealer_configuration import (
 )
 from src.database.models.vehicle_option import VehicleOption
 from src.database.models.package import Package
+from src.services.configuration.price_overlay import (
+    invalidate_dealer_price_configs,
+    invalidate_dealer_prices,
+)
 
 logger = get_logger(__name__)
 
@@ -149,6 +153,7 @@ class DealerManagementService:
 
             self.db.add(config)
             await self.db.flush()
+            invalidate_dealer_prices(dealer_id)
 
             logger.info(
                 "Dealer option configuration created",
@@ -271,6 +276,7 @@ class DealerManagementService:
 
             self.db.add(config)
             await self.db.flush()
+            invalidate_dealer_prices(dealer_id)
 
             logger.info(
                 "Dealer package configuration created",
@@ -346,6 +352,7 @@ class DealerManagementService:
 
             config.update_availability(is_available)
             await self.db.flush()
+            invalidate_dealer_prices(config.dealer_id)
 
             logger.info(
                 "Option availability updated",
@@ -403,6 +410,7 @@ class DealerManagementService:
 
             config.update_availability(is_available)
             await self.db.flush()
+            invalidate_dealer_prices(config.dealer_id)
 
             logger.info(
                 "Package availability updated",
@@ -459,6 +467,7 @@ class DealerManagementService:
 
             config.update_custom_price(custom_price)
             await self.db.flush()
+            invalidate_dealer_prices(config.dealer_id)
 
             logger.info(
                 "Option pricing updated",
@@ -520,6 +529,7 @@ class DealerManagementService:
 
             config.update_custom_price(custom_price)
             await self.db.flush()
+            invalidate_dealer_prices(config.dealer_id)
 
             logger.info(
                 "Package pricing updated",
@@ -728,6 +738,7 @@ class DealerManagementService:
             result = await self.db.execute(stmt)
             updated_count = result.rowcount
             await self.db.flush()
+            invalidate_dealer_prices(dealer_id)
 
             logger.info(
                 "Bulk updated option availability",
@@ -789,6 +800,7 @@ class DealerManagementService:
             result = await self.db.execute(stmt)
             updated_count = result.rowcount
             await self.db.flush()
+            invalidate_dealer_prices(dealer_id)
 
             logger.info(
                 "Bulk updated package availability",
@@ -834,6 +846,7 @@ class DealerManagementService:
                 raise DealerConfigurationNotFoundError(config_id)
 
             await self.db.flush()
+            invalidate_dealer_price_configs(config_id)
 
             logger.info("Dealer option configuration deleted", config_id=str(config_id))
 
@@ -875,6 +888,7 @@ class DealerManagementService:
                 raise DealerConfigurationNotFoundError(config_id)
 
             await self.db.flush()
+            invalidate_dealer_price_configs(config_id)
 
             logger.info(
                 "Dealer package configuration deleted", config_id=str(config_id)
@@ -0,0 +1,6 @@
+"""
+Outbox service package initialization.
+
+This module makes the outbox service directory a Python package, allowing
+outbox-related modules to be imported and organized in a modular structure.
+"""
@@ -0,0 +1,95 @@
+"""
+Prometheus metrics for the outbox relay.
+
+Lag is reported two ways: the age of the oldest pending event, which grows
+while the relay is stuck or behind, and the commit-to-apply delay of every
+applied event. Both are exposed on the /metrics endpoint next to the cache
+metrics. Without prometheus_client installed every recording function is a
+no-op.
+"""
+
+from typing import Optional
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+except ImportError:  # pragma: no cover - optional dependency
+    Counter = None
+
+LAG_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900)
+
+if Counter is not None:
+    OUTBOX_EVENTS = Counter(
+        "outbox_events_total",
+        "Outbox events handled by the relay by outcome",
+        ["aggregate", "result"],
+    )
+    OUTBOX_DELIVERY_SECONDS = Histogram(
+        "outbox_delivery_lag_seconds",
+        "Delay between an outbox event's commit and its application",
+        buckets=LAG_BUCKETS,
+    )
+    OUTBOX_PENDING = Gauge(
+        "outbox_pending_events",
+        "Outbox events not yet applied",
+        multiprocess_mode="max",
+    )
+    OUTBOX_OLDEST_AGE = Gauge(
+        "outbox_oldest_pending_age_seconds",
+        "Age of the oldest pending outbox event",
+        multiprocess_mode="max",
+    )
+    OUTBOX_BATCH_SECONDS = Histogram(
+        "outbox_batch_duration_seconds",
+        "Duration of outbox relay batches",
+        buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+    )
+
+
+def record_events(aggregate: str, result: str, count: int = 1) -> None:
+    """
+    Count handled outbox events.
+
+    Args:
+        aggregate: Aggregate type (vehicle or inventory)
+        result: Outcome (processed or failed)
+        count: Number of events
+    """
+    if Counter is not None and count:
+        OUTBOX_EVENTS.labels(aggregate, result).inc(count)
+
+
+def observe_delivery(lag_seconds: float) -> None:
+    """
+    Record the commit-to-apply delay of an event.
+
+    Args:
+        lag_seconds: Seconds between commit and application
+    """
+    if Counter is not None:
+        OUTBOX_DELIVERY_SECONDS.observe(max(lag_seconds, 0.0))
+
+
+def observe_batch(duration: float) -> None:
+    """
+    Record the duration of a relay batch.
+
+    Args:
+        duration: Batch duration in seconds
+    """
+    if Counter is not None:
+        OUTBOX_BATCH_SECONDS.observe(duration)
+
+
+def set_backlog(pending: int, oldest_age: Optional[float]) -> None:
+    """
+    Publish the current outbox backlog.
+
+    Args:
+        pending: Pending event count
+        oldest_age: Age in seconds of the oldest pending event (None if empty)
+    """
+    if Counter is None:
+        return
+
+    OUTBOX_PENDING.set(pending)
+    OUTBOX_OLDEST_AGE.set(oldest_age or 0.0)
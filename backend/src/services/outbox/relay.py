@@ -0,0 +1,565 @@
+"""
+Background relay that applies outbox events to search and cache.
+
+Each batch claims the oldest pending events, collapses them to the set of
+affected vehicles and reads those vehicles' current rows. Vehicles that
+still exist are written to Elasticsearch with one bulk request, and deleted
+ones are removed with another. Their cache entries and the list and search
+caches are then invalidated, and the autocomplete index is marked stale;
+without Elasticsearch, so is the facet counts view. Applying the current
+row, not the event contents, makes every step idempotent, so an event that
+is retried after a partial failure, or delivered twice, converges on the
+same state.
+
+Events whose vehicle could not be written are rescheduled with exponential
+backoff; the rest of the batch is marked processed in the same transaction
+that claimed it. Each vehicle is applied under an advisory lock held until
+that transaction ends, and events of vehicles another relay is applying are
+left pending, so concurrent relays never write one vehicle out of order.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncContextManager, Callable, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.database.connection import get_session
+from src.database.models.outbox import OutboxAggregate, OutboxEvent
+from src.database.models.vehicle import Vehicle
+from src.services.cache.vehicle_cache import VehicleCache, get_vehicle_cache
+from src.services.configuration.constraint_graph import invalidate_compiled_rules
+from src.services.outbox import metrics
+from src.services.outbox.repository import OutboxRepository
+from src.services.search.autocomplete import AutocompleteIndex, get_autocomplete_index
+from src.services.search.elasticsearch_client import get_elasticsearch_client
+from src.services.search.vehicle_index import VehicleIndex
+from src.services.vehicles.facet_counts import (
+    FacetCountRefresher,
+    get_facet_count_refresher,
+)
+from src.services.vehicles.repository import VehicleRepository
+from src.services.vehicles.service import VehicleService
+
+logger = get_logger(__name__)
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+# Converts a vehicle row into its search document
+DocumentBuilder = Callable[[Vehicle], dict[str, Any]]
+
+
+class OutboxRelay:
+    """
+    Drains the transactional outbox into Elasticsearch and the cache.
+
+    Provides a single-batch entry point for tests and tooling and a
+    background loop that polls while the outbox is empty and drains
+    back-to-back while it is not.
+    """
+
+    # Seconds between backlog gauge refreshes and retention cleanups
+    BACKLOG_INTERVAL = 15.0
+    CLEANUP_INTERVAL = 3600.0
+
+    # Failed attempts after which each further failure is logged as an error
+    ALERT_AFTER_ATTEMPTS = 5
+
+    def __init__(
+        self,
+        session_factory: SessionFactory = get_session,
+        vehicle_index: Optional[VehicleIndex] = None,
+        vehicle_cache: Optional[VehicleCache] = None,
+        autocomplete: Optional[AutocompleteIndex] = None,
+        facet_counts: Optional[FacetCountRefresher] = None,
+        build_document: Optional[DocumentBuilder] = None,
+        batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        max_backoff: Optional[int] = None,
+        retention_hours: Optional[int] = None,
+    ):
+        """
+        Initialize outbox relay.
+
+        Args:
+            session_factory: Async context manager factory yielding a
+                session that commits on exit
+            vehicle_index: Vehicle search index (global client if None)
+            vehicle_cache: Vehicle cache service (uses global if None)
+            autocomplete: Suggestion index to mark stale (uses global if
+                None and autocomplete is enabled)
+            facet_counts: Facet counts view refresher to mark stale (uses
+                global if None and search is disabled)
+            build_document: Converts a vehicle row into its search document
+                (VehicleService response conversion if None)
+            batch_size: Events claimed per batch
+            poll_interval: Seconds to sleep when the outbox is empty
+            max_backoff: Maximum retry delay in seconds
+            retention_hours: Hours processed events are kept
+        """
+        settings = get_settings()
+        self._session_factory = session_factory
+        self._vehicle_index = vehicle_index
+        self._vehicle_cache = vehicle_cache
+        self._autocomplete = autocomplete
+        self._autocomplete_enabled = (
+            autocomplete is not None or settings.autocomplete_enabled
+        )
+        self._facet_counts = facet_counts
+        self._build_document = build_document
+        self._search_enabled = (
+            vehicle_index is not None or settings.elasticsearch_enabled
+        )
+        self.batch_size = batch_size or settings.outbox_batch_size
+        self.poll_interval = poll_interval or settings.outbox_poll_interval
+        self.max_backoff = max_backoff or settings.outbox_max_backoff
+        self.retention = timedelta(
+            hours=retention_hours or settings.outbox_retention_hours
+        )
+
+        self._task: Optional[asyncio.Task] = None
+        self._is_running = False
+        self._last_backlog = 0.0
+        self._last_cleanup = 0.0
+        self._stats = {
+            "batches": 0,
+            "processed": 0,
+            "failed": 0,
+            "failed_batches": 0,
+        }
+
+    async def _get_vehicle_index(self) -> Optional[VehicleIndex]:
+        """
+        Get the vehicle index, or None when search is disabled.
+
+        Returns:
+            Vehicle index instance
+        """
+        if self._vehicle_index is None and self._search_enabled:
+            self._vehicle_index = VehicleIndex(client=await get_elasticsearch_client())
+        return self._vehicle_index
+
+    async def _get_vehicle_cache(self) -> VehicleCache:
+        """
+        Get vehicle cache instance.
+
+        Returns:
+            Vehicle cache instance
+        """
+        if self._vehicle_cache is None:
+            self._vehicle_cache = await get_vehicle_cache()
+        return self._vehicle_cache
+
+    async def _get_autocomplete(self) -> Optional[AutocompleteIndex]:
+        """
+        Get the autocomplete index, or None when autocomplete is disabled.
+
+        Returns:
+            Autocomplete index instance
+        """
+        if self._autocomplete is None and self._autocomplete_enabled:
+            self._autocomplete = await get_autocomplete_index()
+        return self._autocomplete
+
+    async def _get_facet_counts(self) -> Optional[FacetCountRefresher]:
+        """
+        Get the facet counts refresher, or None when search is enabled.
+
+        Returns:
+            Facet count refresher instance
+        """
+        if self._facet_counts is None and not self._search_enabled:
+            self._facet_counts = await get_facet_count_refresher()
+        return self._facet_counts
+
+    @staticmethod
+    def affected_vehicle(event: OutboxEvent) -> Optional[uuid.UUID]:
+        """
+        Get the vehicle whose search document and cache an event touches.
+
+        Args:
+            event: Outbox event
+
+        Returns:
+            Vehicle id, or None if the event does not name one
+        """
+        if event.aggregate_type == OutboxAggregate.VEHICLE.value:
+            return event.aggregate_id
+
+        vehicle_id = (event.payload or {}).get("vehicle_id")
+        return uuid.UUID(vehicle_id) if vehicle_id else None
+
+    async def process_batch(self) -> int:
+        """
+        Claim and apply one batch of pending events.
+
+        Events of vehicles locked by another relay are left pending and
+        picked up by a later batch.
+
+        Returns:
+            Number of events applied or rescheduled
+
+        Raises:
+            SQLAlchemyError: If claiming or updating events fails
+        """
+        started = time.perf_counter()
+
+        async with self._session_factory() as session:
+            outbox = OutboxRepository(session)
+            events = await outbox.claim_batch(self.batch_size)
+            if not events:
+                return 0
+
+            locked = await outbox.lock_vehicles(
+                list(
+                    dict.fromkeys(
+                        vehicle_id
+                        for event in events
+                        if (vehicle_id := self.affected_vehicle(event)) is not None
+                    )
+                )
+            )
+            deferred = [
+                event
+                for event in events
+                if (vehicle_id := self.affected_vehicle(event)) is not None
+                and vehicle_id not in locked
+            ]
+            if deferred:
+                events = [event for event in events if event not in deferred]
+                logger.debug(
+                    "Outbox events deferred to another relay",
+                    events=len(deferred),
+                )
+
+            vehicle_ids = list(
+                dict.fromkeys(
+                    vehicle_id
+                    for event in events
+                    if (vehicle_id := self.affected_vehicle(event)) is not None
+                )
+            )
+
+            try:
+                failed_ids = await self._apply(session, vehicle_ids)
+                error = "Search document could not be built or was rejected"
+
+            except Exception as e:
+                logger.error(
+                    "Outbox batch failed, scheduling retry",
+                    events=len(events),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                failed_ids = set(vehicle_ids)
+                error = f"{type(e).__name__}: {e}"
+                self._stats["failed_batches"] += 1
+
+            failed = [e for e in events if self.affected_vehicle(e) in failed_ids]
+            processed = [
+                e for e in events if self.affected_vehicle(e) not in failed_ids
+            ]
+
+            await outbox.mark_processed(processed)
+            outbox.mark_failed(failed, error, self.max_backoff)
+
+        self._record(processed, failed)
+        metrics.observe_batch(time.perf_counter() - started)
+
+        logger.debug(
+            "Outbox batch applied",
+            events=len(events),
+            vehicles=len(vehicle_ids),
+            processed=len(processed),
+            failed=len(failed),
+            deferred=len(deferred),
+        )
+
+        return len(events)
+
+    async def _apply(
+        self,
+        session: AsyncSession,
+        vehicle_ids: list[uuid.UUID],
+    ) -> set[uuid.UUID]:
+        """
+        Bring search documents and caches of vehicles up to date.
+
+        Args:
+            session: Session of the claiming transaction
+            vehicle_ids: Affected vehicles
+
+        Returns:
+            Vehicles whose search document could not be built or written
+
+        Raises:
+            Exception: If the database, Elasticsearch or Redis is unavailable
+        """
+        if not vehicle_ids:
+            return set()
+
+        failed: set[uuid.UUID] = set()
+        index = await self._get_vehicle_index()
+
+        if index is not None:
+            vehicles = {
+                vehicle.id: vehicle
+                for vehicle in await VehicleRepository(session).get_many_by_ids(
+                    vehicle_ids
+                )
+            }
+            build_document = self._build_document or self._response_builder(session)
+
+            upserts = []
+            for vehicle in vehicles.values():
+                try:
+                    upserts.append((str(vehicle.id), build_document(vehicle)))
+                except Exception as e:
+                    failed.add(vehicle.id)
+                    logger.error(
+                        "Failed to build search document",
+                        vehicle_id=str(vehicle.id),
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+            deletes = [
+                str(vehicle_id)
+                for vehicle_id in vehicle_ids
+                if vehicle_id not in vehicles
+            ]
+
+            if upserts:
+                result = await index.bulk_index_documents(upserts)
+                failed |= self._failed_ids(result["errors"])
+            if deletes:
+                result = await index.bulk_delete_documents(deletes)
+                failed |= self._failed_ids(result["errors"])
+
+        cache = await self._get_vehicle_cache()
+        for vehicle_id in vehicle_ids:
+            await cache.invalidate_vehicle(vehicle_id)
+        await cache.invalidate_vehicle_lists()
+        await cache.invalidate_search_results()
+        invalidate_compiled_rules(*vehicle_ids)
+
+        autocomplete = await self._get_autocomplete()
+        if autocomplete is not None:
+            autocomplete.mark_stale()
+
+        facet_counts = await self._get_facet_counts()
+        if facet_counts is not None:
+            facet_counts.mark_stale()
+
+        return failed
+
+    @staticmethod
+    def _response_builder(session: AsyncSession) -> DocumentBuilder:
+        """
+        Build search documents the same way the vehicle service does.
+
+        Args:
+            session: Session of the claiming transaction
+
+        Returns:
+            Document builder
+        """
+        to_response = VehicleService(session=session)._to_response
+        return lambda vehicle: VehicleIndex.prepare_document(to_response(vehicle))
+
+    @staticmethod
+    def _failed_ids(errors: list[dict[str, Any]]) -> set[uuid.UUID]:
+        """
+        Get the vehicle ids of failed bulk items.
+
+        Args:
+            errors: Bulk error items, keyed by operation type
+
+        Returns:
+            Vehicle ids with at least one failed item
+        """
+        ids = set()
+        for error in errors:
+            for item in error.values():
+                if item.get("_id"):
+                    ids.add(uuid.UUID(item["_id"]))
+        return ids
+
+    def _record(
+        self,
+        processed: Sequence[OutboxEvent],
+        failed: Sequence[OutboxEvent],
+    ) -> None:
+        """
+        Update statistics and metrics for a finished batch.
+
+        Args:
+            processed: Applied events
+            failed: Events scheduled for retry
+        """
+        self._stats["batches"] += 1
+        self._stats["processed"] += len(processed)
+        self._stats["failed"] += len(failed)
+
+        now = datetime.now(timezone.utc)
+        for event in processed:
+            metrics.record_events(event.aggregate_type, "processed")
+            if event.created_at is not None:
+                metrics.observe_delivery((now - event.created_at).total_seconds())
+
+        for event in failed:
+            metrics.record_events(event.aggregate_type, "failed")
+            if event.attempts >= self.ALERT_AFTER_ATTEMPTS:
+                logger.error(
+                    "Outbox event keeps failing",
+                    event_id=event.id,
+                    aggregate_type=event.aggregate_type,
+                    aggregate_id=str(event.aggregate_id),
+                    attempts=event.attempts,
+                    last_error=event.last_error,
+                )
+
+    async def update_backlog(self) -> dict[str, Any]:
+        """
+        Refresh the backlog gauges.
+
+        Returns:
+            Dictionary with pending count and oldest pending age in seconds
+        """
+        async with self._session_factory() as session:
+            backlog = await OutboxRepository(session).get_backlog()
+
+        oldest = backlog["oldest_created_at"]
+        age = (
+            (datetime.now(timezone.utc) - oldest).total_seconds()
+            if oldest is not None
+            else None
+        )
+        metrics.set_backlog(backlog["pending"], age)
+
+        return {"pending": backlog["pending"], "oldest_age_seconds": age}
+
+    async def cleanup(self) -> int:
+        """
+        Delete processed events past the retention period.
+
+        Returns:
+            Number of deleted events
+        """
+        cutoff = datetime.now(timezone.utc) - self.retention
+        async with self._session_factory() as session:
+            deleted = await OutboxRepository(session).delete_processed_before(cutoff)
+
+        if deleted:
+            logger.info("Processed outbox events cleaned up", deleted=deleted)
+        return deleted
+
+    async def _run_loop(self) -> None:
+        """Drain the outbox until stopped."""
+        while self._is_running:
+            claimed = 0
+            try:
+                claimed = await self.process_batch()
+
+                now = time.monotonic()
+                if now - self._last_backlog >= self.BACKLOG_INTERVAL:
+                    self._last_backlog = now
+                    await self.update_backlog()
+                if now - self._last_cleanup >= self.CLEANUP_INTERVAL:
+                    self._last_cleanup = now
+                    await self.cleanup()
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                logger.error(
+                    "Error in outbox relay loop",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+            # A full batch means more is waiting; drain without sleeping
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def start(self) -> None:
+        """
+        Start the background relay loop.
+
+        Raises:
+            RuntimeError: If relay is already running
+        """
+        if self._is_running:
+            raise RuntimeError("Outbox relay is already running")
+
+        self._is_running = True
+        self._task = asyncio.create_task(self._run_loop())
+
+        logger.info(
+            "Outbox relay started",
+            batch_size=self.batch_size,
+            poll_interval=self.poll_interval,
+        )
+
+    async def stop(self) -> None:
+        """
+        Stop the background relay loop.
+
+        Events claimed by an interrupted batch stay pending and are picked
+        up again on the next start.
+        """
+        if not self._is_running:
+            return
+
+        self._is_running = False
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        logger.info("Outbox relay stopped", **self._stats)
+
+    def get_statistics(self) -> dict[str, Any]:
+        """
+        Get outbox relay statistics.
+
+        Returns:
+            Dictionary containing batch and event counts
+        """
+        return {**self._stats, "is_running": self._is_running}
+
+
+_outbox_relay: Optional[OutboxRelay] = None
+
+
+async def get_outbox_relay() -> OutboxRelay:
+    """
+    Get or create global outbox relay instance.
+
+    Returns:
+        Singleton outbox relay instance
+    """
+    global _outbox_relay
+
+    if _outbox_relay is None:
+        _outbox_relay = OutboxRelay()
+
+    return _outbox_relay
+
+
+async def close_outbox_relay() -> None:
+    """
+    Stop the global outbox relay.
+    """
+    global _outbox_relay
+
+    if _outbox_relay is not None:
+        await _outbox_relay.stop()
+        _outbox_relay = None
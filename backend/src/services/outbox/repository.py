@@ -0,0 +1,308 @@
+"""
+Outbox repository for recording and draining catalog change events.
+
+Writers add events to the session of the change they describe, so the event
+commits or rolls back with it. The relay claims pending events with
+FOR UPDATE SKIP LOCKED, which lets several relay instances drain the outbox
+concurrently without applying the same event twice at the same time. Events
+of one vehicle can still be claimed by two relays at once, so a relay also
+takes a transaction-scoped advisory lock per vehicle before applying them;
+the relay that loses leaves its events pending for a later batch.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import (
+    BigInteger,
+    and_,
+    bindparam,
+    delete,
+    func,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+from src.database.models.outbox import OutboxAggregate, OutboxEvent, OutboxEventType
+
+logger = get_logger(__name__)
+
+# Takes every free advisory lock among the keys without waiting for the rest
+_TRY_LOCK_KEYS = text(
+    "SELECT key FROM unnest(:keys) AS key WHERE pg_try_advisory_xact_lock(key)"
+).bindparams(bindparam("keys", type_=ARRAY(BigInteger)))
+
+
+def vehicle_lock_key(vehicle_id: uuid.UUID) -> int:
+    """
+    Get the advisory lock key serializing outbox work on a vehicle.
+
+    Both halves of the id are folded together; vehicles whose keys collide
+    are merely applied one after the other.
+
+    Args:
+        vehicle_id: Vehicle identifier
+
+    Returns:
+        Signed 64-bit lock key
+    """
+    folded = (vehicle_id.int >> 64) ^ (vehicle_id.int & 0xFFFFFFFFFFFFFFFF)
+    return int.from_bytes(folded.to_bytes(8, "big"), "big", signed=True)
+
+
+class OutboxRepository:
+    """
+    Repository for transactional outbox events.
+
+    Attributes:
+        session: Async database session for operations
+    """
+
+    # Characters of an error message kept on a failed event
+    MAX_ERROR_LENGTH = 1000
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize outbox repository.
+
+        Args:
+            session: Async database session
+        """
+        self.session = session
+
+    def add(
+        self,
+        aggregate_type: OutboxAggregate,
+        aggregate_id: uuid.UUID,
+        event_type: OutboxEventType,
+        payload: Optional[dict[str, Any]] = None,
+    ) -> OutboxEvent:
+        """
+        Record a change event in the current transaction.
+
+        The event is flushed and committed together with the change.
+
+        Args:
+            aggregate_type: Changed record kind
+            aggregate_id: Changed record id
+            event_type: Change kind
+            payload: Extra identifiers needed to apply the event
+
+        Returns:
+            Pending outbox event
+        """
+        event = OutboxEvent(
+            aggregate_type=aggregate_type.value,
+            aggregate_id=aggregate_id,
+            event_type=event_type.value,
+            payload=payload or {},
+        )
+        self.session.add(event)
+
+        logger.debug(
+            "Outbox event recorded",
+            aggregate_type=aggregate_type.value,
+            aggregate_id=str(aggregate_id),
+            event_type=event_type.value,
+        )
+
+        return event
+
+    async def claim_batch(self, limit: int) -> Sequence[OutboxEvent]:
+        """
+        Lock the oldest pending events that are due.
+
+        Rows stay locked until the session's transaction ends; events
+        locked by another relay are skipped.
+
+        Args:
+            limit: Maximum events to claim
+
+        Returns:
+            Claimed events in id order
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            stmt = (
+                select(OutboxEvent)
+                .where(
+                    and_(
+                        OutboxEvent.processed_at.is_(None),
+                        OutboxEvent.available_at <= func.now(),
+                    )
+                )
+                .order_by(OutboxEvent.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+
+            result = await self.session.execute(stmt)
+            return result.scalars().all()
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to claim outbox events",
+                limit=limit,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+    async def lock_vehicles(
+        self, vehicle_ids: Sequence[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        """
+        Lock vehicles for applying their events, skipping locked ones.
+
+        Locks are held until the session's transaction ends, so two relays
+        never write the same vehicle's search document concurrently and a
+        stale read cannot land after a newer one.
+
+        Args:
+            vehicle_ids: Vehicles of the claimed events
+
+        Returns:
+            Vehicles locked by this transaction; the others are being
+            applied by another relay
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not vehicle_ids:
+            return set()
+
+        keys = {vehicle_lock_key(vehicle_id): vehicle_id for vehicle_id in vehicle_ids}
+
+        try:
+            result = await self.session.execute(_TRY_LOCK_KEYS, {"keys": list(keys)})
+            return {keys[key] for key in result.scalars().all()}
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to lock outbox vehicles",
+                count=len(vehicle_ids),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+    async def mark_processed(self, events: Sequence[OutboxEvent]) -> None:
+        """
+        Mark events as applied.
+
+        Args:
+            events: Claimed events
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not events:
+            return
+
+        try:
+            stmt = (
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_([event.id for event in events]))
+                .values(processed_at=func.now(), last_error=None)
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.execute(stmt)
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to mark outbox events processed",
+                count=len(events),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+    def mark_failed(
+        self,
+        events: Sequence[OutboxEvent],
+        error: str,
+        max_backoff: int,
+    ) -> None:
+        """
+        Schedule failed events for a retry with exponential backoff.
+
+        Args:
+            events: Claimed events that could not be applied
+            error: Failure description
+            max_backoff: Maximum retry delay in seconds
+        """
+        now = datetime.now(timezone.utc)
+        for event in events:
+            event.attempts += 1
+            delay = min(2 ** event.attempts, max_backoff)
+            event.available_at = now + timedelta(seconds=delay)
+            event.last_error = error[: self.MAX_ERROR_LENGTH]
+
+    async def get_backlog(self) -> dict[str, Any]:
+        """
+        Get the number and age of pending events.
+
+        Returns:
+            Dictionary with ``pending`` count and ``oldest_created_at``
+            (None when the outbox is drained)
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            stmt = select(
+                func.count(OutboxEvent.id),
+                func.min(OutboxEvent.created_at),
+            ).where(OutboxEvent.processed_at.is_(None))
+
+            result = await self.session.execute(stmt)
+            pending, oldest = result.one()
+            return {"pending": pending, "oldest_created_at": oldest}
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to read outbox backlog",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+    async def delete_processed_before(self, cutoff: datetime) -> int:
+        """
+        Delete applied events older than a cutoff.
+
+        Args:
+            cutoff: Processed-at timestamp before which events are removed
+
+        Returns:
+            Number of deleted events
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            stmt = delete(OutboxEvent).where(
+                and_(
+                    OutboxEvent.processed_at.is_not(None),
+                    OutboxEvent.processed_at < cutoff,
+                )
+            )
+            result = await self.session.execute(stmt)
+            return result.rowcount or 0
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to delete processed outbox events",
+                cutoff=cutoff.isoformat(),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
@@ -8,13 +8,14 @@ configurations. Implements proper authorization checks, caching, and error handl
 
 import secrets
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache.negative_cache import NegativeCache, get_negative_cache
 from src.core.logging import get_logger
 from src.database.models.saved_configuration import SavedConfiguration
 from src.database.models.vehicle_configuration import VehicleConfiguration
@@ -77,16 +78,40 @@ class SavedConfigurationService:
     vehicle configurations with proper authorization and error handling.
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        negative_cache: Optional[NegativeCache] = None,
+    ):
         """
         Initialize saved configuration service.
 
         Args:
             session: Async database session
+            negative_cache: Optional cache of share tokens known not to exist
         """
         self.session = session
+        self._negative_cache = negative_cache
         logger.debug("SavedConfigurationService initialized")
 
+    async def _get_negative_cache(self) -> NegativeCache:
+        """Get or create negative cache instance."""
+        if self._negative_cache is None:
+            self._negative_cache = await get_negative_cache()
+        return self._negative_cache
+
+    async def record_share_token(self, share_token: str) -> None:
+        """
+        Make a share token visible to lookups.
+
+        Call after the transaction that created the token commits.
+
+        Args:
+            share_token: Committed share token
+        """
+        negative_cache = await self._get_negative_cache()
+        await negative_cache.record_created(NegativeCache.SHARE_TOKEN, share_token)
+
     async def save_configuration(
         self,
         user_id: UUID,
@@ -97,6 +122,8 @@ class SavedConfigurationService:
         """
         Save a vehicle configuration for a user.
 
+        After committing, pass the share token to record_share_token().
+
         Args:
             user_id: ID of user saving configuration
             configuration_id: ID of configuration to save
@@ -436,6 +463,8 @@ class SavedConfigurationService:
         """
         Generate or regenerate share token for configuration.
 
+        After committing, pass the token to record_share_token().
+
         Args:
             config_id: ID of saved configuration
             user_id: ID of user requesting token
@@ -502,6 +531,10 @@ class SavedConfigurationService:
         Raises:
             InvalidShareTokenError: If token invalid or configuration not accessible
         """
+        negative_cache = await self._get_negative_cache()
+        if await negative_cache.is_missing(NegativeCache.SHARE_TOKEN, share_token):
+            raise InvalidShareTokenError(share_token)
+
         try:
             stmt = select(SavedConfiguration).where(
                 SavedConfiguration.share_token == share_token,
@@ -512,6 +545,9 @@ class SavedConfigurationService:
             saved_config = result.scalar_one_or_none()
 
             if not saved_config:
+                await negative_cache.mark_missing(
+                    NegativeCache.SHARE_TOKEN, share_token
+                )
                 raise InvalidShareTokenError(share_token)
 
             # Verify configuration is shareable
@@ -544,6 +580,32 @@ class SavedConfigurationService:
                 token_prefix=share_token[:8],
             ) from e
 
+    async def stream_share_tokens(
+        self,
+        batch_size: int = 5000,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the share tokens of all non-deleted configurations.
+
+        Args:
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Share tokens
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        stmt = (
+            select(SavedConfiguration.share_token)
+            .where(SavedConfiguration.deleted_at.is_(None))
+            .execution_options(yield_per=batch_size)
+        )
+
+        result = await self.session.stream_scalars(stmt)
+        async for share_token in result:
+            yield share_token
+
     async def get_statistics(
         self,
         user_id: Optional[UUID] = None,
@@ -613,14 +675,16 @@ class SavedConfigurationService:
 
 def get_saved_configuration_service(
     session: AsyncSession,
+    negative_cache: Optional[NegativeCache] = None,
 ) -> SavedConfigurationService:
     """
     Factory function for creating SavedConfigurationService instance.
 
     Args:
         session: Async database session
+        negative_cache: Optional cache of share tokens known not to exist
 
     Returns:
         SavedConfigurationService instance
     """
-    return SavedConfigurationService(session)
\ No newline at end of file
+    return SavedConfigurationService(session, negative_cache=negative_cache)
\ No newline at end of file
@@ -0,0 +1,380 @@
+"""
+In-process autocomplete index for make and model suggestions.
+
+The make/model vocabulary is a few thousand strings, so suggestions are
+served from memory instead of an Elasticsearch completion round trip per
+keystroke. Each field keeps a sorted array of normalized keys; a prefix
+lookup is two binary searches that bound the matching slice. Every term is
+keyed by its full text and by each later word, so "cher" finds
+"Grand Cherokee".
+
+Terms are ranked by popularity: the number of active vehicles carrying the
+term plus the access counts VehicleAccessRecorder collects for the most
+viewed vehicles. Ranks are fixed at build time, so ordering a lookup's
+matches is a sort of small integers.
+
+The index is built from the catalog at startup and rebuilt in the
+background when the outbox relay reports catalog changes or it exceeds its
+maximum age. A rebuild swaps in new arrays in one assignment, so lookups
+never see a partial index.
+"""
+
+import re
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import AsyncContextManager, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.redis_client import RedisClient, get_redis_client
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.database.connection import get_session
+from src.services.cache.access_recorder import VehicleAccessRecorder
+from src.services.vehicles.repository import VehicleRepository
+
+logger = get_logger(__name__)
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+# Boundaries after which a later word of a term starts
+WORD_START_PATTERN = re.compile(r"[\s\-/]+")
+
+# Sorts after every character a normalized prefix can continue with
+PREFIX_END = "\U0010ffff"
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """
+    Autocomplete suggestion.
+
+    Attributes:
+        text: Term as displayed in the catalog
+        weight: Popularity weight the term was ranked by
+    """
+
+    text: str
+    weight: float
+
+
+@dataclass(frozen=True)
+class _FieldIndex:
+    """Sorted prefix keys of one field and the ranked terms they point to."""
+
+    keys: list[str]
+    ranks: list[int]
+    terms: list[Suggestion]
+
+
+def normalize_term(text: str) -> str:
+    """
+    Normalize a term or prefix for matching.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Lowercased text with collapsed whitespace
+    """
+    return " ".join(text.lower().split())
+
+
+class AutocompleteIndex:
+    """
+    Popularity-ranked prefix index of catalog makes and models.
+
+    Provides synchronous lookups for request handlers and an async refresh
+    that rebuilds the index from the database and Redis.
+    """
+
+    FIELDS = ("make", "model")
+
+    # Weight of one vehicle access relative to one catalog vehicle
+    POPULARITY_WEIGHT = 1.0
+
+    def __init__(
+        self,
+        session_factory: SessionFactory = get_session,
+        redis_client: Optional[RedisClient] = None,
+        popular_vehicles: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        """
+        Initialize autocomplete index.
+
+        Args:
+            session_factory: Async context manager factory yielding a session
+            redis_client: Redis client for access counts (uses global if None)
+            popular_vehicles: Most accessed vehicles whose counts feed ranking
+                (defaults to settings)
+            max_age: Seconds after which the index is rebuilt even without
+                catalog changes (defaults to settings)
+        """
+        settings = get_settings()
+        self._session_factory = session_factory
+        self._redis_client = redis_client
+        self.popular_vehicles = (
+            settings.autocomplete_popular_vehicles
+            if popular_vehicles is None
+            else popular_vehicles
+        )
+        self.max_age = max_age or settings.autocomplete_max_age
+
+        self._fields: dict[str, _FieldIndex] = {}
+        self._built_at: Optional[float] = None
+        self._stale = True
+        self._stats = {
+            "lookups": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "failed_refreshes": 0,
+        }
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the index has been built at least once."""
+        return self._built_at is not None
+
+    def mark_stale(self) -> None:
+        """Request a rebuild on the next refresh check."""
+        self._stale = True
+
+    def needs_refresh(self, now: Optional[float] = None) -> bool:
+        """
+        Check whether the index should be rebuilt.
+
+        Args:
+            now: Current monotonic time, for testing
+
+        Returns:
+            True if the index is unbuilt, stale or past its maximum age
+        """
+        if self._stale or self._built_at is None:
+            return True
+        now = time.monotonic() if now is None else now
+        return now - self._built_at >= self.max_age
+
+    def suggest(self, field: str, prefix: str, limit: int = 10) -> list[Suggestion]:
+        """
+        Get the most popular terms of a field matching a prefix.
+
+        Args:
+            field: Field to suggest from (make or model)
+            prefix: Prefix typed so far
+            limit: Maximum suggestions
+
+        Returns:
+            Matching terms, most popular first
+        """
+        self._stats["lookups"] += 1
+        index = self._fields.get(field)
+        key = normalize_term(prefix)
+        if index is None or not key:
+            self._stats["misses"] += 1
+            return []
+
+        start = bisect_left(index.keys, key)
+        end = bisect_left(index.keys, key + PREFIX_END, lo=start)
+        ranks = sorted(set(index.ranks[start:end]))[:limit]
+
+        if not ranks:
+            self._stats["misses"] += 1
+        return [index.terms[rank] for rank in ranks]
+
+    def build(self, weights: dict[str, dict[str, float]]) -> None:
+        """
+        Replace the index contents.
+
+        Case variants of a term are merged under the variant with the
+        highest weight.
+
+        Args:
+            weights: Term weights keyed by field, then by display text
+        """
+        fields: dict[str, _FieldIndex] = {}
+
+        for field in self.FIELDS:
+            variants: dict[str, list[tuple[float, str]]] = defaultdict(list)
+            for text, weight in weights.get(field, {}).items():
+                if text and text.strip():
+                    variants[normalize_term(text)].append((weight, text))
+
+            merged = [
+                (normalized, max(options)[1], sum(w for w, _ in options))
+                for normalized, options in variants.items()
+            ]
+            merged.sort(key=lambda term: (-term[2], len(term[0]), term[0]))
+
+            entries = sorted(
+                (key, rank)
+                for rank, (normalized, _, _) in enumerate(merged)
+                for key in self._prefix_keys(normalized)
+            )
+            fields[field] = _FieldIndex(
+                keys=[key for key, _ in entries],
+                ranks=[rank for _, rank in entries],
+                terms=[Suggestion(text=text, weight=weight) for _, text, weight in merged],
+            )
+
+        self._fields = fields
+        self._built_at = time.monotonic()
+
+    @staticmethod
+    def _prefix_keys(normalized: str) -> set[str]:
+        """
+        Get the keys a term is found under.
+
+        Args:
+            normalized: Normalized term
+
+        Returns:
+            The term itself and its suffixes starting at each later word
+        """
+        keys = {normalized}
+        for match in WORD_START_PATTERN.finditer(normalized):
+            if match.end() < len(normalized):
+                keys.add(normalized[match.end():])
+        return keys
+
+    async def _get_redis_client(self) -> RedisClient:
+        """
+        Get Redis client instance.
+
+        Returns:
+            Redis client instance
+
+        Raises:
+            ConnectionError: If Redis connection fails
+        """
+        if self._redis_client is None:
+            self._redis_client = await get_redis_client()
+        return self._redis_client
+
+    async def refresh(self) -> int:
+        """
+        Rebuild the index from the catalog and recorded popularity.
+
+        Access counts are optional: if Redis is unavailable, terms are
+        ranked by vehicle counts alone. A failed rebuild keeps the
+        previous index and leaves it marked stale.
+
+        Returns:
+            Number of indexed terms
+
+        Raises:
+            SQLAlchemyError: If the catalog cannot be read
+        """
+        self._stale = False
+        started = time.perf_counter()
+        weights: dict[str, dict[str, float]] = {
+            field: defaultdict(float) for field in self.FIELDS
+        }
+
+        try:
+            async with self._session_factory() as session:
+                repository = VehicleRepository(session)
+                for make, model, count in await repository.get_make_model_counts():
+                    weights["make"][make] += count
+                    weights["model"][model] += count
+
+                for (make, model), score in (
+                    await self._load_popularity(repository)
+                ).items():
+                    weights["make"][make] += score
+                    weights["model"][model] += score
+
+        except Exception:
+            self._stale = True
+            self._stats["failed_refreshes"] += 1
+            raise
+
+        self.build(weights)
+        self._stats["refreshes"] += 1
+        terms = sum(len(index.terms) for index in self._fields.values())
+
+        logger.info(
+            "Autocomplete index rebuilt",
+            terms=terms,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+        return terms
+
+    async def _load_popularity(
+        self, repository: VehicleRepository
+    ) -> dict[tuple[str, str], float]:
+        """
+        Sum the access counts of the most accessed vehicles per make and model.
+
+        Args:
+            repository: Repository of the refresh session
+
+        Returns:
+            Weighted access counts keyed by (make, model)
+        """
+        if self.popular_vehicles <= 0:
+            return {}
+
+        try:
+            redis = await self._get_redis_client()
+            popular = await redis.zrevrange(
+                VehicleAccessRecorder.ACCESS_COUNTS_KEY,
+                0,
+                self.popular_vehicles - 1,
+                withscores=True,
+            )
+        except Exception as e:
+            logger.warning(
+                "Access counts unavailable, ranking suggestions by vehicle counts",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return {}
+
+        scores = {UUID(str(vehicle_id)): float(score) for vehicle_id, score in popular}
+        popularity: dict[tuple[str, str], float] = defaultdict(float)
+        for vehicle_id, make_model in (
+            await repository.get_make_model_by_ids(list(scores))
+        ).items():
+            popularity[make_model] += scores[vehicle_id] * self.POPULARITY_WEIGHT
+
+        return popularity
+
+    def get_statistics(self) -> dict[str, float | int | bool]:
+        """
+        Get autocomplete index statistics.
+
+        Returns:
+            Dictionary containing lookup and refresh counts and term counts
+        """
+        return {
+            **self._stats,
+            **{
+                f"{field}_terms": len(index.terms)
+                for field, index in self._fields.items()
+            },
+            "is_ready": self.is_ready,
+            "is_stale": self._stale,
+        }
+
+
+_autocomplete_index: Optional[AutocompleteIndex] = None
+
+
+async def get_autocomplete_index() -> AutocompleteIndex:
+    """
+    Get or create global autocomplete index instance.
+
+    Returns:
+        Singleton autocomplete index instance
+    """
+    global _autocomplete_index
+
+    if _autocomplete_index is None:
+        _autocomplete_index = AutocompleteIndex()
+
+    return _autocomplete_index
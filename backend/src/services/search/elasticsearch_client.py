@@ -313,7 +313,12 @@ class ElasticsearchClient:
             ) from e
 
     async def create_index(
-        self, index_name: str, mappings: dict[str, Any], settings: Optional[dict[str, Any]] = None
+        self,
+        index_name: str,
+        mappings: dict[str, Any],
+        settings: Optional[dict[str, Any]] = None,
+        aliases: Optional[dict[str, Any]] = None,
+        exist_ok: bool = True,
     ) -> None:
         """
         Create index with mappings and settings.
@@ -322,6 +327,9 @@ class ElasticsearchClient:
             index_name: Name of the index to create
             mappings: Index mappings configuration
             settings: Optional index settings
+            aliases: Optional aliases to attach on creation
+            exist_ok: Return quietly if the index already exists; when False
+                the create request itself fails, so only one caller wins
 
         Raises:
             ElasticsearchIndexError: If index creation fails
@@ -331,13 +339,15 @@ class ElasticsearchClient:
 
         try:
             # Check if index already exists
-            if await self.index_exists(index_name):
+            if exist_ok and await self.index_exists(index_name):
                 logger.warning("Index already exists", index=index_name)
                 return
 
             body: dict[str, Any] = {"mappings": mappings}
             if settings:
                 body["settings"] = settings
+            if aliases:
+                body["aliases"] = aliases
 
             await self._client.indices.create(index=index_name, body=body)
 
@@ -359,6 +369,7 @@ class ElasticsearchClient:
                 index=index_name,
                 error=str(e),
                 status_code=e.status_code,
+                reason=e.error,
             ) from e
 
         except Exception as e:
@@ -461,6 +472,111 @@ class ElasticsearchClient:
                 error_type=type(e).__name__,
             ) from e
 
+    async def get_aliases(self, index_pattern: str) -> dict[str, list[str]]:
+        """
+        Get the aliases of every index matching a pattern.
+
+        Args:
+            index_pattern: Index name or wildcard pattern
+
+        Returns:
+            Mapping of index name to its alias names; indices without
+            aliases map to an empty list
+
+        Raises:
+            ElasticsearchIndexError: If the lookup fails
+        """
+        if not self._client:
+            raise ElasticsearchConnectionError("Client not connected")
+
+        try:
+            response = await self._client.indices.get_alias(index=index_pattern)
+            return {
+                index: sorted(details.get("aliases", {}))
+                for index, details in dict(response).items()
+            }
+
+        except NotFoundError:
+            return {}
+
+        except Exception as e:
+            logger.error(
+                "Failed to get index aliases",
+                index=index_pattern,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise ElasticsearchIndexError(
+                "Failed to get index aliases",
+                index=index_pattern,
+                error=str(e),
+                error_type=type(e).__name__,
+            ) from e
+
+    async def update_aliases(self, actions: list[dict[str, Any]]) -> None:
+        """
+        Apply alias add/remove actions atomically.
+
+        Args:
+            actions: Alias actions, e.g. ``{"add": {"index": ..., "alias": ...}}``
+
+        Raises:
+            ElasticsearchIndexError: If the update fails
+        """
+        if not self._client:
+            raise ElasticsearchConnectionError("Client not connected")
+
+        try:
+            await self._client.indices.update_aliases(actions=actions)
+
+            logger.info("Index aliases updated", actions=actions)
+
+        except Exception as e:
+            logger.error(
+                "Failed to update index aliases",
+                actions=actions,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise ElasticsearchIndexError(
+                "Failed to update index aliases",
+                error=str(e),
+                error_type=type(e).__name__,
+            ) from e
+
+    async def put_settings(self, index_name: str, settings: dict[str, Any]) -> None:
+        """
+        Update dynamic settings of an index.
+
+        Args:
+            index_name: Name of the index to update
+            settings: Dynamic index settings
+
+        Raises:
+            ElasticsearchIndexError: If the update fails
+        """
+        if not self._client:
+            raise ElasticsearchConnectionError("Client not connected")
+
+        try:
+            await self._client.indices.put_settings(index=index_name, settings=settings)
+
+            logger.debug("Index settings updated", index=index_name, settings=settings)
+
+        except Exception as e:
+            logger.error(
+                "Failed to update index settings",
+                index=index_name,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise ElasticsearchIndexError(
+                "Failed to update index settings",
+                index=index_name,
+                error=str(e),
+                error_type=type(e).__name__,
+            ) from e
+
     @property
     def client(self) -> AsyncElasticsearch:
         """
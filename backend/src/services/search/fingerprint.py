@@ -0,0 +1,173 @@
+"""
+Canonical fingerprints of vehicle search requests for result caching.
+
+Requests that differ only in ways Elasticsearch ignores should share a cache
+entry: the full-text query is analyzed case-insensitively, so it is
+lowercased and its whitespace collapsed, and filters are serialized with
+sorted keys and normalized decimals. Keyword filters such as make are
+matched case-sensitively and keep their case.
+
+Facet aggregations are the costliest part of a search and barely move with
+small price changes, so facets are fingerprinted and computed with price
+bounds widened to whole price buckets. Nearby price slider positions then
+share one facet entry, while hit pages keep the exact bounds.
+"""
+
+import json
+from dataclasses import dataclass
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from typing import Any, Optional
+
+from src.schemas.vehicles import VehicleSearchRequest
+
+# Request fields that select a page of hits rather than the matching set
+PAGE_FIELDS = frozenset(
+    {
+        "page",
+        "page_size",
+        "cursor",
+        "total_mode",
+        "sort_by",
+        "sort_order",
+        "search_query",
+    }
+)
+
+CENTS = Decimal("0.01")
+
+
+@dataclass(frozen=True)
+class SearchFingerprint:
+    """
+    Canonical identity of a search request.
+
+    Attributes:
+        query: Normalized full-text query ("" when absent)
+        page_filters: Canonical filters plus pagination and sort, keying
+            a page of hits
+        facet_filters: Canonical filters with bucketed prices, keying facets
+    """
+
+    query: str
+    page_filters: dict[str, Any]
+    facet_filters: dict[str, Any]
+
+
+def normalize_query(query: Optional[str]) -> str:
+    """
+    Normalize a full-text query for fingerprinting.
+
+    Args:
+        query: Raw search query
+
+    Returns:
+        Lowercased query with collapsed whitespace ("" when absent)
+    """
+    if not query:
+        return ""
+    return " ".join(query.lower().split())
+
+
+def bucket_price_range(
+    price_min: Optional[Decimal],
+    price_max: Optional[Decimal],
+    bucket: int,
+) -> tuple[Optional[Decimal], Optional[Decimal]]:
+    """
+    Widen price bounds outward to whole buckets.
+
+    Args:
+        price_min: Lower price bound
+        price_max: Upper price bound
+        bucket: Bucket width; 0 disables bucketing
+
+    Returns:
+        Tuple of (bucketed lower bound, bucketed upper bound)
+    """
+    if bucket <= 0:
+        return price_min, price_max
+
+    step = Decimal(bucket)
+    if price_min is not None:
+        price_min = (price_min / step).to_integral_value(rounding=ROUND_FLOOR) * step
+    if price_max is not None:
+        price_max = (price_max / step).to_integral_value(rounding=ROUND_CEILING) * step
+    return price_min, price_max
+
+
+def facet_request(
+    search_request: VehicleSearchRequest, price_bucket: int
+) -> VehicleSearchRequest:
+    """
+    Derive the request facets are computed for.
+
+    Args:
+        search_request: Original search request
+        price_bucket: Price bucket width; 0 disables bucketing
+
+    Returns:
+        Request with bucketed price bounds
+    """
+    price_min, price_max = bucket_price_range(
+        search_request.price_min, search_request.price_max, price_bucket
+    )
+    return search_request.model_copy(
+        update={"price_min": price_min, "price_max": price_max}
+    )
+
+
+def _canonical_value(value: Any) -> Any:
+    """Convert a filter value to a stable, JSON-compatible form."""
+    if isinstance(value, Decimal):
+        return str(value.quantize(CENTS))
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return value
+
+
+def canonical_filters(search_request: VehicleSearchRequest) -> dict[str, Any]:
+    """
+    Get the filters of a request in canonical form.
+
+    Args:
+        search_request: Search request
+
+    Returns:
+        Set filters keyed by field, in sorted key order
+    """
+    values = search_request.model_dump(exclude=set(PAGE_FIELDS))
+    return {
+        field: _canonical_value(values[field])
+        for field in sorted(values)
+        if values[field] is not None
+    }
+
+
+def fingerprint_search(
+    search_request: VehicleSearchRequest, price_bucket: int
+) -> SearchFingerprint:
+    """
+    Fingerprint a search request for caching.
+
+    Args:
+        search_request: Search request
+        price_bucket: Price bucket width for facets; 0 disables bucketing
+
+    Returns:
+        Canonical request fingerprint
+    """
+    page_filters = canonical_filters(search_request)
+    page_filters.update(
+        page=search_request.page,
+        page_size=search_request.page_size,
+        sort_by=search_request.sort_by or "relevance",
+        sort_order=search_request.sort_order.lower(),
+    )
+
+    return SearchFingerprint(
+        query=normalize_query(search_request.search_query),
+        page_filters=page_filters,
+        facet_filters=canonical_filters(facet_request(search_request, price_bucket)),
+    )
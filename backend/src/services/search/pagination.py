@@ -0,0 +1,124 @@
+"""
+Search cursors for deep pagination over Elasticsearch.
+
+Offset paging makes every shard collect and sort ``from + size`` hits, so
+deep pages get slower the further a client goes and stop working entirely
+at the index's ``max_result_window``. Cursor paging instead continues after
+the sort values of the previous page's last hit with ``search_after``, and
+pins the result set to a point-in-time (PIT) so documents indexed or removed
+while a client pages do not shift or duplicate results.
+
+Cursors are opaque to clients: they are URL-safe base64 JSON recording the
+sort, the last hit's sort values, the PIT id and the total counted on the
+first page. A cursor is only valid for the sort it was issued for.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# Sort name recorded for relevance-ordered results
+RELEVANCE_SORT = "relevance"
+
+
+class InvalidSearchCursorError(ValueError):
+    """Raised when a search cursor is malformed or was issued for another sort."""
+
+
+@dataclass(frozen=True)
+class SearchCursor:
+    """
+    Position after the last hit of a search page.
+
+    Attributes:
+        sort_by: Sort field the cursor was issued for
+        sort_order: Sort order the cursor was issued for
+        search_after: Sort values of the last hit returned
+        pit_id: Point-in-time id, None until a client continues past page one
+        page: Page number the cursor leads to
+        total: Total counted on the first page
+        total_is_estimate: Whether total is a lower bound
+    """
+
+    sort_by: str
+    sort_order: str
+    search_after: list[Any]
+    pit_id: Optional[str]
+    page: int
+    total: int
+    total_is_estimate: bool
+
+
+def encode_search_cursor(cursor: SearchCursor) -> str:
+    """
+    Encode a search position as an opaque cursor.
+
+    Args:
+        cursor: Search position
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {
+        "s": cursor.sort_by,
+        "o": cursor.sort_order.lower(),
+        "a": cursor.search_after,
+        "pit": cursor.pit_id,
+        "p": cursor.page,
+        "t": cursor.total,
+        "e": cursor.total_is_estimate,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_search_cursor(
+    cursor: str,
+    sort_by: Optional[str],
+    sort_order: str,
+) -> SearchCursor:
+    """
+    Decode a cursor into the search position to continue after.
+
+    Args:
+        cursor: Cursor returned with a previous page
+        sort_by: Sort field of the current request (None for relevance)
+        sort_order: Sort order of the current request
+
+    Returns:
+        Decoded search position
+
+    Raises:
+        InvalidSearchCursorError: If the cursor is malformed or does not
+            match the sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        decoded = SearchCursor(
+            sort_by=payload["s"],
+            sort_order=payload["o"],
+            search_after=payload["a"],
+            pit_id=payload["pit"],
+            page=int(payload["p"]),
+            total=int(payload["t"]),
+            total_is_estimate=bool(payload["e"]),
+        )
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidSearchCursorError("Malformed search cursor") from e
+
+    if not isinstance(decoded.search_after, list) or not decoded.search_after:
+        raise InvalidSearchCursorError("Malformed search cursor")
+
+    if decoded.pit_id is not None and not isinstance(decoded.pit_id, str):
+        raise InvalidSearchCursorError("Malformed search cursor")
+
+    if (
+        decoded.sort_by != (sort_by or RELEVANCE_SORT)
+        or decoded.sort_order != sort_order.lower()
+    ):
+        raise InvalidSearchCursorError("Search cursor was issued for a different sort")
+
+    return decoded
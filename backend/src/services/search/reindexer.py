@@ -0,0 +1,374 @@
+"""
+Streaming, concurrent full reindex of the vehicle catalog.
+
+A full reindex used to page through Postgres with OFFSET and a COUNT per
+batch and waited for every bulk request before reading the next page. The
+reindexer here separates the two sides: a producer streams vehicles in id
+order from a server-side cursor, converts them and puts bulk batches on a
+bounded queue, while a configurable number of workers send those batches to
+Elasticsearch concurrently. When the workers fall behind the queue fills up
+and the producer waits, so memory stays bounded by the queue size.
+
+Progress is checkpointed in Redis as the last vehicle id below which every
+batch has been indexed. Batches finish out of order, so the checkpoint only
+advances over a contiguous run of completed batches, and never past a batch
+with failed documents. An interrupted reindex resumes after the checkpoint,
+re-sending at most the batches that were in flight; a run with failed
+documents keeps its checkpoint so the next run retries them.
+
+During a blue/green rebuild the reindexer loads a concrete new index version
+that live writes already reach. It then only creates documents, so a row
+read before a concurrent update never overwrites the newer document.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from src.cache.redis_client import RedisClient, get_redis_client
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.database.models.vehicle import Vehicle
+from src.services.search.vehicle_index import VehicleIndex
+from src.services.vehicles.repository import VehicleRepository
+
+logger = get_logger(__name__)
+
+# Converts a vehicle row into its search document
+DocumentBuilder = Callable[[Vehicle], dict[str, Any]]
+
+
+class VehicleReindexer:
+    """
+    Reindex every active vehicle through a bounded producer/worker pipeline.
+
+    Reports indexed and failed document counts, throughput and the
+    checkpoint the run resumed from.
+    """
+
+    CHECKPOINT_KEY_PREFIX = "search:reindex:checkpoint"
+
+    # Seconds between progress log lines
+    PROGRESS_INTERVAL = 10.0
+
+    def __init__(
+        self,
+        repository: VehicleRepository,
+        index: VehicleIndex,
+        build_document: DocumentBuilder,
+        redis_client: Optional[RedisClient] = None,
+        batch_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        target_index: Optional[str] = None,
+    ):
+        """
+        Initialize reindexer.
+
+        Args:
+            repository: Vehicle repository whose session streams the catalog
+            index: Target vehicle index
+            build_document: Converts a vehicle row into its search document
+            redis_client: Redis client for checkpoints (uses global if None)
+            batch_size: Documents per bulk request
+            workers: Concurrent bulk workers
+            queue_size: Batches buffered between producer and workers
+            target_index: Concrete index version being built; documents are
+                only created there (index write targets if None)
+        """
+        settings = get_settings()
+        self.repository = repository
+        self.index = index
+        self.build_document = build_document
+        self._redis_client = redis_client
+        self.batch_size = batch_size or settings.search_reindex_batch_size
+        self.workers = workers or settings.search_reindex_workers
+        self.queue_size = queue_size or settings.search_reindex_queue_size
+        self.target_index = target_index
+
+        self._completed: dict[int, uuid.UUID] = {}
+        self._next_sequence = 0
+        self._indexed = 0
+        self._failed = 0
+        self._skipped = 0
+
+    @property
+    def target_name(self) -> str:
+        """Name of the index or alias being loaded."""
+        return self.target_index or self.index.index_name
+
+    @property
+    def checkpoint_key(self) -> str:
+        """Redis key holding the resume checkpoint of the target index."""
+        return f"{self.CHECKPOINT_KEY_PREFIX}:{self.target_name}"
+
+    async def _get_redis_client(self) -> RedisClient:
+        """
+        Get Redis client instance.
+
+        Returns:
+            Redis client instance
+        """
+        if self._redis_client is None:
+            self._redis_client = await get_redis_client()
+        return self._redis_client
+
+    async def load_checkpoint(self) -> Optional[uuid.UUID]:
+        """
+        Get the id after which an interrupted reindex resumes.
+
+        Returns:
+            Last fully indexed vehicle id, or None to start from the beginning
+        """
+        try:
+            redis = await self._get_redis_client()
+            value = await redis.get(self.checkpoint_key)
+            return uuid.UUID(value) if value else None
+
+        except Exception as e:
+            logger.warning(
+                "Failed to load reindex checkpoint, starting from the beginning",
+                index=self.target_name,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return None
+
+    async def _save_checkpoint(self, vehicle_id: uuid.UUID) -> None:
+        """
+        Persist the resume checkpoint.
+
+        Args:
+            vehicle_id: Last vehicle id below which every batch is indexed
+        """
+        try:
+            redis = await self._get_redis_client()
+            await redis.set(self.checkpoint_key, str(vehicle_id))
+
+        except Exception as e:
+            logger.warning(
+                "Failed to save reindex checkpoint",
+                index=self.target_name,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    async def clear_checkpoint(self) -> None:
+        """Remove the checkpoint so the next run starts from the beginning."""
+        try:
+            redis = await self._get_redis_client()
+            await redis.delete(self.checkpoint_key)
+
+        except Exception as e:
+            logger.warning(
+                "Failed to clear reindex checkpoint",
+                index=self.target_name,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    async def _complete_batch(
+        self,
+        sequence: int,
+        last_id: uuid.UUID,
+        succeeded: bool = True,
+    ) -> None:
+        """
+        Record a finished batch and advance the checkpoint if possible.
+
+        Args:
+            sequence: Batch sequence number
+            last_id: Highest vehicle id in the batch
+            succeeded: Whether every document of the batch was indexed; a
+                failed batch stops the checkpoint for the rest of the run
+        """
+        self._completed[sequence] = last_id if succeeded else None
+
+        checkpoint = None
+        while self._completed.get(self._next_sequence) is not None:
+            checkpoint = self._completed.pop(self._next_sequence)
+            self._next_sequence += 1
+
+        if checkpoint is not None:
+            await self._save_checkpoint(checkpoint)
+
+    async def _produce(
+        self,
+        queue: asyncio.Queue,
+        after_id: Optional[uuid.UUID],
+    ) -> None:
+        """
+        Stream vehicles into bulk batches on the queue.
+
+        Args:
+            queue: Bounded batch queue
+            after_id: Resume after this vehicle id
+        """
+        sequence = 0
+        rows = 0
+        failed = 0
+        documents: list[tuple[str, dict[str, Any]]] = []
+        last_id: Optional[uuid.UUID] = None
+
+        async for vehicle in self.repository.stream_for_indexing(
+            after_id=after_id,
+            batch_size=self.batch_size,
+        ):
+            rows += 1
+            last_id = vehicle.id
+            try:
+                documents.append((str(vehicle.id), self.build_document(vehicle)))
+            except Exception as e:
+                self._failed += 1
+                failed += 1
+                logger.error(
+                    "Failed to build search document",
+                    vehicle_id=str(vehicle.id),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+            if rows >= self.batch_size:
+                await queue.put((sequence, last_id, documents, failed))
+                sequence += 1
+                rows = 0
+                failed = 0
+                documents = []
+
+        if rows:
+            await queue.put((sequence, last_id, documents, failed))
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        """
+        Send batches from the queue to Elasticsearch until told to stop.
+
+        Args:
+            queue: Bounded batch queue
+        """
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+
+                sequence, last_id, documents, failed = item
+                if documents:
+                    if self.target_index:
+                        result = await self.index.bulk_index_documents(
+                            documents,
+                            index_name=self.target_index,
+                            op_type="create",
+                        )
+                    else:
+                        result = await self.index.bulk_index_documents(documents)
+                    self._indexed += result["success"]
+                    self._failed += result["failed"]
+                    self._skipped += result.get("skipped", 0)
+                    failed += result["failed"]
+
+                await self._complete_batch(sequence, last_id, succeeded=not failed)
+
+            finally:
+                queue.task_done()
+
+    async def run(self, resume: bool = True) -> dict[str, Any]:
+        """
+        Reindex every active vehicle.
+
+        Args:
+            resume: Continue after the stored checkpoint if there is one
+
+        Returns:
+            Dictionary with indexed, failed and skipped counts, duration,
+            throughput and the checkpoint resumed from
+
+        Raises:
+            VehicleIndexError: If a bulk request fails outright
+            SQLAlchemyError: If streaming from the database fails
+        """
+        after_id = await self.load_checkpoint() if resume else None
+        if not resume:
+            await self.clear_checkpoint()
+
+        self._completed.clear()
+        self._next_sequence = 0
+        self._indexed = 0
+        self._failed = 0
+        self._skipped = 0
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        started = time.perf_counter()
+
+        logger.info(
+            "Starting vehicle reindex",
+            index=self.target_name,
+            batch_size=self.batch_size,
+            workers=self.workers,
+            queue_size=self.queue_size,
+            resumed_from=str(after_id) if after_id else None,
+        )
+
+        workers = [
+            asyncio.create_task(self._work(queue)) for _ in range(self.workers)
+        ]
+        producer = asyncio.create_task(self._produce(queue, after_id))
+        progress = asyncio.create_task(self._report_progress(started))
+
+        try:
+            # Workers only finish early by failing; a failure stops the
+            # producer instead of leaving it blocked on a full queue
+            done, _ = await asyncio.wait(
+                [producer, *workers],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                task.result()
+            await producer
+
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+
+        except BaseException:
+            for task in [producer, *workers]:
+                task.cancel()
+            await asyncio.gather(producer, *workers, return_exceptions=True)
+            raise
+
+        finally:
+            progress.cancel()
+
+        if not self._failed:
+            await self.clear_checkpoint()
+
+        duration = time.perf_counter() - started
+        stats = {
+            "indexed": self._indexed,
+            "failed": self._failed,
+            "skipped": self._skipped,
+            "duration_seconds": round(duration, 3),
+            "docs_per_second": round(self._indexed / duration, 1) if duration else 0.0,
+            "resumed_from": str(after_id) if after_id else None,
+        }
+
+        logger.info("Vehicle reindex completed", index=self.target_name, **stats)
+        return stats
+
+    async def _report_progress(self, started: float) -> None:
+        """
+        Log throughput periodically while a reindex runs.
+
+        Args:
+            started: perf_counter value at the start of the run
+        """
+        while True:
+            await asyncio.sleep(self.PROGRESS_INTERVAL)
+            elapsed = time.perf_counter() - started
+            logger.info(
+                "Vehicle reindex progress",
+                index=self.target_name,
+                indexed=self._indexed,
+                failed=self._failed,
+                docs_per_second=round(self._indexed / elapsed, 1),
+            )
@@ -7,6 +7,7 @@ Provides query builders for different search types with relevance scoring and
 result processing with proper error handling and logging.
 """
 
+import asyncio
 import logging
 from decimal import Decimal
 from typing import Any, Optional
@@ -14,12 +15,23 @@ from typing import Any, Optional
 from elasticsearch import AsyncElasticsearch
 from elasticsearch.exceptions import ApiError, NotFoundError
 
+from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.schemas.vehicles import VehicleListResponse, VehicleResponse, VehicleSearchRequest
+from src.services.cache.vehicle_cache import VehicleCache
+from src.services.search.autocomplete import AutocompleteIndex
 from src.services.search.elasticsearch_client import (
     ElasticsearchClient,
     ElasticsearchError,
 )
+from src.services.search.fingerprint import facet_request, fingerprint_search
+from src.services.search.pagination import (
+    RELEVANCE_SORT,
+    InvalidSearchCursorError,
+    SearchCursor,
+    decode_search_cursor,
+    encode_search_cursor,
+)
 from src.services.search.vehicle_index import VehicleIndex
 
 logger = get_logger(__name__)
@@ -56,16 +68,57 @@ class VehicleSearchService:
     filtered search, faceted search, and fuzzy matching with relevance scoring.
     """
 
-    def __init__(self, client: ElasticsearchClient, index: VehicleIndex):
+    # Deepest hit offset paging can reach (Elasticsearch max_result_window)
+    MAX_RESULT_WINDOW = 10000
+
+    # Unique sort field appended so hits with equal sort values keep a
+    # stable order between pages
+    TIEBREAKER_SORT = {"id": {"order": "asc"}}
+
+    def __init__(
+        self,
+        client: ElasticsearchClient,
+        index: VehicleIndex,
+        track_total_hits: Optional[int] = None,
+        cursor_keep_alive: Optional[str] = None,
+        cache: Optional[VehicleCache] = None,
+        price_bucket: Optional[int] = None,
+        autocomplete: Optional[AutocompleteIndex] = None,
+    ):
         """
         Initialize vehicle search service.
 
         Args:
             client: Elasticsearch client instance
             index: Vehicle index manager
+            track_total_hits: Matches counted exactly before totals become
+                a lower bound (defaults to settings)
+            cursor_keep_alive: Point-in-time keep-alive between cursor pages
+                (defaults to settings)
+            cache: Vehicle cache for result pages and facets (uncached if None)
+            price_bucket: Price bucket width facets are computed for
+                (defaults to settings)
+            autocomplete: In-process suggestion index (Elasticsearch
+                completion suggester only if None)
         """
+        settings = get_settings()
         self._client = client
         self._index = index
+        self.track_total_hits = (
+            settings.search_track_total_hits
+            if track_total_hits is None
+            else track_total_hits
+        )
+        self.cursor_keep_alive = (
+            cursor_keep_alive or settings.search_cursor_keep_alive
+        )
+        self._cache = cache
+        self.price_bucket = (
+            settings.search_cache_price_bucket
+            if price_bucket is None
+            else price_bucket
+        )
+        self._autocomplete = autocomplete
 
         logger.info(
             "Vehicle search service initialized",
@@ -78,6 +131,50 @@ class VehicleSearchService:
         """
         Execute vehicle search with filters and pagination.
 
+        With a cache configured, offset pages are served from it, keyed by
+        the request's canonical fingerprint. Cursor pages are read from
+        their point-in-time and never cached.
+
+        Args:
+            search_request: Search request with filters and pagination
+
+        Returns:
+            Paginated search results with vehicles
+
+        Raises:
+            SearchQueryError: If search query or cursor is invalid
+            SearchExecutionError: If search execution fails
+        """
+        if self._cache is None or search_request.cursor:
+            return await self._execute_search(search_request)
+
+        fingerprint = fingerprint_search(search_request, self.price_bucket)
+
+        async def load() -> dict[str, Any]:
+            page = await self._execute_search(search_request)
+            return page.model_dump(mode="json")
+
+        data = await self._cache.get_or_load_search_results(
+            fingerprint.query,
+            fingerprint.page_filters,
+            loader=load,
+            refresh_loader=load,
+        )
+        return VehicleListResponse.model_validate(data)
+
+    async def _execute_search(
+        self, search_request: VehicleSearchRequest
+    ) -> VehicleListResponse:
+        """
+        Run a vehicle search against Elasticsearch.
+
+        The first page is fetched by offset. Full pages return a next_cursor;
+        requests carrying one continue with search_after inside a
+        point-in-time opened on the first continuation, so deep pages cost
+        the same as the first and are not capped by max_result_window.
+        Totals are counted exactly up to the track_total_hits threshold and
+        reported as a lower bound beyond it.
+
         Args:
             search_request: Search request with filters and pagination
 
@@ -85,37 +182,60 @@ class VehicleSearchService:
             Paginated search results with vehicles
 
         Raises:
-            SearchQueryError: If search query is invalid
+            SearchQueryError: If search query or cursor is invalid
             SearchExecutionError: If search execution fails
         """
         try:
             # Build search query
             query = self._build_search_query(search_request)
 
-            # Calculate pagination
-            from_offset = (search_request.page - 1) * search_request.page_size
-
             # Build sort configuration
-            sort = self._build_sort_config(
+            sort = self._build_page_sort(
                 search_request.sort_by, search_request.sort_order
             )
 
-            # Execute search
-            response = await self._client.client.search(
-                index=self._index.index_name,
-                query=query,
-                from_=from_offset,
-                size=search_request.page_size,
-                sort=sort,
-                track_total_hits=True,
-            )
+            if search_request.cursor:
+                cursor = self._decode_cursor(search_request)
+                response, pit_id = await self._search_after(
+                    query, sort, search_request.page_size, cursor
+                )
+                page = cursor.page
+                total = cursor.total
+                total_is_estimate = cursor.total_is_estimate
+            else:
+                # Calculate pagination
+                from_offset = (search_request.page - 1) * search_request.page_size
+                self._check_result_window(from_offset, search_request.page_size)
+
+                # Execute search
+                response = await self._client.client.search(
+                    index=self._index.index_name,
+                    query=query,
+                    from_=from_offset,
+                    size=search_request.page_size,
+                    sort=sort,
+                    track_total_hits=self.track_total_hits,
+                )
+                pit_id = None
+                page = search_request.page
+                total, total_is_estimate = self._read_total(response)
 
             # Process results
-            total = response["hits"]["total"]["value"]
             hits = response["hits"]["hits"]
 
             vehicles = [self._process_search_hit(hit) for hit in hits]
 
+            if total_is_estimate:
+                # A lower bound must cover every hit already returned
+                seen = (page - 1) * search_request.page_size + len(hits)
+                total = max(total, seen)
+
+            next_cursor = self._next_cursor(
+                search_request, hits, page, total, total_is_estimate, pit_id
+            )
+            if pit_id and next_cursor is None:
+                await self._close_point_in_time(pit_id)
+
             # Calculate pagination metadata
             total_pages = (
                 (total + search_request.page_size - 1) // search_request.page_size
@@ -126,19 +246,26 @@ class VehicleSearchService:
             logger.info(
                 "Search completed successfully",
                 total_results=total,
-                page=search_request.page,
+                total_is_estimate=total_is_estimate,
+                page=page,
                 page_size=search_request.page_size,
+                cursor=bool(search_request.cursor),
                 query_filters=self._get_active_filters(search_request),
             )
 
             return VehicleListResponse(
                 items=vehicles,
                 total=total,
-                page=search_request.page,
+                page=page,
                 page_size=search_request.page_size,
                 total_pages=total_pages,
+                total_is_estimate=total_is_estimate,
+                next_cursor=next_cursor,
             )
 
+        except SearchQueryError:
+            raise
+
         except ApiError as e:
             logger.error(
                 "Search execution failed",
@@ -171,6 +298,52 @@ class VehicleSearchService:
         """
         Execute faceted search with aggregations for filters.
 
+        With a cache configured, the hit page and the facets are cached
+        separately: facets do not depend on the page or sort, are computed
+        for bucketed price bounds and are kept longer, so paging and small
+        price changes reuse them. Without a cache, hits and facets come from
+        one query.
+
+        Args:
+            search_request: Search request with filters
+
+        Returns:
+            Dictionary with search results and facet counts
+
+        Raises:
+            SearchQueryError: If the page is beyond the offset paging window
+            SearchExecutionError: If faceted search fails
+        """
+        if self._cache is None:
+            return await self._execute_faceted_search(search_request)
+
+        fingerprint = fingerprint_search(search_request, self.price_bucket)
+        facets_for = facet_request(search_request, self.price_bucket)
+
+        async def load_facets() -> dict[str, Any]:
+            return await self._load_facets(facets_for)
+
+        results, facets = await asyncio.gather(
+            self.search(search_request),
+            self._cache.get_or_load_search_facets(
+                fingerprint.query,
+                fingerprint.facet_filters,
+                loader=load_facets,
+                refresh_loader=load_facets,
+            ),
+        )
+
+        return {"results": results, "facets": facets}
+
+    async def _execute_faceted_search(
+        self, search_request: VehicleSearchRequest
+    ) -> dict[str, Any]:
+        """
+        Fetch a hit page and its facets in one Elasticsearch query.
+
+        Facets describe the whole result set, so faceted search pages by
+        offset only; full pages return a next_cursor that search() continues.
+
         Args:
             search_request: Search request with filters
 
@@ -178,6 +351,7 @@ class VehicleSearchService:
             Dictionary with search results and facet counts
 
         Raises:
+            SearchQueryError: If the page is beyond the offset paging window
             SearchExecutionError: If faceted search fails
         """
         try:
@@ -189,9 +363,10 @@ class VehicleSearchService:
 
             # Calculate pagination
             from_offset = (search_request.page - 1) * search_request.page_size
+            self._check_result_window(from_offset, search_request.page_size)
 
             # Build sort configuration
-            sort = self._build_sort_config(
+            sort = self._build_page_sort(
                 search_request.sort_by, search_request.sort_order
             )
 
@@ -203,11 +378,11 @@ class VehicleSearchService:
                 from_=from_offset,
                 size=search_request.page_size,
                 sort=sort,
-                track_total_hits=True,
+                track_total_hits=self.track_total_hits,
             )
 
             # Process results
-            total = response["hits"]["total"]["value"]
+            total, total_is_estimate = self._read_total(response)
             hits = response["hits"]["hits"]
             aggs = response.get("aggregations", {})
 
@@ -216,6 +391,15 @@ class VehicleSearchService:
             # Process facets
             facets = self._process_facets(aggs)
 
+            next_cursor = self._next_cursor(
+                search_request,
+                hits,
+                search_request.page,
+                total,
+                total_is_estimate,
+                pit_id=None,
+            )
+
             # Calculate pagination metadata
             total_pages = (
                 (total + search_request.page_size - 1) // search_request.page_size
@@ -237,10 +421,15 @@ class VehicleSearchService:
                     page=search_request.page,
                     page_size=search_request.page_size,
                     total_pages=total_pages,
+                    total_is_estimate=total_is_estimate,
+                    next_cursor=next_cursor,
                 ),
                 "facets": facets,
             }
 
+        except SearchQueryError:
+            raise
+
         except Exception as e:
             logger.error(
                 "Faceted search failed",
@@ -253,6 +442,49 @@ class VehicleSearchService:
                 error_type=type(e).__name__,
             ) from e
 
+    async def _load_facets(self, search_request: VehicleSearchRequest) -> dict[str, Any]:
+        """
+        Run the facet aggregations of a request without fetching hits.
+
+        Args:
+            search_request: Search request with filters
+
+        Returns:
+            Processed facets
+
+        Raises:
+            SearchExecutionError: If the aggregation query fails
+        """
+        try:
+            response = await self._client.client.search(
+                index=self._index.index_name,
+                query=self._build_search_query(search_request),
+                aggs=self._build_facet_aggregations(),
+                size=0,
+                track_total_hits=False,
+            )
+
+            facets = self._process_facets(response.get("aggregations", {}))
+
+            logger.debug(
+                "Search facets computed",
+                facet_counts=len(facets),
+            )
+
+            return facets
+
+        except Exception as e:
+            logger.error(
+                "Facet aggregation failed",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise SearchExecutionError(
+                "Facet aggregation failed",
+                error=str(e),
+                error_type=type(e).__name__,
+            ) from e
+
     async def fuzzy_search(
         self, query: str, max_results: int = 10, fuzziness: str = "AUTO"
     ) -> list[VehicleResponse]:
@@ -310,7 +542,7 @@ class VehicleSearchService:
                 index=self._index.index_name,
                 query=fuzzy_query,
                 size=max_results,
-                track_total_hits=True,
+                track_total_hits=False,
             )
 
             # Process results
@@ -340,13 +572,21 @@ class VehicleSearchService:
                 error_type=type(e).__name__,
             ) from e
 
-    async def suggest(self, prefix: str, field: str = "make") -> list[str]:
+    async def suggest(
+        self, prefix: str, field: str = "make", limit: int = 10
+    ) -> list[str]:
         """
         Get search suggestions for autocomplete.
 
+        Prefix matches are served from the in-process autocomplete index
+        once it is built. Elasticsearch is only queried, with a fuzzy
+        completion suggester, when the index has no match (such as for a
+        typo) or is not built yet.
+
         Args:
             prefix: Prefix to search for
             field: Field to get suggestions from (make or model)
+            limit: Maximum suggestions
 
         Returns:
             List of suggestions
@@ -367,15 +607,27 @@ class VehicleSearchService:
                 field=field,
             )
 
+        if self._autocomplete is not None and self._autocomplete.is_ready:
+            matches = self._autocomplete.suggest(field, prefix, limit)
+            if matches:
+                logger.debug(
+                    "Suggestions served from autocomplete index",
+                    prefix=prefix,
+                    field=field,
+                    count=len(matches),
+                )
+                return [match.text for match in matches]
+
         try:
-            # Build suggestion query
+            # Build fuzzy suggestion query
             suggest_query = {
                 f"{field}_suggest": {
                     "prefix": prefix,
                     "completion": {
                         "field": f"{field}.suggest",
-                        "size": 10,
+                        "size": limit,
                         "skip_duplicates": True,
+                        "fuzzy": {"fuzziness": "AUTO"},
                     },
                 }
             }
@@ -570,6 +822,229 @@ class VehicleSearchService:
             {"_score": {"order": "desc"}},
         ]
 
+    def _build_page_sort(
+        self, sort_by: Optional[str], sort_order: str
+    ) -> list[dict[str, Any]]:
+        """
+        Build the sort of a result page with a unique tiebreaker.
+
+        Args:
+            sort_by: Field to sort by
+            sort_order: Sort order (asc or desc)
+
+        Returns:
+            Elasticsearch sort configuration ending in the tiebreaker
+        """
+        return self._build_sort_config(sort_by, sort_order) + [self.TIEBREAKER_SORT]
+
+    def _check_result_window(self, from_offset: int, size: int) -> None:
+        """
+        Reject offset pages Elasticsearch would refuse to collect.
+
+        Args:
+            from_offset: Offset of the first hit
+            size: Page size
+
+        Raises:
+            SearchQueryError: If the page ends beyond max_result_window
+        """
+        if from_offset + size > self.MAX_RESULT_WINDOW:
+            raise SearchQueryError(
+                "Page is too deep for offset pagination; continue with next_cursor",
+                from_offset=from_offset,
+                size=size,
+                max_result_window=self.MAX_RESULT_WINDOW,
+            )
+
+    @staticmethod
+    def _read_total(response: dict[str, Any]) -> tuple[int, bool]:
+        """
+        Read the hit total of a search response.
+
+        Args:
+            response: Elasticsearch search response
+
+        Returns:
+            Tuple of (total, whether total is a lower bound)
+        """
+        total = response["hits"]["total"]
+        return total["value"], total.get("relation", "eq") == "gte"
+
+    def _decode_cursor(self, search_request: VehicleSearchRequest) -> SearchCursor:
+        """
+        Decode the cursor of a search request.
+
+        Args:
+            search_request: Search request carrying a cursor
+
+        Returns:
+            Decoded search position
+
+        Raises:
+            SearchQueryError: If the cursor is invalid for the request
+        """
+        try:
+            return decode_search_cursor(
+                search_request.cursor,
+                search_request.sort_by,
+                search_request.sort_order,
+            )
+        except InvalidSearchCursorError as e:
+            raise SearchQueryError(str(e), field="cursor") from e
+
+    def _next_cursor(
+        self,
+        search_request: VehicleSearchRequest,
+        hits: list[dict[str, Any]],
+        page: int,
+        total: int,
+        total_is_estimate: bool,
+        pit_id: Optional[str],
+    ) -> Optional[str]:
+        """
+        Build the cursor continuing after a page.
+
+        Args:
+            search_request: Search request of the page
+            hits: Hits of the page
+            page: Page number
+            total: Total matches
+            total_is_estimate: Whether total is a lower bound
+            pit_id: Point-in-time the page was read from, if any
+
+        Returns:
+            Cursor for the next page, or None on the last page
+        """
+        if len(hits) < search_request.page_size:
+            return None
+
+        if not total_is_estimate and page * search_request.page_size >= total:
+            return None
+
+        search_after = hits[-1].get("sort")
+        if not search_after:
+            return None
+
+        return encode_search_cursor(
+            SearchCursor(
+                sort_by=search_request.sort_by or RELEVANCE_SORT,
+                sort_order=search_request.sort_order.lower(),
+                search_after=search_after,
+                pit_id=pit_id,
+                page=page + 1,
+                total=total,
+                total_is_estimate=total_is_estimate,
+            )
+        )
+
+    async def _search_after(
+        self,
+        query: dict[str, Any],
+        sort: list[dict[str, Any]],
+        size: int,
+        cursor: SearchCursor,
+    ) -> tuple[dict[str, Any], str]:
+        """
+        Fetch the page after a cursor from its point-in-time.
+
+        The point-in-time is opened when a client first continues past page
+        one. An expired point-in-time is replaced by a fresh one, so a slow
+        client keeps its position but may see changes made meanwhile.
+
+        Args:
+            query: Elasticsearch query DSL
+            sort: Sort configuration ending in the tiebreaker
+            size: Page size
+            cursor: Position to continue after
+
+        Returns:
+            Tuple of (search response, point-in-time id for the next page)
+        """
+        pit_id = cursor.pit_id or await self._open_point_in_time()
+
+        try:
+            response = await self._search_point_in_time(
+                query, sort, size, cursor.search_after, pit_id
+            )
+        except NotFoundError:
+            if cursor.pit_id is None:
+                raise
+
+            logger.info(
+                "Search cursor point-in-time expired, reopening",
+                page=cursor.page,
+            )
+            pit_id = await self._open_point_in_time()
+            response = await self._search_point_in_time(
+                query, sort, size, cursor.search_after, pit_id
+            )
+
+        # Elasticsearch may return an updated id for the next request
+        return response, response.get("pit_id") or pit_id
+
+    async def _search_point_in_time(
+        self,
+        query: dict[str, Any],
+        sort: list[dict[str, Any]],
+        size: int,
+        search_after: list[Any],
+        pit_id: str,
+    ) -> dict[str, Any]:
+        """
+        Search a point-in-time after the given sort values.
+
+        Totals are not counted; cursor pages reuse the first page's total.
+
+        Args:
+            query: Elasticsearch query DSL
+            sort: Sort configuration ending in the tiebreaker
+            size: Page size
+            search_after: Sort values of the previous page's last hit
+            pit_id: Point-in-time id
+
+        Returns:
+            Elasticsearch search response
+        """
+        return await self._client.client.search(
+            query=query,
+            size=size,
+            sort=sort,
+            search_after=search_after,
+            pit={"id": pit_id, "keep_alive": self.cursor_keep_alive},
+            track_total_hits=False,
+        )
+
+    async def _open_point_in_time(self) -> str:
+        """
+        Open a point-in-time on the vehicle index.
+
+        Returns:
+            Point-in-time id
+        """
+        response = await self._client.client.open_point_in_time(
+            index=self._index.index_name,
+            keep_alive=self.cursor_keep_alive,
+        )
+        return response["id"]
+
+    async def _close_point_in_time(self, pit_id: str) -> None:
+        """
+        Release a point-in-time after its last page.
+
+        Failures are only logged; the point-in-time expires on its own.
+
+        Args:
+            pit_id: Point-in-time id
+        """
+        try:
+            await self._client.client.close_point_in_time(id=pit_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to close search point-in-time",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
     def _build_facet_aggregations(self) -> dict[str, Any]:
         """
         Build aggregations for faceted search.
@@ -4,14 +4,26 @@ Vehicle search index management and mapping definition.
 This module defines Elasticsearch mapping for vehicle documents with proper field types
 for search, filtering, and aggregations. Includes methods for index creation, deletion,
 and document management with comprehensive error handling and logging.
+
+Searches and writes go through the ``vehicles`` alias, which points at one
+versioned index (``vehicles_v1``, ``vehicles_v2``, ...). A mapping change is
+rolled out by building the next version next to the live one and swapping
+the alias atomically once it is loaded; the previous version is kept for
+rollback. While a version is being built it carries the ``vehicles_rebuild``
+alias, and document writes go to both indexes so no change made during the
+load is lost.
 """
 
+import asyncio
 import logging
-from typing import Any, Optional
+import re
+import time
+from typing import Any, Awaitable, Callable, Optional
 
 from elasticsearch.exceptions import ApiError, NotFoundError
 
 from src.core.logging import get_logger
+from src.schemas.vehicles import VehicleResponse
 from src.services.search.elasticsearch_client import (
     ElasticsearchClient,
     ElasticsearchIndexError,
@@ -37,8 +49,27 @@ class VehicleIndex:
     operations with optimized mapping for vehicle search, filtering, and aggregations.
     """
 
+    # Alias that searches and writes go through
     INDEX_NAME = "vehicles"
-    INDEX_VERSION = "v1"
+
+    # Alias marking the version being built
+    BUILD_ALIAS = "vehicles_rebuild"
+
+    VERSION_PATTERN = re.compile(r"^vehicles_v(\d+)$")
+
+    # Seconds a process reuses its view of the write targets. A rebuild
+    # waits this long after creating the new version so every process is
+    # dual writing before the load starts.
+    WRITE_TARGETS_TTL = 5.0
+
+    # Settings during a bulk load, restored from SETTINGS before the swap
+    BULK_LOAD_SETTINGS = {
+        "number_of_replicas": 0,
+        "refresh_interval": "-1",
+    }
+
+    # Write targets per alias, shared by every instance in the process
+    _write_targets_cache: dict[str, tuple[float, list[str]]] = {}
 
     # Elasticsearch mapping for vehicle documents
     MAPPING = {
@@ -211,7 +242,7 @@ class VehicleIndex:
             client: Elasticsearch client instance
         """
         self._client = client
-        self._index_name = f"{self.INDEX_NAME}_{self.INDEX_VERSION}"
+        self._index_name = self.INDEX_NAME
 
         logger.info(
             "Vehicle index manager initialized",
@@ -220,47 +251,173 @@ class VehicleIndex:
 
     @property
     def index_name(self) -> str:
-        """Get full index name with version."""
+        """Get the alias searches and writes go through."""
         return self._index_name
 
+    @classmethod
+    def version_name(cls, version: int) -> str:
+        """
+        Get the concrete index name of a version.
+
+        Args:
+            version: Index version number
+
+        Returns:
+            Index name such as ``vehicles_v2``
+        """
+        return f"{cls.INDEX_NAME}_v{version}"
+
+    @classmethod
+    def parse_version(cls, index_name: str) -> Optional[int]:
+        """
+        Get the version number of a concrete index name.
+
+        Args:
+            index_name: Index name
+
+        Returns:
+            Version number, or None if the name is not a vehicle index version
+        """
+        match = cls.VERSION_PATTERN.match(index_name)
+        return int(match.group(1)) if match else None
+
+    async def get_index_state(self) -> dict[str, Any]:
+        """
+        Get the versioned indexes and where the aliases point.
+
+        Returns:
+            Dictionary with ``live`` and ``building`` index names and the
+            sorted list of existing ``versions``
+
+        Raises:
+            ElasticsearchIndexError: If the alias lookup fails
+        """
+        aliases = await self._client.get_aliases(f"{self.INDEX_NAME}_v*")
+        versions = {
+            name: version
+            for name in aliases
+            if (version := self.parse_version(name)) is not None
+        }
+
+        return {
+            "live": sorted(name for name in versions if self._index_name in aliases[name]),
+            "building": sorted(
+                name for name in versions if self.BUILD_ALIAS in aliases[name]
+            ),
+            "versions": sorted(versions.values()),
+        }
+
+    async def _write_targets(self) -> list[str]:
+        """
+        Get the indexes a document write must reach.
+
+        The live alias always; the version being built as well while a
+        rebuild runs. The lookup is cached for WRITE_TARGETS_TTL seconds.
+        If it fails, writes fall back to the live alias only.
+
+        Returns:
+            Index or alias names to write to
+        """
+        cached = self._write_targets_cache.get(self._index_name)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.WRITE_TARGETS_TTL:
+            return cached[1]
+
+        try:
+            state = await self.get_index_state()
+        except Exception as e:
+            logger.warning(
+                "Failed to resolve vehicle index write targets, writing to live index only",
+                index=self._index_name,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return [self._index_name]
+
+        targets = [self._index_name, *state["building"]]
+        self._write_targets_cache[self._index_name] = (now, targets)
+        return targets
+
+    def _invalidate_write_targets(self) -> None:
+        """Drop the cached write targets of this process."""
+        self._write_targets_cache.pop(self._index_name, None)
+
+    @staticmethod
+    def prepare_document(vehicle: VehicleResponse) -> dict[str, Any]:
+        """
+        Build the search document of a vehicle.
+
+        Documents are the JSON form of VehicleResponse, so search hits
+        convert straight back into responses.
+
+        Args:
+            vehicle: Vehicle response
+
+        Returns:
+            JSON-serializable document
+        """
+        return vehicle.model_dump(mode="json")
+
     async def create_index(self, delete_if_exists: bool = False) -> None:
         """
-        Create vehicle search index with mapping and settings.
+        Create the first vehicle index version behind the alias.
+
+        Does nothing when the alias already points at an index. Indexes
+        created before the alias existed are attached to it instead of
+        being recreated. Mapping changes go through rebuild(), which
+        keeps the live index serving.
 
         Args:
-            delete_if_exists: Whether to delete existing index before creation
+            delete_if_exists: Whether to delete every existing version first
 
         Raises:
             VehicleIndexError: If index creation fails
         """
         try:
-            # Check if index exists
-            exists = await self._client.index_exists(self._index_name)
-
-            if exists:
-                if delete_if_exists:
-                    logger.warning(
-                        "Deleting existing index",
-                        index=self._index_name,
-                    )
-                    await self.delete_index()
-                else:
-                    logger.info(
-                        "Index already exists",
-                        index=self._index_name,
-                    )
-                    return
+            state = await self.get_index_state()
+
+            if state["versions"] and delete_if_exists:
+                logger.warning(
+                    "Deleting existing vehicle indexes",
+                    index=self._index_name,
+                    versions=state["versions"],
+                )
+                await self.delete_index()
+                state = {"live": [], "building": [], "versions": []}
+
+            if state["live"]:
+                logger.info(
+                    "Index already exists",
+                    index=self._index_name,
+                    live=state["live"],
+                )
+                return
+
+            if state["versions"]:
+                newest = self.version_name(state["versions"][-1])
+                await self._client.update_aliases(
+                    [{"add": {"index": newest, "alias": self._index_name}}]
+                )
+                logger.info(
+                    "Attached alias to existing vehicle index",
+                    index=self._index_name,
+                    live=newest,
+                )
+                return
 
             # Create index with mapping and settings
+            first = self.version_name(1)
             await self._client.create_index(
-                index_name=self._index_name,
+                index_name=first,
                 mappings=self.MAPPING,
                 settings=self.SETTINGS,
+                aliases={self._index_name: {}},
             )
 
             logger.info(
                 "Vehicle index created successfully",
                 index=self._index_name,
+                live=first,
                 properties_count=len(self.MAPPING["properties"]),
             )
 
@@ -278,6 +435,9 @@ class VehicleIndex:
                 error=str(e),
             ) from e
 
+        except VehicleIndexError:
+            raise
+
         except Exception as e:
             logger.error(
                 "Unexpected error creating vehicle index",
@@ -293,50 +453,312 @@ class VehicleIndex:
                 error_type=type(e).__name__,
             ) from e
 
-    async def delete_index(self) -> None:
+    async def delete_index(self, index_name: Optional[str] = None) -> None:
         """
-        Delete vehicle search index.
+        Delete one vehicle index version, or all of them.
+
+        Args:
+            index_name: Concrete index to delete (every version if None)
 
         Raises:
             VehicleIndexError: If index deletion fails
         """
+        target = index_name or self._index_name
         try:
-            await self._client.delete_index(self._index_name)
+            if index_name is None:
+                state = await self.get_index_state()
+                names = [self.version_name(version) for version in state["versions"]]
+            else:
+                names = [index_name]
+
+            for name in names:
+                await self._client.delete_index(name)
+
+            self._invalidate_write_targets()
 
             logger.info(
                 "Vehicle index deleted successfully",
-                index=self._index_name,
+                index=target,
+                deleted=names,
             )
 
         except ElasticsearchIndexError as e:
             logger.error(
                 "Failed to delete vehicle index",
-                index=self._index_name,
+                index=target,
                 error=str(e),
                 code=e.code,
             )
             raise VehicleIndexError(
                 "Failed to delete vehicle index",
                 code="DELETE_INDEX_FAILED",
-                index=self._index_name,
+                index=target,
                 error=str(e),
             ) from e
 
         except Exception as e:
             logger.error(
                 "Unexpected error deleting vehicle index",
-                index=self._index_name,
+                index=target,
                 error=str(e),
                 error_type=type(e).__name__,
             )
             raise VehicleIndexError(
                 "Unexpected error deleting vehicle index",
                 code="DELETE_INDEX_ERROR",
+                index=target,
+                error=str(e),
+                error_type=type(e).__name__,
+            ) from e
+
+    async def rebuild(
+        self,
+        load: Callable[[str], Awaitable[dict[str, Any]]],
+        allow_failures: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Build the next index version and swap the alias to it.
+
+        The new version is created with replicas and refresh disabled and
+        the build alias attached, so document writes reach it while
+        ``load`` fills it. Afterwards the regular settings are restored,
+        the index is refreshed and the alias moves from the old version to
+        the new one in a single atomic update. The old version is kept for
+        rollback(). If anything fails the new version is deleted and the
+        live index is left untouched.
+
+        Creating the new version fails if it already exists, so of two
+        overlapping rebuilds only one loads it; the other raises
+        REBUILD_IN_PROGRESS and never deletes an index it did not create.
+
+        A load that reports failed documents is discarded like any other
+        failure unless allow_failures is set, so vehicles rejected by a new
+        mapping never silently drop out of live search.
+
+        Args:
+            load: Coroutine function that loads every document into the
+                given concrete index and returns its statistics
+            allow_failures: Swap the alias even if some documents failed
+
+        Returns:
+            Load statistics plus the ``index`` now live and the
+            ``previous`` index names
+
+        Raises:
+            VehicleIndexError: If a rebuild is already running or any step fails
+        """
+        state = await self.get_index_state()
+        if state["building"]:
+            raise VehicleIndexError(
+                "A vehicle index rebuild is already running",
+                code="REBUILD_IN_PROGRESS",
+                index=self._index_name,
+                building=state["building"],
+            )
+
+        previous = state["live"]
+        new_index = self.version_name(max(state["versions"], default=0) + 1)
+
+        logger.info(
+            "Starting vehicle index rebuild",
+            index=self._index_name,
+            target=new_index,
+            previous=previous,
+        )
+
+        try:
+            await self._client.create_index(
+                index_name=new_index,
+                mappings=self.MAPPING,
+                settings={**self.SETTINGS, **self.BULK_LOAD_SETTINGS},
+                aliases={self.BUILD_ALIAS: {}},
+                exist_ok=False,
+            )
+        except Exception as e:
+            if (
+                isinstance(e, ElasticsearchIndexError)
+                and e.context.get("reason") == "resource_already_exists_exception"
+            ):
+                raise VehicleIndexError(
+                    "A vehicle index rebuild is already running",
+                    code="REBUILD_IN_PROGRESS",
+                    index=self._index_name,
+                    building=[new_index],
+                ) from e
+            logger.error(
+                "Failed to create vehicle index version",
+                index=self._index_name,
+                target=new_index,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise VehicleIndexError(
+                "Vehicle index rebuild failed",
+                code="REBUILD_FAILED",
+                index=self._index_name,
+                target=new_index,
+                error=str(e),
+                error_type=type(e).__name__,
+            ) from e
+
+        try:
+            self._invalidate_write_targets()
+
+            # Let every process pick up the new write target before the
+            # load reads the catalog
+            await asyncio.sleep(self.WRITE_TARGETS_TTL)
+
+            stats = await load(new_index)
+            if stats.get("failed") and not allow_failures:
+                raise VehicleIndexError(
+                    "Vehicle index rebuild loaded incomplete index",
+                    code="REBUILD_INCOMPLETE",
+                    index=self._index_name,
+                    target=new_index,
+                    failed=stats["failed"],
+                )
+
+            await self._client.put_settings(
+                new_index,
+                {key: self.SETTINGS[key] for key in self.BULK_LOAD_SETTINGS},
+            )
+            await self._client.refresh_index(new_index)
+
+            actions = [
+                {"remove": {"index": name, "alias": self._index_name}}
+                for name in previous
+            ]
+            actions.append({"add": {"index": new_index, "alias": self._index_name}})
+            actions.append({"remove": {"index": new_index, "alias": self.BUILD_ALIAS}})
+            await self._client.update_aliases(actions)
+
+        except BaseException as e:
+            logger.error(
+                "Vehicle index rebuild failed, discarding new index",
+                index=self._index_name,
+                target=new_index,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            await self._discard_index(new_index)
+            if isinstance(e, VehicleIndexError) or not isinstance(e, Exception):
+                raise
+            raise VehicleIndexError(
+                "Vehicle index rebuild failed",
+                code="REBUILD_FAILED",
                 index=self._index_name,
+                target=new_index,
                 error=str(e),
                 error_type=type(e).__name__,
             ) from e
 
+        finally:
+            self._invalidate_write_targets()
+
+        logger.info(
+            "Vehicle index rebuild completed",
+            index=self._index_name,
+            live=new_index,
+            previous=previous,
+        )
+
+        return {**stats, "index": new_index, "previous": previous}
+
+    async def abort_rebuild(self) -> list[str]:
+        """
+        Discard versions left behind by an interrupted rebuild.
+
+        Returns:
+            Names of the deleted indexes
+        """
+        state = await self.get_index_state()
+        for name in state["building"]:
+            await self._discard_index(name)
+        self._invalidate_write_targets()
+        return state["building"]
+
+    async def rollback(self) -> str:
+        """
+        Point the alias back at the previous index version.
+
+        Documents written since the swap are only in the newer version, so
+        run an in-place reindex after rolling back if writes happened.
+
+        Returns:
+            Name of the index now live
+
+        Raises:
+            VehicleIndexError: If there is no previous version or the swap fails
+        """
+        state = await self.get_index_state()
+        if len(state["live"]) != 1:
+            raise VehicleIndexError(
+                "Vehicle alias does not point at exactly one index",
+                code="ROLLBACK_FAILED",
+                index=self._index_name,
+                live=state["live"],
+            )
+
+        current = state["live"][0]
+        current_version = self.parse_version(current)
+        candidates = [
+            version
+            for version in state["versions"]
+            if version < current_version
+            and self.version_name(version) not in state["building"]
+        ]
+        if not candidates:
+            raise VehicleIndexError(
+                "No previous vehicle index to roll back to",
+                code="NO_PREVIOUS_INDEX",
+                index=self._index_name,
+                live=current,
+            )
+
+        target = self.version_name(candidates[-1])
+        try:
+            await self._client.update_aliases(
+                [
+                    {"remove": {"index": current, "alias": self._index_name}},
+                    {"add": {"index": target, "alias": self._index_name}},
+                ]
+            )
+
+        except ElasticsearchIndexError as e:
+            raise VehicleIndexError(
+                "Failed to roll back vehicle index",
+                code="ROLLBACK_FAILED",
+                index=self._index_name,
+                live=current,
+                target=target,
+                error=str(e),
+            ) from e
+
+        logger.warning(
+            "Vehicle index rolled back",
+            index=self._index_name,
+            live=target,
+            previous=current,
+        )
+        return target
+
+    async def _discard_index(self, index_name: str) -> None:
+        """
+        Delete an index without raising, used to clean up failed rebuilds.
+
+        Args:
+            index_name: Concrete index to delete
+        """
+        try:
+            await self._client.delete_index(index_name)
+        except Exception as e:
+            logger.error(
+                "Failed to delete discarded vehicle index",
+                index=index_name,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
     async def index_exists(self) -> bool:
         """
         Check if vehicle index exists.
@@ -379,6 +801,8 @@ class VehicleIndex:
         """
         Index a vehicle document.
 
+        While a rebuild runs the document is also written to the new version.
+
         Args:
             document_id: Unique document identifier
             document: Vehicle document data
@@ -387,11 +811,12 @@ class VehicleIndex:
             VehicleIndexError: If document indexing fails
         """
         try:
-            await self._client.client.index(
-                index=self._index_name,
-                id=document_id,
-                document=document,
-            )
+            for target in await self._write_targets():
+                await self._client.client.index(
+                    index=target,
+                    id=document_id,
+                    document=document,
+                )
 
             logger.debug(
                 "Vehicle document indexed",
@@ -439,6 +864,9 @@ class VehicleIndex:
         """
         Update a vehicle document with partial data.
 
+        While a rebuild runs the update is also applied to the new version
+        if the document has been loaded there already.
+
         Args:
             document_id: Unique document identifier
             partial_document: Partial vehicle document data to update
@@ -447,11 +875,18 @@ class VehicleIndex:
             VehicleIndexError: If document update fails
         """
         try:
-            await self._client.client.update(
-                index=self._index_name,
-                id=document_id,
-                doc=partial_document,
-            )
+            for target in await self._write_targets():
+                try:
+                    await self._client.client.update(
+                        index=target,
+                        id=document_id,
+                        doc=partial_document,
+                    )
+                except NotFoundError:
+                    # Not loaded into the new version yet; the load brings
+                    # in the current row
+                    if target == self._index_name:
+                        raise
 
             logger.debug(
                 "Vehicle document updated",
@@ -511,6 +946,8 @@ class VehicleIndex:
         """
         Delete a vehicle document from index.
 
+        While a rebuild runs the document is also deleted from the new version.
+
         Args:
             document_id: Unique document identifier
 
@@ -518,10 +955,18 @@ class VehicleIndex:
             VehicleIndexError: If document deletion fails
         """
         try:
-            await self._client.client.delete(
-                index=self._index_name,
-                id=document_id,
-            )
+            for target in await self._write_targets():
+                try:
+                    await self._client.client.delete(
+                        index=target,
+                        id=document_id,
+                    )
+                except NotFoundError:
+                    logger.warning(
+                        "Vehicle document not found for deletion",
+                        index=target,
+                        document_id=document_id,
+                    )
 
             logger.debug(
                 "Vehicle document deleted",
@@ -529,13 +974,6 @@ class VehicleIndex:
                 document_id=document_id,
             )
 
-        except NotFoundError:
-            logger.warning(
-                "Vehicle document not found for deletion",
-                index=self._index_name,
-                document_id=document_id,
-            )
-
         except ApiError as e:
             logger.error(
                 "Failed to delete vehicle document",
@@ -571,27 +1009,40 @@ class VehicleIndex:
             ) from e
 
     async def bulk_index_documents(
-        self, documents: list[tuple[str, dict[str, Any]]]
+        self,
+        documents: list[tuple[str, dict[str, Any]]],
+        index_name: Optional[str] = None,
+        op_type: str = "index",
     ) -> dict[str, Any]:
         """
         Bulk index multiple vehicle documents.
 
+        Without an explicit index the documents go to every write target,
+        so bulk syncs during a rebuild reach the new version too.
+
         Args:
             documents: List of (document_id, document) tuples
+            index_name: Concrete index to write to (write targets if None)
+            op_type: ``index`` to overwrite, or ``create`` to skip documents
+                that already exist
 
         Returns:
-            Dictionary with bulk operation results
+            Dictionary with bulk operation results; with ``create`` the
+            documents that already existed are counted as skipped, not failed
 
         Raises:
             VehicleIndexError: If bulk indexing fails
         """
         try:
+            targets = [index_name] if index_name else await self._write_targets()
             actions = [
                 {
-                    "_index": self._index_name,
+                    "_op_type": op_type,
+                    "_index": target,
                     "_id": doc_id,
                     "_source": document,
                 }
+                for target in targets
                 for doc_id, document in documents
             ]
 
@@ -603,19 +1054,32 @@ class VehicleIndex:
                 raise_on_error=False,
             )
 
+            errors = failed if failed else []
+            skipped = 0
+            if op_type == "create":
+                remaining = [
+                    error for error in errors
+                    if error.get("create", {}).get("status") != 409
+                ]
+                skipped = len(errors) - len(remaining)
+                errors = remaining
+
             logger.info(
                 "Bulk index operation completed",
-                index=self._index_name,
-                total=len(documents),
+                index=index_name or self._index_name,
+                targets=targets,
+                total=len(actions),
                 success=success,
-                failed=len(failed) if failed else 0,
+                failed=len(errors),
+                skipped=skipped,
             )
 
             return {
-                "total": len(documents),
+                "total": len(actions),
                 "success": success,
-                "failed": len(failed) if failed else 0,
-                "errors": failed if failed else [],
+                "failed": len(errors),
+                "skipped": skipped,
+                "errors": errors,
             }
 
         except Exception as e:
@@ -635,6 +1099,75 @@ class VehicleIndex:
                 error_type=type(e).__name__,
             ) from e
 
+    async def bulk_delete_documents(self, document_ids: list[str]) -> dict[str, Any]:
+        """
+        Bulk delete vehicle documents from every write target.
+
+        Documents that are already gone count as deleted, so replaying a
+        delete is harmless.
+
+        Args:
+            document_ids: Document identifiers
+
+        Returns:
+            Dictionary with bulk operation results
+
+        Raises:
+            VehicleIndexError: If bulk deletion fails
+        """
+        try:
+            targets = await self._write_targets()
+            actions = [
+                {"_op_type": "delete", "_index": target, "_id": doc_id}
+                for target in targets
+                for doc_id in document_ids
+            ]
+
+            from elasticsearch.helpers import async_bulk
+
+            success, failed = await async_bulk(
+                self._client.client,
+                actions,
+                raise_on_error=False,
+            )
+
+            errors = [
+                error for error in (failed or [])
+                if error.get("delete", {}).get("status") != 404
+            ]
+
+            logger.info(
+                "Bulk delete operation completed",
+                index=self._index_name,
+                targets=targets,
+                total=len(actions),
+                failed=len(errors),
+            )
+
+            return {
+                "total": len(actions),
+                "success": len(actions) - len(errors),
+                "failed": len(errors),
+                "errors": errors,
+            }
+
+        except Exception as e:
+            logger.error(
+                "Bulk delete operation failed",
+                index=self._index_name,
+                total_documents=len(document_ids),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise VehicleIndexError(
+                "Bulk delete operation failed",
+                code="BULK_DELETE_ERROR",
+                index=self._index_name,
+                total_documents=len(document_ids),
+                error=str(e),
+                error_type=type(e).__name__,
+            ) from e
+
     async def refresh_index(self) -> None:
         """
         Refresh vehicle index to make recent changes searchable.
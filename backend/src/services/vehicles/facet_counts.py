@@ -0,0 +1,131 @@
+"""
+Scheduled refresh of the vehicle_facet_counts materialized view.
+
+Deployments without Elasticsearch serve faceted navigation from the view
+(see VehicleRepository.get_facet_counts). The outbox relay marks the view
+stale when it applies catalog changes, and a background task refreshes it
+no more often than the minimum interval, so bursts of changes cost one
+refresh. The view is also refreshed after a maximum age, which covers
+changes applied by other instances' relays.
+"""
+
+import time
+from typing import AsyncContextManager, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+from src.database.connection import get_session
+from src.services.vehicles.repository import VehicleRepository
+
+logger = get_logger(__name__)
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+class FacetCountRefresher:
+    """
+    Debounced refresher of the vehicle_facet_counts materialized view.
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory = get_session,
+        min_interval: Optional[float] = None,
+        max_age: Optional[float] = None,
+    ):
+        """
+        Initialize facet count refresher.
+
+        Args:
+            session_factory: Async context manager factory yielding a
+                session that commits on exit
+            min_interval: Minimum seconds between refreshes of a stale view
+                (defaults to settings)
+            max_age: Seconds after which the view is refreshed without
+                changes (defaults to settings)
+        """
+        settings = get_settings()
+        self._session_factory = session_factory
+        self.min_interval = min_interval or settings.facet_counts_min_interval
+        self.max_age = max_age or settings.facet_counts_max_age
+
+        self._refreshed_at: Optional[float] = None
+        self._stale = True
+        self._stats = {"refreshes": 0, "failed_refreshes": 0}
+
+    def mark_stale(self) -> None:
+        """Request a refresh once the minimum interval has passed."""
+        self._stale = True
+
+    def needs_refresh(self, now: Optional[float] = None) -> bool:
+        """
+        Check whether the view should be refreshed.
+
+        Args:
+            now: Current monotonic time, for testing
+
+        Returns:
+            True if never refreshed by this process, stale past the minimum
+            interval, or past the maximum age
+        """
+        if self._refreshed_at is None:
+            return True
+        now = time.monotonic() if now is None else now
+        age = now - self._refreshed_at
+        return (self._stale and age >= self.min_interval) or age >= self.max_age
+
+    async def refresh(self) -> None:
+        """
+        Refresh the view concurrently.
+
+        Raises:
+            SQLAlchemyError: If the refresh fails; the view stays stale
+        """
+        self._stale = False
+        started = time.perf_counter()
+
+        try:
+            async with self._session_factory() as session:
+                await VehicleRepository(session).refresh_facet_counts()
+
+        except Exception:
+            self._stale = True
+            self._stats["failed_refreshes"] += 1
+            raise
+
+        self._refreshed_at = time.monotonic()
+        self._stats["refreshes"] += 1
+
+        logger.info(
+            "Vehicle facet counts refreshed",
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+    def get_statistics(self) -> dict[str, int | bool]:
+        """
+        Get facet count refresher statistics.
+
+        Returns:
+            Dictionary containing refresh counts and staleness
+        """
+        return {**self._stats, "is_stale": self._stale}
+
+
+_facet_count_refresher: Optional[FacetCountRefresher] = None
+
+
+async def get_facet_count_refresher() -> FacetCountRefresher:
+    """
+    Get or create global facet count refresher instance.
+
+    Returns:
+        Singleton facet count refresher instance
+    """
+    global _facet_count_refresher
+
+    if _facet_count_refresher is None:
+        _facet_count_refresher = FacetCountRefresher()
+
+    return _facet_count_refresher
@@ -0,0 +1,127 @@
+"""
+Keyset pagination cursors for vehicle listings.
+
+Offset pagination makes Postgres read and discard every row before the
+requested page, so deep pages get slower the further a client goes. Keyset
+pagination instead continues after the last row of the previous page using
+the (sort value, id) pair, which an index on the same columns answers in
+constant time.
+
+Cursors are opaque to clients: they are URL-safe base64 JSON recording the
+sort field, direction and the last row's key. A cursor is only valid for the
+sort it was issued for.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+# Sort fields that can be paged by key, with the parser for cursor values.
+# Only non-nullable columns qualify, since NULLs break row comparisons.
+KEYSET_SORT_FIELDS: dict[str, Callable[[Any], Any]] = {
+    "year": int,
+    "make": str,
+    "model": str,
+    "base_price": Decimal,
+    "msrp": Decimal,
+    "created_at": datetime.fromisoformat,
+    "id": uuid.UUID,
+}
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or was issued for another sort."""
+
+
+def supports_keyset(sort_by: str) -> bool:
+    """
+    Check whether a sort field can be paged with cursors.
+
+    Args:
+        sort_by: Sort field name
+
+    Returns:
+        True if cursors can be issued for the field
+    """
+    return sort_by in KEYSET_SORT_FIELDS
+
+
+def _serialize(value: Any) -> Any:
+    """Convert a sort value to a JSON-compatible value."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def encode_cursor(
+    sort_by: str,
+    sort_order: str,
+    value: Any,
+    vehicle_id: uuid.UUID,
+) -> str:
+    """
+    Encode the position after a row as an opaque cursor.
+
+    Args:
+        sort_by: Sort field name
+        sort_order: Sort order (asc or desc)
+        value: Sort field value of the last row
+        vehicle_id: ID of the last row
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {
+        "s": sort_by,
+        "o": sort_order.lower(),
+        "v": _serialize(value),
+        "id": str(vehicle_id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(
+    cursor: str,
+    sort_by: str,
+    sort_order: str,
+) -> tuple[Any, uuid.UUID]:
+    """
+    Decode a cursor into the key to continue after.
+
+    Args:
+        cursor: Cursor returned with a previous page
+        sort_by: Sort field of the current request
+        sort_order: Sort order of the current request
+
+    Returns:
+        Tuple of (sort value, vehicle ID)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match the sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        field, order = payload["s"], payload["o"]
+        raw_value, raw_id = payload["v"], payload["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+
+    if field != sort_by or order != sort_order.lower():
+        raise InvalidCursorError("Pagination cursor was issued for a different sort")
+
+    parse: Optional[Callable[[Any], Any]] = KEYSET_SORT_FIELDS.get(field)
+    if parse is None:
+        raise InvalidCursorError(f"Sort field '{field}' does not support cursors")
+
+    try:
+        return parse(raw_value), uuid.UUID(raw_id)
+    except (ArithmeticError, ValueError, TypeError, AttributeError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
@@ -7,15 +7,35 @@ and complex queries with inventory joins. Provides efficient database operations
 with proper error handling and logging.
 """
 
+import json
+import re
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Any, Sequence
-
-from sqlalchemy import select, func, and_, or_, desc, asc
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from sqlalchemy import (
+    Integer,
+    Numeric,
+    String,
+    column,
+    select,
+    func,
+    and_,
+    or_,
+    desc,
+    asc,
+    cast,
+    literal_column,
+    table,
+    text,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import selectinload, joinedload, noload
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from src.core.logging import get_logger
 from src.database.models.vehicle import Vehicle, VehicleConfiguration
@@ -23,6 +43,37 @@ from src.database.models.inventory import InventoryItem, InventoryStatus
 
 logger = get_logger(__name__)
 
+# Materialized view of vehicle counts and price statistics per make, model,
+# year, body style, fuel type, drivetrain and price bucket (migration 014)
+VEHICLE_FACET_COUNTS = table(
+    "vehicle_facet_counts",
+    column("make", String),
+    column("model", String),
+    column("year", Integer),
+    column("body_style", String),
+    column("fuel_type", String),
+    column("drivetrain", String),
+    column("price_bucket", Numeric),
+    column("vehicle_count", Integer),
+    column("price_min", Numeric),
+    column("price_max", Numeric),
+    column("price_sum", Numeric),
+)
+
+
+class _ExplainJson(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, executed with its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(_ExplainJson, "postgresql")
+def _compile_explain_json(element: _ExplainJson, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
 
 class VehicleRepository:
     """
@@ -32,6 +83,36 @@ class VehicleRepository:
     pagination, and complex queries with inventory data joins.
     """
 
+    # Maximum ids bound into a single IN clause by bulk lookups
+    BULK_FETCH_CHUNK_SIZE = 1000
+
+    # Numeric specification keys that can be filtered by range; horsepower
+    # and the MPG keys have expression indexes
+    SPEC_RANGE_KEYS = frozenset(
+        {"horsepower", "torque", "mpg_city", "mpg_highway", "electric_range"}
+    )
+
+    # Words of a free-text query, matched as tsquery prefixes
+    QUERY_TOKEN_PATTERN = re.compile(r"\w+")
+
+    # Term facets as (grain column, bucket limit), matching the sizes of the
+    # Elasticsearch facet aggregations
+    FACET_TERMS = {
+        "makes": ("make", 50),
+        "models": ("model", 100),
+        "body_styles": ("body_style", 20),
+        "fuel_types": ("fuel_type", 10),
+        "drivetrains": ("drivetrain", 10),
+    }
+
+    # Price bucket width of vehicle_facet_counts and the price histogram
+    FACET_PRICE_INTERVAL = 5000
+
+    # Total count modes for search
+    COUNT_EXACT = "exact"
+    COUNT_ESTIMATED = "estimated"
+    COUNT_NONE = "none"
+
     def __init__(self, session: AsyncSession):
         """
         Initialize vehicle repository.
@@ -98,6 +179,66 @@ class VehicleRepository:
             )
             raise
 
+    async def get_many_by_ids(
+        self,
+        vehicle_ids: list[uuid.UUID],
+        include_inventory: bool = False,
+    ) -> list[Vehicle]:
+        """
+        Get multiple vehicles by ID in bulk.
+
+        Issues one IN query per BULK_FETCH_CHUNK_SIZE ids instead of one
+        query per vehicle; inventory is eager-loaded with selectinload.
+
+        Args:
+            vehicle_ids: Vehicle identifiers
+            include_inventory: Whether to load inventory relationships
+
+        Returns:
+            Found vehicles, in no particular order (missing ids are skipped)
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        unique_ids = list(dict.fromkeys(vehicle_ids))
+        vehicles: list[Vehicle] = []
+
+        try:
+            for i in range(0, len(unique_ids), self.BULK_FETCH_CHUNK_SIZE):
+                chunk = unique_ids[i : i + self.BULK_FETCH_CHUNK_SIZE]
+                stmt = select(Vehicle).where(
+                    and_(
+                        Vehicle.id.in_(chunk),
+                        Vehicle.deleted_at.is_(None),
+                    )
+                )
+
+                if include_inventory:
+                    stmt = stmt.options(
+                        selectinload(Vehicle.inventory_items),
+                    )
+
+                result = await self.session.execute(stmt)
+                vehicles.extend(result.scalars().all())
+
+            logger.debug(
+                "Vehicles retrieved in bulk",
+                requested=len(unique_ids),
+                found=len(vehicles),
+                include_inventory=include_inventory,
+            )
+
+            return vehicles
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to retrieve vehicles in bulk",
+                requested=len(unique_ids),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
     async def get_by_vin(self, vin: str) -> Optional[Vehicle]:
         """
         Get vehicle by VIN.
@@ -138,6 +279,170 @@ class VehicleRepository:
             )
             raise
 
+    async def stream_vins(self, batch_size: int = 5000) -> AsyncIterator[str]:
+        """
+        Stream the VINs of all active vehicles.
+
+        Rows are fetched from a server-side cursor in batches so the full
+        VIN set is never held in memory.
+
+        Args:
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            VINs of non-deleted vehicles
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        stmt = (
+            select(Vehicle.vin)
+            .where(
+                and_(
+                    Vehicle.vin.is_not(None),
+                    Vehicle.deleted_at.is_(None),
+                )
+            )
+            .execution_options(yield_per=batch_size)
+        )
+
+        try:
+            result = await self.session.stream_scalars(stmt)
+            async for vin in result:
+                yield vin
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to stream vehicle VINs",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+    async def get_make_model_counts(self) -> list[tuple[str, str, int]]:
+        """
+        Count active vehicles per make and model.
+
+        Returns:
+            List of (make, model, vehicle count) rows
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        stmt = (
+            select(Vehicle.make, Vehicle.model, func.count(Vehicle.id))
+            .where(Vehicle.deleted_at.is_(None))
+            .group_by(Vehicle.make, Vehicle.model)
+        )
+
+        try:
+            result = await self.session.execute(stmt)
+            rows = [(make, model, count) for make, model, count in result.all()]
+
+            logger.debug("Make and model counts retrieved", rows=len(rows))
+
+            return rows
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to count vehicles by make and model",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+    async def get_make_model_by_ids(
+        self,
+        vehicle_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, tuple[str, str]]:
+        """
+        Get the make and model of vehicles without loading full rows.
+
+        Args:
+            vehicle_ids: Vehicle identifiers
+
+        Returns:
+            Mapping of vehicle id to (make, model); missing ids are skipped
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        unique_ids = list(dict.fromkeys(vehicle_ids))
+        found: dict[uuid.UUID, tuple[str, str]] = {}
+
+        try:
+            for i in range(0, len(unique_ids), self.BULK_FETCH_CHUNK_SIZE):
+                chunk = unique_ids[i : i + self.BULK_FETCH_CHUNK_SIZE]
+                stmt = select(Vehicle.id, Vehicle.make, Vehicle.model).where(
+                    and_(
+                        Vehicle.id.in_(chunk),
+                        Vehicle.deleted_at.is_(None),
+                    )
+                )
+                result = await self.session.execute(stmt)
+                found.update(
+                    (vehicle_id, (make, model))
+                    for vehicle_id, make, model in result.all()
+                )
+
+            return found
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to retrieve vehicle makes and models",
+                requested=len(unique_ids),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+    async def stream_for_indexing(
+        self,
+        after_id: Optional[uuid.UUID] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Vehicle]:
+        """
+        Stream active vehicles in id order for search indexing.
+
+        Rows come from a server-side cursor in batches, and relationships
+        are not loaded, so memory use does not grow with the catalog.
+
+        Args:
+            after_id: Only stream vehicles with a greater id (resume point)
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Non-deleted vehicles ordered by id
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        conditions = [Vehicle.deleted_at.is_(None)]
+        if after_id is not None:
+            conditions.append(Vehicle.id > after_id)
+
+        stmt = (
+            select(Vehicle)
+            .where(and_(*conditions))
+            .options(noload("*"))
+            .order_by(Vehicle.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        try:
+            result = await self.session.stream_scalars(stmt)
+            async for vehicle in result:
+                yield vehicle
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to stream vehicles for indexing",
+                after_id=str(after_id) if after_id else None,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
     async def create(self, vehicle: Vehicle) -> Vehicle:
         """
         Create new vehicle.
@@ -282,15 +587,32 @@ class VehicleRepository:
         min_price: Optional[Decimal] = None,
         max_price: Optional[Decimal] = None,
         specifications: Optional[dict[str, Any]] = None,
+        spec_ranges: Optional[
+            dict[str, tuple[Optional[int], Optional[int]]]
+        ] = None,
+        query: Optional[str] = None,
         available_only: bool = False,
         skip: int = 0,
         limit: int = 100,
         sort_by: str = "year",
         sort_order: str = "desc",
-    ) -> tuple[Sequence[Vehicle], int]:
+        after: Optional[tuple[Any, uuid.UUID]] = None,
+        count_mode: str = COUNT_EXACT,
+    ) -> tuple[Sequence[Vehicle], Optional[int]]:
         """
         Search vehicles with filtering and pagination.
 
+        Pages are either addressed by offset (skip) or by key (after). Keyset
+        pages continue after the given (sort value, id) pair and cost the same
+        at any depth; rows are always ordered by id after the sort field so
+        both modes page deterministically.
+
+        Make and model match substrings through trigram indexes, body style
+        and fuel type match case-insensitively on the whole value, and query
+        matches word prefixes against the full-text search vector.
+        Specification filters become one JSONB containment predicate, so
+        values must match their stored JSON types.
+
         Args:
             make: Filter by manufacturer
             model: Filter by model name
@@ -302,85 +624,64 @@ class VehicleRepository:
             min_price: Filter by minimum price
             max_price: Filter by maximum price
             specifications: Filter by JSONB specifications
+            spec_ranges: Inclusive (min, max) bounds per numeric specification
+                key; either bound may be None
+            query: Free-text query over make, model, trim and body style
             available_only: Only return available vehicles
             skip: Number of records to skip
             limit: Maximum number of records to return
             sort_by: Field to sort by
             sort_order: Sort order (asc or desc)
+            after: Sort value and id of the last row of the previous page
+            count_mode: exact runs COUNT(*), estimated uses the planner's
+                row estimate and none skips counting
 
         Returns:
-            Tuple of (vehicles list, total count)
+            Tuple of (vehicles list, total count or None if not counted)
 
         Raises:
+            ValueError: If a range filter targets an unsupported key
             SQLAlchemyError: If database operation fails
         """
         try:
-            conditions = [Vehicle.deleted_at.is_(None)]
-
-            if make:
-                conditions.append(
-                    Vehicle.make.ilike(f"%{make}%")
-                )
-
-            if model:
-                conditions.append(
-                    Vehicle.model.ilike(f"%{model}%")
-                )
-
-            if year:
-                conditions.append(Vehicle.year == year)
-
-            if min_year:
-                conditions.append(Vehicle.year >= min_year)
-
-            if max_year:
-                conditions.append(Vehicle.year <= max_year)
-
-            if body_style:
-                conditions.append(
-                    Vehicle.body_style.ilike(f"%{body_style}%")
-                )
-
-            if fuel_type:
-                conditions.append(
-                    Vehicle.fuel_type.ilike(f"%{fuel_type}%")
-                )
-
-            if min_price:
-                conditions.append(Vehicle.base_price >= min_price)
-
-            if max_price:
-                conditions.append(Vehicle.base_price <= max_price)
-
-            if specifications:
-                for key, value in specifications.items():
-                    conditions.append(
-                        Vehicle.specifications[key].astext == str(value)
-                    )
+            conditions = self._search_conditions(
+                make=make,
+                model=model,
+                year=year,
+                min_year=min_year,
+                max_year=max_year,
+                body_style=body_style,
+                fuel_type=fuel_type,
+                min_price=min_price,
+                max_price=max_price,
+                specifications=specifications,
+                spec_ranges=spec_ranges,
+                query=query,
+                available_only=available_only,
+            )
 
-            if available_only:
-                conditions.append(
-                    Vehicle.inventory_items.any(
-                        and_(
-                            InventoryItem.status == InventoryStatus.AVAILABLE,
-                            InventoryItem.deleted_at.is_(None),
-                        )
-                    )
+            total: Optional[int] = None
+            if count_mode == self.COUNT_EXACT:
+                count_stmt = select(func.count()).select_from(Vehicle).where(
+                    and_(*conditions)
                 )
-
-            count_stmt = select(func.count()).select_from(Vehicle).where(
-                and_(*conditions)
-            )
-            count_result = await self.session.execute(count_stmt)
-            total = count_result.scalar_one()
+                count_result = await self.session.execute(count_stmt)
+                total = count_result.scalar_one()
 
             sort_column = getattr(Vehicle, sort_by, Vehicle.year)
-            order_func = desc if sort_order.lower() == "desc" else asc
+            descending = sort_order.lower() == "desc"
+            order_func = desc if descending else asc
+
+            page_conditions = list(conditions)
+            if after is not None:
+                key, bound = tuple_(sort_column, Vehicle.id), tuple_(*after)
+                page_conditions.append(key < bound if descending else key > bound)
+                skip = 0
 
             stmt = (
                 select(Vehicle)
-                .where(and_(*conditions))
-                .order_by(order_func(sort_column))
+                .where(and_(*page_conditions))
+                .order_by(order_func(sort_column), order_func(Vehicle.id))
                 .offset(skip)
                 .limit(limit)
             )
@@ -388,9 +689,19 @@ class VehicleRepository:
             result = await self.session.execute(stmt)
             vehicles = result.scalars().all()
 
+            if count_mode == self.COUNT_ESTIMATED:
+                if after is None and len(vehicles) < limit:
+                    # A short first page or offset page is already exact
+                    total = skip + len(vehicles)
+                else:
+                    estimate = await self._estimate_count(conditions)
+                    total = max(estimate, skip + len(vehicles))
+
             logger.info(
                 "Vehicle search completed",
                 total=total,
+                count_mode=count_mode,
+                keyset=after is not None,
                 returned=len(vehicles),
                 filters={
                     "make": make,
@@ -398,6 +709,7 @@ class VehicleRepository:
                     "year": year,
                     "body_style": body_style,
                     "fuel_type": fuel_type,
+                    "query": query,
                     "available_only": available_only,
                 },
             )
@@ -412,6 +724,183 @@ class VehicleRepository:
             )
             raise
 
+    def _search_conditions(
+        self,
+        make: Optional[str] = None,
+        model: Optional[str] = None,
+        year: Optional[int] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
+        body_style: Optional[str] = None,
+        fuel_type: Optional[str] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        specifications: Optional[dict[str, Any]] = None,
+        spec_ranges: Optional[
+            dict[str, tuple[Optional[int], Optional[int]]]
+        ] = None,
+        query: Optional[str] = None,
+        available_only: bool = False,
+    ) -> list[Any]:
+        """
+        Build the WHERE conditions of a vehicle search.
+
+        Args:
+            make: Filter by manufacturer (substring)
+            model: Filter by model name (substring)
+            year: Filter by exact year
+            min_year: Filter by minimum year
+            max_year: Filter by maximum year
+            body_style: Filter by body style
+            fuel_type: Filter by fuel type
+            min_price: Filter by minimum price
+            max_price: Filter by maximum price
+            specifications: Filter by JSONB specifications
+            spec_ranges: Inclusive (min, max) bounds per numeric specification key
+            query: Free-text query over make, model, trim and body style
+            available_only: Only match available vehicles
+
+        Returns:
+            Conditions to combine with and_()
+
+        Raises:
+            ValueError: If a range filter targets an unsupported key
+        """
+        conditions = [Vehicle.deleted_at.is_(None)]
+
+        if make:
+            conditions.append(
+                Vehicle.make.ilike(f"%{make}%")
+            )
+
+        if model:
+            conditions.append(
+                Vehicle.model.ilike(f"%{model}%")
+            )
+
+        if year:
+            conditions.append(Vehicle.year == year)
+
+        if min_year:
+            conditions.append(Vehicle.year >= min_year)
+
+        if max_year:
+            conditions.append(Vehicle.year <= max_year)
+
+        if body_style:
+            conditions.append(
+                func.lower(Vehicle.body_style) == body_style.strip().lower()
+            )
+
+        if fuel_type:
+            conditions.append(
+                func.lower(Vehicle.fuel_type) == fuel_type.strip().lower()
+            )
+
+        if query:
+            tsquery = self._to_prefix_tsquery(query)
+            if tsquery:
+                conditions.append(
+                    Vehicle.search_vector.op("@@")(
+                        func.to_tsquery("simple", tsquery)
+                    )
+                )
+
+        if min_price:
+            conditions.append(Vehicle.base_price >= min_price)
+
+        if max_price:
+            conditions.append(Vehicle.base_price <= max_price)
+
+        if specifications:
+            conditions.append(Vehicle.specifications.contains(specifications))
+
+        for key, (low, high) in (spec_ranges or {}).items():
+            value = self._spec_number(key)
+            if low is not None:
+                conditions.append(value >= low)
+            if high is not None:
+                conditions.append(value <= high)
+
+        if available_only:
+            conditions.append(
+                Vehicle.inventory_items.any(
+                    and_(
+                        InventoryItem.status == InventoryStatus.AVAILABLE,
+                        InventoryItem.deleted_at.is_(None),
+                    )
+                )
+            )
+
+        return conditions
+
+    @classmethod
+    def _spec_number(cls, key: str) -> Any:
+        """
+        Build the integer expression of a numeric specification key.
+
+        The key is rendered as a literal rather than a bound parameter so
+        the expression matches the expression indexes on hot keys.
+
+        Args:
+            key: Specification key
+
+        Returns:
+            SQL expression casting the key's value to integer
+
+        Raises:
+            ValueError: If the key does not support range filters
+        """
+        if key not in cls.SPEC_RANGE_KEYS:
+            raise ValueError(f"Specification '{key}' does not support range filters")
+
+        return cast(
+            Vehicle.specifications.op("->>")(literal_column(f"'{key}'")),
+            Integer,
+        )
+
+    @classmethod
+    def _to_prefix_tsquery(cls, query: str) -> str:
+        """
+        Convert free text to a tsquery matching every word as a prefix.
+
+        Only word characters are kept, so user input can never inject
+        tsquery operators.
+
+        Args:
+            query: Free-text query
+
+        Returns:
+            tsquery text such as ``toy:* & cam:*``, empty if no words remain
+        """
+        words = cls.QUERY_TOKEN_PATTERN.findall(query.lower())
+        return " & ".join(f"{word}:*" for word in words)
+
+    async def _estimate_count(self, conditions: list[Any]) -> int:
+        """
+        Estimate the number of vehicles matching conditions from the query plan.
+
+        Runs EXPLAIN instead of COUNT(*), so the cost does not grow with the
+        number of matches. Filter values stay bound parameters, so JSONB and
+        tsquery filters are typed the same way as in the search itself.
+
+        Args:
+            conditions: Search conditions
+
+        Returns:
+            Planner row estimate
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        stmt = select(Vehicle.id).where(and_(*conditions))
+        result = await self.session.execute(_ExplainJson(stmt))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     async def get_with_inventory(
         self,
         vehicle_id: uuid.UUID,
@@ -683,10 +1172,14 @@ class VehicleRepository:
                 conditions.append(Vehicle.make.ilike(make))
 
             if body_style:
-                conditions.append(Vehicle.body_style.ilike(body_style))
+                conditions.append(
+                    func.lower(Vehicle.body_style) == body_style.strip().lower()
+                )
 
             if fuel_type:
-                conditions.append(Vehicle.fuel_type.ilike(fuel_type))
+                conditions.append(
+                    func.lower(Vehicle.fuel_type) == fuel_type.strip().lower()
+                )
 
             stmt = select(func.count()).select_from(Vehicle).where(
                 and_(*conditions)
@@ -713,4 +1206,325 @@ class VehicleRepository:
                 error=str(e),
                 error_type=type(e).__name__,
             )
-            raise
\ No newline at end of file
+            raise
+
+    async def get_facet_counts(
+        self,
+        make: Optional[str] = None,
+        model: Optional[str] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
+        body_style: Optional[str] = None,
+        fuel_type: Optional[str] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        specifications: Optional[dict[str, Any]] = None,
+        spec_ranges: Optional[
+            dict[str, tuple[Optional[int], Optional[int]]]
+        ] = None,
+        query: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Get facet counts for faceted navigation without Elasticsearch.
+
+        Filters on the view's dimensions are answered from the
+        vehicle_facet_counts materialized view, with price bounds widened to
+        whole FACET_PRICE_INTERVAL buckets. Free-text and specification
+        filters are not in the view; with either, the same grain is grouped
+        from matching vehicles instead. All facets come from one GROUPING
+        SETS query, and the result has the shape of
+        VehicleSearchService._process_facets.
+
+        Args:
+            make: Filter by manufacturer (substring)
+            model: Filter by model name (substring)
+            min_year: Filter by minimum year
+            max_year: Filter by maximum year
+            body_style: Filter by body style
+            fuel_type: Filter by fuel type
+            min_price: Filter by minimum price
+            max_price: Filter by maximum price
+            specifications: Filter by JSONB specifications
+            spec_ranges: Inclusive (min, max) bounds per numeric specification key
+            query: Free-text query over make, model, trim and body style
+
+        Returns:
+            Term facets, year and price statistics and price histogram
+
+        Raises:
+            ValueError: If a range filter targets an unsupported key
+            SQLAlchemyError: If database operation fails
+        """
+        live = bool(query or specifications or spec_ranges)
+
+        if live:
+            source = self._live_facet_source(
+                self._search_conditions(
+                    make=make,
+                    model=model,
+                    min_year=min_year,
+                    max_year=max_year,
+                    body_style=body_style,
+                    fuel_type=fuel_type,
+                    min_price=min_price,
+                    max_price=max_price,
+                    specifications=specifications,
+                    spec_ranges=spec_ranges,
+                    query=query,
+                )
+            )
+            conditions: list[Any] = []
+        else:
+            source = VEHICLE_FACET_COUNTS
+            conditions = self._facet_view_conditions(
+                make=make,
+                model=model,
+                min_year=min_year,
+                max_year=max_year,
+                body_style=body_style,
+                fuel_type=fuel_type,
+                min_price=min_price,
+                max_price=max_price,
+            )
+
+        c = source.c
+        dimensions = [
+            c.make,
+            c.model,
+            c.body_style,
+            c.fuel_type,
+            c.drivetrain,
+            c.price_bucket,
+        ]
+        stmt = (
+            select(
+                *dimensions,
+                func.sum(c.vehicle_count).label("vehicle_count"),
+                func.min(c.year).label("year_min"),
+                func.max(c.year).label("year_max"),
+                func.sum(c.year * c.vehicle_count).label("year_sum"),
+                func.min(c.price_min).label("price_min"),
+                func.max(c.price_max).label("price_max"),
+                func.sum(c.price_sum).label("price_sum"),
+            )
+            .where(*conditions)
+            .group_by(func.grouping_sets(*dimensions))
+        )
+
+        try:
+            result = await self.session.execute(stmt)
+            facets = self._facets_from_rows(result.mappings().all())
+
+            logger.debug(
+                "Facet counts retrieved",
+                source="vehicles" if live else "vehicle_facet_counts",
+                total=facets["price_range"]["count"],
+            )
+
+            return facets
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to retrieve facet counts",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
+
+    def _facet_view_conditions(
+        self,
+        make: Optional[str] = None,
+        model: Optional[str] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
+        body_style: Optional[str] = None,
+        fuel_type: Optional[str] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+    ) -> list[Any]:
+        """
+        Build vehicle_facet_counts conditions matching search filters.
+
+        Args:
+            make: Filter by manufacturer (substring)
+            model: Filter by model name (substring)
+            min_year: Filter by minimum year
+            max_year: Filter by maximum year
+            body_style: Filter by body style
+            fuel_type: Filter by fuel type
+            min_price: Keep price buckets ending above this price
+            max_price: Keep price buckets starting at or below this price
+
+        Returns:
+            Conditions to combine with and_()
+        """
+        c = VEHICLE_FACET_COUNTS.c
+        conditions = []
+
+        if make:
+            conditions.append(c.make.ilike(f"%{make}%"))
+
+        if model:
+            conditions.append(c.model.ilike(f"%{model}%"))
+
+        if min_year:
+            conditions.append(c.year >= min_year)
+
+        if max_year:
+            conditions.append(c.year <= max_year)
+
+        if body_style:
+            conditions.append(func.lower(c.body_style) == body_style.strip().lower())
+
+        if fuel_type:
+            conditions.append(func.lower(c.fuel_type) == fuel_type.strip().lower())
+
+        if min_price:
+            conditions.append(c.price_bucket + self.FACET_PRICE_INTERVAL > min_price)
+
+        if max_price:
+            conditions.append(c.price_bucket <= max_price)
+
+        return conditions
+
+    def _live_facet_source(self, conditions: list[Any]) -> Any:
+        """
+        Group matching vehicles to the grain of vehicle_facet_counts.
+
+        Args:
+            conditions: Vehicle search conditions
+
+        Returns:
+            Subquery with the columns of vehicle_facet_counts
+        """
+        price_bucket = (
+            func.floor(Vehicle.base_price / self.FACET_PRICE_INTERVAL)
+            * self.FACET_PRICE_INTERVAL
+        ).label("price_bucket")
+        grain = [
+            Vehicle.make.label("make"),
+            Vehicle.model.label("model"),
+            Vehicle.year.label("year"),
+            Vehicle.body_style.label("body_style"),
+            Vehicle.fuel_type.label("fuel_type"),
+            Vehicle.drivetrain.label("drivetrain"),
+            price_bucket,
+        ]
+
+        return (
+            select(
+                *grain,
+                func.count().label("vehicle_count"),
+                func.min(Vehicle.base_price).label("price_min"),
+                func.max(Vehicle.base_price).label("price_max"),
+                func.sum(Vehicle.base_price).label("price_sum"),
+            )
+            .where(and_(*conditions))
+            .group_by(*grain)
+            .subquery("vehicle_facet_grain")
+        )
+
+    @classmethod
+    def _facets_from_rows(cls, rows: Sequence[Any]) -> dict[str, Any]:
+        """
+        Shape GROUPING SETS rows like Elasticsearch facets.
+
+        Grain columns are never NULL, so the one non-NULL dimension of a
+        row names its grouping set. Every vehicle is in exactly one make
+        group, so the make rows add up to the year and price statistics.
+
+        Args:
+            rows: Result mappings of the facet query
+
+        Returns:
+            Term facets, year and price statistics and price histogram
+        """
+        terms: dict[str, list[dict[str, Any]]] = {
+            name: [] for name in cls.FACET_TERMS
+        }
+        histogram = []
+        totals = {
+            "count": 0,
+            "year_sum": 0,
+            "price_sum": Decimal(0),
+            "year_min": None,
+            "year_max": None,
+            "price_min": None,
+            "price_max": None,
+        }
+
+        for row in rows:
+            count = int(row["vehicle_count"])
+            if row["price_bucket"] is not None:
+                histogram.append({"range": float(row["price_bucket"]), "count": count})
+                continue
+
+            for name, (field, _) in cls.FACET_TERMS.items():
+                if row[field] is not None:
+                    terms[name].append({"value": row[field], "count": count})
+                    break
+
+            if row["make"] is None:
+                continue
+
+            totals["count"] += count
+            totals["year_sum"] += int(row["year_sum"])
+            totals["price_sum"] += row["price_sum"]
+            for key, pick in (
+                ("year_min", min),
+                ("year_max", max),
+                ("price_min", min),
+                ("price_max", max),
+            ):
+                totals[key] = (
+                    row[key] if totals[key] is None else pick(totals[key], row[key])
+                )
+
+        facets: dict[str, Any] = {
+            name: sorted(terms[name], key=lambda b: (-b["count"], b["value"]))[:size]
+            for name, (_, size) in cls.FACET_TERMS.items()
+        }
+
+        count = totals["count"]
+        facets["year_range"] = {
+            "min": float(totals["year_min"]) if count else None,
+            "max": float(totals["year_max"]) if count else None,
+            "avg": totals["year_sum"] / count if count else None,
+            "count": count,
+        }
+        facets["price_range"] = {
+            "min": float(totals["price_min"]) if count else None,
+            "max": float(totals["price_max"]) if count else None,
+            "avg": float(totals["price_sum"]) / count if count else None,
+            "count": count,
+        }
+        facets["price_histogram"] = sorted(
+            (bucket for bucket in histogram if bucket["count"] > 0),
+            key=lambda bucket: bucket["range"],
+        )
+
+        return facets
+
+    async def refresh_facet_counts(self) -> None:
+        """
+        Refresh the vehicle_facet_counts materialized view.
+
+        Runs concurrently, so facet reads keep using the previous contents
+        until the refresh commits.
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            await self.session.execute(
+                text("REFRESH MATERIALIZED VIEW CONCURRENTLY vehicle_facet_counts")
+            )
+            logger.debug("Vehicle facet counts refreshed")
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to refresh vehicle facet counts",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
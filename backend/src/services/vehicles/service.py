@@ -10,16 +10,29 @@ Implements production-ready patterns with proper error handling and logging.
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Any, Sequence
+from typing import Awaitable, Callable, Optional, Any, Sequence, TypeVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from src.core.logging import get_logger
+from src.cache.negative_cache import NegativeCache
 from src.cache.redis_client import RedisClient, CacheKeyManager
+from src.cache.single_flight import SingleFlight
 from src.services.cache.vehicle_cache import VehicleCache
+from src.database.connection import get_session
 from src.database.models.vehicle import Vehicle
 from src.database.models.inventory import InventoryItem, InventoryStatus
+from src.database.models.outbox import OutboxAggregate, OutboxEventType
+from src.services.outbox.repository import OutboxRepository
+from src.services.search.reindexer import VehicleReindexer
+from src.services.search.vehicle_index import VehicleIndex
+from src.services.vehicles.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    supports_keyset,
+)
 from src.services.vehicles.repository import VehicleRepository
 from src.schemas.vehicles import (
     VehicleCreate,
@@ -31,6 +44,8 @@ from src.schemas.vehicles import (
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class VehicleServiceError(Exception):
     """Base exception for vehicle service errors."""
@@ -80,6 +95,8 @@ class VehicleService:
         cache_ttl: int = 3600,
         search_service: Optional[Any] = None,
         vehicle_cache: Optional[VehicleCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        negative_cache: Optional[NegativeCache] = None,
     ):
         """
         Initialize vehicle service.
@@ -90,14 +107,19 @@ class VehicleService:
             cache_ttl: Cache TTL in seconds (default: 1 hour)
             search_service: Optional Elasticsearch search service
             vehicle_cache: Optional vehicle cache service
+            single_flight: Optional coalescer for concurrent cache misses
+            negative_cache: Optional cache of IDs and VINs known not to exist
         """
         self.repository = VehicleRepository(session)
+        self.outbox = OutboxRepository(session)
         self.session = session
         self.cache_client = cache_client
         self.cache_ttl = cache_ttl
         self.cache_key_manager = CacheKeyManager()
         self.search_service = search_service
         self.vehicle_cache = vehicle_cache
+        self.single_flight = single_flight
+        self.negative_cache = negative_cache
 
         logger.info(
             "Vehicle service initialized",
@@ -146,18 +168,29 @@ class VehicleService:
             )
 
             created_vehicle = await self.repository.create(vehicle)
+            self.outbox.add(
+                OutboxAggregate.VEHICLE,
+                created_vehicle.id,
+                OutboxEventType.UPSERTED,
+            )
             await self.session.commit()
 
             response = self._to_response(created_vehicle)
 
+            if self.negative_cache:
+                await self.negative_cache.record_created(
+                    NegativeCache.VEHICLE_ID, created_vehicle.id
+                )
+                if created_vehicle.vin:
+                    await self.negative_cache.record_created(
+                        NegativeCache.VIN, created_vehicle.vin
+                    )
+
             if self.vehicle_cache:
                 await self.vehicle_cache.invalidate_vehicle_lists()
             elif self.cache_client:
                 await self._invalidate_list_cache()
 
-            if self.search_service:
-                await self._sync_to_search_index(response)
-
             logger.info(
                 "Vehicle created successfully",
                 vehicle_id=str(created_vehicle.id),
@@ -222,8 +255,28 @@ class VehicleService:
             VehicleServiceError: If retrieval fails
         """
         try:
-            if self.vehicle_cache and not include_inventory:
-                cached_vehicle = await self.vehicle_cache.get_vehicle_detail(vehicle_id)
+            if self.negative_cache and await self.negative_cache.is_missing(
+                NegativeCache.VEHICLE_ID, vehicle_id
+            ):
+                raise VehicleNotFoundError(vehicle_id)
+
+            if include_inventory:
+                response = await self._load_vehicle(
+                    vehicle_id, include_inventory=True
+                )
+            elif self.vehicle_cache:
+                response = await self.vehicle_cache.get_or_load_vehicle_detail(
+                    vehicle_id,
+                    lambda: self._load_vehicle(vehicle_id),
+                    refresh_loader=lambda: self._refresh_in_new_session(
+                        lambda service: service._load_vehicle(vehicle_id)
+                    ),
+                )
+            elif self.cache_client:
+                cache_key = self.cache_key_manager.vehicle_key(str(vehicle_id))
+                cached_vehicle = await self._get_cached_model(
+                    cache_key, VehicleResponse
+                )
                 if cached_vehicle:
                     logger.debug(
                         "Vehicle retrieved from cache",
@@ -231,35 +284,22 @@ class VehicleService:
                     )
                     return cached_vehicle
 
-            if self.cache_client and not include_inventory and not self.vehicle_cache:
-                cache_key = self.cache_key_manager.vehicle_key(str(vehicle_id))
-                cached_data = await self.cache_client.get(cache_key)
-                if cached_data:
-                    logger.debug(
-                        "Vehicle retrieved from cache",
-                        vehicle_id=str(vehicle_id),
+                async def load_and_cache() -> VehicleResponse:
+                    loaded = await self._load_vehicle(vehicle_id)
+                    await self.cache_client.set(
+                        cache_key,
+                        loaded.model_dump_json(),
+                        ex=self.cache_ttl,
                     )
-                    return VehicleResponse.model_validate_json(cached_data)
-
-            vehicle = await self.repository.get_by_id(
-                vehicle_id,
-                include_inventory=include_inventory,
-            )
-
-            if not vehicle:
-                raise VehicleNotFoundError(vehicle_id)
-
-            response = self._to_response(vehicle)
+                    return loaded
 
-            if self.vehicle_cache and not include_inventory:
-                await self.vehicle_cache.set_vehicle_detail(vehicle_id, response)
-            elif self.cache_client and not include_inventory:
-                cache_key = self.cache_key_manager.vehicle_key(str(vehicle_id))
-                await self.cache_client.set(
+                response = await self._load_coalesced(
                     cache_key,
-                    response.model_dump_json(),
-                    ex=self.cache_ttl,
+                    lambda: self._get_cached_model(cache_key, VehicleResponse),
+                    load_and_cache,
                 )
+            else:
+                response = await self._load_vehicle(vehicle_id)
 
             logger.debug(
                 "Vehicle retrieved successfully",
@@ -295,6 +335,94 @@ class VehicleService:
             )
             raise
 
+    async def get_vehicle_by_vin(self, vin: str) -> Optional[VehicleResponse]:
+        """
+        Get vehicle by VIN, answering known-missing VINs without a query.
+
+        Args:
+            vin: Vehicle Identification Number
+
+        Returns:
+            Vehicle response, or None if no active vehicle has the VIN
+
+        Raises:
+            VehicleServiceError: If retrieval fails
+        """
+        if self.negative_cache and await self.negative_cache.is_missing(
+            NegativeCache.VIN, vin
+        ):
+            return None
+
+        try:
+            vehicle = await self.repository.get_by_vin(vin)
+
+        except SQLAlchemyError as e:
+            raise VehicleServiceError(
+                "Failed to retrieve vehicle by VIN",
+                code="VEHICLE_GET_ERROR",
+                vin=vin,
+                error=str(e),
+            ) from e
+
+        if not vehicle:
+            if self.negative_cache:
+                await self.negative_cache.mark_missing(NegativeCache.VIN, vin)
+            return None
+
+        return self._to_response(vehicle)
+
+    async def get_vehicles_by_ids(
+        self,
+        vehicle_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, VehicleResponse]:
+        """
+        Get several vehicles by ID with one cache and one database round trip.
+
+        Vehicles that do not exist or are soft-deleted are omitted from the
+        result rather than raising.
+
+        Args:
+            vehicle_ids: Vehicle identifiers
+
+        Returns:
+            Dictionary mapping found vehicle IDs to vehicle responses
+
+        Raises:
+            VehicleServiceError: If retrieval fails
+        """
+        try:
+            if self.vehicle_cache:
+                vehicles = await self.vehicle_cache.get_vehicle_details_many(
+                    vehicle_ids, loader=self._load_vehicles
+                )
+            else:
+                vehicles = {
+                    vehicle.id: vehicle
+                    for vehicle in await self._load_vehicles(vehicle_ids)
+                }
+
+            logger.debug(
+                "Vehicles retrieved by IDs",
+                requested=len(vehicle_ids),
+                found=len(vehicles),
+            )
+
+            return vehicles
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Bulk vehicle retrieval failed",
+                count=len(vehicle_ids),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise VehicleServiceError(
+                "Failed to retrieve vehicles",
+                code="VEHICLE_GET_MANY_ERROR",
+                count=len(vehicle_ids),
+                error=str(e),
+            ) from e
+
     async def update_vehicle(
         self,
         vehicle_id: uuid.UUID,
@@ -333,6 +461,11 @@ class VehicleService:
                     setattr(vehicle, field, value)
 
             updated_vehicle = await self.repository.update(vehicle)
+            self.outbox.add(
+                OutboxAggregate.VEHICLE,
+                vehicle_id,
+                OutboxEventType.UPSERTED,
+            )
             await self.session.commit()
 
             response = self._to_response(updated_vehicle)
@@ -344,9 +477,6 @@ class VehicleService:
                 await self._invalidate_vehicle_cache(vehicle_id)
                 await self._invalidate_list_cache()
 
-            if self.search_service:
-                await self._sync_to_search_index(response)
-
             logger.info(
                 "Vehicle updated successfully",
                 vehicle_id=str(vehicle_id),
@@ -408,6 +538,11 @@ class VehicleService:
             if not deleted:
                 raise VehicleNotFoundError(vehicle_id)
 
+            self.outbox.add(
+                OutboxAggregate.VEHICLE,
+                vehicle_id,
+                OutboxEventType.DELETED,
+            )
             await self.session.commit()
 
             if self.vehicle_cache:
@@ -417,9 +552,6 @@ class VehicleService:
                 await self._invalidate_vehicle_cache(vehicle_id)
                 await self._invalidate_list_cache()
 
-            if self.search_service:
-                await self._remove_from_search_index(vehicle_id)
-
             logger.info(
                 "Vehicle deleted successfully",
                 vehicle_id=str(vehicle_id),
@@ -475,79 +607,55 @@ class VehicleService:
         try:
             if self.vehicle_cache:
                 filters = search_request.model_dump(exclude_unset=True)
-                cached_results = await self.vehicle_cache.get_vehicle_list(filters)
+                response = await self.vehicle_cache.get_or_load_vehicle_list(
+                    filters,
+                    lambda: self._load_search_results(search_request),
+                    refresh_loader=lambda: self._refresh_in_new_session(
+                        lambda service: service._load_search_results(search_request)
+                    ),
+                )
+            elif self.cache_client:
+                cache_key = self._generate_search_cache_key(search_request)
+                cached_results = await self._get_cached_model(
+                    cache_key, VehicleListResponse
+                )
                 if cached_results:
                     logger.debug(
                         "Search results retrieved from cache",
-                        filters=filters,
+                        cache_key=cache_key,
                     )
                     return cached_results
 
-            if self.cache_client and not self.vehicle_cache:
-                cache_key = self._generate_search_cache_key(search_request)
-                cached_data = await self.cache_client.get(cache_key)
-                if cached_data:
-                    logger.debug(
-                        "Search results retrieved from cache",
-                        cache_key=cache_key,
+                async def load_and_cache() -> VehicleListResponse:
+                    loaded = await self._load_search_results(search_request)
+                    await self.cache_client.set(
+                        cache_key,
+                        loaded.model_dump_json(),
+                        ex=self.cache_ttl,
                     )
-                    return VehicleListResponse.model_validate_json(cached_data)
-
-            skip = (search_request.page - 1) * search_request.page_size
-
-            vehicles, total = await self.repository.search(
-                make=search_request.make,
-                model=search_request.model,
-                year=None,
-                min_year=search_request.year_min,
-                max_year=search_request.year_max,
-                body_style=search_request.body_style,
-                fuel_type=search_request.fuel_type,
-                min_price=search_request.price_min,
-                max_price=search_request.price_max,
-                specifications=search_request.custom_attributes,
-                available_only=False,
-                skip=skip,
-                limit=search_request.page_size,
-                sort_by=search_request.sort_by or "year",
-                sort_order=search_request.sort_order,
-            )
+                    return loaded
 
-            total_pages = (
-                (total + search_request.page_size - 1) // search_request.page_size
-                if total > 0
-                else 0
-            )
-
-            response = VehicleListResponse(
-                items=[self._to_response(v) for v in vehicles],
-                total=total,
-                page=search_request.page,
-                page_size=search_request.page_size,
-                total_pages=total_pages,
-            )
-
-            if self.vehicle_cache:
-                filters = search_request.model_dump(exclude_unset=True)
-                await self.vehicle_cache.set_vehicle_list(response, filters)
-            elif self.cache_client:
-                cache_key = self._generate_search_cache_key(search_request)
-                await self.cache_client.set(
+                response = await self._load_coalesced(
                     cache_key,
-                    response.model_dump_json(),
-                    ex=self.cache_ttl,
+                    lambda: self._get_cached_model(cache_key, VehicleListResponse),
+                    load_and_cache,
                 )
+            else:
+                response = await self._load_search_results(search_request)
 
             logger.info(
                 "Vehicle search completed",
-                total=total,
-                returned=len(vehicles),
+                total=response.total,
+                returned=len(response.items),
                 page=search_request.page,
                 filters=search_request.model_dump(exclude_unset=True),
             )
 
             return response
 
+        except VehicleValidationError:
+            raise
+
         except SQLAlchemyError as e:
             logger.error(
                 "Vehicle search failed",
@@ -694,18 +802,75 @@ class VehicleService:
             )
             raise
 
+    async def get_search_facets(
+        self,
+        search_request: VehicleSearchRequest,
+    ) -> dict[str, Any]:
+        """
+        Get facet counts for a search without Elasticsearch.
+
+        Facets are read from the precomputed facet counts view and have
+        the same shape as Elasticsearch faceted search facets.
+
+        Args:
+            search_request: Search parameters; pagination and sort are ignored
+
+        Returns:
+            Term facets, year and price statistics and price histogram
+
+        Raises:
+            VehicleValidationError: If a specification range is unsupported
+            VehicleServiceError: If retrieval fails
+        """
+        try:
+            return await self.repository.get_facet_counts(
+                make=search_request.make,
+                model=search_request.model,
+                min_year=search_request.year_min,
+                max_year=search_request.year_max,
+                body_style=search_request.body_style,
+                fuel_type=search_request.fuel_type,
+                min_price=search_request.price_min,
+                max_price=search_request.price_max,
+                specifications=search_request.custom_attributes,
+                spec_ranges=search_request.spec_ranges(),
+                query=search_request.search_query,
+            )
+
+        except ValueError as e:
+            raise VehicleValidationError(str(e), field="spec_ranges") from e
+
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to retrieve search facets",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise VehicleServiceError(
+                "Failed to retrieve search facets",
+                code="VEHICLE_FACETS_ERROR",
+                error=str(e),
+            ) from e
+
     async def bulk_index_vehicles(
         self,
-        batch_size: int = 100,
-    ) -> dict[str, int]:
+        batch_size: Optional[int] = None,
+        resume: bool = True,
+    ) -> dict[str, Any]:
         """
         Bulk index all active vehicles to Elasticsearch.
 
+        Streams the catalog through VehicleReindexer, which sends bulk
+        requests concurrently and checkpoints progress so an interrupted
+        run can resume.
+
         Args:
-            batch_size: Number of vehicles to process per batch
+            batch_size: Number of vehicles per bulk request (settings default
+                if None)
+            resume: Continue after the checkpoint of an interrupted run
 
         Returns:
-            Dictionary with indexing statistics
+            Dictionary with indexing statistics and throughput
 
         Raises:
             VehicleServiceError: If bulk indexing fails
@@ -715,79 +880,84 @@ class VehicleService:
             return {"indexed": 0, "failed": 0, "skipped": 0}
 
         try:
-            indexed_count = 0
-            failed_count = 0
-            offset = 0
+            reindexer = VehicleReindexer(
+                repository=self.repository,
+                index=self.search_service._index,
+                build_document=lambda vehicle: VehicleIndex.prepare_document(
+                    self._to_response(vehicle)
+                ),
+                batch_size=batch_size,
+            )
+            return await reindexer.run(resume=resume)
 
-            logger.info("Starting bulk vehicle indexing", batch_size=batch_size)
+        except Exception as e:
+            logger.error(
+                "Bulk vehicle indexing failed",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise VehicleServiceError(
+                "Failed to bulk index vehicles",
+                code="VEHICLE_BULK_INDEX_ERROR",
+                error=str(e),
+            ) from e
 
-            while True:
-                vehicles, total = await self.repository.search(
-                    available_only=False,
-                    skip=offset,
-                    limit=batch_size,
-                )
+    async def rebuild_search_index(
+        self,
+        batch_size: Optional[int] = None,
+        allow_failures: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Rebuild the search index into a new version without downtime.
 
-                if not vehicles:
-                    break
-
-                batch_responses = []
-                for vehicle in vehicles:
-                    try:
-                        response = self._to_response(vehicle)
-                        batch_responses.append(response)
-                    except Exception as e:
-                        logger.error(
-                            "Failed to convert vehicle to response",
-                            vehicle_id=str(vehicle.id),
-                            error=str(e),
-                        )
-                        failed_count += 1
-
-                if batch_responses:
-                    try:
-                        await self._bulk_sync_to_search_index(batch_responses)
-                        indexed_count += len(batch_responses)
-                        logger.info(
-                            "Indexed vehicle batch",
-                            batch_size=len(batch_responses),
-                            total_indexed=indexed_count,
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "Failed to index vehicle batch",
-                            batch_size=len(batch_responses),
-                            error=str(e),
-                        )
-                        failed_count += len(batch_responses)
-
-                offset += batch_size
-
-                if offset >= total:
-                    break
+        Searches keep hitting the live index while the next version is
+        loaded; vehicle writes during the load reach both. The alias is
+        swapped once the new version is complete and the old version is
+        kept for rollback. If any document fails to load the new version is
+        discarded instead, unless allow_failures is set.
 
-            logger.info(
-                "Bulk vehicle indexing completed",
-                indexed=indexed_count,
-                failed=failed_count,
-                total=total,
+        Args:
+            batch_size: Number of vehicles per bulk request (settings default
+                if None)
+            allow_failures: Go live even if some documents failed to load
+
+        Returns:
+            Dictionary with indexing statistics and the new and previous
+            index names
+
+        Raises:
+            VehicleServiceError: If the rebuild fails
+        """
+        if not self.search_service:
+            logger.warning("Search service not configured, skipping index rebuild")
+            return {"indexed": 0, "failed": 0, "skipped": 0}
+
+        index = self.search_service._index
+
+        async def load(target_index: str) -> dict[str, Any]:
+            reindexer = VehicleReindexer(
+                repository=self.repository,
+                index=index,
+                build_document=lambda vehicle: VehicleIndex.prepare_document(
+                    self._to_response(vehicle)
+                ),
+                batch_size=batch_size,
+                target_index=target_index,
             )
+            return await reindexer.run(resume=False)
 
-            return {
-                "indexed": indexed_count,
-                "failed": failed_count,
-                "skipped": 0,
-            }
+        try:
+            return await index.rebuild(load, allow_failures=allow_failures)
 
         except Exception as e:
             logger.error(
-                "Bulk vehicle indexing failed",
+                "Search index rebuild failed",
                 error=str(e),
                 error_type=type(e).__name__,
             )
             raise VehicleServiceError(
-                "Failed to bulk index vehicles",
-                code="VEHICLE_BULK_INDEX_ERROR",
+                "Failed to rebuild search index",
+                code="VEHICLE_INDEX_REBUILD_ERROR",
                 error=str(e),
             ) from e
 
@@ -812,17 +982,15 @@ class VehicleService:
             return 0
 
         try:
+            vehicles = await self.repository.get_many_by_ids(vehicle_ids)
             vehicle_data = []
-            for vehicle_id in vehicle_ids:
+            for vehicle in vehicles:
                 try:
-                    vehicle = await self.repository.get_by_id(vehicle_id)
-                    if vehicle:
-                        response = self._to_response(vehicle)
-                        vehicle_data.append(response)
+                    vehicle_data.append(self._to_response(vehicle))
                 except Exception as e:
                     logger.error(
-                        "Failed to retrieve vehicle for cache warming",
-                        vehicle_id=str(vehicle_id),
+                        "Failed to convert vehicle for cache warming",
+                        vehicle_id=str(vehicle.id),
                         error=str(e),
                     )
 
@@ -855,107 +1023,6 @@ class VehicleService:
                 error=str(e),
             ) from e
 
-    async def _sync_to_search_index(self, vehicle: VehicleResponse) -> None:
-        """
-        Sync single vehicle to Elasticsearch index.
-
-        Args:
-            vehicle: Vehicle response to index
-        """
-        if not self.search_service:
-            return
-
-        try:
-            from src.services.search.vehicle_index import VehicleIndex
-
-            vehicle_index = VehicleIndex()
-            document = vehicle_index.prepare_document(vehicle)
-
-            await self.search_service._index.index_vehicle(
-                vehicle_id=str(vehicle.id),
-                document=document,
-            )
-
-            logger.debug(
-                "Vehicle synced to search index",
-                vehicle_id=str(vehicle.id),
-            )
-
-        except Exception as e:
-            logger.error(
-                "Failed to sync vehicle to search index",
-                vehicle_id=str(vehicle.id),
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-
-    async def _bulk_sync_to_search_index(
-        self,
-        vehicles: list[VehicleResponse],
-    ) -> None:
-        """
-        Bulk sync vehicles to Elasticsearch index.
-
-        Args:
-            vehicles: List of vehicle responses to index
-        """
-        if not self.search_service:
-            return
-
-        try:
-            from src.services.search.vehicle_index import VehicleIndex
-
-            vehicle_index = VehicleIndex()
-            documents = []
-
-            for vehicle in vehicles:
-                document = vehicle_index.prepare_document(vehicle)
-                documents.append({
-                    "id": str(vehicle.id),
-                    "document": document,
-                })
-
-            await self.search_service._index.bulk_index_vehicles(documents)
-
-            logger.debug(
-                "Vehicles bulk synced to search index",
-                count=len(vehicles),
-            )
-
-        except Exception as e:
-            logger.error(
-                "Failed to bulk sync vehicles to search index",
-                count=len(vehicles),
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-
-    async def _remove_from_search_index(self, vehicle_id: uuid.UUID) -> None:
-        """
-        Remove vehicle from Elasticsearch index.
-
-        Args:
-            vehicle_id: Vehicle identifier to remove
-        """
-        if not self.search_service:
-            return
-
-        try:
-            await self.search_service._index.delete_vehicle(str(vehicle_id))
-
-            logger.debug(
-                "Vehicle removed from search index",
-                vehicle_id=str(vehicle_id),
-            )
-
-        except Exception as e:
-            logger.error(
-                "Failed to remove vehicle from search index",
-                vehicle_id=str(vehicle_id),
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-
     async def _validate_vehicle_uniqueness(
         self,
         make: str,
@@ -1027,6 +1094,199 @@ class VehicleService:
             updated_at=vehicle.updated_at,
         )
 
+    async def _load_vehicle(
+        self,
+        vehicle_id: uuid.UUID,
+        include_inventory: bool = False,
+    ) -> VehicleResponse:
+        """
+        Load vehicle from the database.
+
+        Args:
+            vehicle_id: Vehicle identifier
+            include_inventory: Whether to include inventory data
+
+        Returns:
+            Vehicle response
+
+        Raises:
+            VehicleNotFoundError: If vehicle not found
+        """
+        vehicle = await self.repository.get_by_id(
+            vehicle_id,
+            include_inventory=include_inventory,
+        )
+
+        if not vehicle:
+            if self.negative_cache:
+                await self.negative_cache.mark_missing(
+                    NegativeCache.VEHICLE_ID, vehicle_id
+                )
+            raise VehicleNotFoundError(vehicle_id)
+
+        return self._to_response(vehicle)
+
+    async def _load_vehicles(
+        self,
+        vehicle_ids: list[uuid.UUID],
+    ) -> list[VehicleResponse]:
+        """
+        Load several vehicles from the database in one query.
+
+        Args:
+            vehicle_ids: Vehicle identifiers
+
+        Returns:
+            Vehicle responses for the vehicles that exist
+        """
+        vehicles = await self.repository.get_many_by_ids(vehicle_ids)
+        return [self._to_response(vehicle) for vehicle in vehicles]
+
+    async def _load_search_results(
+        self,
+        search_request: VehicleSearchRequest,
+    ) -> VehicleListResponse:
+        """
+        Run vehicle search against the database.
+
+        Requests carrying a cursor continue after the cursor's row instead of
+        skipping by page number. Full pages sorted by a keyset-capable field
+        return a next_cursor.
+
+        Args:
+            search_request: Search parameters
+
+        Returns:
+            Paginated vehicle list response
+
+        Raises:
+            VehicleValidationError: If the cursor is invalid for the request
+        """
+        sort_by = search_request.sort_by or "year"
+        skip = (search_request.page - 1) * search_request.page_size
+
+        after = None
+        if search_request.cursor:
+            try:
+                after = decode_cursor(
+                    search_request.cursor, sort_by, search_request.sort_order
+                )
+            except InvalidCursorError as e:
+                raise VehicleValidationError(
+                    str(e),
+                    field="cursor",
+                ) from e
+
+        vehicles, total = await self.repository.search(
+            make=search_request.make,
+            model=search_request.model,
+            year=None,
+            min_year=search_request.year_min,
+            max_year=search_request.year_max,
+            body_style=search_request.body_style,
+            fuel_type=search_request.fuel_type,
+            min_price=search_request.price_min,
+            max_price=search_request.price_max,
+            specifications=search_request.custom_attributes,
+            spec_ranges=search_request.spec_ranges(),
+            query=search_request.search_query,
+            available_only=False,
+            skip=skip,
+            limit=search_request.page_size,
+            sort_by=sort_by,
+            sort_order=search_request.sort_order,
+            after=after,
+            count_mode=search_request.total_mode,
+        )
+
+        next_cursor = None
+        if len(vehicles) == search_request.page_size and supports_keyset(sort_by):
+            last = vehicles[-1]
+            next_cursor = encode_cursor(
+                sort_by,
+                search_request.sort_order,
+                getattr(last, sort_by),
+                last.id,
+            )
+
+        total_pages = (
+            (total + search_request.page_size - 1) // search_request.page_size
+            if total > 0
+            else 0
+        )
+
+        return VehicleListResponse(
+            items=[self._to_response(v) for v in vehicles],
+            total=total,
+            page=search_request.page,
+            page_size=search_request.page_size,
+            total_pages=total_pages,
+            total_is_estimate=(
+                search_request.total_mode == VehicleRepository.COUNT_ESTIMATED
+            ),
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    async def _refresh_in_new_session(
+        load: Callable[["VehicleService"], Awaitable[T]],
+    ) -> T:
+        """
+        Run a loader against a dedicated database session.
+
+        Background cache refreshes outlive the request that triggered them,
+        so they cannot use the request-scoped session.
+
+        Args:
+            load: Coroutine factory taking a service bound to the new session
+
+        Returns:
+            Loaded value
+        """
+        async with get_session() as session:
+            return await load(VehicleService(session))
+
+    async def _get_cached_model(
+        self,
+        cache_key: str,
+        model_cls: type[T],
+    ) -> Optional[T]:
+        """
+        Read and deserialize a cached response.
+
+        Args:
+            cache_key: Cache key
+            model_cls: Pydantic response model to validate into
+
+        Returns:
+            Cached response or None on miss
+        """
+        cached_data = await self.cache_client.get(cache_key)
+        if not cached_data:
+            return None
+        return model_cls.model_validate_json(cached_data)
+
+    async def _load_coalesced(
+        self,
+        cache_key: str,
+        read_cache: Callable[[], Awaitable[Optional[T]]],
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Load a missed cache key, coalescing concurrent misses when enabled.
+
+        Args:
+            cache_key: Cache key that missed
+            read_cache: Coroutine factory reading the cached value
+            loader: Coroutine factory loading and caching the value
+
+        Returns:
+            Loaded or cached value
+        """
+        if self.single_flight is None:
+            return await loader()
+        return await self.single_flight.load(cache_key, read_cache, loader)
+
     def _generate_search_cache_key(
         self,
         search_request: VehicleSearchRequest,
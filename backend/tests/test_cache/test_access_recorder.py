@@ -0,0 +1,204 @@
+"""
+Test suite for vehicle access recording.
+
+Tests cover in-memory buffering, pipelined bucket flushes, window
+aggregation, failure recovery and ranked sorted set reads.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import RedisError
+
+from src.cache.redis_client import RedisClient
+from src.services.cache.access_recorder import VehicleAccessRecorder
+
+
+NOW = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_pipeline():
+    """
+    Create a mock Redis pipeline usable as an async context manager.
+
+    Returns:
+        MagicMock: Mocked pipeline
+    """
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    return pipe
+
+
+@pytest.fixture
+def mock_redis_client(mock_pipeline):
+    """
+    Create a mock Redis client for testing.
+
+    Returns:
+        AsyncMock: Mocked Redis client with pipeline support
+    """
+    mock_client = AsyncMock(spec=RedisClient)
+    mock_client.pipeline = MagicMock(return_value=mock_pipeline)
+    return mock_client
+
+
+@pytest.fixture
+def recorder(mock_redis_client):
+    """
+    Create access recorder with mocked Redis.
+
+    Returns:
+        VehicleAccessRecorder: Recorder instance for testing
+    """
+    return VehicleAccessRecorder(redis_client=mock_redis_client)
+
+
+# ============================================================================
+# Unit Tests - Recording
+# ============================================================================
+
+
+class TestRecording:
+    """Test accesses are buffered without touching Redis."""
+
+    def test_record_buffers_increments(self, recorder, mock_redis_client):
+        """Test repeated views of a vehicle are summed in memory."""
+        vehicle_id = uuid4()
+
+        recorder.record(vehicle_id)
+        recorder.record(vehicle_id)
+
+        assert recorder._buffer[str(vehicle_id)] == 2
+        mock_redis_client.pipeline.assert_not_called()
+
+    def test_record_many_applies_weight(self, recorder):
+        """Test search impressions are recorded with their weight."""
+        ids = [uuid4(), uuid4()]
+
+        recorder.record_many(ids, weight=0.1)
+
+        assert recorder._buffer[str(ids[0])] == pytest.approx(0.1)
+        assert recorder.get_statistics()["buffered_keys"] == 2
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_flushes_early(self, mock_redis_client):
+        """Test reaching the buffer limit schedules a flush."""
+        recorder = VehicleAccessRecorder(
+            redis_client=mock_redis_client, max_buffered_keys=2
+        )
+
+        recorder.record(uuid4())
+        recorder.record(uuid4())
+        await recorder._early_flush_task
+
+        mock_redis_client.pipeline.assert_called_once()
+        assert recorder.get_statistics()["buffered_keys"] == 0
+
+
+# ============================================================================
+# Unit Tests - Flushing
+# ============================================================================
+
+
+class TestFlush:
+    """Test buffered counts are written to hourly buckets."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_hourly_bucket(self, recorder, mock_pipeline):
+        """Test each vehicle gets one ZINCRBY into the current bucket."""
+        vehicle_id = uuid4()
+        recorder.record(vehicle_id)
+        recorder.record(vehicle_id)
+
+        flushed = await recorder.flush(now=NOW)
+
+        bucket = "vehicle:access_counts:hour:2026030112"
+        assert flushed == 1
+        mock_pipeline.zincrby.assert_called_once_with(bucket, 2, str(vehicle_id))
+        mock_pipeline.expire.assert_called_once_with(bucket, 25 * 3600)
+
+    @pytest.mark.asyncio
+    async def test_flush_rebuilds_windows(self, recorder, mock_pipeline):
+        """Test the aggregated sets are rebuilt from recent buckets."""
+        recorder.record(uuid4())
+
+        await recorder.flush(now=NOW)
+
+        popular_call, trending_call = mock_pipeline.zunionstore.call_args_list
+        assert popular_call.args[0] == VehicleAccessRecorder.ACCESS_COUNTS_KEY
+        assert len(popular_call.args[1]) == 24
+        assert trending_call.args[0] == VehicleAccessRecorder.TRENDING_COUNTS_KEY
+        weights = trending_call.args[1]
+        assert weights[recorder.bucket_key(NOW)] == 1.0
+        assert weights[recorder.bucket_key(NOW - timedelta(hours=1))] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_windows_rebuilt_at_interval(self, recorder, mock_pipeline):
+        """Test aggregation is skipped until the interval has elapsed."""
+        recorder.record(uuid4())
+        await recorder.flush(now=NOW)
+        recorder.record(uuid4())
+        await recorder.flush(now=NOW + timedelta(seconds=10))
+
+        assert mock_pipeline.zunionstore.call_count == 2
+        assert recorder.get_statistics()["aggregations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_restores_buffer(
+        self, recorder, mock_redis_client, mock_pipeline
+    ):
+        """Test counts survive a failed flush and are retried."""
+        mock_pipeline.__aexit__.side_effect = RedisError("down")
+        vehicle_id = uuid4()
+        recorder.record(vehicle_id)
+
+        assert await recorder.flush(now=NOW) == 0
+
+        assert recorder._buffer[str(vehicle_id)] == 1
+        assert recorder.get_statistics()["failed_flushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining(self, recorder, mock_pipeline):
+        """Test stopping the recorder writes out buffered counts."""
+        await recorder.start()
+        recorder.record(uuid4())
+
+        await recorder.stop()
+
+        mock_pipeline.zincrby.assert_called_once()
+        assert recorder.get_statistics()["is_running"] is False
+
+
+# ============================================================================
+# Unit Tests - Sorted Set Reads
+# ============================================================================
+
+
+class TestSortedSetReads:
+    """Test the Redis client exposes ranked reads for cache warming."""
+
+    @pytest.mark.asyncio
+    async def test_zrevrange_returns_ranked_members(self):
+        """Test ZREVRANGE is forwarded with scores on the wrapped client."""
+        client = RedisClient(url="redis://localhost:6379/0")
+        client._client = MagicMock()
+        client._client.zrevrange = AsyncMock(return_value=[("a", 150.0)])
+        client._is_connected = True
+
+        result = await client.zrevrange(
+            VehicleAccessRecorder.ACCESS_COUNTS_KEY, 0, 9, withscores=True
+        )
+
+        assert result == [("a", 150.0)]
+        client._client.zrevrange.assert_awaited_once_with(
+            VehicleAccessRecorder.ACCESS_COUNTS_KEY, 0, 9, withscores=True
+        )
@@ -0,0 +1,242 @@
+"""
+Test suite for soft-TTL freshness handling in the vehicle cache.
+
+Tests cover envelope writes, probabilistic early expiration, plain getter
+behaviour for stale entries and stale-while-revalidate background refresh.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.cache.redis_client import RedisClient
+from src.services.cache.vehicle_cache import FreshnessPolicy, VehicleCache
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_redis_client():
+    """
+    Create a mock Redis client for testing.
+
+    Returns:
+        AsyncMock: Mocked Redis client
+    """
+    mock_client = AsyncMock(spec=RedisClient)
+    mock_client.get_json = AsyncMock(return_value=None)
+    mock_client.set_json = AsyncMock(return_value=True)
+    mock_client.acquire_lock = AsyncMock(return_value="token")
+    mock_client.release_lock = AsyncMock(return_value=True)
+    mock_client.get_cache_stats = Mock(return_value={})
+    return mock_client
+
+
+@pytest.fixture
+def swr_cache(mock_redis_client):
+    """
+    Create vehicle cache with a soft-TTL policy for search results.
+
+    Returns:
+        VehicleCache: Cache instance for testing
+    """
+    return VehicleCache(
+        redis_client=mock_redis_client,
+        freshness_policies={VehicleCache.SEARCH_FAMILY: FreshnessPolicy(600)},
+    )
+
+
+def make_envelope(value, stored_at, soft_ttl=100, compute_time=0.05):
+    """Build a soft-TTL envelope as stored in Redis."""
+    return {
+        VehicleCache.ENVELOPE_KEY: 1,
+        "value": value,
+        "stored_at": stored_at,
+        "soft_ttl": soft_ttl,
+        "compute_time": compute_time,
+    }
+
+
+# ============================================================================
+# Unit Tests - Envelope Writes
+# ============================================================================
+
+
+class TestEnvelopeWrites:
+    """Test soft-TTL families are written as envelopes."""
+
+    @pytest.mark.asyncio
+    async def test_policy_family_written_with_stale_window(
+        self, swr_cache, mock_redis_client
+    ):
+        """Test Redis expiry covers soft TTL plus the stale window."""
+        with patch("src.services.cache.vehicle_cache.time.time", return_value=1000.0):
+            await swr_cache.set_search_results(
+                "suv", {"hits": []}, ttl=100, compute_time=0.4
+            )
+
+        _, payload = mock_redis_client.set_json.call_args.args
+        assert mock_redis_client.set_json.call_args.kwargs["ex"] == 700
+        assert payload == make_envelope({"hits": []}, 1000.0, compute_time=0.4)
+
+    @pytest.mark.asyncio
+    async def test_family_without_policy_unchanged(
+        self, swr_cache, mock_redis_client
+    ):
+        """Test families without a policy keep plain values and hard TTLs."""
+        await swr_cache.set_inventory_data(
+            "00000000-0000-0000-0000-000000000001", {"count": 3}, ttl=30
+        )
+
+        _, payload = mock_redis_client.set_json.call_args.args
+        assert payload == {"count": 3}
+        assert mock_redis_client.set_json.call_args.kwargs["ex"] == 30
+
+
+# ============================================================================
+# Unit Tests - Early Expiration
+# ============================================================================
+
+
+class TestEarlyExpiration:
+    """Test XFetch-style early expiration decisions."""
+
+    def test_fresh_entry_not_refreshed(self, swr_cache):
+        """Test entries far from expiry are served as fresh."""
+        entry = make_envelope("v", stored_at=1000.0)
+
+        with patch("src.services.cache.vehicle_cache.time.time", return_value=1010.0):
+            value, needs_refresh = swr_cache._unwrap_entry("search", entry)
+
+        assert value == "v"
+        assert needs_refresh is False
+
+    def test_entry_past_soft_ttl_needs_refresh(self, swr_cache):
+        """Test entries past their soft TTL always need refresh."""
+        entry = make_envelope("v", stored_at=1000.0)
+
+        with patch("src.services.cache.vehicle_cache.time.time", return_value=1101.0):
+            _, needs_refresh = swr_cache._unwrap_entry("search", entry)
+
+        assert needs_refresh is True
+
+    def test_entry_near_expiry_refreshes_early(self, swr_cache):
+        """Test an unlucky draw near expiry triggers early refresh."""
+        entry = make_envelope("v", stored_at=1000.0, compute_time=2.0)
+
+        with patch(
+            "src.services.cache.vehicle_cache.time.time", return_value=1099.0
+        ), patch(
+            "src.services.cache.vehicle_cache.random.random", return_value=0.9
+        ):
+            _, needs_refresh = swr_cache._unwrap_entry("search", entry)
+
+        assert needs_refresh is True
+        assert swr_cache._freshness_stats["early_expirations"] == 1
+
+    def test_plain_values_never_stale(self, swr_cache):
+        """Test values written before soft TTLs were enabled stay valid."""
+        assert swr_cache._unwrap_entry("search", {"hits": []}) == (
+            {"hits": []},
+            False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_plain_getter_treats_stale_as_miss(
+        self, swr_cache, mock_redis_client
+    ):
+        """Test getters without a loader make the caller recompute."""
+        mock_redis_client.get_json.return_value = make_envelope({"hits": []}, 0.0)
+
+        assert await swr_cache.get_search_results("suv") is None
+        assert swr_cache._cache_stats["misses"] == 1
+
+
+# ============================================================================
+# Unit Tests - Stale-While-Revalidate
+# ============================================================================
+
+
+class TestStaleWhileRevalidate:
+    """Test stale entries are served while refreshing in the background."""
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_and_refreshed(
+        self, swr_cache, mock_redis_client
+    ):
+        """Test stale values return immediately and refresh once."""
+        mock_redis_client.get_json.return_value = make_envelope({"hits": ["old"]}, 0.0)
+        loader = AsyncMock(return_value={"hits": ["inline"]})
+        refresh_loader = AsyncMock(return_value={"hits": ["new"]})
+
+        results = await asyncio.gather(
+            *(
+                swr_cache.get_or_load_search_results(
+                    "suv", None, loader, refresh_loader=refresh_loader
+                )
+                for _ in range(3)
+            )
+        )
+        await asyncio.gather(*swr_cache._refresh_tasks.values())
+
+        assert results == [{"hits": ["old"]}] * 3
+        loader.assert_not_awaited()
+        refresh_loader.assert_awaited_once()
+        assert mock_redis_client.set_json.call_args.args[1]["value"] == {
+            "hits": ["new"]
+        }
+        assert swr_cache._freshness_stats["stale_hits"] == 3
+
+    @pytest.mark.asyncio
+    async def test_refresh_skipped_when_other_pod_holds_lock(
+        self, swr_cache, mock_redis_client
+    ):
+        """Test only the refresh lock holder reloads a stale entry."""
+        mock_redis_client.get_json.return_value = make_envelope({"hits": []}, 0.0)
+        mock_redis_client.acquire_lock.return_value = None
+        refresh_loader = AsyncMock(return_value={"hits": []})
+
+        await swr_cache.get_or_load_search_results(
+            "suv", None, AsyncMock(), refresh_loader=refresh_loader
+        )
+        await asyncio.gather(*swr_cache._refresh_tasks.values())
+
+        refresh_loader.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_without_refresh_loader_reloads_inline(
+        self, swr_cache, mock_redis_client
+    ):
+        """Test stale entries are reloaded in line without a refresh loader."""
+        mock_redis_client.get_json.return_value = make_envelope({"hits": []}, 0.0)
+        loader = AsyncMock(return_value={"hits": ["new"]})
+
+        result = await swr_cache.get_or_load_search_results("suv", None, loader)
+
+        assert result == {"hits": ["new"]}
+        loader.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_is_contained(self, swr_cache, mock_redis_client):
+        """Test background refresh errors are logged, not raised."""
+        mock_redis_client.get_json.return_value = make_envelope({"hits": []}, 0.0)
+        refresh_loader = AsyncMock(side_effect=RuntimeError("db down"))
+
+        await swr_cache.get_or_load_search_results(
+            "suv", None, AsyncMock(), refresh_loader=refresh_loader
+        )
+        await asyncio.gather(*swr_cache._refresh_tasks.values())
+
+        assert swr_cache._freshness_stats["refresh_failures"] == 1
+        mock_redis_client.release_lock.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_statistics_include_freshness(self, swr_cache):
+        """Test statistics report freshness counters when enabled."""
+        stats = await swr_cache.get_cache_statistics()
+
+        assert stats["freshness"]["background_refreshes"] == 0
@@ -19,6 +19,8 @@ Test Categories:
 import asyncio
 import time
 import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime
 from decimal import Decimal
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -38,6 +40,7 @@ from src.schemas.vehicles import (
     VehicleSpecifications,
     VehicleUpdate,
 )
+from src.services.cache.cache_warming import CacheWarmingService
 from src.services.cache.vehicle_cache import VehicleCache
 from src.services.vehicles.service import (
     VehicleNotFoundError,
@@ -1045,7 +1048,9 @@ async def test_warm_popular_vehicles_cache(
                 updated_at=sample_vehicle_response.updated_at,
             )
 
-        mock_repo.get_by_id = AsyncMock(side_effect=get_vehicle_by_id)
+        mock_repo.get_many_by_ids = AsyncMock(
+            side_effect=lambda ids, **kwargs: [get_vehicle_by_id(vid) for vid in ids]
+        )
         mock_repo_class.return_value = mock_repo
 
         service = VehicleService(
@@ -1060,9 +1065,86 @@ async def test_warm_popular_vehicles_cache(
         count = await service.warm_popular_vehicles(vehicle_ids)
 
         assert count == len(vehicle_ids)
+        mock_repo.get_many_by_ids.assert_awaited_once_with(vehicle_ids)
         mock_vehicle_cache.warm_cache_for_vehicles.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_warming_service_loads_vehicle_responses(
+    mock_db_session: AsyncMock,
+) -> None:
+    """
+    Test the warming service converts loaded rows into vehicle responses.
+
+    Validates:
+    - Vehicles are loaded with one bulk query
+    - Every loaded row becomes a populated response
+    """
+    vehicle_ids = [uuid.uuid4() for _ in range(3)]
+    specifications = {
+        "engine_type": "2.5L 4-Cylinder",
+        "horsepower": 203,
+        "torque": 184,
+        "transmission": "8-Speed Automatic",
+        "drivetrain": "FWD",
+        "fuel_type": "Gasoline",
+        "mpg_city": 28,
+        "mpg_highway": 39,
+    }
+    rows = [
+        MagicMock(
+            id=vehicle_id,
+            make="Toyota",
+            model="Camry",
+            year=2024,
+            trim="XLE",
+            body_style="Sedan",
+            exterior_color="Silver",
+            interior_color="Black",
+            base_price=Decimal("32500.00"),
+            specifications=specifications,
+            dimensions={
+                "length": 192.7,
+                "width": 72.4,
+                "height": 56.9,
+                "wheelbase": 111.2,
+                "curb_weight": 3310,
+                "seating_capacity": 5,
+            },
+            features={"safety_features": ["Blind Spot Monitor"]},
+            custom_attributes={},
+            is_active=True,
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 2),
+        )
+        for vehicle_id in vehicle_ids
+    ]
+
+    @asynccontextmanager
+    async def get_session():
+        yield mock_db_session
+
+    with patch(
+        "src.services.cache.cache_warming.get_session", get_session
+    ), patch(
+        "src.services.cache.cache_warming.VehicleRepository"
+    ) as mock_repo_class:
+        mock_repo = AsyncMock()
+        mock_repo.get_many_by_ids = AsyncMock(return_value=rows)
+        mock_repo_class.return_value = mock_repo
+
+        service = CacheWarmingService(vehicle_cache=AsyncMock(spec=VehicleCache))
+        vehicle_data = await service._load_vehicle_data(vehicle_ids)
+
+    mock_repo.get_many_by_ids.assert_awaited_once_with(vehicle_ids)
+    assert list(vehicle_data) == vehicle_ids
+    for vehicle_id, response in vehicle_data.items():
+        assert response.id == vehicle_id
+        assert response.make == "Toyota"
+        assert response.specifications.engine_type == "2.5L 4-Cylinder"
+        assert response.dimensions.seating_capacity == 5
+
+
 # ============================================================================
 # API Integration Tests
 # ============================================================================
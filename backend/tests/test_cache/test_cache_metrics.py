@@ -0,0 +1,151 @@
+"""
+Test suite for cache Prometheus metrics.
+
+Tests cover key family derivation, lookup and latency recording from the
+Redis client, stale entry accounting and the metrics endpoint.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from src.cache import metrics
+from src.cache.redis_client import RedisClient
+
+
+def lookup_count(family: str, result: str, tier: str = "redis") -> float:
+    """Read the current value of a lookup counter."""
+    return (
+        REGISTRY.get_sample_value(
+            "cache_lookups_total",
+            {"family": family, "tier": tier, "result": result},
+        )
+        or 0.0
+    )
+
+
+def operation_count(operation: str, family: str) -> float:
+    """Read the number of observed operations of a family."""
+    return (
+        REGISTRY.get_sample_value(
+            "cache_operation_duration_seconds_count",
+            {"operation": operation, "family": family},
+        )
+        or 0.0
+    )
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def redis_client():
+    """
+    Create a connected Redis client backed by mocks.
+
+    Returns:
+        RedisClient: Client whose connection is mocked
+    """
+    client = RedisClient(url="redis://localhost:6379/0")
+    client._client = MagicMock()
+    client._client.execute_command = AsyncMock(return_value=b"payload")
+    client._is_connected = True
+    return client
+
+
+# ============================================================================
+# Unit Tests - Key Families
+# ============================================================================
+
+
+class TestKeyFamily:
+    """Test cache keys map to bounded family labels."""
+
+    @pytest.mark.parametrize(
+        "key,family",
+        [
+            ("autoselect:vehicles:detail:6f1c", "vehicles:detail"),
+            ("autoselect:vehicles:list:page=1", "vehicles:list"),
+            ("pricing:9a8b7c", "pricing"),
+            ("negative:vin:1HGBH41JXMN109186", "negative:vin"),
+            ("lock:bloom:vin", "lock:bloom"),
+            ("recommendations", "recommendations"),
+            ("0b5e7d91", "other"),
+        ],
+    )
+    def test_key_family(self, key, family):
+        """Test namespaces are stripped and identifiers never become labels."""
+        assert metrics.key_family(key) == family
+
+
+# ============================================================================
+# Unit Tests - Recording
+# ============================================================================
+
+
+class TestRecording:
+    """Test the Redis client and cache layers record metrics."""
+
+    @pytest.mark.asyncio
+    async def test_get_raw_records_hit_and_latency(self, redis_client):
+        """Test a found key counts as a hit and its latency is observed."""
+        hits = lookup_count("vehicles:detail", "hit")
+        ops = operation_count("get", "vehicles:detail")
+
+        await redis_client.get_raw("autoselect:vehicles:detail:1")
+
+        assert lookup_count("vehicles:detail", "hit") == hits + 1
+        assert operation_count("get", "vehicles:detail") == ops + 1
+
+    @pytest.mark.asyncio
+    async def test_get_raw_records_miss(self, redis_client):
+        """Test a missing key counts as a miss."""
+        redis_client._client.execute_command.return_value = None
+        misses = lookup_count("vehicles:detail", "miss")
+
+        await redis_client.get_raw("autoselect:vehicles:detail:2")
+
+        assert lookup_count("vehicles:detail", "miss") == misses + 1
+
+    def test_track_operation_observes_failures(self):
+        """Test failed operations are still timed."""
+        ops = operation_count("set", "pricing")
+
+        with pytest.raises(ConnectionError):
+            with metrics.track_operation("set", "pricing:abc"):
+                raise ConnectionError("down")
+
+        assert operation_count("set", "pricing") == ops + 1
+
+    def test_record_family_lookup(self):
+        """Test stale serves are counted under their family."""
+        stale = lookup_count("vehicles:list", "stale")
+
+        metrics.record_family_lookup("vehicles:list", "stale")
+
+        assert lookup_count("vehicles:list", "stale") == stale + 1
+
+
+# ============================================================================
+# Integration Tests - Endpoint
+# ============================================================================
+
+
+class TestMetricsEndpoint:
+    """Test the Prometheus scrape endpoint."""
+
+    def test_metrics_endpoint_exposes_cache_metrics(self):
+        """Test the endpoint returns the text exposition format."""
+        from src.main import app
+
+        metrics.record_lookup("pricing:abc", "hit")
+
+        response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "cache_lookups_total" in response.text
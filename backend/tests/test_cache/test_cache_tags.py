@@ -0,0 +1,216 @@
+"""
+Test suite for tag-based cache invalidation in the Redis client.
+
+Tests cover tag registration on writes, tag set expiry, batched UNLINK
+invalidation, bulk writes and error propagation.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import RedisError
+
+from src.cache.redis_client import RedisClient
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_pipeline():
+    """
+    Create a mock Redis pipeline usable as an async context manager.
+
+    Returns:
+        MagicMock: Mocked pipeline
+    """
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    pipe.execute = AsyncMock(return_value=[True])
+    pipe.reset = AsyncMock()
+    return pipe
+
+
+@pytest.fixture
+def redis_client(mock_pipeline):
+    """
+    Create a connected Redis client backed by mocks.
+
+    Returns:
+        RedisClient: Client with mocked connection
+    """
+    client = RedisClient(url="redis://localhost:6379/0")
+    client._client = MagicMock()
+    client._client.pipeline = MagicMock(return_value=mock_pipeline)
+    client._client.set = AsyncMock(return_value=True)
+    client._client.unlink = AsyncMock(side_effect=lambda *keys: len(keys))
+    client._is_connected = True
+    return client
+
+
+# ============================================================================
+# Unit Tests - Tag Registration
+# ============================================================================
+
+
+class TestTagRegistration:
+    """Test keys are registered in tag sets on write."""
+
+    @pytest.mark.asyncio
+    async def test_set_without_tags_skips_pipeline(self, redis_client):
+        """Test untagged writes issue a plain SET."""
+        await redis_client.set("k", "v", ex=60)
+
+        redis_client._client.set.assert_awaited_once()
+        redis_client._client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_with_tags_registers_key(self, redis_client, mock_pipeline):
+        """Test tagged writes add the key to each tag set atomically."""
+        result = await redis_client.set("k", "v", ex=60, tags=["a", "b"])
+
+        assert result is True
+        redis_client._client.pipeline.assert_called_once_with(transaction=True)
+        mock_pipeline.set.assert_called_once_with(
+            "k", "v", ex=60, px=None, nx=False, xx=False
+        )
+        mock_pipeline.sadd.assert_any_call("tag:a", "k")
+        mock_pipeline.sadd.assert_any_call("tag:b", "k")
+
+    @pytest.mark.asyncio
+    async def test_tag_set_expiry_only_extends(self, redis_client, mock_pipeline):
+        """Test tag sets get a TTL that is set once and only ever extended."""
+        await redis_client.set("k", "v", ex=60, tags=["a"])
+
+        mock_pipeline.pexpire.assert_any_call("tag:a", 60000, nx=True)
+        mock_pipeline.pexpire.assert_any_call("tag:a", 60000, gt=True)
+
+    @pytest.mark.asyncio
+    async def test_tag_set_persists_for_keys_without_ttl(
+        self, redis_client, mock_pipeline
+    ):
+        """Test tag sets do not expire while they track non-expiring keys."""
+        await redis_client.set("k", "v", tags=["a"])
+
+        mock_pipeline.persist.assert_called_once_with("tag:a")
+        mock_pipeline.pexpire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_json_forwards_tags(self, redis_client, mock_pipeline):
+        """Test JSON writes register tags as well."""
+        await redis_client.set_json("k", {"a": 1}, ex=10, tags=["a"])
+
+        mock_pipeline.sadd.assert_called_once_with("tag:a", "k")
+
+    @pytest.mark.asyncio
+    async def test_tag_keys_registers_each_key(self, redis_client, mock_pipeline):
+        """Test bulk registration queues every key in one pipeline."""
+        await redis_client.tag_keys({"k1": ["a"], "k2": ["a", "b"]}, ex=30)
+
+        assert mock_pipeline.sadd.call_count == 3
+        mock_pipeline.execute.assert_awaited_once()
+
+
+# ============================================================================
+# Unit Tests - Tag Invalidation
+# ============================================================================
+
+
+class TestTagInvalidation:
+    """Test tagged keys are removed without scanning the keyspace."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_unlinks_members(
+        self, redis_client, mock_pipeline
+    ):
+        """Test members of all tags are unlinked and tag sets removed."""
+        mock_pipeline.execute.return_value = [{"k1", "k2"}, {"k2", "k3"}, 2]
+
+        count = await redis_client.invalidate_tags("a", "b")
+
+        assert count == 3
+        mock_pipeline.unlink.assert_called_once_with("tag:a", "tag:b")
+        unlinked = redis_client._client.unlink.await_args.args
+        assert set(unlinked) == {"k1", "k2", "k3"}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_batches_unlink(self, redis_client, mock_pipeline):
+        """Test large tag sets are unlinked in bounded batches."""
+        mock_pipeline.execute.return_value = [{f"k{i}" for i in range(5)}, 1]
+
+        count = await redis_client.invalidate_tags("a", batch_size=2)
+
+        assert count == 5
+        assert redis_client._client.unlink.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidate_empty_tag(self, redis_client, mock_pipeline):
+        """Test invalidating an unknown tag deletes nothing."""
+        mock_pipeline.execute.return_value = [set(), 0]
+
+        assert await redis_client.invalidate_tags("missing") == 0
+        redis_client._client.unlink.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_without_tags(self, redis_client):
+        """Test calling without tags is a no-op."""
+        assert await redis_client.invalidate_tags() == 0
+        redis_client._client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_propagates_errors(
+        self, redis_client, mock_pipeline
+    ):
+        """Test Redis errors are raised to the caller."""
+        mock_pipeline.execute.side_effect = RedisError("boom")
+
+        with pytest.raises(RedisError):
+            await redis_client.invalidate_tags("a")
+
+
+# ============================================================================
+# Unit Tests - Bulk Writes
+# ============================================================================
+
+
+class TestBulkWrites:
+    """Test multi-key writes with per-key TTLs and tags."""
+
+    @pytest.mark.asyncio
+    async def test_set_many_without_expiry_uses_mset(self, redis_client):
+        """Test plain bulk writes issue a single MSET."""
+        redis_client._client.mset = AsyncMock(return_value=True)
+
+        await redis_client.set_many({"k1": "a", "k2": "b"})
+
+        redis_client._client.mset.assert_awaited_once_with({"k1": "a", "k2": "b"})
+        redis_client._client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_many_per_key_ttls(self, redis_client, mock_pipeline):
+        """Test per-key TTLs override the shared expiry in one pipeline."""
+        await redis_client.set_many({"k1": "a", "k2": "b"}, ex=60, ttls={"k2": 90})
+
+        mock_pipeline.set.assert_any_call("k1", "a", ex=60)
+        mock_pipeline.set.assert_any_call("k2", "b", ex=90)
+        mock_pipeline.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_set_many_registers_tags(self, redis_client, mock_pipeline):
+        """Test tags are registered in the same pipeline as the writes."""
+        await redis_client.set_many(
+            {"k1": "a", "k2": "b"}, ttls={"k1": 30, "k2": 40}, tags={"k1": ["t"]}
+        )
+
+        mock_pipeline.sadd.assert_called_once_with("tag:t", "k1")
+        mock_pipeline.pexpire.assert_any_call("tag:t", 30000, gt=True)
+        redis_client._client.pipeline.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_set_many_empty_mapping(self, redis_client):
+        """Test an empty mapping is a no-op."""
+        assert await redis_client.set_many({}) is True
+        redis_client._client.pipeline.assert_not_called()
@@ -0,0 +1,169 @@
+"""
+Test suite for cached payload codecs.
+
+Tests cover legacy JSON compatibility, framed binary payloads, compression
+thresholds, cross-configuration decoding and Redis client integration.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.client import NEVER_DECODE
+
+from src.cache.codec import CacheCodec, CodecError
+from src.cache.redis_client import RedisClient
+
+
+PAYLOAD = {
+    "items": [{"id": str(i), "make": "Toyota", "price": 28500.5} for i in range(50)],
+    "total": 50,
+    "page": 1,
+}
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def redis_client():
+    """
+    Create a connected Redis client backed by mocks.
+
+    Returns:
+        RedisClient: Client with mocked connection
+    """
+    client = RedisClient(url="redis://localhost:6379/0", codec=CacheCodec("orjson"))
+    client._client = MagicMock()
+    client._client.set = AsyncMock(return_value=True)
+    client._client.execute_command = AsyncMock(return_value=None)
+    client._is_connected = True
+    return client
+
+
+# ============================================================================
+# Unit Tests - JSON Compatibility
+# ============================================================================
+
+
+class TestJsonCompatibility:
+    """Test uncompressed JSON stays readable by every deployment."""
+
+    def test_json_codec_writes_plain_json(self):
+        """Test the stdlib codec writes the legacy format."""
+        assert CacheCodec().encode({"a": 1}) == json.dumps({"a": 1}).encode()
+
+    def test_orjson_output_is_plain_json(self):
+        """Test orjson payloads are unframed and parse as JSON."""
+        encoded = CacheCodec("orjson").encode(PAYLOAD)
+
+        assert json.loads(encoded) == PAYLOAD
+
+    def test_decodes_legacy_text(self):
+        """Test values written before codecs existed still decode."""
+        assert CacheCodec("orjson").decode('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_orjson_accepts_non_string_keys(self):
+        """Test orjson matches stdlib handling of integer keys."""
+        assert CacheCodec("orjson").decode(CacheCodec("orjson").encode({1: "a"})) == {
+            "1": "a"
+        }
+
+    def test_unserializable_value_raises_codec_error(self):
+        """Test serialization failures surface as CodecError."""
+        with pytest.raises(CodecError):
+            CacheCodec("orjson").encode({"a": object()})
+
+
+# ============================================================================
+# Unit Tests - Framed Payloads
+# ============================================================================
+
+
+class TestFramedPayloads:
+    """Test binary serializers and compression use the version header."""
+
+    def test_unknown_version_rejected(self):
+        """Test payloads from a future format version are refused."""
+        with pytest.raises(CodecError, match="version"):
+            CacheCodec().decode(b"\x02\x00{}")
+
+    def test_corrupt_payload_raises_codec_error(self):
+        """Test truncated framed payloads raise CodecError."""
+        with pytest.raises(CodecError):
+            CacheCodec().decode(b"\x01\x10garbage")
+
+    def test_unknown_backend_rejected(self):
+        """Test unknown serializer names are rejected."""
+        with pytest.raises(ValueError):
+            CacheCodec("pickle")
+
+    def test_msgpack_round_trip(self):
+        """Test msgpack payloads are framed and decodable by JSON codecs."""
+        pytest.importorskip("msgpack")
+        encoded = CacheCodec("msgpack").encode(PAYLOAD)
+
+        assert encoded[0] == CacheCodec.FORMAT_VERSION
+        assert CacheCodec("orjson").decode(encoded) == PAYLOAD
+
+    @pytest.mark.parametrize("compression", ["zstd", "lz4"])
+    def test_compression_above_threshold(self, compression):
+        """Test large payloads are compressed and small ones are not."""
+        pytest.importorskip("zstandard" if compression == "zstd" else "lz4")
+        codec = CacheCodec("orjson", compression, compression_threshold=256)
+
+        large = codec.encode(PAYLOAD)
+        small = codec.encode({"a": 1})
+
+        assert large[0] == CacheCodec.FORMAT_VERSION
+        assert len(large) < len(CacheCodec("orjson").encode(PAYLOAD))
+        assert small == b'{"a":1}'
+        assert CacheCodec().decode(large) == PAYLOAD
+
+    def test_missing_backend_falls_back_to_json(self, monkeypatch):
+        """Test settings naming an unavailable backend degrade to JSON."""
+        monkeypatch.setattr("src.cache.codec.zstandard", None)
+        settings = MagicMock(
+            cache_serializer="orjson",
+            cache_compression="zstd",
+            cache_compression_threshold_bytes=0,
+            cache_compression_level=3,
+        )
+
+        codec = CacheCodec.from_settings(settings)
+
+        assert (codec.serializer, codec.compression) == ("json", "none")
+
+
+# ============================================================================
+# Integration Tests - Redis Client
+# ============================================================================
+
+
+class TestRedisClientCodec:
+    """Test the Redis client reads and writes through its codec."""
+
+    @pytest.mark.asyncio
+    async def test_set_json_writes_encoded_bytes(self, redis_client):
+        """Test JSON writes store the codec output."""
+        await redis_client.set_json("k", {"a": 1}, ex=10)
+
+        assert redis_client._client.set.await_args.args == ("k", b'{"a":1}')
+
+    @pytest.mark.asyncio
+    async def test_get_json_reads_raw_bytes(self, redis_client):
+        """Test JSON reads bypass response decoding."""
+        redis_client._client.execute_command.return_value = b'{"a":1}'
+
+        assert await redis_client.get_json("k") == {"a": 1}
+        call = redis_client._client.execute_command.await_args
+        assert call.args == ("GET", "k")
+        assert NEVER_DECODE in call.kwargs
+
+    @pytest.mark.asyncio
+    async def test_get_json_miss(self, redis_client):
+        """Test a missing key returns None and counts a miss."""
+        assert await redis_client.get_json("k") is None
+        assert redis_client.get_cache_stats()["cache_misses"] == 1
@@ -0,0 +1,292 @@
+"""
+Test suite for the in-process L1 cache and two-tier cache wrapper.
+
+Tests cover LRU eviction, byte budgets, TTL expiry, tag invalidation,
+L1/L2 read-through behaviour and pub/sub invalidation handling.
+"""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.cache.codec import CacheCodec
+from src.cache.local_cache import LocalCache, TieredCache, vehicle_tag
+from src.cache.redis_client import RedisClient
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def local_cache():
+    """
+    Create a small local cache for testing.
+
+    Returns:
+        LocalCache: Cache with tight limits
+    """
+    return LocalCache(max_bytes=100, max_entries=3, default_ttl=60)
+
+
+@pytest.fixture
+def mock_redis_client():
+    """
+    Create a mock Redis client for testing.
+
+    Returns:
+        AsyncMock: Mocked Redis client
+    """
+    mock_client = AsyncMock(spec=RedisClient)
+    mock_client.codec = CacheCodec()
+    mock_client.get_raw = AsyncMock(return_value=None)
+    mock_client.set = AsyncMock(return_value=True)
+    mock_client.delete = AsyncMock(return_value=1)
+    mock_client.invalidate_tags = AsyncMock(return_value=0)
+    mock_client.publish = AsyncMock(return_value=1)
+    mock_client.get_cache_stats = Mock(
+        return_value={"cache_hits": 0, "cache_misses": 0}
+    )
+    return mock_client
+
+
+@pytest.fixture
+def tiered_cache(mock_redis_client, local_cache):
+    """
+    Create tiered cache with mocked Redis.
+
+    Returns:
+        TieredCache: Cache instance for testing
+    """
+    return TieredCache(mock_redis_client, local_cache, channel="test:invalidate")
+
+
+# ============================================================================
+# Unit Tests - LocalCache
+# ============================================================================
+
+
+class TestLocalCache:
+    """Test bounded LRU behaviour of the local cache."""
+
+    def test_get_returns_stored_value(self, local_cache):
+        """Test stored values are returned and counted as hits."""
+        local_cache.set("a", {"x": 1}, size=10)
+
+        assert local_cache.get("a") == {"x": 1}
+        assert local_cache.get_stats()["cache_hits"] == 1
+
+    def test_get_missing_counts_miss(self, local_cache):
+        """Test missing keys are counted as misses."""
+        assert local_cache.get("missing") is None
+        assert local_cache.get_stats()["cache_misses"] == 1
+
+    def test_entry_limit_evicts_least_recently_used(self, local_cache):
+        """Test the least recently used entry is evicted first."""
+        local_cache.set("a", 1, size=1)
+        local_cache.set("b", 2, size=1)
+        local_cache.set("c", 3, size=1)
+        local_cache.get("a")
+        local_cache.set("d", 4, size=1)
+
+        assert local_cache.get("b") is None
+        assert local_cache.get("a") == 1
+        assert local_cache.get_stats()["evictions"] == 1
+
+    def test_byte_budget_evicts_entries(self, local_cache):
+        """Test entries are evicted once the byte budget is exceeded."""
+        local_cache.set("a", 1, size=60)
+        local_cache.set("b", 2, size=60)
+
+        assert local_cache.get("a") is None
+        assert local_cache.get("b") == 2
+        assert local_cache.current_bytes == 60
+
+    def test_oversized_value_is_rejected(self, local_cache):
+        """Test values larger than the budget are not stored."""
+        assert local_cache.set("big", 1, size=101) is False
+        assert len(local_cache) == 0
+
+    def test_expired_entry_is_dropped(self, local_cache):
+        """Test entries past their TTL are treated as misses."""
+        with patch("src.cache.local_cache.time.monotonic", return_value=1000.0):
+            local_cache.set("a", 1, size=1, ttl=5)
+
+        with patch("src.cache.local_cache.time.monotonic", return_value=1006.0):
+            assert local_cache.get("a") is None
+
+        assert local_cache.get_stats()["expirations"] == 1
+        assert local_cache.current_bytes == 0
+
+    def test_ttl_is_capped_at_default(self, local_cache):
+        """Test per-entry TTL never exceeds the L1 default TTL."""
+        with patch("src.cache.local_cache.time.monotonic", return_value=0.0):
+            local_cache.set("a", 1, size=1, ttl=86400)
+
+        with patch("src.cache.local_cache.time.monotonic", return_value=61.0):
+            assert local_cache.get("a") is None
+
+    def test_invalidate_tags_removes_tagged_entries(self, local_cache):
+        """Test tag invalidation removes every entry with that tag."""
+        local_cache.set("detail", 1, size=1, tags=["vehicle:1"])
+        local_cache.set("options", 2, size=1, tags=["vehicle:1"])
+        local_cache.set("other", 3, size=1, tags=["vehicle:2"])
+
+        removed = local_cache.invalidate_tags("vehicle:1")
+
+        assert removed == 2
+        assert local_cache.get("other") == 3
+        assert local_cache.get("detail") is None
+
+    def test_overwrite_updates_size(self, local_cache):
+        """Test overwriting a key replaces its accounted size."""
+        local_cache.set("a", 1, size=40)
+        local_cache.set("a", 2, size=10)
+
+        assert local_cache.current_bytes == 10
+        assert local_cache.get("a") == 2
+
+
+# ============================================================================
+# Unit Tests - TieredCache
+# ============================================================================
+
+
+class TestTieredCache:
+    """Test L1/L2 read-through and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_get_json_promotes_redis_value(
+        self, tiered_cache, mock_redis_client
+    ):
+        """Test L2 hits are promoted so the next read skips Redis."""
+        mock_redis_client.get_raw.return_value = json.dumps({"id": "1"}).encode()
+
+        first = await tiered_cache.get_json("k", tags=["vehicle:1"])
+        second = await tiered_cache.get_json("k")
+
+        assert first == second == {"id": "1"}
+        mock_redis_client.get_raw.assert_awaited_once_with("k")
+
+    @pytest.mark.asyncio
+    async def test_get_json_miss_in_both_tiers(
+        self, tiered_cache, mock_redis_client
+    ):
+        """Test a miss in both tiers returns None."""
+        assert await tiered_cache.get_json("k") is None
+        assert len(tiered_cache.local) == 0
+
+    @pytest.mark.asyncio
+    async def test_set_json_writes_both_tiers(
+        self, tiered_cache, mock_redis_client
+    ):
+        """Test writes go to Redis and L1."""
+        await tiered_cache.set_json("k", {"a": 1}, ex=30)
+
+        mock_redis_client.set.assert_awaited_once_with(
+            "k", b'{"a": 1}', ex=30, tags=None
+        )
+        assert tiered_cache.local.get("k") == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_set_json_registers_remote_tags(
+        self, tiered_cache, mock_redis_client
+    ):
+        """Test tags are registered in Redis as well as L1."""
+        await tiered_cache.set_json("k", {"a": 1}, ex=30, tags=["vehicle:1"])
+
+        assert mock_redis_client.set.await_args.kwargs["tags"] == ["vehicle:1"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_in_redis(self, tiered_cache, mock_redis_client):
+        """Test tag invalidation also removes tagged keys from Redis."""
+        mock_redis_client.invalidate_tags = AsyncMock(return_value=3)
+
+        deleted = await tiered_cache.invalidate(tags=["vehicle:1"])
+
+        assert deleted == 3
+        mock_redis_client.invalidate_tags.assert_awaited_once_with("vehicle:1")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_deletes_and_broadcasts(
+        self, tiered_cache, mock_redis_client
+    ):
+        """Test invalidation evicts L1, deletes L2 and publishes."""
+        tiered_cache.local.set("k", 1, size=1, tags=[vehicle_tag("1")])
+
+        await tiered_cache.invalidate(keys=["k"], tags=[vehicle_tag("1")])
+
+        assert tiered_cache.local.get("k") is None
+        mock_redis_client.delete.assert_awaited_once_with("k")
+        channel, message = mock_redis_client.publish.await_args.args
+        assert channel == "test:invalidate"
+        assert json.loads(message)["tags"] == ["vehicle:1"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_survives_publish_failure(
+        self, tiered_cache, mock_redis_client
+    ):
+        """Test publish errors do not fail the invalidation."""
+        mock_redis_client.publish.side_effect = ConnectionError("down")
+
+        deleted = await tiered_cache.invalidate(keys=["k"])
+
+        assert deleted == 1
+
+    def test_remote_message_evicts_local_entries(self, tiered_cache):
+        """Test broadcasts from other replicas evict L1 entries."""
+        tiered_cache.local.set("k", 1, size=1, tags=["vehicle:1"])
+        message = json.dumps({"origin": "other", "keys": [], "tags": ["vehicle:1"]})
+
+        assert tiered_cache.handle_invalidation_message(message) == 1
+        assert tiered_cache.local.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_clear_local_is_broadcast(self, tiered_cache, mock_redis_client):
+        """Test a full flush empties L1 here and tells other replicas to."""
+        tiered_cache.local.set("k", 1, size=1)
+
+        await tiered_cache.invalidate(tags=["vehicle_details"], clear_local=True)
+
+        assert len(tiered_cache.local) == 0
+        mock_redis_client.invalidate_tags.assert_awaited_once_with("vehicle_details")
+        _, message = mock_redis_client.publish.await_args.args
+        assert json.loads(message)["clear"] is True
+
+    def test_remote_clear_message_empties_local_cache(self, tiered_cache):
+        """Test a full flush from another replica drops untagged entries too."""
+        tiered_cache.local.set("a", 1, size=1)
+        tiered_cache.local.set("b", 2, size=1, tags=["vehicle:1"])
+        message = json.dumps(
+            {"origin": "other", "keys": [], "tags": [], "clear": True}
+        )
+
+        assert tiered_cache.handle_invalidation_message(message) == 2
+        assert len(tiered_cache.local) == 0
+
+    def test_own_message_is_ignored(self, tiered_cache):
+        """Test broadcasts from this instance are not re-applied."""
+        tiered_cache.local.set("k", 1, size=1)
+        message = json.dumps(
+            {"origin": tiered_cache._instance_id, "keys": ["k"], "tags": []}
+        )
+
+        assert tiered_cache.handle_invalidation_message(message) == 0
+
+    def test_malformed_message_is_ignored(self, tiered_cache):
+        """Test malformed payloads are ignored."""
+        assert tiered_cache.handle_invalidation_message("not json") == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_report_tiers_separately(
+        self, tiered_cache, mock_redis_client
+    ):
+        """Test statistics report L1 and L2 separately."""
+        await tiered_cache.get_json("k")
+
+        stats = tiered_cache.get_cache_stats()
+
+        assert stats["l1"]["cache_misses"] == 1
+        assert stats["l2"] == {"cache_hits": 0, "cache_misses": 0}
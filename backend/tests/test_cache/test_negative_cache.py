@@ -0,0 +1,307 @@
+"""
+Test suite for negative lookup caching.
+
+Tests cover Bloom filter sizing and readiness, rebuilds swapped in while
+values are added, missing markers, consistency hooks for created values,
+rebuild coordination and Redis failure handling.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.cache.negative_cache import BloomFilter, NegativeCache
+from src.cache.redis_client import RedisClient
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_redis_client():
+    """
+    Create a mock Redis client backed by in-memory bitmaps and keys.
+
+    Returns:
+        AsyncMock: Mocked Redis client
+    """
+    bitmaps: dict[str, set[int]] = {}
+    keys: dict[str, str] = {}
+
+    async def getbits(key, offsets):
+        return [int(offset in bitmaps.get(key, ())) for offset in offsets]
+
+    async def setbits(key, offsets):
+        bitmaps.setdefault(key, set()).update(offsets)
+
+    async def set_(key, value, ex=None):
+        keys[key] = value
+        return True
+
+    async def exists(*names):
+        return sum(name in keys or name in bitmaps for name in names)
+
+    async def set_many(mapping, ex=None):
+        keys.update(mapping)
+        return True
+
+    async def rename(source, destination):
+        bitmaps[destination] = bitmaps.pop(source)
+
+    async def delete(*names):
+        removed = 0
+        for name in names:
+            removed += int(keys.pop(name, None) is not None)
+            removed += int(bitmaps.pop(name, None) is not None)
+        return removed
+
+    mock_client = AsyncMock(spec=RedisClient)
+    mock_client.getbits = AsyncMock(side_effect=getbits)
+    mock_client.setbits = AsyncMock(side_effect=setbits)
+    mock_client.set = AsyncMock(side_effect=set_)
+    mock_client.set_many = AsyncMock(side_effect=set_many)
+    mock_client.rename = AsyncMock(side_effect=rename)
+    mock_client.exists = AsyncMock(side_effect=exists)
+    mock_client.delete = AsyncMock(side_effect=delete)
+    mock_client.acquire_lock = AsyncMock(return_value="token")
+    mock_client.release_lock = AsyncMock(return_value=True)
+    return mock_client
+
+
+@pytest.fixture
+def negative_cache(mock_redis_client):
+    """
+    Create negative cache with small filters.
+
+    Returns:
+        NegativeCache: Cache instance for testing
+    """
+    return NegativeCache(
+        redis_client=mock_redis_client,
+        ttl=30,
+        filter_capacity=1000,
+        filter_error_rate=0.01,
+        rebuild_interval=600,
+    )
+
+
+# ============================================================================
+# Unit Tests - Bloom Filter
+# ============================================================================
+
+
+class TestBloomFilter:
+    """Test Bloom filter sizing, hashing and readiness."""
+
+    def test_sized_for_capacity_and_error_rate(self):
+        """Test bit and hash counts follow the standard formulas."""
+        bloom = BloomFilter("bloom:test", capacity=1000, error_rate=0.01)
+
+        assert bloom.num_bits == 9586
+        assert bloom.num_hashes == 7
+
+    def test_offsets_are_stable_and_skip_sentinel(self):
+        """Test offsets are deterministic and never touch the sentinel bit."""
+        bloom = BloomFilter("bloom:test", capacity=1000, error_rate=0.01)
+
+        offsets = bloom.offsets("1HGBH41JXMN109186")
+
+        assert offsets == bloom.offsets("1HGBH41JXMN109186")
+        assert all(1 <= offset <= bloom.num_bits for offset in offsets)
+
+    @pytest.mark.asyncio
+    async def test_not_ready_filter_never_rejects(self, mock_redis_client):
+        """Test a filter without its sentinel reports every value possible."""
+        bloom = BloomFilter("bloom:test", capacity=1000, error_rate=0.01)
+
+        assert await bloom.might_contain(mock_redis_client, "unknown") is True
+
+    @pytest.mark.asyncio
+    async def test_rebuilt_filter_rejects_unknown_values(self, mock_redis_client):
+        """Test a ready filter rejects values it never saw."""
+        bloom = BloomFilter("bloom:test", capacity=1000, error_rate=0.01)
+
+        count = await bloom.rebuild(mock_redis_client, [f"v{i}" for i in range(50)])
+
+        assert count == 50
+        assert await bloom.might_contain(mock_redis_client, "v7") is True
+        rejected = [
+            not await bloom.might_contain(mock_redis_client, f"x{i}")
+            for i in range(100)
+        ]
+        assert sum(rejected) >= 95
+
+    @pytest.mark.asyncio
+    async def test_rebuild_keeps_live_filter_and_concurrent_adds(
+        self, mock_redis_client
+    ):
+        """Test the old filter serves during a rebuild and adds survive the swap."""
+        bloom = BloomFilter("bloom:test", capacity=1000, error_rate=0.01)
+        await bloom.rebuild(mock_redis_client, ["old"])
+
+        async def values():
+            yield "v1"
+            assert await bloom.might_contain(mock_redis_client, "unknown") is False
+            await bloom.add(mock_redis_client, "created")
+            yield "v2"
+
+        await bloom.rebuild(mock_redis_client, values())
+
+        assert await bloom.might_contain(mock_redis_client, "created") is True
+        assert await bloom.might_contain(mock_redis_client, "v2") is True
+        assert not await mock_redis_client.exists(bloom.build_key)
+
+
+# ============================================================================
+# Unit Tests - Redis Bitfield Commands
+# ============================================================================
+
+
+class TestRedisBitfield:
+    """Test bitmap reads and writes use one BITFIELD command."""
+
+    @pytest.fixture
+    def redis_client(self):
+        """Create a connected Redis client backed by mocks."""
+        client = RedisClient(url="redis://localhost:6379/0")
+        client._client = MagicMock()
+        client._client.execute_command = AsyncMock(return_value=[1, 0])
+        client._is_connected = True
+        return client
+
+    @pytest.mark.asyncio
+    async def test_getbits(self, redis_client):
+        """Test several bits are read in a single command."""
+        assert await redis_client.getbits("b", [0, 9]) == [1, 0]
+        redis_client._client.execute_command.assert_awaited_once_with(
+            "BITFIELD", "b", "GET", "u1", 0, "GET", "u1", 9
+        )
+
+    @pytest.mark.asyncio
+    async def test_setbits(self, redis_client):
+        """Test several bits are set in a single command."""
+        await redis_client.setbits("b", [3, 4])
+        redis_client._client.execute_command.assert_awaited_once_with(
+            "BITFIELD", "b", "SET", "u1", 3, 1, "SET", "u1", 4, 1
+        )
+
+
+# ============================================================================
+# Unit Tests - Negative Cache
+# ============================================================================
+
+
+class TestNegativeCache:
+    """Test missing markers and filter-backed short-circuits."""
+
+    @pytest.mark.asyncio
+    async def test_marked_value_is_missing(self, negative_cache, mock_redis_client):
+        """Test a confirmed miss is remembered with the configured TTL."""
+        await negative_cache.mark_missing(NegativeCache.VEHICLE_ID, "abc")
+
+        assert await negative_cache.is_missing(NegativeCache.VEHICLE_ID, "abc")
+        mock_redis_client.set.assert_awaited_once_with(
+            "negative:vehicle_id:abc", "1", ex=30
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_value_not_missing_before_rebuild(self, negative_cache):
+        """Test filtered namespaces fall through until the filter is built."""
+        assert not await negative_cache.is_missing(NegativeCache.VIN, "UNKNOWN")
+
+    @pytest.mark.asyncio
+    async def test_filter_rejects_after_rebuild(self, negative_cache):
+        """Test values absent from a rebuilt filter short-circuit."""
+        await negative_cache.rebuild_filter(NegativeCache.VIN, ["1hgbh41jxmn109186"])
+
+        assert not await negative_cache.is_missing(
+            NegativeCache.VIN, "1HGBH41JXMN109186"
+        )
+        assert await negative_cache.is_missing(NegativeCache.VIN, "WVWZZZ1JZXW000001")
+        assert negative_cache.get_statistics()["filter_rejections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_record_created_adds_to_filter_and_clears_marker(
+        self, negative_cache
+    ):
+        """Test created values stop being reported missing."""
+        await negative_cache.rebuild_filter(NegativeCache.SHARE_TOKEN, [])
+        await negative_cache.mark_missing(NegativeCache.SHARE_TOKEN, "tok")
+        assert await negative_cache.is_missing(NegativeCache.SHARE_TOKEN, "tok")
+
+        await negative_cache.record_created(NegativeCache.SHARE_TOKEN, "tok")
+
+        assert not await negative_cache.is_missing(NegativeCache.SHARE_TOKEN, "tok")
+
+    @pytest.mark.asyncio
+    async def test_marker_written_after_create_is_removed(self, negative_cache):
+        """Test a miss read before a create cannot hide the created value."""
+        await negative_cache.record_created(NegativeCache.VEHICLE_ID, "abc")
+        await negative_cache.mark_missing(NegativeCache.VEHICLE_ID, "abc")
+
+        assert not await negative_cache.is_missing(NegativeCache.VEHICLE_ID, "abc")
+
+    @pytest.mark.asyncio
+    async def test_failed_add_discards_filter(self, negative_cache, mock_redis_client):
+        """Test a filter that missed a created value stops rejecting lookups."""
+        await negative_cache.rebuild_filter(NegativeCache.VIN, [])
+        mock_redis_client.setbits.side_effect = ConnectionError("down")
+
+        await negative_cache.record_created(NegativeCache.VIN, "1HGBH41JXMN109186")
+
+        assert not await negative_cache.is_missing(
+            NegativeCache.VIN, "1HGBH41JXMN109186"
+        )
+        mock_redis_client.delete.assert_any_await("lock:bloom:vin")
+
+    @pytest.mark.asyncio
+    async def test_failed_discard_is_retried(self, negative_cache, mock_redis_client):
+        """Test the filter is skipped until it can be discarded."""
+        await negative_cache.rebuild_filter(NegativeCache.VIN, [])
+        mock_redis_client.set_many.side_effect = ConnectionError("down")
+        delete = mock_redis_client.delete.side_effect
+        mock_redis_client.delete.side_effect = ConnectionError("down")
+
+        await negative_cache.record_created(NegativeCache.VIN, "1HGBH41JXMN109186")
+        mock_redis_client.delete.side_effect = delete
+
+        assert not await negative_cache.is_missing(
+            NegativeCache.VIN, "1HGBH41JXMN109186"
+        )
+        mock_redis_client.getbits.assert_not_awaited()
+        assert not await negative_cache.is_missing(NegativeCache.VIN, "OTHER")
+        mock_redis_client.getbits.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rebuild_skipped_while_lock_held(
+        self, negative_cache, mock_redis_client
+    ):
+        """Test only one process rebuilds a filter per interval."""
+        mock_redis_client.acquire_lock.return_value = None
+
+        assert await negative_cache.rebuild_filter(NegativeCache.VIN, ["A"]) is None
+        mock_redis_client.setbits.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rebuild_failure_releases_lock(
+        self, negative_cache, mock_redis_client
+    ):
+        """Test a failed rebuild lets the next attempt run."""
+        mock_redis_client.setbits.side_effect = ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            await negative_cache.rebuild_filter(NegativeCache.VIN, ["A"])
+
+        mock_redis_client.release_lock.assert_awaited_once_with(
+            "lock:bloom:vin", "token"
+        )
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_fails_open(self, negative_cache, mock_redis_client):
+        """Test Redis errors never report a value missing."""
+        mock_redis_client.exists.side_effect = ConnectionError("down")
+
+        assert not await negative_cache.is_missing(NegativeCache.VEHICLE_ID, "abc")
+        assert negative_cache.get_statistics()["errors"] == 1
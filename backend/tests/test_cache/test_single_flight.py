@@ -0,0 +1,312 @@
+"""
+Test suite for cache miss coalescing.
+
+Tests cover in-process sharing of concurrent loads, error propagation,
+cross-process fill locks and the VehicleCache get-or-load helpers.
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.cache.redis_client import RedisClient
+from src.cache import single_flight as single_flight_module
+from src.cache.single_flight import SingleFlight, get_single_flight
+from src.schemas.vehicles import VehicleListResponse
+from src.services.cache.vehicle_cache import VehicleCache
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_redis_client():
+    """
+    Create a mock Redis client for testing.
+
+    Returns:
+        AsyncMock: Mocked Redis client with lock support
+    """
+    mock_client = AsyncMock(spec=RedisClient)
+    mock_client.acquire_lock = AsyncMock(return_value="token")
+    mock_client.release_lock = AsyncMock(return_value=True)
+    mock_client.get_json = AsyncMock(return_value=None)
+    mock_client.set_json = AsyncMock(return_value=True)
+    return mock_client
+
+
+@pytest.fixture
+def single_flight(mock_redis_client):
+    """
+    Create single-flight coordinator with mocked Redis.
+
+    Returns:
+        SingleFlight: Coordinator with short wait settings
+    """
+    return SingleFlight(
+        redis_client=mock_redis_client,
+        lock_ttl_ms=1000,
+        wait_timeout=0.05,
+        poll_interval=0.01,
+    )
+
+
+def slow_loader(result, calls, delay=0.01):
+    """Build a loader that records calls and yields to the event loop."""
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return result
+
+    return load
+
+
+# ============================================================================
+# Unit Tests - In-Process Coalescing
+# ============================================================================
+
+
+class TestInProcessCoalescing:
+    """Test concurrent callers share one load."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_load(self):
+        """Test concurrent callers for a key run the loader once."""
+        flight = SingleFlight()
+        calls = []
+
+        results = await asyncio.gather(
+            *(flight.do("k", slow_loader("v", calls)) for _ in range(10))
+        )
+
+        assert results == ["v"] * 10
+        assert len(calls) == 1
+        assert flight.get_stats()["coalesced"] == 9
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_distinct_keys_load_independently(self):
+        """Test different keys are not coalesced."""
+        flight = SingleFlight()
+        calls = []
+
+        await asyncio.gather(
+            flight.do("a", slow_loader(1, calls)),
+            flight.do("b", slow_loader(2, calls)),
+        )
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self):
+        """Test a failed load raises for every coalesced caller."""
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", failing), flight.do("k", failing), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_reload(self):
+        """Test results are not memoized once the load completes."""
+        flight = SingleFlight()
+        calls = []
+
+        await flight.do("k", slow_loader("v", calls, delay=0))
+        await flight.do("k", slow_loader("v", calls, delay=0))
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_load(self):
+        """Test cancelling one caller leaves the shared load running."""
+        flight = SingleFlight()
+        calls = []
+
+        first = asyncio.ensure_future(flight.do("k", slow_loader("v", calls, 0.02)))
+        second = asyncio.ensure_future(flight.do("k", slow_loader("v", calls)))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "v"
+        assert len(calls) == 1
+
+
+# ============================================================================
+# Unit Tests - Cross-Process Fill Lock
+# ============================================================================
+
+
+class TestFillLock:
+    """Test Redis lock coordination between processes."""
+
+    @pytest.mark.asyncio
+    async def test_lock_holder_loads_and_releases(
+        self, single_flight, mock_redis_client
+    ):
+        """Test the lock holder loads the key and releases its lock."""
+        read_cache = AsyncMock(return_value=None)
+        loader = AsyncMock(return_value="v")
+
+        result = await single_flight.load("k", read_cache, loader)
+
+        assert result == "v"
+        loader.assert_awaited_once()
+        mock_redis_client.acquire_lock.assert_awaited_once_with("lock:fill:k", 1000)
+        mock_redis_client.release_lock.assert_awaited_once_with(
+            "lock:fill:k", "token"
+        )
+
+    @pytest.mark.asyncio
+    async def test_lock_holder_rechecks_cache(self, single_flight):
+        """Test a key filled before the lock was taken is not reloaded."""
+        read_cache = AsyncMock(return_value="cached")
+        loader = AsyncMock(return_value="v")
+
+        result = await single_flight.load("k", read_cache, loader)
+
+        assert result == "cached"
+        loader.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_waiter_serves_value_filled_elsewhere(
+        self, single_flight, mock_redis_client
+    ):
+        """Test non-holders poll the cache instead of loading."""
+        mock_redis_client.acquire_lock.return_value = None
+        read_cache = AsyncMock(side_effect=[None, "filled"])
+        loader = AsyncMock(return_value="v")
+
+        result = await single_flight.load("k", read_cache, loader)
+
+        assert result == "filled"
+        loader.assert_not_awaited()
+        assert single_flight.get_stats()["lock_wait_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_loads_after_timeout(
+        self, single_flight, mock_redis_client
+    ):
+        """Test non-holders load themselves if the fill never appears."""
+        mock_redis_client.acquire_lock.return_value = None
+        read_cache = AsyncMock(return_value=None)
+        loader = AsyncMock(return_value="v")
+
+        result = await single_flight.load("k", read_cache, loader)
+
+        assert result == "v"
+        loader.assert_awaited_once()
+        mock_redis_client.release_lock.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lock_errors_degrade_to_direct_load(
+        self, single_flight, mock_redis_client
+    ):
+        """Test Redis lock failures do not fail the request."""
+        mock_redis_client.acquire_lock.side_effect = ConnectionError("down")
+        loader = AsyncMock(return_value="v")
+
+        result = await single_flight.load("k", AsyncMock(return_value=None), loader)
+
+        assert result == "v"
+
+    @pytest.mark.asyncio
+    async def test_lock_used_once_redis_recovers(
+        self, mock_redis_client, monkeypatch
+    ):
+        """Test a coordinator created during an outage picks Redis up later."""
+        get_redis_client = AsyncMock(
+            side_effect=[ConnectionError("down"), ConnectionError("down")]
+        )
+        monkeypatch.setattr(single_flight_module, "_single_flight", None)
+        monkeypatch.setattr(
+            single_flight_module, "get_redis_client", get_redis_client
+        )
+        single_flight = await get_single_flight()
+        loader = AsyncMock(return_value="v")
+        read_cache = AsyncMock(return_value=None)
+
+        await single_flight.load("k", read_cache, loader)
+        mock_redis_client.acquire_lock.assert_not_awaited()
+
+        get_redis_client.side_effect = None
+        get_redis_client.return_value = mock_redis_client
+        monkeypatch.setattr(SingleFlight, "REDIS_RETRY_INTERVAL", 0.0)
+        single_flight._next_redis_attempt = 0.0
+
+        await single_flight.load("k", read_cache, loader)
+
+        assert await get_single_flight() is single_flight
+        mock_redis_client.acquire_lock.assert_awaited_once()
+        mock_redis_client.release_lock.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_redis_retry_is_throttled(self, mock_redis_client):
+        """Test an outage does not retry Redis on every miss."""
+        factory = AsyncMock(side_effect=ConnectionError("down"))
+        single_flight = SingleFlight(redis_client_factory=factory)
+        loader = AsyncMock(return_value="v")
+
+        for _ in range(3):
+            await single_flight.load("k", AsyncMock(return_value=None), loader)
+
+        factory.assert_awaited_once()
+        assert loader.await_count == 3
+
+
+# ============================================================================
+# Integration Tests - VehicleCache
+# ============================================================================
+
+
+class TestVehicleCacheGetOrLoad:
+    """Test VehicleCache coalesces concurrent list misses."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_list_misses_load_once(self, mock_redis_client):
+        """Test concurrent misses for the same filters hit the loader once."""
+        cache = VehicleCache(
+            redis_client=mock_redis_client,
+            single_flight=SingleFlight(redis_client=mock_redis_client),
+        )
+        response = VehicleListResponse(
+            items=[], total=0, page=1, page_size=20, total_pages=0
+        )
+        calls = []
+
+        results = await asyncio.gather(
+            *(
+                cache.get_or_load_vehicle_list(
+                    {"make": "Toyota"}, slow_loader(response, calls)
+                )
+                for _ in range(5)
+            )
+        )
+
+        assert all(r == response for r in results)
+        assert len(calls) == 1
+        mock_redis_client.set_json.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_without_single_flight(self, mock_redis_client):
+        """Test the helper still loads and caches without a coordinator."""
+        cache = VehicleCache(redis_client=mock_redis_client)
+        vehicle_id = uuid.uuid4()
+        loader = AsyncMock(side_effect=RuntimeError("loader error"))
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load_vehicle_detail(vehicle_id, loader)
+
+        loader.assert_awaited_once()
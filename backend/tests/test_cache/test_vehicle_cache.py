@@ -14,6 +14,7 @@ from uuid import UUID, uuid4
 
 import pytest
 
+from src.cache.local_cache import TieredCache
 from src.cache.redis_client import CacheKeyManager, RedisClient
 from src.schemas.vehicles import VehicleListResponse, VehicleResponse
 from src.services.cache.vehicle_cache import VehicleCache, get_vehicle_cache
@@ -37,6 +38,8 @@ def mock_redis_client():
     mock_client.set_json = AsyncMock(return_value=True)
     mock_client.delete = AsyncMock(return_value=0)
     mock_client.delete_pattern = AsyncMock(return_value=0)
+    mock_client.invalidate_tags = AsyncMock(return_value=0)
+    mock_client.tag_keys = AsyncMock(return_value=None)
     mock_client.pipeline = AsyncMock()
     mock_client.get_cache_stats = Mock(
         return_value={
@@ -781,19 +784,21 @@ class TestCacheInvalidation:
         self, vehicle_cache, mock_redis_client
     ):
         """Test invalidating vehicle lists successfully."""
-        mock_redis_client.delete_pattern.return_value = 5
+        mock_redis_client.invalidate_tags.return_value = 5
 
         result = await vehicle_cache.invalidate_vehicle_lists()
 
         assert result == 5
         assert vehicle_cache._cache_stats["invalidations"] == 5
+        mock_redis_client.invalidate_tags.assert_called_once_with("vehicle_lists")
+        mock_redis_client.delete_pattern.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_invalidate_search_results_success(
         self, vehicle_cache, mock_redis_client
     ):
         """Test invalidating search results successfully."""
-        mock_redis_client.delete_pattern.return_value = 3
+        mock_redis_client.invalidate_tags.return_value = 3
 
         result = await vehicle_cache.invalidate_search_results()
 
@@ -805,20 +810,26 @@ class TestCacheInvalidation:
         self, vehicle_cache, mock_redis_client
     ):
         """Test invalidating all vehicle caches successfully."""
-        mock_redis_client.delete_pattern.return_value = 10
+        mock_redis_client.invalidate_tags.return_value = 50
 
         result = await vehicle_cache.invalidate_all_vehicle_caches()
 
-        assert result == 50  # 10 per pattern * 5 patterns
+        assert result == 50
         assert vehicle_cache._cache_stats["invalidations"] == 50
-        assert mock_redis_client.delete_pattern.call_count == 5
+        mock_redis_client.invalidate_tags.assert_called_once_with(
+            "vehicle_lists",
+            "vehicle_details",
+            "vehicle_search",
+            "vehicle_inventory",
+            "vehicle_price_ranges",
+        )
 
     @pytest.mark.asyncio
     async def test_invalidate_all_vehicle_caches_redis_error(
         self, vehicle_cache, mock_redis_client
     ):
         """Test handling Redis errors during full invalidation."""
-        mock_redis_client.delete_pattern.side_effect = ConnectionError(
+        mock_redis_client.invalidate_tags.side_effect = ConnectionError(
             "Redis unavailable"
         )
 
@@ -826,6 +837,34 @@ class TestCacheInvalidation:
 
         assert result == 0
 
+    @pytest.mark.asyncio
+    async def test_invalidate_all_vehicle_caches_clears_every_replica(
+        self, mock_redis_client, mock_key_manager
+    ):
+        """Test a full flush goes out to the L1 caches of all replicas."""
+        tiered_cache = AsyncMock(spec=TieredCache)
+        tiered_cache.invalidate.return_value = 50
+        vehicle_cache = VehicleCache(
+            redis_client=mock_redis_client,
+            key_manager=mock_key_manager,
+            tiered_cache=tiered_cache,
+        )
+
+        result = await vehicle_cache.invalidate_all_vehicle_caches()
+
+        assert result == 50
+        tiered_cache.invalidate.assert_awaited_once_with(
+            tags=[
+                "vehicle_lists",
+                "vehicle_details",
+                "vehicle_search",
+                "vehicle_inventory",
+                "vehicle_price_ranges",
+            ],
+            clear_local=True,
+        )
+        mock_redis_client.invalidate_tags.assert_not_called()
+
 
 # ============================================================================
 # Unit Tests - Cache Warming
@@ -839,17 +878,37 @@ class TestCacheWarming:
     async def test_warm_cache_for_vehicles_success(
         self, vehicle_cache, mock_redis_client, sample_vehicle_response
     ):
-        """Test warming cache for multiple vehicles successfully."""
+        """Test warming cache for multiple vehicles in one bulk write."""
         vehicle_ids = [uuid4() for _ in range(3)]
         vehicle_data = [sample_vehicle_response for _ in range(3)]
 
-        mock_pipeline = AsyncMock()
-        mock_redis_client.pipeline.return_value.__aenter__.return_value = mock_pipeline
-
         result = await vehicle_cache.warm_cache_for_vehicles(vehicle_ids, vehicle_data)
 
         assert result == 3
         assert vehicle_cache._cache_stats["warming_operations"] == 3
+        mock_redis_client.set_many.assert_awaited_once()
+        mapping = mock_redis_client.set_many.call_args.args[0]
+        assert len(mapping) == 3
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_for_vehicles_jitters_ttls(
+        self, vehicle_cache, mock_redis_client, sample_vehicle_response
+    ):
+        """Test warmed keys get per-key TTLs and detail tags."""
+        vehicle_ids = [uuid4() for _ in range(20)]
+        vehicle_data = [sample_vehicle_response for _ in range(20)]
+
+        await vehicle_cache.warm_cache_for_vehicles(vehicle_ids, vehicle_data)
+
+        kwargs = mock_redis_client.set_many.call_args.kwargs
+        base = VehicleCache.VEHICLE_DETAIL_TTL
+        assert all(
+            base <= ttl <= base * (1 + VehicleCache.WARMING_TTL_JITTER)
+            for ttl in kwargs["ttls"].values()
+        )
+        assert all(
+            VehicleCache.DETAIL_TAG in tags for tags in kwargs["tags"].values()
+        )
 
     @pytest.mark.asyncio
     async def test_warm_cache_for_vehicles_length_mismatch(
@@ -867,12 +926,10 @@ class TestCacheWarming:
         self, vehicle_cache, mock_redis_client
     ):
         """Test warming cache with empty lists."""
-        mock_pipeline = AsyncMock()
-        mock_redis_client.pipeline.return_value.__aenter__.return_value = mock_pipeline
-
         result = await vehicle_cache.warm_cache_for_vehicles([], [])
 
         assert result == 0
+        mock_redis_client.set_many.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_warm_cache_for_vehicles_redis_error(
@@ -882,7 +939,7 @@ class TestCacheWarming:
         vehicle_ids = [uuid4()]
         vehicle_data = [sample_vehicle_response]
 
-        mock_redis_client.pipeline.side_effect = ConnectionError("Redis unavailable")
+        mock_redis_client.set_many.side_effect = ConnectionError("Redis unavailable")
 
         result = await vehicle_cache.warm_cache_for_vehicles(vehicle_ids, vehicle_data)
 
@@ -1096,12 +1153,13 @@ class TestCachePerformance:
         self, vehicle_cache, mock_redis_client
     ):
         """Test bulk invalidation is efficient."""
-        mock_redis_client.delete_pattern.return_value = 100
+        mock_redis_client.invalidate_tags.return_value = 500
 
         result = await vehicle_cache.invalidate_all_vehicle_caches()
 
-        assert result == 500  # 100 per pattern * 5 patterns
-        assert mock_redis_client.delete_pattern.call_count == 5
+        assert result == 500
+        assert mock_redis_client.invalidate_tags.call_count == 1
+        mock_redis_client.delete_pattern.assert_not_called()
 
 
 # ============================================================================
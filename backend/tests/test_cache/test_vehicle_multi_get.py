@@ -0,0 +1,253 @@
+"""
+Test suite for batched vehicle detail reads.
+
+Tests cover the pipelined MGET path in the Redis client, L1-first multi-get
+in the tiered cache and bulk read-through with backfill in the vehicle cache.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import UUID, uuid4
+
+import pytest
+from redis.client import NEVER_DECODE
+
+from src.cache.codec import CacheCodec
+from src.cache.local_cache import LocalCache, TieredCache
+from src.cache.redis_client import RedisClient
+from src.schemas.vehicles import VehicleResponse
+from src.services.cache.vehicle_cache import VehicleCache
+
+
+def make_vehicle(vehicle_id: UUID) -> VehicleResponse:
+    """Build a minimal valid vehicle response."""
+    now = datetime.now(timezone.utc)
+    return VehicleResponse(
+        id=vehicle_id,
+        make="Toyota",
+        model="Camry",
+        year=2024,
+        body_style="Sedan",
+        exterior_color="Silver",
+        interior_color="Black",
+        base_price=32500,
+        specifications={
+            "engine_type": "2.5L I4",
+            "horsepower": 203,
+            "torque": 184,
+            "transmission": "8-Speed Automatic",
+            "drivetrain": "FWD",
+            "fuel_type": "gasoline",
+            "mpg_city": 28,
+            "mpg_highway": 39,
+        },
+        dimensions={
+            "length": 192.7,
+            "width": 72.4,
+            "height": 56.9,
+            "wheelbase": 111.2,
+            "curb_weight": 3310,
+            "seating_capacity": 5,
+        },
+        features={},
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def redis_client():
+    """
+    Create a connected Redis client backed by mocks.
+
+    Returns:
+        RedisClient: Client with mocked connection
+    """
+    client = RedisClient(url="redis://localhost:6379/0", codec=CacheCodec("orjson"))
+    client._client = MagicMock()
+    client._client.execute_command = AsyncMock(return_value=[])
+    client._is_connected = True
+    return client
+
+
+@pytest.fixture
+def mock_redis_client():
+    """
+    Create a mock Redis client for vehicle cache tests.
+
+    Returns:
+        AsyncMock: Mocked Redis client
+    """
+    mock_client = AsyncMock(spec=RedisClient)
+    mock_client.codec = CacheCodec()
+    mock_client.get_many_json = AsyncMock(return_value={})
+    mock_client.set_many = AsyncMock(return_value=True)
+    mock_client.get_cache_stats = Mock(return_value={})
+    return mock_client
+
+
+@pytest.fixture
+def vehicle_cache(mock_redis_client):
+    """
+    Create vehicle cache with mocked Redis.
+
+    Returns:
+        VehicleCache: Cache instance for testing
+    """
+    return VehicleCache(redis_client=mock_redis_client)
+
+
+# ============================================================================
+# Unit Tests - Redis Client
+# ============================================================================
+
+
+class TestRedisClientMultiGet:
+    """Test MGET reads through the codec."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_json_uses_single_raw_mget(self, redis_client):
+        """Test all keys are fetched in one undecoded MGET."""
+        redis_client._client.execute_command.return_value = [b'{"a":1}', None]
+
+        result = await redis_client.get_many_json("k1", "k2")
+
+        assert result == {"k1": {"a": 1}, "k2": None}
+        call = redis_client._client.execute_command.await_args
+        assert call.args == ("MGET", "k1", "k2")
+        assert NEVER_DECODE in call.kwargs
+
+    @pytest.mark.asyncio
+    async def test_corrupt_value_does_not_fail_batch(self, redis_client):
+        """Test one undecodable entry is returned as None."""
+        redis_client._client.execute_command.return_value = [b"\x02\x00", b"[1]"]
+
+        result = await redis_client.get_many_json("bad", "good")
+
+        assert result == {"bad": None, "good": [1]}
+
+    @pytest.mark.asyncio
+    async def test_no_keys_skips_round_trip(self, redis_client):
+        """Test an empty key list does not call Redis."""
+        assert await redis_client.get_many_json() == {}
+        redis_client._client.execute_command.assert_not_awaited()
+
+
+# ============================================================================
+# Unit Tests - Tiered Cache
+# ============================================================================
+
+
+class TestTieredMultiGet:
+    """Test L1-first multi-get in the tiered cache."""
+
+    @pytest.mark.asyncio
+    async def test_reads_l1_then_fetches_remainder(self):
+        """Test only L1 misses go to Redis and are promoted."""
+        redis = AsyncMock(spec=RedisClient)
+        redis.codec = CacheCodec()
+        redis.get_many = AsyncMock(return_value={"b": b'{"v":2}', "c": None})
+        local = LocalCache(max_bytes=1 << 20, max_entries=100, default_ttl=60)
+        local.set("a", {"v": 1}, size=8)
+        cache = TieredCache(redis, local)
+
+        result = await cache.get_many_json(["a", "b", "c"], tags={"b": ["t:b"]})
+
+        assert result == {"a": {"v": 1}, "b": {"v": 2}, "c": None}
+        redis.get_many.assert_awaited_once_with("b", "c", raw=True)
+        assert local.get("b") == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_all_local_hits_skip_redis(self):
+        """Test no Redis round trip happens when L1 has every key."""
+        redis = AsyncMock(spec=RedisClient)
+        local = LocalCache(max_bytes=1 << 20, max_entries=100, default_ttl=60)
+        local.set("a", 1, size=1)
+        cache = TieredCache(redis, local)
+
+        assert await cache.get_many_json(["a"]) == {"a": 1}
+        redis.get_many.assert_not_awaited()
+
+
+# ============================================================================
+# Unit Tests - Vehicle Cache
+# ============================================================================
+
+
+class TestVehicleDetailsMultiGet:
+    """Test bulk vehicle detail read-through."""
+
+    @pytest.mark.asyncio
+    async def test_hits_and_misses_use_one_loader_call(
+        self, vehicle_cache, mock_redis_client
+    ):
+        """Test misses are loaded in one call and backfilled in one pipeline."""
+        hit_id, miss_id = uuid4(), uuid4()
+        hit = make_vehicle(hit_id)
+        miss = make_vehicle(miss_id)
+        mock_redis_client.get_many_json.return_value = {
+            vehicle_cache._make_detail_key(hit_id): hit.model_dump(mode="json"),
+        }
+        loader = AsyncMock(return_value=[miss])
+
+        result = await vehicle_cache.get_vehicle_details_many(
+            [hit_id, miss_id, hit_id], loader=loader
+        )
+
+        assert result == {hit_id: hit, miss_id: miss}
+        mock_redis_client.get_many_json.assert_awaited_once()
+        assert len(mock_redis_client.get_many_json.await_args.args) == 2
+        loader.assert_awaited_once_with([miss_id])
+        mapping = mock_redis_client.set_many.await_args.args[0]
+        assert list(mapping) == [vehicle_cache._make_detail_key(miss_id)]
+
+    @pytest.mark.asyncio
+    async def test_all_hits_skip_loader(self, vehicle_cache, mock_redis_client):
+        """Test the loader is not called when every vehicle is cached."""
+        vehicle_id = uuid4()
+        mock_redis_client.get_many_json.return_value = {
+            vehicle_cache._make_detail_key(vehicle_id): make_vehicle(
+                vehicle_id
+            ).model_dump(mode="json"),
+        }
+        loader = AsyncMock()
+
+        result = await vehicle_cache.get_vehicle_details_many(
+            [vehicle_id], loader=loader
+        )
+
+        assert list(result) == [vehicle_id]
+        loader.assert_not_awaited()
+        mock_redis_client.set_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_loader(
+        self, vehicle_cache, mock_redis_client
+    ):
+        """Test a cache outage loads every vehicle from the loader."""
+        vehicle_id = uuid4()
+        mock_redis_client.get_many_json.side_effect = ConnectionError("down")
+        mock_redis_client.set_many.side_effect = ConnectionError("down")
+        loader = AsyncMock(return_value=[make_vehicle(vehicle_id)])
+
+        result = await vehicle_cache.get_vehicle_details_many(
+            [vehicle_id], loader=loader
+        )
+
+        assert list(result) == [vehicle_id]
+        loader.assert_awaited_once_with([vehicle_id])
+
+    @pytest.mark.asyncio
+    async def test_missing_vehicles_omitted(self, vehicle_cache):
+        """Test vehicles absent from cache and database are left out."""
+        result = await vehicle_cache.get_vehicle_details_many(
+            [uuid4()], loader=AsyncMock(return_value=[])
+        )
+
+        assert result == {}
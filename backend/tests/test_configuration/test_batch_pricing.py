@@ -0,0 +1,366 @@
+"""
+Parity test suite for batch pricing.
+
+Tests check that calculate_total_prices_batch returns exactly the numbers
+of calculate_total_price for random configurations, with and without
+NumPy, including prices the fixed-point path cannot represent, totals at
+the validation limits, and invalid prices raising the scalar path's errors.
+"""
+
+import random
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.database.models.package import Package
+from src.database.models.vehicle import Vehicle
+from src.database.models.vehicle_option import VehicleOption
+from src.services.configuration import pricing_engine as pricing_module
+from src.services.configuration.price_overlay import (
+    DealerPriceResolver,
+    DealerPriceTable,
+)
+from src.services.configuration.pricing_engine import (
+    PricingCalculationError,
+    PricingEngine,
+    PricingValidationError,
+)
+
+REGIONS = [None, "CA", "NY", "TX", "FL", "ZZ"]
+
+
+def make_vehicle(base_price, destination_charge="1295.00"):
+    """Build a vehicle with the given prices."""
+    vehicle = Mock(spec=Vehicle)
+    vehicle.id = uuid.uuid4()
+    vehicle.base_price = Decimal(base_price)
+    vehicle.destination_charge = Decimal(destination_charge)
+    return vehicle
+
+
+def make_option(price):
+    """Build an option with the given price."""
+    option = Mock(spec=VehicleOption)
+    option.id = uuid.uuid4()
+    option.name = f"Option {price}"
+    option.price = Decimal(price)
+    return option
+
+
+def make_package(discount_percentage):
+    """Build a package with the given discount."""
+    package = Mock(spec=Package)
+    package.id = uuid.uuid4()
+    package.name = f"Package {discount_percentage}"
+    package.discount_percentage = Decimal(discount_percentage)
+    return package
+
+
+def random_configurations(rng, count):
+    """Build random configurations sharing a catalog of options."""
+    catalog = [
+        make_option(f"{rng.randint(0, 800000) / 100:.2f}") for _ in range(40)
+    ]
+    vehicles = [
+        make_vehicle(
+            f"{rng.randint(1500000, 9000000) / 100:.2f}",
+            f"{rng.randint(0, 200000) / 100:.2f}",
+        )
+        for _ in range(5)
+    ]
+
+    configurations = []
+    for _ in range(count):
+        packages = [
+            (
+                make_package(f"{rng.randint(0, 10000) / 100:.2f}"),
+                rng.sample(catalog, rng.randint(0, 5)),
+            )
+            for _ in range(rng.randint(0, 3))
+        ]
+        configurations.append(
+            (
+                rng.choice(vehicles),
+                rng.sample(catalog, rng.randint(0, 12)),
+                packages,
+                rng.choice(REGIONS),
+            )
+        )
+    return configurations
+
+
+def random_price_table(rng, configurations):
+    """Build dealer overrides for some of the configurations' options and packages."""
+    option_ids = {
+        option.id
+        for _, options, packages, _ in configurations
+        for option in [*options, *(o for _, included in packages for o in included)]
+    }
+    package_ids = {
+        package.id
+        for _, _, packages, _ in configurations
+        for package, _ in packages
+    }
+    option_cents: dict[str, dict[uuid.UUID, int]] = {"": {}, "ca": {}}
+    for option_id in sorted(option_ids):
+        if rng.random() < 0.4:
+            option_cents[rng.choice(["", "ca"])][option_id] = rng.randint(0, 800000)
+    package_cents: dict[str, dict[uuid.UUID, int]] = {"": {}, "ny": {}}
+    for package_id in sorted(package_ids):
+        if rng.random() < 0.5:
+            package_cents[rng.choice(["", "ny"])][package_id] = rng.randint(0, 2000000)
+    return DealerPriceTable(
+        dealer_id=uuid.uuid4(),
+        option_cents=option_cents,
+        package_cents=package_cents,
+        version="test",
+    )
+
+
+def dealer_engine(price_table):
+    """Create pricing engine whose resolver returns price_table."""
+    resolver = Mock(spec=DealerPriceResolver)
+    resolver.get_price_table = AsyncMock(return_value=price_table)
+    return PricingEngine(
+        redis_client=None, enable_caching=False, price_resolver=resolver
+    )
+
+
+async def scalar_prices(engine, configurations, **flags):
+    """Price configurations one at a time."""
+    return [
+        await engine.calculate_total_price(
+            vehicle, options=options, packages=packages, region=region, **flags
+        )
+        for vehicle, options, packages, region in configurations
+    ]
+
+
+def without_timestamps(results):
+    """Drop calculation timestamps, which differ between calls."""
+    return [
+        {key: value for key, value in result.items() if key != "calculated_at"}
+        for result in results
+    ]
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def engine():
+    """Create pricing engine without caching."""
+    return PricingEngine(redis_client=None, enable_caching=False)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request):
+    """Run batch pricing with NumPy and with plain integers."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        yield request.param
+    else:
+        with patch.object(pricing_module, "np", None):
+            yield request.param
+
+
+# ============================================================================
+# Parity Tests
+# ============================================================================
+
+
+class TestBatchPricingParity:
+    """Test batch prices equal scalar prices exactly."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("include_tax", [True, False])
+    @pytest.mark.parametrize("include_destination", [True, False])
+    async def test_random_configurations(
+        self, engine, backend, include_tax, include_destination
+    ):
+        """Test random configurations price identically."""
+        configurations = random_configurations(random.Random(5), 300)
+        flags = {
+            "include_tax": include_tax,
+            "include_destination": include_destination,
+        }
+
+        batch = engine.calculate_total_prices_batch(configurations, **flags)
+        scalar = await scalar_prices(engine, configurations, **flags)
+
+        assert without_timestamps(batch) == without_timestamps(scalar)
+
+    @pytest.mark.asyncio
+    async def test_unrepresentable_prices(self, engine, backend):
+        """Test sub-cent prices and discounts fall back to the scalar path."""
+        vehicle = make_vehicle("31999.995")
+        option = make_option("0.125")
+        package = make_package("12.345")
+        configurations = [
+            (vehicle, [option], [], "NY"),
+            (
+                make_vehicle("25000.00"),
+                [make_option("10.00")],
+                [(package, [option])],
+                None,
+            ),
+            (make_vehicle("25000.00"), [option, option], [], "CA"),
+        ]
+
+        batch = engine.calculate_total_prices_batch(configurations)
+        scalar = await scalar_prices(engine, configurations)
+
+        assert without_timestamps(batch) == without_timestamps(scalar)
+
+    @pytest.mark.asyncio
+    async def test_maximum_total(self, engine, backend):
+        """Test totals at the maximum price are accepted."""
+        configurations = [
+            (make_vehicle("9999999.00", "1.00"), [], [], None),
+            (
+                make_vehicle("9000000.00", "0.00"),
+                [make_option("999999.99")],
+                [],
+                None,
+            ),
+        ]
+
+        batch = engine.calculate_total_prices_batch(
+            configurations, include_tax=False
+        )
+        scalar = await scalar_prices(engine, configurations, include_tax=False)
+
+        assert batch[0]["total"] == 10000000.0
+        assert without_timestamps(batch) == without_timestamps(scalar)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("include_tax", [True, False])
+    async def test_dealer_prices(self, backend, include_tax):
+        """Test dealer overrides price identically in both paths."""
+        rng = random.Random(11)
+        configurations = random_configurations(rng, 300)
+        price_table = random_price_table(rng, configurations)
+        engine = dealer_engine(price_table)
+
+        batch = engine.calculate_total_prices_batch(
+            configurations, include_tax=include_tax, price_table=price_table
+        )
+        scalar = await scalar_prices(
+            engine,
+            configurations,
+            include_tax=include_tax,
+            dealer_id=price_table.dealer_id,
+        )
+
+        assert without_timestamps(batch) == without_timestamps(scalar)
+        list_prices = engine.calculate_total_prices_batch(configurations)
+        assert without_timestamps(batch) != without_timestamps(list_prices)
+
+    @pytest.mark.asyncio
+    async def test_dealer_package_price_above_options(self, backend):
+        """Test a dealer package price above its options gives no discount."""
+        options = [make_option("1000.00"), make_option("500.00")]
+        package = make_package("10.00")
+        price_table = DealerPriceTable(
+            dealer_id=uuid.uuid4(),
+            option_cents={"ca": {options[0].id: 95000}},
+            package_cents={"": {package.id: 160000}},
+            version="test",
+        )
+        engine = dealer_engine(price_table)
+        configurations = [
+            (make_vehicle("30000.00"), options, [(package, options)], "CA"),
+            (make_vehicle("30000.00"), [], [(package, [make_option("0.125")])], None),
+        ]
+
+        batch = engine.calculate_total_prices_batch(
+            configurations, price_table=price_table
+        )
+        scalar = await scalar_prices(
+            engine, configurations, dealer_id=price_table.dealer_id
+        )
+
+        assert batch[0]["options_price"] == 1450.0
+        assert batch[0]["packages_price"] == 1600.0
+        assert batch[0]["packages_discount"] == 0.0
+        assert without_timestamps(batch) == without_timestamps(scalar)
+
+
+# ============================================================================
+# Error Handling Tests
+# ============================================================================
+
+
+class TestBatchPricingErrors:
+    """Test batch pricing raises the scalar path's errors."""
+
+    def test_negative_base_price(self, engine, backend):
+        """Test invalid base prices raise validation errors."""
+        configurations = [
+            (make_vehicle("30000.00"), [], [], None),
+            (make_vehicle("-1.00"), [], [], None),
+        ]
+
+        with pytest.raises(PricingValidationError):
+            engine.calculate_total_prices_batch(configurations)
+
+    def test_invalid_package_option(self, engine, backend):
+        """Test invalid package option prices raise calculation errors."""
+        package = make_package("10.00")
+        configurations = [
+            (
+                make_vehicle("30000.00"),
+                [],
+                [(package, [make_option("-5.00")])],
+                None,
+            ),
+        ]
+
+        with pytest.raises(PricingCalculationError):
+            engine.calculate_total_prices_batch(configurations)
+
+    def test_total_exceeds_maximum(self, engine, backend):
+        """Test totals above the maximum price are rejected."""
+        configurations = [
+            (make_vehicle("9999999.00"), [make_option("5000.00")], [], "CA"),
+        ]
+
+        with pytest.raises(PricingValidationError):
+            engine.calculate_total_prices_batch(configurations)
+
+    def test_empty_batch(self, engine, backend):
+        """Test an empty batch returns no results."""
+        assert engine.calculate_total_prices_batch([]) == []
+
+
+# ============================================================================
+# Scalar Path Tests
+# ============================================================================
+
+
+class TestScalarPackagePricing:
+    """Test the scalar path totals package options once."""
+
+    @pytest.mark.asyncio
+    async def test_options_totaled_once_per_package(self, engine):
+        """Test each package's options are summed a single time."""
+        package = make_package("10.00")
+        options = [make_option("1000.00"), make_option("500.00")]
+
+        with patch.object(
+            engine, "calculate_options_total", wraps=engine.calculate_options_total
+        ) as options_total:
+            result = await engine.calculate_total_price(
+                make_vehicle("30000.00"),
+                packages=[(package, options)],
+                include_tax=False,
+                include_destination=False,
+            )
+
+        assert options_total.call_count == 1
+        assert result["packages_price"] == 1350.0
+        assert result["packages_discount"] == 150.0
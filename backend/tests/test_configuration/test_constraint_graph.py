@@ -0,0 +1,239 @@
+"""
+Test suite for compiled configuration rules.
+
+Tests cover compiling options and packages into bitsets, transitive
+requirement closures, parity of compiled validation with the error
+messages of the rules engine, and caching compiled rules per vehicle.
+"""
+
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.local_cache import LocalCache, vehicle_tag
+from src.database.models.package import Package
+from src.database.models.vehicle_option import VehicleOption
+from src.services.configuration.business_rules import ConfigurationRulesEngine
+from src.services.configuration.constraint_graph import compile_rules, iter_bits
+
+
+def make_option(name, is_required=False, excludes=(), requires=()):
+    """Build a vehicle option with the given rule edges."""
+    return VehicleOption(
+        id=uuid.uuid4(),
+        name=name,
+        category="general",
+        price=Decimal("100.00"),
+        is_required=is_required,
+        mutually_exclusive_with=list(excludes),
+        required_options=list(requires),
+    )
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def vehicle_id():
+    """Generate test vehicle ID."""
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def options():
+    """Create options with exclusivity and a requirement chain."""
+    paint = make_option("Paint", is_required=True)
+    sunroof = make_option("Sunroof")
+    roof_rack = make_option("Roof Rack", excludes=[sunroof.id])
+    trailer = make_option("Trailer Hitch")
+    tow = make_option("Tow Package", requires=[trailer.id])
+    cooling = make_option("Heavy Cooling", requires=[tow.id])
+    return [paint, sunroof, roof_rack, trailer, tow, cooling]
+
+
+@pytest.fixture
+def packages(options):
+    """Create a package restricted to one trim and year."""
+    return [
+        Package(
+            id=uuid.uuid4(),
+            name="Adventure Package",
+            description="Roof and towing",
+            base_price=Decimal("900.00"),
+            included_options=[options[2].id, options[4].id],
+            trim_compatibility=["Sport"],
+            model_year_compatibility=[2024],
+        ),
+    ]
+
+
+@pytest.fixture
+def rules(vehicle_id, options, packages):
+    """Compile the fixture rules."""
+    return compile_rules(vehicle_id, options, packages)
+
+
+@pytest.fixture
+def rules_engine():
+    """Create rules engine with a compiled rules cache."""
+    cache = LocalCache(max_bytes=1024 * 1024, max_entries=10, default_ttl=60)
+    return ConfigurationRulesEngine(
+        session=AsyncMock(spec=AsyncSession), compiled_cache=cache
+    )
+
+
+# ============================================================================
+# Unit Tests - Compilation
+# ============================================================================
+
+
+class TestCompileRules:
+    """Test compiling rules into bitsets."""
+
+    def test_bitsets(self, rules, options):
+        """Test required, exclusivity and requirement edges."""
+        assert list(iter_bits(rules.required_mask)) == [0]
+        assert rules.excludes[2] == 1 << 1
+        assert rules.conflicts[1] == 1 << 2
+        assert rules.requires[4] == 1 << 3
+        assert rules.package_includes[0] == (1 << 2) | (1 << 4)
+
+    def test_transitive_closure(self, rules):
+        """Test requirements are followed transitively."""
+        assert list(iter_bits(rules.requires_closure[5])) == [3, 4]
+
+    def test_requirement_cycle(self):
+        """Test cyclic requirements terminate."""
+        first = make_option("First")
+        second = make_option("Second", requires=[first.id])
+        first.required_options = [second.id]
+
+        rules = compile_rules(None, [first, second])
+
+        assert rules.requires_closure == (0b11, 0b11)
+
+    def test_open_edges(self, rules, options):
+        """Test edges to ids outside the catalog are tracked."""
+        dangling = make_option("Dangling", requires=[uuid.uuid4()])
+
+        assert not rules.open_options
+        assert compile_rules(None, [*options, dangling]).open_options == {6}
+
+
+# ============================================================================
+# Unit Tests - Validation Parity
+# ============================================================================
+
+
+class TestCompiledValidation:
+    """Test compiled checks report the rules engine's messages."""
+
+    @pytest.mark.asyncio
+    async def test_compiled_matches_lists(self, rules_engine, rules, options):
+        """Test compiled rules and option lists give identical errors."""
+        selected = [options[1].id, options[2].id, options[5].id]
+
+        for check in (
+            rules_engine.check_required_options,
+            rules_engine.check_mutually_exclusive,
+            rules_engine.check_option_dependencies,
+        ):
+            assert await check(rules, selected) == await check(options, selected)
+
+        assert await rules_engine.check_mutually_exclusive(rules, selected) == [
+            "Option 'Roof Rack' is mutually exclusive with 'Sunroof' - "
+            "only one can be selected"
+        ]
+        assert await rules_engine.check_option_dependencies(rules, selected) == [
+            "Option 'Heavy Cooling' requires 'Tow Package' to be selected"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_required_id(self, rules_engine):
+        """Test requirements outside the catalog are reported by id."""
+        missing_id = uuid.uuid4()
+        option = make_option("Orphan", requires=[missing_id])
+
+        errors = await rules_engine.check_option_dependencies([option], [option.id])
+        satisfied = await rules_engine.check_option_dependencies(
+            [option], [option.id, missing_id]
+        )
+
+        assert errors == [f"Option 'Orphan' requires '{missing_id}' to be selected"]
+        assert satisfied == []
+
+    @pytest.mark.asyncio
+    async def test_package_checks(self, rules_engine, rules, options, packages):
+        """Test package requirements and compatibility from compiled rules."""
+        package_id = packages[0].id
+
+        requirement_errors = await rules_engine.validate_package_requirements(
+            rules, [package_id], [options[2].id]
+        )
+        compatibility_errors = await rules_engine.validate_package_compatibility(
+            rules, [package_id], "Base", 2023
+        )
+
+        assert requirement_errors == [
+            "Package 'Adventure Package' requires all included options to be "
+            f"selected. Missing options: {options[4].id}"
+        ]
+        assert compatibility_errors == packages[0].validate_compatibility(
+            "Base", 2023
+        )[1]
+
+
+# ============================================================================
+# Integration Tests - Caching
+# ============================================================================
+
+
+class TestCompiledRulesCache:
+    """Test compiled rules are cached per vehicle."""
+
+    @pytest.mark.asyncio
+    async def test_rules_compiled_once(
+        self, rules_engine, vehicle_id, options, packages
+    ):
+        """Test repeated validations load the catalog once."""
+        rules_engine._load_vehicle_options = AsyncMock(return_value=options)
+        rules_engine._load_vehicle_packages = AsyncMock(return_value=packages)
+        selected = [options[0].id, options[1].id]
+
+        for _ in range(3):
+            is_valid, errors = await rules_engine.validate_configuration(
+                vehicle_id, selected, []
+            )
+            assert is_valid is True
+            assert errors == []
+
+        rules_engine._load_vehicle_options.assert_awaited_once()
+        rules_engine._load_vehicle_packages.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_vehicle_tag_invalidation(
+        self, rules_engine, vehicle_id, options, packages
+    ):
+        """Test vehicle invalidations evict compiled rules."""
+        rules_engine._load_vehicle_options = AsyncMock(return_value=options)
+        rules_engine._load_vehicle_packages = AsyncMock(return_value=packages)
+
+        await rules_engine.get_compiled_rules(vehicle_id)
+        rules_engine.compiled_cache.invalidate_tags(vehicle_tag(vehicle_id))
+        await rules_engine.get_compiled_rules(vehicle_id)
+
+        assert rules_engine._load_vehicle_options.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_catalog_not_cached(self, rules_engine, vehicle_id):
+        """Test vehicles without options are not cached."""
+        rules_engine._load_vehicle_options = AsyncMock(return_value=[])
+
+        assert await rules_engine.get_compiled_rules(vehicle_id) is None
+        assert len(rules_engine.compiled_cache) == 0
+        assert rules_engine.invalidate_compiled_rules(vehicle_id) is False
@@ -0,0 +1,284 @@
+"""
+Test suite for incremental configuration validation.
+
+Tests cover signed validation state tokens, parity of incremental results
+with full validation across a sequence of changes, rechecking only the
+constraints a change touches, and the disabled and required options
+returned for configurator UIs.
+"""
+
+import dataclasses
+import random
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.local_cache import LocalCache
+from src.database.models.package import Package
+from src.database.models.vehicle_option import VehicleOption
+from src.services.configuration.business_rules import ConfigurationRulesEngine
+from src.services.configuration.service import (
+    ConfigurationService,
+    ConfigurationServiceError,
+)
+from src.services.configuration.validation_state import (
+    InvalidValidationStateError,
+    ValidationState,
+    decode_validation_state,
+    encode_validation_state,
+)
+
+
+def make_option(name, is_required=False, excludes=(), requires=()):
+    """Build a vehicle option with the given rule edges."""
+    return VehicleOption(
+        id=uuid.uuid4(),
+        name=name,
+        category="general",
+        price=Decimal("100.00"),
+        is_required=is_required,
+        mutually_exclusive_with=list(excludes),
+        required_options=list(requires),
+    )
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def vehicle_id():
+    """Generate test vehicle ID."""
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def options():
+    """Create options with exclusivity and a requirement chain."""
+    paint = make_option("Paint", is_required=True)
+    sunroof = make_option("Sunroof")
+    roof_rack = make_option("Roof Rack", excludes=[sunroof.id])
+    trailer = make_option("Trailer Hitch")
+    tow = make_option("Tow Package", requires=[trailer.id])
+    cooling = make_option("Heavy Cooling", requires=[tow.id])
+    crossbars = make_option("Crossbars", requires=[roof_rack.id])
+    return [paint, sunroof, roof_rack, trailer, tow, cooling, crossbars]
+
+
+@pytest.fixture
+def packages(options):
+    """Create a package restricted to one trim."""
+    return [
+        Package(
+            id=uuid.uuid4(),
+            name="Adventure Package",
+            description="Roof and towing",
+            base_price=Decimal("900.00"),
+            included_options=[options[2].id, options[4].id],
+            trim_compatibility=["Sport"],
+            model_year_compatibility=[],
+        ),
+    ]
+
+
+@pytest.fixture
+def rules_engine(options, packages):
+    """Create rules engine over the fixture catalog."""
+    cache = LocalCache(max_bytes=1024 * 1024, max_entries=10, default_ttl=60)
+    engine = ConfigurationRulesEngine(
+        session=AsyncMock(spec=AsyncSession), compiled_cache=cache
+    )
+    engine._load_vehicle_options = AsyncMock(return_value=options)
+    engine._load_vehicle_packages = AsyncMock(return_value=packages)
+    return engine
+
+
+# ============================================================================
+# Unit Tests - State Tokens
+# ============================================================================
+
+
+class TestValidationStateToken:
+    """Test encoding and verifying state tokens."""
+
+    def test_round_trip(self, vehicle_id):
+        """Test a token decodes to the state it was issued for."""
+        state = ValidationState(
+            vehicle_id=vehicle_id,
+            fingerprint="abc",
+            option_ids=(uuid.uuid4(),),
+            package_ids=(),
+            trim="Sport",
+            year=2024,
+            required_errors=("missing",),
+            exclusivity_errors={3: ("conflict",)},
+        )
+
+        assert decode_validation_state(encode_validation_state(state)) == state
+
+    def test_tampered_token_rejected(self, vehicle_id):
+        """Test a token whose payload was altered is rejected."""
+        state = ValidationState(
+            vehicle_id=vehicle_id, fingerprint="abc", option_ids=(), package_ids=()
+        )
+        payload, signature = encode_validation_state(state).split(".")
+
+        with pytest.raises(InvalidValidationStateError):
+            decode_validation_state(f"{payload}x.{signature}")
+        with pytest.raises(InvalidValidationStateError):
+            decode_validation_state("not-a-token")
+
+
+# ============================================================================
+# Unit Tests - Incremental Validation
+# ============================================================================
+
+
+class TestValidateIncremental:
+    """Test rechecking only the constraints a change touches."""
+
+    @pytest.mark.asyncio
+    async def test_matches_full_validation(
+        self, rules_engine, vehicle_id, options, packages
+    ):
+        """Test every step of a click sequence matches full validation."""
+        rng = random.Random(7)
+        option_ids = [option.id for option in options] + [uuid.uuid4()]
+        package_ids = [package.id for package in packages]
+        selected, selected_packages = [], []
+        previous = None
+
+        for _ in range(40):
+            choice = rng.choice(option_ids)
+            if choice in selected:
+                selected.remove(choice)
+            else:
+                selected.append(choice)
+            if rng.random() < 0.2:
+                selected_packages = [] if selected_packages else package_ids
+
+            previous, _, _ = await rules_engine.validate_incremental(
+                vehicle_id, selected, selected_packages, "Base", None, previous
+            )
+            _, errors = await rules_engine.validate_configuration(
+                vehicle_id, selected, selected_packages, trim="Base"
+            )
+
+            assert previous.errors == errors
+
+    @pytest.mark.asyncio
+    async def test_untouched_errors_reused(
+        self, rules_engine, vehicle_id, options
+    ):
+        """Test constraints unrelated to a change are not rechecked."""
+        state, _, _ = await rules_engine.validate_incremental(
+            vehicle_id, [options[0].id, options[1].id, options[2].id], []
+        )
+        marker = ("previously reported",)
+        stale = dataclasses.replace(state, exclusivity_errors={2: marker})
+
+        unrelated, _, _ = await rules_engine.validate_incremental(
+            vehicle_id,
+            [options[0].id, options[1].id, options[2].id, options[3].id],
+            [],
+            previous=stale,
+        )
+        touched, _, _ = await rules_engine.validate_incremental(
+            vehicle_id, [options[0].id, options[2].id], [], previous=stale
+        )
+
+        assert unrelated.exclusivity_errors == {2: marker}
+        assert touched.exclusivity_errors == {}
+
+    @pytest.mark.asyncio
+    async def test_changed_rules_revalidate(
+        self, rules_engine, vehicle_id, options
+    ):
+        """Test a state validated against other rules is not reused."""
+        state, _, _ = await rules_engine.validate_incremental(
+            vehicle_id, [options[0].id], []
+        )
+        stale = dataclasses.replace(
+            state, fingerprint="outdated", dependency_errors={0: ("bogus",)}
+        )
+
+        fresh, _, _ = await rules_engine.validate_incremental(
+            vehicle_id, [options[0].id], [], previous=stale
+        )
+
+        assert fresh.dependency_errors == {}
+
+    @pytest.mark.asyncio
+    async def test_disabled_and_required_options(
+        self, rules_engine, vehicle_id, options, packages
+    ):
+        """Test conflicts disable options and requirements are reported."""
+        _, disabled, required = await rules_engine.validate_incremental(
+            vehicle_id, [options[1].id, options[5].id], []
+        )
+
+        # Roof Rack conflicts with Sunroof; Crossbars requires Roof Rack
+        assert disabled == [options[2].id, options[6].id]
+        # Paint is required; Heavy Cooling needs Tow Package and Trailer Hitch
+        assert required == [options[0].id, options[3].id, options[4].id]
+
+        _, _, required = await rules_engine.validate_incremental(
+            vehicle_id, [options[0].id], [packages[0].id]
+        )
+
+        assert required == [options[2].id, options[3].id, options[4].id]
+
+
+# ============================================================================
+# Integration Tests - Service
+# ============================================================================
+
+
+class TestValidateConfigurationChanges:
+    """Test applying changes through the configuration service."""
+
+    @pytest.fixture
+    def service(self, rules_engine):
+        """Create configuration service using the fixture rules engine."""
+        service = ConfigurationService(
+            session=AsyncMock(spec=AsyncSession), enable_caching=False
+        )
+        service.rules_engine = rules_engine
+        return service
+
+    @pytest.mark.asyncio
+    async def test_changes_applied_to_token_selection(
+        self, service, vehicle_id, options
+    ):
+        """Test added and removed options update the token's selection."""
+        first = await service.validate_configuration_changes(
+            vehicle_id, selected_option_ids=[options[0].id, options[1].id]
+        )
+        second = await service.validate_configuration_changes(
+            vehicle_id,
+            state_token=first["state_token"],
+            added_option_ids=[options[2].id],
+            removed_option_ids=[options[1].id],
+        )
+
+        assert first["is_valid"] is True
+        assert second["selected_options"] == [str(options[0].id), str(options[2].id)]
+        assert second["is_valid"] is True
+
+    @pytest.mark.asyncio
+    async def test_token_for_other_vehicle_rejected(
+        self, service, vehicle_id, options
+    ):
+        """Test a token cannot be replayed against another vehicle."""
+        result = await service.validate_configuration_changes(
+            vehicle_id, selected_option_ids=[options[0].id]
+        )
+
+        with pytest.raises(ConfigurationServiceError):
+            await service.validate_configuration_changes(
+                uuid.uuid4(), state_token=result["state_token"]
+            )
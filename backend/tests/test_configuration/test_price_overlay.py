@@ -0,0 +1,325 @@
+"""
+Test suite for dealer price overlays.
+
+Tests cover compiling dealer overrides into price tables (regional
+precedence, effective dates and table lifetime), caching tables per dealer,
+evicting them on dealer configuration writes, and applying overrides in the
+pricing engine.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.local_cache import LocalCache
+from src.database.models.dealer_configuration import (
+    DealerOptionConfig,
+    DealerPackageConfig,
+)
+from src.database.models.package import Package
+from src.database.models.vehicle import Vehicle
+from src.database.models.vehicle_option import VehicleOption
+from src.services.configuration import price_overlay
+from src.services.configuration.price_overlay import (
+    DealerPriceResolver,
+    build_price_table,
+)
+from src.services.configuration.pricing_engine import (
+    PricingCalculationError,
+    PricingEngine,
+)
+from src.services.dealer_management.service import DealerManagementService
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+
+def make_config(
+    model, item_field, item_id, price, region=None, starts=-30, ends=None
+):
+    """Build a dealer configuration row effective relative to NOW in days."""
+    config = Mock(spec=model)
+    config.id = uuid.uuid4()
+    setattr(config, item_field, item_id)
+    config.custom_price = Decimal(price)
+    config.region = region
+    config.effective_from = NOW + timedelta(days=starts)
+    config.effective_to = NOW + timedelta(days=ends) if ends is not None else None
+    return config
+
+
+def option_config(option_id, price, **kwargs):
+    """Build a dealer option override."""
+    return make_config(DealerOptionConfig, "option_id", option_id, price, **kwargs)
+
+
+def package_config(package_id, price, **kwargs):
+    """Build a dealer package override."""
+    return make_config(DealerPackageConfig, "package_id", package_id, price, **kwargs)
+
+
+def scalars_result(rows):
+    """Build a query result returning rows from scalars().all()."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def dealer_id():
+    """Generate test dealer ID."""
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Install a fresh process-wide dealer price cache."""
+    cache = LocalCache(max_bytes=1024 * 1024, max_entries=10, default_ttl=60)
+    monkeypatch.setattr(price_overlay, "_dealer_price_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def vehicle():
+    """Create vehicle without destination charge."""
+    vehicle = Mock(spec=Vehicle)
+    vehicle.id = uuid.uuid4()
+    vehicle.base_price = Decimal("30000.00")
+    vehicle.destination_charge = Decimal("0.00")
+    return vehicle
+
+
+@pytest.fixture
+def options():
+    """Create two options at list price."""
+    options = []
+    for name, price in [("Sunroof", "1200.00"), ("Tow Hitch", "400.00")]:
+        option = Mock(spec=VehicleOption)
+        option.id = uuid.uuid4()
+        option.name = name
+        option.price = Decimal(price)
+        options.append(option)
+    return options
+
+
+@pytest.fixture
+def package():
+    """Create package with a 10% discount."""
+    package = Mock(spec=Package)
+    package.id = uuid.uuid4()
+    package.name = "Convenience Package"
+    package.discount_percentage = Decimal("10.00")
+    return package
+
+
+# ============================================================================
+# Unit Tests - Price Tables
+# ============================================================================
+
+
+class TestBuildPriceTable:
+    """Test compiling overrides into price tables."""
+
+    def test_regional_override_preferred(self, dealer_id):
+        """Test overrides for the priced region win over general ones."""
+        option_id = uuid.uuid4()
+        table = build_price_table(
+            dealer_id,
+            [
+                option_config(option_id, "900.00"),
+                option_config(option_id, "850.00", region="CA"),
+            ],
+            [],
+            now=NOW,
+        )
+
+        assert table.option_price(option_id) == Decimal("900.00")
+        assert table.option_price(option_id, "ca") == Decimal("850.00")
+        assert table.option_price(option_id, "NY") == Decimal("900.00")
+        assert table.option_price(uuid.uuid4(), "CA") is None
+
+    def test_effective_dates(self, dealer_id):
+        """Test ended and future rows are ignored and bound the lifetime."""
+        option_id = uuid.uuid4()
+        table = build_price_table(
+            dealer_id,
+            [
+                option_config(option_id, "700.00", starts=-60, ends=-1),
+                option_config(option_id, "800.00", starts=-30),
+                option_config(option_id, "750.00", starts=-10, ends=20),
+                option_config(option_id, "600.00", starts=5),
+            ],
+            [],
+            now=NOW,
+        )
+
+        assert table.option_price(option_id) == Decimal("750.00")
+        assert table.expires_at == NOW + timedelta(days=5)
+        assert len(table.config_ids) == 3
+
+    def test_version_tracks_prices(self, dealer_id):
+        """Test the version changes exactly when prices change."""
+        option_id = uuid.uuid4()
+
+        def version(price):
+            return build_price_table(
+                dealer_id, [option_config(option_id, price)], [], now=NOW
+            ).version
+
+        assert version("500.00") == version("500.00")
+        assert version("500.00") != version("501.00")
+
+
+# ============================================================================
+# Integration Tests - Resolver Caching
+# ============================================================================
+
+
+class TestDealerPriceResolver:
+    """Test loading and caching dealer price tables."""
+
+    @pytest.mark.asyncio
+    async def test_table_loaded_once(self, cache, dealer_id):
+        """Test repeated lookups query each configuration table once."""
+        option_id = uuid.uuid4()
+        session = AsyncMock(spec=AsyncSession)
+        session.execute = AsyncMock(
+            side_effect=[
+                scalars_result([option_config(option_id, "900.00", starts=-1)]),
+                scalars_result([]),
+            ]
+        )
+        resolver = DealerPriceResolver(session)
+
+        for _ in range(3):
+            table = await resolver.get_price_table(dealer_id)
+
+        assert table.option_price(option_id) == Decimal("900.00")
+        assert session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_dealer_writes_evict_table(self, cache, dealer_id):
+        """Test pricing updates and deletes evict the dealer's table."""
+        option_id = uuid.uuid4()
+        config = option_config(option_id, "900.00", starts=-1)
+        config.dealer_id = dealer_id
+        session = AsyncMock(spec=AsyncSession)
+        # Each load queries option overrides, then package overrides
+        session.execute = AsyncMock(
+            side_effect=lambda stmt: scalars_result(
+                [config] if session.execute.await_count % 2 else []
+            )
+        )
+        resolver = DealerPriceResolver(session)
+        await resolver.get_price_table(dealer_id)
+
+        db = AsyncMock(spec=AsyncSession)
+        found = MagicMock()
+        found.scalar_one_or_none.return_value = config
+        db.execute = AsyncMock(return_value=found)
+        await DealerManagementService(db).update_option_pricing(
+            config.id, Decimal("950.00")
+        )
+
+        assert len(cache) == 0
+
+        await resolver.get_price_table(dealer_id)
+        deleted = MagicMock(rowcount=1)
+        db.execute = AsyncMock(return_value=deleted)
+        await DealerManagementService(db).delete_option_config(config.id)
+
+        assert len(cache) == 0
+
+
+# ============================================================================
+# Integration Tests - Pricing Engine
+# ============================================================================
+
+
+class TestDealerPricing:
+    """Test applying dealer overrides when pricing."""
+
+    @pytest.fixture
+    def table(self, dealer_id, options, package):
+        """Create dealer overrides for an option and the package."""
+        return build_price_table(
+            dealer_id,
+            [
+                option_config(options[0].id, "1000.00"),
+                option_config(options[0].id, "950.00", region="CA"),
+            ],
+            [package_config(package.id, "1250.00")],
+            now=NOW,
+        )
+
+    @pytest.fixture
+    def engine(self, table):
+        """Create pricing engine with a resolver returning the table."""
+        resolver = Mock(spec=DealerPriceResolver)
+        resolver.get_price_table = AsyncMock(return_value=table)
+        return PricingEngine(enable_caching=False, price_resolver=resolver)
+
+    @pytest.mark.asyncio
+    async def test_overrides_applied(
+        self, engine, dealer_id, vehicle, options, package
+    ):
+        """Test dealer prices replace list prices of options and packages."""
+        result = await engine.calculate_total_price(
+            vehicle,
+            options=options,
+            packages=[(package, options)],
+            region="CA",
+            include_tax=False,
+            dealer_id=dealer_id,
+        )
+
+        assert result["options_price"] == 1350.0  # 950 + 400
+        assert result["packages_price"] == 1250.0
+        assert result["packages_discount"] == 100.0  # 1350 - 1250
+        assert result["total"] == 32600.0
+
+    @pytest.mark.asyncio
+    async def test_list_prices_without_dealer(
+        self, engine, vehicle, options, package
+    ):
+        """Test pricing without a dealer is unchanged."""
+        result = await engine.calculate_total_price(
+            vehicle,
+            options=options,
+            packages=[(package, options)],
+            include_tax=False,
+        )
+
+        assert result["options_price"] == 1600.0
+        assert result["packages_price"] == 1440.0
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_price_version(
+        self, engine, table, dealer_id, vehicle
+    ):
+        """Test cached dealer prices are keyed by the table version."""
+        redis = AsyncMock()
+        redis.get_json = AsyncMock(return_value=None)
+        engine._enable_caching = True
+        engine._redis_client = redis
+
+        await engine.calculate_total_price(vehicle, dealer_id=dealer_id)
+
+        cache_key = redis.set_json.await_args.args[0]
+        assert cache_key.endswith(table.cache_token)
+
+    @pytest.mark.asyncio
+    async def test_dealer_pricing_requires_resolver(self, vehicle, dealer_id):
+        """Test dealer pricing fails without a resolver."""
+        engine = PricingEngine(enable_caching=False)
+
+        with pytest.raises(PricingCalculationError):
+            await engine.calculate_total_price(vehicle, dealer_id=dealer_id)
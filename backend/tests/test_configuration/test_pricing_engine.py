@@ -6,6 +6,7 @@ package discounts, tax calculations, total pricing, caching behavior,
 and regional pricing variations.
 """
 
+import asyncio
 import uuid
 from decimal import Decimal
 from datetime import datetime, timedelta
@@ -20,6 +21,7 @@ from src.services.configuration.pricing_engine import (
     PricingValidationError,
     PricingCalculationError,
 )
+from src.cache.single_flight import SingleFlight
 from src.database.models.vehicle import Vehicle
 from src.database.models.vehicle_option import VehicleOption
 from src.database.models.package import Package
@@ -37,6 +39,7 @@ def mock_redis_client():
     mock_client.get_json = AsyncMock(return_value=None)
     mock_client.set_json = AsyncMock()
     mock_client.delete_pattern = AsyncMock(return_value=0)
+    mock_client.invalidate_tags = AsyncMock(return_value=0)
     return mock_client
 
 
@@ -278,9 +281,21 @@ class TestCacheOperations:
         await pricing_engine._set_cached_price("test_key", price_data)
 
         mock_redis_client.set_json.assert_called_once_with(
-            "test_key", price_data, ex=3600
+            "test_key", price_data, ex=3600, tags=["pricing"]
         )
 
+    @pytest.mark.asyncio
+    async def test_set_cached_price_tags_vehicle(
+        self, pricing_engine, mock_redis_client
+    ):
+        """Test cached prices are tagged with their vehicle."""
+        vehicle_id = str(uuid.uuid4())
+
+        await pricing_engine._set_cached_price("test_key", {"vehicle_id": vehicle_id})
+
+        tags = mock_redis_client.set_json.call_args.kwargs["tags"]
+        assert tags == ["pricing", f"pricing:{vehicle_id}"]
+
     @pytest.mark.asyncio
     async def test_set_cached_price_error(self, pricing_engine, mock_redis_client):
         """Test setting cached price with error."""
@@ -937,6 +952,33 @@ class TestCachingBehavior:
         assert "total" in result
         # No cache operations should occur
 
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_calculate_once(
+        self, sample_vehicle, mock_redis_client
+    ):
+        """Test concurrent misses share one lookup, calculation and write."""
+        engine = PricingEngine(
+            redis_client=mock_redis_client, single_flight=SingleFlight()
+        )
+
+        async def slow_miss(key):
+            await asyncio.sleep(0.01)
+            return None
+
+        mock_redis_client.get_json.side_effect = slow_miss
+
+        with patch.object(
+            engine, "_price_configuration", wraps=engine._price_configuration
+        ) as price_configuration:
+            results = await asyncio.gather(
+                *(engine.calculate_total_price(sample_vehicle) for _ in range(5))
+            )
+
+        assert all(result == results[0] for result in results)
+        mock_redis_client.get_json.assert_awaited_once()
+        price_configuration.assert_called_once()
+        mock_redis_client.set_json.assert_awaited_once()
+
 
 # ============================================================================
 # Integration Tests - Cache Invalidation
@@ -952,35 +994,34 @@ class TestCacheInvalidation:
     ):
         """Test invalidating cache for specific vehicle."""
         vehicle_id = uuid.uuid4()
-        mock_redis_client.delete_pattern.return_value = 5
+        mock_redis_client.invalidate_tags.return_value = 5
 
         count = await pricing_engine.invalidate_cache(vehicle_id)
 
         assert count == 5
-        mock_redis_client.delete_pattern.assert_called_once()
-        pattern = mock_redis_client.delete_pattern.call_args[0][0]
-        assert str(vehicle_id) in pattern
+        mock_redis_client.invalidate_tags.assert_called_once_with(
+            f"pricing:{vehicle_id}"
+        )
+        mock_redis_client.delete_pattern.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_invalidate_cache_all_vehicles(
         self, pricing_engine, mock_redis_client
     ):
         """Test invalidating cache for all vehicles."""
-        mock_redis_client.delete_pattern.return_value = 100
+        mock_redis_client.invalidate_tags.return_value = 100
 
         count = await pricing_engine.invalidate_cache()
 
         assert count == 100
-        mock_redis_client.delete_pattern.assert_called_once()
-        pattern = mock_redis_client.delete_pattern.call_args[0][0]
-        assert "*" in pattern
+        mock_redis_client.invalidate_tags.assert_called_once_with("pricing")
 
     @pytest.mark.asyncio
     async def test_invalidate_cache_error_handling(
         self, pricing_engine, mock_redis_client
     ):
         """Test cache invalidation error handling."""
-        mock_redis_client.delete_pattern.side_effect = Exception("Redis error")
+        mock_redis_client.invalidate_tags.side_effect = Exception("Redis error")
 
         with patch("src.services.configuration.pricing_engine.logger") as mock_logger:
             count = await pricing_engine.invalidate_cache()
@@ -0,0 +1,318 @@
+"""
+Test suite for the configuration solver.
+
+Tests cover constraint propagation of partial selections, the cheapest
+completion, enumerating completions in price order, counting valid
+configurations against brute force enumeration, time budgets, and pricing
+completions through the configuration service.
+"""
+
+import random
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.local_cache import LocalCache
+from src.database.models.package import Package
+from src.database.models.vehicle_option import VehicleOption
+from src.services.configuration.business_rules import ConfigurationRulesEngine
+from src.services.configuration.constraint_graph import compile_rules, iter_bits
+from src.services.configuration.service import ConfigurationService
+from src.services.configuration.solver import ConfigurationSolver
+
+
+def make_option(name, price, is_required=False, excludes=(), requires=()):
+    """Build a vehicle option with the given price and rule edges."""
+    return VehicleOption(
+        id=uuid.uuid4(),
+        name=name,
+        category="general",
+        price=Decimal(price),
+        is_required=is_required,
+        mutually_exclusive_with=list(excludes),
+        required_options=list(requires),
+    )
+
+
+def make_solver(options, packages=(), time_budget=5.0):
+    """Compile a catalog and build a solver pricing options at list price."""
+    rules = compile_rules(uuid.uuid4(), options, packages)
+    return ConfigurationSolver(
+        rules, [option.price for option in options], time_budget=time_budget
+    )
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def vehicle_id():
+    """Generate test vehicle ID."""
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def options():
+    """Create priced options with exclusivity and a requirement chain."""
+    paint = make_option("Paint", "500.00", is_required=True)
+    sunroof = make_option("Sunroof", "1200.00")
+    roof_rack = make_option("Roof Rack", "300.00", excludes=[sunroof.id])
+    trailer = make_option("Trailer Hitch", "400.00")
+    tow = make_option("Tow Package", "800.00", requires=[trailer.id])
+    crossbars = make_option("Crossbars", "150.00", requires=[roof_rack.id])
+    return [paint, sunroof, roof_rack, trailer, tow, crossbars]
+
+
+@pytest.fixture
+def packages(options):
+    """Create a towing package restricted to one trim."""
+    return [
+        Package(
+            id=uuid.uuid4(),
+            name="Towing Package",
+            description="Hitch and towing",
+            base_price=Decimal("1000.00"),
+            included_options=[options[4].id],
+            trim_compatibility=["Sport"],
+            model_year_compatibility=[],
+        ),
+    ]
+
+
+# ============================================================================
+# Unit Tests - Propagation
+# ============================================================================
+
+
+class TestPropagation:
+    """Test propagating partial selections."""
+
+    def test_forced_and_free_options(self, options):
+        """Test requirements are forced and conflicting options dropped."""
+        solver = make_solver(options)
+
+        propagation = solver.propagate([options[5].id])
+
+        # Paint is required; Crossbars requires Roof Rack, excluding Sunroof
+        assert list(iter_bits(propagation.forced)) == [0, 2, 5]
+        assert list(iter_bits(propagation.free)) == [3, 4]
+
+    def test_package_options_forced(self, options, packages):
+        """Test package options and their requirements are forced."""
+        solver = make_solver(options, packages)
+
+        propagation = solver.propagate([], [packages[0].id], trim="Sport")
+
+        assert list(iter_bits(propagation.forced)) == [0, 3, 4]
+        assert propagation.has_packages is True
+
+    def test_infeasible_selections(self, options, packages):
+        """Test selections without valid completions are rejected."""
+        solver = make_solver(options, packages)
+
+        assert solver.propagate([options[1].id, options[2].id]) is None
+        assert solver.propagate([uuid.uuid4()]) is None
+        assert solver.propagate([], [packages[0].id], trim="Base") is None
+
+    def test_unpriced_options_never_added(self, options):
+        """Test options without a price and their dependents stay out."""
+        rules = compile_rules(uuid.uuid4(), options)
+        prices = [option.price for option in options]
+        prices[2] = None
+        solver = ConfigurationSolver(rules, prices, time_budget=5.0)
+
+        propagation = solver.propagate([])
+
+        assert list(iter_bits(propagation.free)) == [1, 3, 4]
+        assert solver.propagate([options[5].id]) is None
+
+
+# ============================================================================
+# Unit Tests - Completions
+# ============================================================================
+
+
+class TestCompletions:
+    """Test enumerating and counting completions."""
+
+    def test_cheapest_completion(self, options):
+        """Test the cheapest completion adds only what is required."""
+        solver = make_solver(options)
+        propagation = solver.propagate([options[4].id])
+
+        completions, complete = solver.top_completions(propagation, 1)
+
+        assert complete is True
+        assert completions[0].option_ids == (
+            options[0].id,
+            options[3].id,
+            options[4].id,
+        )
+        assert completions[0].added_option_ids == (options[0].id, options[3].id)
+        assert completions[0].options_price == Decimal("1700.00")
+
+    def test_completions_in_price_order(self, options):
+        """Test completions are distinct and ordered by price."""
+        solver = make_solver(options)
+        propagation = solver.propagate([])
+
+        completions, _ = solver.top_completions(propagation, 100)
+        prices = [completion.options_price for completion in completions]
+
+        assert prices == sorted(prices)
+        assert len({completion.option_mask for completion in completions}) == len(
+            completions
+        )
+        assert len(completions) == solver.count_completions(propagation)
+
+    @pytest.mark.asyncio
+    async def test_matches_brute_force(self):
+        """Test counts and completions match enumerating every subset."""
+        rng = random.Random(11)
+
+        for _ in range(30):
+            ids = [uuid.uuid4() for _ in range(rng.randint(1, 7))]
+
+            def edges(option_id):
+                return [o for o in ids if o != option_id and rng.random() < 0.2]
+
+            options = [
+                VehicleOption(
+                    id=option_id,
+                    name=f"Option {index}",
+                    category="general",
+                    price=Decimal(rng.randint(0, 50)),
+                    is_required=rng.random() < 0.1,
+                    mutually_exclusive_with=edges(option_id),
+                    required_options=edges(option_id),
+                )
+                for index, option_id in enumerate(ids)
+            ]
+            partial = [option_id for option_id in ids if rng.random() < 0.2]
+
+            engine = ConfigurationRulesEngine(session=AsyncMock(spec=AsyncSession))
+            engine._load_vehicle_options = AsyncMock(return_value=options)
+            engine._load_vehicle_packages = AsyncMock(return_value=[])
+
+            valid = set()
+            for mask in range(1 << len(ids)):
+                selected = [ids[index] for index in iter_bits(mask)]
+                if set(partial) <= set(selected):
+                    is_valid, _ = await engine.validate_configuration(
+                        None, selected, []
+                    )
+                    if is_valid:
+                        valid.add(mask)
+
+            solver = make_solver(options)
+            propagation = solver.propagate(partial)
+            if propagation is None:
+                assert not valid
+                continue
+
+            completions, complete = solver.top_completions(
+                propagation, len(valid) + 1
+            )
+
+            assert complete is True
+            assert solver.count_completions(propagation) == len(valid)
+            assert {completion.option_mask for completion in completions} == valid
+
+    def test_time_budget(self):
+        """Test exhausted budgets return partial results."""
+        options = [make_option(f"Option {index}", "10.00") for index in range(40)]
+        solver = make_solver(options, time_budget=0.0)
+        propagation = solver.propagate([])
+
+        completions, complete = solver.top_completions(propagation, 100000)
+
+        assert complete is False
+        assert 0 < len(completions) < 100000
+        # Independent options count without search
+        assert solver.count_completions(propagation) == 2**40 - 1
+
+
+# ============================================================================
+# Integration Tests - Service
+# ============================================================================
+
+
+class TestCompleteConfiguration:
+    """Test pricing completions through the configuration service."""
+
+    @pytest.fixture
+    def service(self, options, packages):
+        """Create configuration service over the fixture catalog."""
+        service = ConfigurationService(
+            session=AsyncMock(spec=AsyncSession), enable_caching=False
+        )
+
+        cache = LocalCache(max_bytes=1024 * 1024, max_entries=10, default_ttl=60)
+        service.rules_engine = ConfigurationRulesEngine(
+            session=service.session, compiled_cache=cache
+        )
+        service.rules_engine._load_vehicle_options = AsyncMock(return_value=options)
+        service.rules_engine._load_vehicle_packages = AsyncMock(
+            return_value=packages
+        )
+
+        service.repository = MagicMock()
+        service.repository.get_vehicle_options = AsyncMock(return_value=options)
+        service.repository.get_packages_by_ids = AsyncMock(return_value=packages)
+
+        vehicle = MagicMock(base_price=Decimal("30000.00"))
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = vehicle
+        service.session.execute = AsyncMock(return_value=result)
+
+        async def total_price(vehicle, options, packages, region=None, **kwargs):
+            total = vehicle.base_price + sum(option.price for option in options)
+            return {"total": total}
+
+        service.pricing_engine = MagicMock()
+        service.pricing_engine.calculate_option_price.side_effect = (
+            lambda option: option.price
+        )
+        service.pricing_engine.calculate_total_price = AsyncMock(
+            side_effect=total_price
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_completions_priced(self, service, vehicle_id, options):
+        """Test completions are priced by the pricing engine."""
+        result = await service.complete_configuration(
+            vehicle_id, [options[5].id], [], limit=3
+        )
+
+        assert result["feasible"] is True
+        assert result["cheapest"]["selected_options"] == [
+            str(options[0].id),
+            str(options[2].id),
+            str(options[5].id),
+        ]
+        assert result["cheapest"]["total"] == Decimal("30950.00")
+        assert [c["total"] for c in result["completions"]] == [
+            Decimal("30950.00"),
+            Decimal("31350.00"),
+            Decimal("32150.00"),
+        ]
+        # Trailer Hitch and Tow Package: without, hitch, or both
+        assert result["valid_configuration_count"] == 3
+        assert result["search_complete"] is True
+
+    @pytest.mark.asyncio
+    async def test_infeasible_selection(self, service, vehicle_id, options):
+        """Test conflicting selections report no completions."""
+        result = await service.complete_configuration(
+            vehicle_id, [options[1].id, options[2].id], []
+        )
+
+        assert result["feasible"] is False
+        assert result["cheapest"] is None
+        assert result["valid_configuration_count"] == 0
@@ -0,0 +1,415 @@
+"""
+Test suite for the transactional outbox and its relay.
+
+Tests cover recording events, collapsing events per vehicle, bulk upserts
+and deletes, cache invalidation, per-document and whole-batch failures with
+retry backoff, deferring vehicles locked by another relay, and running
+without Elasticsearch.
+"""
+
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.outbox import OutboxAggregate, OutboxEvent, OutboxEventType
+from src.services.cache.vehicle_cache import VehicleCache
+from src.services.outbox import relay as relay_module
+from src.services.outbox.relay import OutboxRelay
+from src.services.outbox.repository import OutboxRepository, vehicle_lock_key
+from src.services.search.vehicle_index import VehicleIndex, VehicleIndexError
+from src.services.vehicles.repository import VehicleRepository
+
+VEHICLE_A = uuid.UUID(int=1)
+VEHICLE_B = uuid.UUID(int=2)
+
+
+def make_event(event_id, aggregate, aggregate_id, event_type, payload=None):
+    """Create a pending outbox event."""
+    return OutboxEvent(
+        id=event_id,
+        aggregate_type=aggregate.value,
+        aggregate_id=aggregate_id,
+        event_type=event_type.value,
+        payload=payload or {},
+        created_at=datetime.now(timezone.utc) - timedelta(seconds=2),
+        attempts=0,
+    )
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_session():
+    """Create mock async database session."""
+    session = AsyncMock(spec=AsyncSession)
+    session.add = MagicMock()
+    return session
+
+
+@pytest.fixture
+def session_factory(mock_session):
+    """Create a session factory yielding the mock session."""
+
+    @asynccontextmanager
+    async def factory():
+        yield mock_session
+
+    return factory
+
+
+@pytest.fixture
+def mock_outbox(monkeypatch):
+    """
+    Replace the relay's outbox repository.
+
+    Returns:
+        AsyncMock: Mocked OutboxRepository
+    """
+    outbox = AsyncMock(spec=OutboxRepository)
+    outbox.mark_failed = MagicMock(
+        side_effect=lambda events, error, max_backoff: OutboxRepository.mark_failed(
+            outbox, events, error, max_backoff
+        )
+    )
+    outbox.MAX_ERROR_LENGTH = OutboxRepository.MAX_ERROR_LENGTH
+    outbox.lock_vehicles.side_effect = lambda vehicle_ids: set(vehicle_ids)
+    monkeypatch.setattr(relay_module, "OutboxRepository", lambda session: outbox)
+    return outbox
+
+
+@pytest.fixture
+def mock_vehicles(monkeypatch):
+    """
+    Replace the relay's vehicle repository; vehicle A exists, B was deleted.
+
+    Returns:
+        AsyncMock: Mocked VehicleRepository
+    """
+    repository = AsyncMock(spec=VehicleRepository)
+    repository.get_many_by_ids = AsyncMock(
+        return_value=[SimpleNamespace(id=VEHICLE_A, is_active=True)]
+    )
+    monkeypatch.setattr(relay_module, "VehicleRepository", lambda session: repository)
+    return repository
+
+
+@pytest.fixture
+def mock_index():
+    """
+    Create a mock vehicle index accepting every operation.
+
+    Returns:
+        AsyncMock: Mocked VehicleIndex
+    """
+    index = AsyncMock(spec=VehicleIndex)
+    index.bulk_index_documents = AsyncMock(
+        return_value={"total": 1, "success": 1, "failed": 0, "errors": []}
+    )
+    index.bulk_delete_documents = AsyncMock(
+        return_value={"total": 1, "success": 1, "failed": 0, "errors": []}
+    )
+    return index
+
+
+@pytest.fixture
+def mock_cache():
+    """
+    Create a mock vehicle cache.
+
+    Returns:
+        AsyncMock: Mocked VehicleCache
+    """
+    return AsyncMock(spec=VehicleCache)
+
+
+@pytest.fixture
+def relay(session_factory, mock_index, mock_cache, mock_outbox, mock_vehicles):
+    """Create a relay wired to the mocks."""
+    return OutboxRelay(
+        session_factory=session_factory,
+        vehicle_index=mock_index,
+        vehicle_cache=mock_cache,
+        build_document=lambda vehicle: {"id": str(vehicle.id)},
+        batch_size=10,
+        max_backoff=60,
+    )
+
+
+# ============================================================================
+# Unit Tests - Recording Events
+# ============================================================================
+
+
+class TestOutboxRepository:
+    """Test recording and rescheduling events."""
+
+    def test_add_uses_callers_session(self, mock_session):
+        """Test events join the transaction of the change they describe."""
+        outbox = OutboxRepository(mock_session)
+
+        event = outbox.add(
+            OutboxAggregate.INVENTORY,
+            VEHICLE_B,
+            OutboxEventType.UPSERTED,
+            payload={"vehicle_id": str(VEHICLE_A)},
+        )
+
+        mock_session.add.assert_called_once_with(event)
+        assert event.aggregate_type == "inventory"
+        assert event.payload == {"vehicle_id": str(VEHICLE_A)}
+
+    def test_mark_failed_backs_off_exponentially(self, mock_session):
+        """Test retry delay doubles per attempt up to the maximum."""
+        outbox = OutboxRepository(mock_session)
+        event = make_event(
+            1, OutboxAggregate.VEHICLE, VEHICLE_A, OutboxEventType.UPSERTED
+        )
+        event.attempts = 3
+
+        before = datetime.now(timezone.utc)
+        outbox.mark_failed([event], "timeout", max_backoff=10)
+
+        assert event.attempts == 4
+        assert event.last_error == "timeout"
+        delay = (event.available_at - before).total_seconds()
+        assert 9 <= delay <= 11
+
+
+    @pytest.mark.asyncio
+    async def test_lock_vehicles_returns_acquired(self, mock_session):
+        """Test only vehicles whose advisory lock was free are returned."""
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [vehicle_lock_key(VEHICLE_B)]
+        mock_session.execute = AsyncMock(return_value=result)
+
+        locked = await OutboxRepository(mock_session).lock_vehicles(
+            [VEHICLE_A, VEHICLE_B]
+        )
+
+        assert locked == {VEHICLE_B}
+        params = mock_session.execute.await_args.args[1]
+        assert sorted(params["keys"]) == sorted(
+            [vehicle_lock_key(VEHICLE_A), vehicle_lock_key(VEHICLE_B)]
+        )
+
+
+# ============================================================================
+# Unit Tests - Relay Batches
+# ============================================================================
+
+
+class TestProcessBatch:
+    """Test applying claimed events."""
+
+    @pytest.mark.asyncio
+    async def test_empty_outbox(self, relay, mock_outbox, mock_index):
+        """Test an empty outbox claims nothing and touches nothing."""
+        mock_outbox.claim_batch.return_value = []
+
+        assert await relay.process_batch() == 0
+        mock_index.bulk_index_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upserts_and_deletes_current_state(
+        self, relay, mock_outbox, mock_index, mock_cache
+    ):
+        """Test existing vehicles are indexed and deleted ones removed."""
+        events = [
+            make_event(1, OutboxAggregate.VEHICLE, VEHICLE_A, OutboxEventType.UPSERTED),
+            make_event(2, OutboxAggregate.VEHICLE, VEHICLE_B, OutboxEventType.DELETED),
+        ]
+        mock_outbox.claim_batch.return_value = events
+
+        assert await relay.process_batch() == 2
+
+        mock_index.bulk_index_documents.assert_awaited_once_with(
+            [(str(VEHICLE_A), {"id": str(VEHICLE_A)})]
+        )
+        mock_index.bulk_delete_documents.assert_awaited_once_with([str(VEHICLE_B)])
+        mock_outbox.mark_processed.assert_awaited_once_with(events)
+        assert mock_cache.invalidate_vehicle.await_count == 2
+        mock_cache.invalidate_vehicle_lists.assert_awaited_once()
+        mock_cache.invalidate_search_results.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_events_collapse_per_vehicle(
+        self, relay, mock_outbox, mock_index, mock_vehicles
+    ):
+        """Test vehicle and inventory events for one vehicle cause one write."""
+        events = [
+            make_event(1, OutboxAggregate.VEHICLE, VEHICLE_A, OutboxEventType.UPSERTED),
+            make_event(
+                2,
+                OutboxAggregate.INVENTORY,
+                uuid.uuid4(),
+                OutboxEventType.UPSERTED,
+                payload={"vehicle_id": str(VEHICLE_A)},
+            ),
+            make_event(3, OutboxAggregate.VEHICLE, VEHICLE_A, OutboxEventType.UPSERTED),
+        ]
+        mock_outbox.claim_batch.return_value = events
+
+        await relay.process_batch()
+
+        mock_vehicles.get_many_by_ids.assert_awaited_once_with([VEHICLE_A])
+        assert len(mock_index.bulk_index_documents.await_args.args[0]) == 1
+        mock_outbox.mark_processed.assert_awaited_once_with(events)
+
+    @pytest.mark.asyncio
+    async def test_rejected_document_is_retried_alone(
+        self, relay, mock_outbox, mock_index
+    ):
+        """Test only the events of a rejected document are rescheduled."""
+        events = [
+            make_event(1, OutboxAggregate.VEHICLE, VEHICLE_A, OutboxEventType.UPSERTED),
+            make_event(2, OutboxAggregate.VEHICLE, VEHICLE_B, OutboxEventType.DELETED),
+        ]
+        mock_outbox.claim_batch.return_value = events
+        mock_index.bulk_index_documents.return_value = {
+            "total": 1,
+            "success": 0,
+            "failed": 1,
+            "errors": [{"index": {"_id": str(VEHICLE_A), "status": 400}}],
+        }
+
+        await relay.process_batch()
+
+        mock_outbox.mark_processed.assert_awaited_once_with([events[1]])
+        assert events[0].attempts == 1
+        assert events[0].available_at > datetime.now(timezone.utc)
+        assert events[1].attempts == 0
+
+    @pytest.mark.asyncio
+    async def test_unbuildable_document_is_retried_alone(
+        self, relay, mock_outbox, mock_index, mock_vehicles
+    ):
+        """Test a row that cannot be converted does not fail its batch."""
+        vehicle_c = uuid.UUID(int=3)
+        mock_vehicles.get_many_by_ids.return_value = [
+            SimpleNamespace(id=VEHICLE_A, is_active=True),
+            SimpleNamespace(id=vehicle_c, is_active=True),
+        ]
+
+        def build_document(vehicle):
+            if vehicle.id == vehicle_c:
+                raise ValueError("invalid specifications")
+            return {"id": str(vehicle.id)}
+
+        relay._build_document = build_document
+        events = [
+            make_event(1, OutboxAggregate.VEHICLE, VEHICLE_A, OutboxEventType.UPSERTED),
+            make_event(2, OutboxAggregate.VEHICLE, vehicle_c, OutboxEventType.UPSERTED),
+            make_event(3, OutboxAggregate.VEHICLE, VEHICLE_B, OutboxEventType.DELETED),
+        ]
+        mock_outbox.claim_batch.return_value = events
+
+        await relay.process_batch()
+
+        mock_index.bulk_index_documents.assert_awaited_once_with(
+            [(str(VEHICLE_A), {"id": str(VEHICLE_A)})]
+        )
+        mock_outbox.mark_processed.assert_awaited_once_with([events[0], events[2]])
+        assert events[1].attempts == 1
+        assert relay.get_statistics()["failed_batches"] == 0
+
+    @pytest.mark.asyncio
+    async def test_vehicle_locked_elsewhere_is_deferred(
+        self, relay, mock_outbox, mock_index, mock_vehicles
+    ):
+        """Test events of a vehicle another relay is applying stay pending."""
+        events = [
+            make_event(1, OutboxAggregate.VEHICLE, VEHICLE_A, OutboxEventType.UPSERTED),
+            make_event(2, OutboxAggregate.VEHICLE, VEHICLE_B, OutboxEventType.DELETED),
+        ]
+        mock_outbox.claim_batch.return_value = events
+        mock_outbox.lock_vehicles.side_effect = lambda vehicle_ids: {VEHICLE_B}
+        mock_vehicles.get_many_by_ids.return_value = []
+
+        assert await relay.process_batch() == 1
+
+        mock_vehicles.get_many_by_ids.assert_awaited_once_with([VEHICLE_B])
+        mock_index.bulk_index_documents.assert_not_called()
+        mock_outbox.mark_processed.assert_awaited_once_with([events[1]])
+        assert events[0].attempts == 0
+        assert events[0].processed_at is None
+
+    @pytest.mark.asyncio
+    async def test_unavailable_search_reschedules_batch(
+        self, relay, mock_outbox, mock_index
+    ):
+        """Test an Elasticsearch outage keeps every event pending."""
+        events = [
+            make_event(1, OutboxAggregate.VEHICLE, VEHICLE_A, OutboxEventType.UPSERTED),
+        ]
+        mock_outbox.claim_batch.return_value = events
+        mock_index.bulk_index_documents.side_effect = VehicleIndexError(
+            "cluster unavailable"
+        )
+
+        assert await relay.process_batch() == 1
+
+        mock_outbox.mark_processed.assert_awaited_once_with([])
+        assert events[0].attempts == 1
+        assert "cluster unavailable" in events[0].last_error
+        assert relay.get_statistics()["failed_batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_without_search_only_invalidates_cache(
+        self, session_factory, mock_outbox, mock_vehicles, mock_cache, monkeypatch
+    ):
+        """Test the relay still invalidates caches when search is disabled."""
+        relay = OutboxRelay(
+            session_factory=session_factory,
+            vehicle_cache=mock_cache,
+            batch_size=10,
+        )
+        relay._search_enabled = False
+        events = [
+            make_event(1, OutboxAggregate.VEHICLE, VEHICLE_A, OutboxEventType.UPSERTED),
+        ]
+        mock_outbox.claim_batch.return_value = events
+
+        await relay.process_batch()
+
+        mock_vehicles.get_many_by_ids.assert_not_called()
+        mock_cache.invalidate_vehicle.assert_awaited_once_with(VEHICLE_A)
+        mock_outbox.mark_processed.assert_awaited_once_with(events)
+
+
+# ============================================================================
+# Unit Tests - Backlog
+# ============================================================================
+
+
+class TestBacklog:
+    """Test lag reporting."""
+
+    @pytest.mark.asyncio
+    async def test_backlog_reports_oldest_age(self, relay, mock_outbox):
+        """Test the backlog age is measured from the oldest pending event."""
+        mock_outbox.get_backlog.return_value = {
+            "pending": 4,
+            "oldest_created_at": datetime.now(timezone.utc) - timedelta(seconds=30),
+        }
+
+        backlog = await relay.update_backlog()
+
+        assert backlog["pending"] == 4
+        assert 29 <= backlog["oldest_age_seconds"] <= 31
+
+    @pytest.mark.asyncio
+    async def test_backlog_empty(self, relay, mock_outbox):
+        """Test a drained outbox reports no age."""
+        mock_outbox.get_backlog.return_value = {"pending": 0, "oldest_created_at": None}
+
+        backlog = await relay.update_backlog()
+
+        assert backlog == {"pending": 0, "oldest_age_seconds": None}
@@ -107,6 +107,7 @@ def mock_service():
     service.delete_configuration = AsyncMock()
     service.generate_share_token = AsyncMock()
     service.get_by_share_token = AsyncMock()
+    service.record_share_token = AsyncMock()
     return service
 
 
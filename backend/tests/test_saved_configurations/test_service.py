@@ -19,6 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from src.cache.negative_cache import NegativeCache
 from src.database.models.saved_configuration import SavedConfiguration
 from src.database.models.user import User
 from src.database.models.vehicle_configuration import VehicleConfiguration
@@ -81,9 +82,21 @@ async def mock_session() -> AsyncMock:
 
 
 @pytest.fixture
-def service(mock_session: AsyncMock) -> SavedConfigurationService:
+def mock_negative_cache() -> AsyncMock:
+    """Create mock negative cache that never short-circuits."""
+    negative_cache = AsyncMock(spec=NegativeCache)
+    negative_cache.is_missing = AsyncMock(return_value=False)
+    return negative_cache
+
+
+@pytest.fixture
+def service(
+    mock_session: AsyncMock, mock_negative_cache: AsyncMock
+) -> SavedConfigurationService:
     """Create SavedConfigurationService instance with mock session."""
-    return SavedConfigurationService(session=mock_session)
+    return SavedConfigurationService(
+        session=mock_session, negative_cache=mock_negative_cache
+    )
 
 
 @pytest.fixture
@@ -902,6 +915,7 @@ class TestShareTokenOperations:
         saved_config_id: UUID,
         user_id: UUID,
         mock_saved_config: SavedConfiguration,
+        mock_negative_cache: AsyncMock,
         share_token: str,
     ):
         """Test generating share token."""
@@ -920,6 +934,22 @@ class TestShareTokenOperations:
         assert token == share_token
         mock_saved_config.regenerate_share_token.assert_called_once()
         mock_session.flush.assert_called_once()
+        # Recorded by the caller once the token is committed
+        mock_negative_cache.record_created.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_record_share_token(
+        self,
+        service: SavedConfigurationService,
+        mock_negative_cache: AsyncMock,
+        share_token: str,
+    ):
+        """Test committed share tokens are made visible to lookups."""
+        await service.record_share_token(share_token)
+
+        mock_negative_cache.record_created.assert_awaited_once_with(
+            NegativeCache.SHARE_TOKEN, share_token
+        )
 
     @pytest.mark.asyncio
     async def test_generate_share_token_unauthorized(
@@ -970,6 +1000,7 @@ class TestShareTokenOperations:
         self,
         service: SavedConfigurationService,
         mock_session: AsyncMock,
+        mock_negative_cache: AsyncMock,
         share_token: str,
     ):
         """Test invalid share token."""
@@ -983,6 +1014,27 @@ class TestShareTokenOperations:
             await service.get_by_share_token(share_token=share_token)
 
         assert exc_info.value.code == "INVALID_SHARE_TOKEN"
+        mock_negative_cache.mark_missing.assert_awaited_once_with(
+            NegativeCache.SHARE_TOKEN, share_token
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_by_share_token_known_missing_skips_query(
+        self,
+        service: SavedConfigurationService,
+        mock_session: AsyncMock,
+        mock_negative_cache: AsyncMock,
+        share_token: str,
+    ):
+        """Test known-missing tokens are rejected without a database query."""
+        # Arrange
+        mock_negative_cache.is_missing.return_value = True
+
+        # Act & Assert
+        with pytest.raises(InvalidShareTokenError):
+            await service.get_by_share_token(share_token=share_token)
+
+        mock_session.execute.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_by_share_token_not_shareable(
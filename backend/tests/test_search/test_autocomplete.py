@@ -0,0 +1,238 @@
+"""
+Test suite for the in-process autocomplete index.
+
+Tests cover prefix and word matching, popularity ranking, case merging,
+rebuilding from the catalog and access counts, staleness, and serving
+suggestions from the index with the Elasticsearch fuzzy fallback.
+"""
+
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.cache.redis_client import RedisClient
+from src.services.search.autocomplete import AutocompleteIndex
+from src.services.search.elasticsearch_client import ElasticsearchClient
+from src.services.search.search_service import VehicleSearchService
+from src.services.search.vehicle_index import VehicleIndex
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def autocomplete():
+    """Create an autocomplete index built from a small vocabulary."""
+    index = AutocompleteIndex(popular_vehicles=0, max_age=60)
+    index.build(
+        {
+            "make": {"Toyota": 10, "Tesla": 30, "TOYOTA": 1, "Land Rover": 5},
+            "model": {"Grand Cherokee": 3, "Cherokee": 8, "Camry": 9},
+        }
+    )
+    return index
+
+
+@pytest.fixture
+def mock_repository():
+    """Create a mock vehicle repository."""
+    repository = AsyncMock()
+    repository.get_make_model_counts.return_value = [
+        ("Toyota", "Camry", 4),
+        ("Honda", "Civic", 6),
+    ]
+    repository.get_make_model_by_ids.return_value = {}
+    return repository
+
+
+@pytest.fixture
+def session_factory():
+    """Create a session factory yielding a mock session."""
+
+    @asynccontextmanager
+    async def factory():
+        yield MagicMock()
+
+    return factory
+
+
+@pytest.fixture
+def mock_es_client():
+    """Create mock Elasticsearch client."""
+    client = MagicMock(spec=ElasticsearchClient)
+    client.client = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def search_service(mock_es_client, autocomplete):
+    """Create a search service backed by the autocomplete index."""
+    index = MagicMock(spec=VehicleIndex)
+    index.index_name = "vehicles"
+    return VehicleSearchService(
+        client=mock_es_client,
+        index=index,
+        autocomplete=autocomplete,
+    )
+
+
+# ============================================================================
+# Unit Tests - Lookups
+# ============================================================================
+
+
+class TestLookup:
+    """Test prefix lookups."""
+
+    def test_prefix_ranked_by_popularity(self, autocomplete):
+        """Test matches are ordered by weight, case-insensitively."""
+        assert [s.text for s in autocomplete.suggest("make", "t")] == [
+            "Tesla",
+            "Toyota",
+        ]
+
+    def test_case_variants_merged(self, autocomplete):
+        """Test case variants share one entry with the summed weight."""
+        [toyota] = autocomplete.suggest("make", "TOY")
+
+        assert toyota.text == "Toyota"
+        assert toyota.weight == 11
+
+    def test_later_words_match(self, autocomplete):
+        """Test a term is found by the start of a later word."""
+        assert [s.text for s in autocomplete.suggest("model", "cher")] == [
+            "Cherokee",
+            "Grand Cherokee",
+        ]
+        assert [s.text for s in autocomplete.suggest("make", "rov")] == ["Land Rover"]
+
+    def test_limit_and_misses(self, autocomplete):
+        """Test the limit applies and unknown prefixes return nothing."""
+        assert len(autocomplete.suggest("model", "c", limit=1)) == 1
+        assert autocomplete.suggest("model", "xyz") == []
+        assert autocomplete.suggest("trim", "ca") == []
+
+
+# ============================================================================
+# Unit Tests - Refresh
+# ============================================================================
+
+
+class TestRefresh:
+    """Test rebuilding the index."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_ranks_by_access_counts(
+        self, session_factory, mock_repository, monkeypatch
+    ):
+        """Test access counts of popular vehicles raise their terms."""
+        vehicle_id = uuid.uuid4()
+        redis = AsyncMock(spec=RedisClient)
+        redis.zrevrange.return_value = [(str(vehicle_id), 10.0)]
+        mock_repository.get_make_model_by_ids.return_value = {
+            vehicle_id: ("Toyota", "Camry")
+        }
+        monkeypatch.setattr(
+            "src.services.search.autocomplete.VehicleRepository",
+            lambda session: mock_repository,
+        )
+        index = AutocompleteIndex(
+            session_factory=session_factory,
+            redis_client=redis,
+            popular_vehicles=100,
+        )
+
+        terms = await index.refresh()
+
+        assert terms == 4
+        assert [s.text for s in index.suggest("model", "c")] == ["Camry", "Civic"]
+        assert not index.needs_refresh()
+
+    @pytest.mark.asyncio
+    async def test_refresh_without_redis_uses_vehicle_counts(
+        self, session_factory, mock_repository, monkeypatch
+    ):
+        """Test an unavailable Redis falls back to vehicle counts."""
+        redis = AsyncMock(spec=RedisClient)
+        redis.zrevrange.side_effect = ConnectionError("Redis down")
+        monkeypatch.setattr(
+            "src.services.search.autocomplete.VehicleRepository",
+            lambda session: mock_repository,
+        )
+        index = AutocompleteIndex(
+            session_factory=session_factory,
+            redis_client=redis,
+            popular_vehicles=100,
+        )
+
+        await index.refresh()
+
+        assert [s.text for s in index.suggest("model", "c")] == ["Civic", "Camry"]
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_index_stale(
+        self, session_factory, mock_repository, monkeypatch
+    ):
+        """Test a failed rebuild keeps the old index and retries."""
+        mock_repository.get_make_model_counts.side_effect = RuntimeError("db down")
+        monkeypatch.setattr(
+            "src.services.search.autocomplete.VehicleRepository",
+            lambda session: mock_repository,
+        )
+        index = AutocompleteIndex(session_factory=session_factory, popular_vehicles=0)
+
+        with pytest.raises(RuntimeError):
+            await index.refresh()
+
+        assert not index.is_ready
+        assert index.needs_refresh()
+
+    def test_mark_stale_and_max_age(self, autocomplete):
+        """Test staleness and age both trigger a rebuild."""
+        autocomplete._stale = False
+        assert not autocomplete.needs_refresh()
+
+        autocomplete.mark_stale()
+        assert autocomplete.needs_refresh()
+
+        autocomplete._stale = False
+        assert autocomplete.needs_refresh(now=autocomplete._built_at + 60)
+
+
+# ============================================================================
+# Integration Tests - Search Service
+# ============================================================================
+
+
+class TestServiceSuggest:
+    """Test suggestions through the search service."""
+
+    @pytest.mark.asyncio
+    async def test_prefix_served_without_elasticsearch(
+        self, search_service, mock_es_client
+    ):
+        """Test prefix matches never reach Elasticsearch."""
+        suggestions = await search_service.suggest("ca", field="model", limit=5)
+
+        assert suggestions == ["Camry"]
+        mock_es_client.client.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_match_falls_back_to_fuzzy(self, search_service, mock_es_client):
+        """Test a typo is resolved by the fuzzy completion suggester."""
+        mock_es_client.client.search.return_value = {
+            "suggest": {"make_suggest": [{"options": [{"text": "Toyota"}]}]}
+        }
+
+        suggestions = await search_service.suggest("Tyo", field="make", limit=3)
+
+        assert suggestions == ["Toyota"]
+        completion = mock_es_client.client.search.await_args.kwargs["suggest"][
+            "make_suggest"
+        ]["completion"]
+        assert completion["fuzzy"] == {"fuzziness": "AUTO"}
+        assert completion["size"] == 3
@@ -508,6 +508,24 @@ class TestElasticsearchIndexOperations:
         assert "Failed to create index" in str(exc_info.value)
         assert exc_info.value.context["status_code"] == 400
 
+    @pytest.mark.asyncio
+    async def test_create_index_exclusive_skips_existence_check(self, es_client):
+        """Test exist_ok=False leaves the existence check to the create request."""
+        es_client._client.indices.exists = AsyncMock(return_value=True)
+        es_client._client.indices.create = AsyncMock(
+            side_effect=ApiError(
+                "resource_already_exists_exception", MagicMock(status=400), {}
+            )
+        )
+
+        with pytest.raises(ElasticsearchIndexError) as exc_info:
+            await es_client.create_index("test-index", {}, exist_ok=False)
+
+        es_client._client.indices.exists.assert_not_called()
+        assert (
+            exc_info.value.context["reason"] == "resource_already_exists_exception"
+        )
+
     @pytest.mark.asyncio
     async def test_create_index_unexpected_error(self, es_client):
         """Test index creation unexpected error handling."""
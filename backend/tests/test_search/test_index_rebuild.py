@@ -0,0 +1,435 @@
+"""
+Test suite for versioned vehicle indexes behind the search alias.
+
+Tests cover bootstrapping the alias, blue/green rebuilds with the atomic
+alias swap, dual writes while a rebuild runs, failure cleanup and rollback.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from elasticsearch.exceptions import NotFoundError
+
+from src.services.search.elasticsearch_client import (
+    ElasticsearchClient,
+    ElasticsearchIndexError,
+)
+from src.services.search.vehicle_index import VehicleIndex, VehicleIndexError
+
+
+class FakeAliases:
+    """In-memory index/alias table mirroring the Elasticsearch alias API."""
+
+    def __init__(self, indices=None):
+        self.indices: dict[str, set[str]] = {
+            name: set(aliases) for name, aliases in (indices or {}).items()
+        }
+        self.settings: dict[str, dict] = {}
+        self.alias_updates: list[list[dict]] = []
+
+    async def get_aliases(self, index_pattern):
+        prefix = index_pattern.rstrip("*")
+        return {
+            name: sorted(aliases)
+            for name, aliases in self.indices.items()
+            if name.startswith(prefix)
+        }
+
+    async def create_index(
+        self, index_name, mappings, settings=None, aliases=None, exist_ok=True
+    ):
+        if index_name in self.indices:
+            if exist_ok:
+                return
+            raise ElasticsearchIndexError(
+                "Failed to create index",
+                index=index_name,
+                status_code=400,
+                reason="resource_already_exists_exception",
+            )
+        self.indices[index_name] = set(aliases or {})
+        self.settings[index_name] = dict(settings or {})
+
+    async def delete_index(self, index_name):
+        self.indices.pop(index_name, None)
+
+    async def put_settings(self, index_name, settings):
+        self.settings[index_name].update(settings)
+
+    async def update_aliases(self, actions):
+        self.alias_updates.append(actions)
+        for action in actions:
+            for verb, spec in action.items():
+                aliases = self.indices[spec["index"]]
+                if verb == "add":
+                    aliases.add(spec["alias"])
+                else:
+                    aliases.discard(spec["alias"])
+
+    def alias_targets(self, alias):
+        return sorted(name for name, aliases in self.indices.items() if alias in aliases)
+
+
+def not_found():
+    """Create an Elasticsearch 404 error."""
+    return NotFoundError(message="not found", meta=MagicMock(status=404), body={})
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clear_write_targets():
+    """Reset the process-wide write target cache between tests."""
+    VehicleIndex._write_targets_cache.clear()
+    yield
+    VehicleIndex._write_targets_cache.clear()
+
+
+@pytest.fixture
+def aliases():
+    """
+    Create an alias table with a live v1 index.
+
+    Returns:
+        FakeAliases: Alias table
+    """
+    return FakeAliases({"vehicles_v1": {"vehicles"}})
+
+
+@pytest.fixture
+def mock_es_client(aliases):
+    """
+    Create a mock Elasticsearch client backed by the alias table.
+
+    Returns:
+        AsyncMock: Mocked ElasticsearchClient
+    """
+    client = AsyncMock(spec=ElasticsearchClient)
+    client.get_aliases = AsyncMock(side_effect=aliases.get_aliases)
+    client.create_index = AsyncMock(side_effect=aliases.create_index)
+    client.delete_index = AsyncMock(side_effect=aliases.delete_index)
+    client.put_settings = AsyncMock(side_effect=aliases.put_settings)
+    client.update_aliases = AsyncMock(side_effect=aliases.update_aliases)
+    client.refresh_index = AsyncMock()
+    client.client = MagicMock()
+    client.client.index = AsyncMock()
+    client.client.update = AsyncMock()
+    client.client.delete = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def vehicle_index(mock_es_client):
+    """
+    Create a vehicle index that does not wait for other processes.
+
+    Returns:
+        VehicleIndex: Index manager
+    """
+    index = VehicleIndex(client=mock_es_client)
+    index.WRITE_TARGETS_TTL = 0
+    return index
+
+
+# ============================================================================
+# Unit Tests - Alias Bootstrap
+# ============================================================================
+
+
+class TestCreateIndex:
+    """Test creating the first version behind the alias."""
+
+    @pytest.mark.asyncio
+    async def test_creates_first_version_with_alias(self, mock_es_client):
+        """Test an empty cluster gets vehicles_v1 behind the alias."""
+        aliases = FakeAliases()
+        mock_es_client.get_aliases.side_effect = aliases.get_aliases
+        mock_es_client.create_index.side_effect = aliases.create_index
+        index = VehicleIndex(client=mock_es_client)
+
+        await index.create_index()
+
+        assert index.index_name == "vehicles"
+        assert aliases.alias_targets("vehicles") == ["vehicles_v1"]
+        assert aliases.settings["vehicles_v1"]["refresh_interval"] == "1s"
+
+    @pytest.mark.asyncio
+    async def test_attaches_alias_to_existing_version(self, mock_es_client):
+        """Test an index created before the alias existed is reused."""
+        aliases = FakeAliases({"vehicles_v1": set()})
+        mock_es_client.get_aliases.side_effect = aliases.get_aliases
+        mock_es_client.update_aliases.side_effect = aliases.update_aliases
+        index = VehicleIndex(client=mock_es_client)
+
+        await index.create_index()
+
+        mock_es_client.create_index.assert_not_called()
+        assert aliases.alias_targets("vehicles") == ["vehicles_v1"]
+
+    @pytest.mark.asyncio
+    async def test_existing_alias_is_left_alone(self, vehicle_index, mock_es_client):
+        """Test create_index is a no-op once the alias is live."""
+        await vehicle_index.create_index()
+
+        mock_es_client.create_index.assert_not_called()
+        mock_es_client.update_aliases.assert_not_called()
+
+
+# ============================================================================
+# Unit Tests - Rebuilds
+# ============================================================================
+
+
+class TestRebuild:
+    """Test blue/green rebuilds."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_swaps_alias_and_keeps_old_version(
+        self, vehicle_index, aliases
+    ):
+        """Test the new version is loaded with bulk settings, then swapped in."""
+        seen = {}
+
+        async def load(target):
+            seen["target"] = target
+            seen["settings"] = dict(aliases.settings[target])
+            seen["live"] = aliases.alias_targets("vehicles")
+            return {"indexed": 3, "failed": 0}
+
+        result = await vehicle_index.rebuild(load)
+
+        assert seen["target"] == "vehicles_v2"
+        assert seen["settings"]["refresh_interval"] == "-1"
+        assert seen["settings"]["number_of_replicas"] == 0
+        assert seen["live"] == ["vehicles_v1"]
+
+        assert result["index"] == "vehicles_v2"
+        assert result["previous"] == ["vehicles_v1"]
+        assert result["indexed"] == 3
+        assert aliases.alias_targets("vehicles") == ["vehicles_v2"]
+        assert aliases.alias_targets(VehicleIndex.BUILD_ALIAS) == []
+        assert aliases.settings["vehicles_v2"]["refresh_interval"] == "1s"
+        assert aliases.settings["vehicles_v2"]["number_of_replicas"] == 1
+        assert "vehicles_v1" in aliases.indices
+
+    @pytest.mark.asyncio
+    async def test_alias_swap_is_a_single_update(self, vehicle_index, aliases):
+        """Test the alias never points at no index or both indexes."""
+        await vehicle_index.rebuild(AsyncMock(return_value={}))
+
+        assert aliases.alias_updates == [
+            [
+                {"remove": {"index": "vehicles_v1", "alias": "vehicles"}},
+                {"add": {"index": "vehicles_v2", "alias": "vehicles"}},
+                {"remove": {"index": "vehicles_v2", "alias": VehicleIndex.BUILD_ALIAS}},
+            ]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_load_discards_new_version(self, vehicle_index, aliases):
+        """Test a failed load leaves the live index serving."""
+        load = AsyncMock(side_effect=RuntimeError("database went away"))
+
+        with pytest.raises(VehicleIndexError) as exc_info:
+            await vehicle_index.rebuild(load)
+
+        assert exc_info.value.code == "REBUILD_FAILED"
+        assert "vehicles_v2" not in aliases.indices
+        assert aliases.alias_targets("vehicles") == ["vehicles_v1"]
+
+    @pytest.mark.asyncio
+    async def test_load_with_failed_documents_is_not_swapped_in(
+        self, vehicle_index, aliases
+    ):
+        """Test documents rejected by the new version keep the old one live."""
+        load = AsyncMock(return_value={"indexed": 8, "failed": 2})
+
+        with pytest.raises(VehicleIndexError) as exc_info:
+            await vehicle_index.rebuild(load)
+
+        assert exc_info.value.code == "REBUILD_INCOMPLETE"
+        assert exc_info.value.context["failed"] == 2
+        assert "vehicles_v2" not in aliases.indices
+        assert aliases.alias_targets("vehicles") == ["vehicles_v1"]
+
+    @pytest.mark.asyncio
+    async def test_failed_documents_can_be_accepted(self, vehicle_index, aliases):
+        """Test allow_failures swaps in a partially loaded version."""
+        load = AsyncMock(return_value={"indexed": 8, "failed": 2})
+
+        result = await vehicle_index.rebuild(load, allow_failures=True)
+
+        assert result["failed"] == 2
+        assert aliases.alias_targets("vehicles") == ["vehicles_v2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_rebuild_is_refused(self, vehicle_index, aliases):
+        """Test a second rebuild does not start while one is running."""
+        aliases.indices["vehicles_v2"] = {VehicleIndex.BUILD_ALIAS}
+
+        with pytest.raises(VehicleIndexError) as exc_info:
+            await vehicle_index.rebuild(AsyncMock())
+
+        assert exc_info.value.code == "REBUILD_IN_PROGRESS"
+
+    @pytest.mark.asyncio
+    async def test_overlapping_rebuild_leaves_winner_alone(
+        self, vehicle_index, aliases, mock_es_client
+    ):
+        """Test a rebuild that loses the race for a version never deletes it."""
+
+        async def create_after_winner(index_name, *args, **kwargs):
+            # Another process created and swapped in vehicles_v2 after this
+            # rebuild read the index state
+            aliases.indices["vehicles_v2"] = {"vehicles"}
+            aliases.indices["vehicles_v1"] = set()
+            await aliases.create_index(index_name, *args, **kwargs)
+
+        mock_es_client.create_index.side_effect = create_after_winner
+        load = AsyncMock()
+
+        with pytest.raises(VehicleIndexError) as exc_info:
+            await vehicle_index.rebuild(load)
+
+        assert exc_info.value.code == "REBUILD_IN_PROGRESS"
+        load.assert_not_called()
+        mock_es_client.delete_index.assert_not_called()
+        assert aliases.alias_targets("vehicles") == ["vehicles_v2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_create_deletes_nothing(self, vehicle_index, mock_es_client):
+        """Test a version that could not be created is not cleaned up."""
+        mock_es_client.create_index.side_effect = ElasticsearchIndexError(
+            "Failed to create index", status_code=400, reason="mapper_parsing_exception"
+        )
+
+        with pytest.raises(VehicleIndexError) as exc_info:
+            await vehicle_index.rebuild(AsyncMock())
+
+        assert exc_info.value.code == "REBUILD_FAILED"
+        mock_es_client.delete_index.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_abort_rebuild_removes_leftover_version(
+        self, vehicle_index, aliases
+    ):
+        """Test an interrupted rebuild can be cleaned up."""
+        aliases.indices["vehicles_v2"] = {VehicleIndex.BUILD_ALIAS}
+
+        discarded = await vehicle_index.abort_rebuild()
+
+        assert discarded == ["vehicles_v2"]
+        assert "vehicles_v2" not in aliases.indices
+
+    @pytest.mark.asyncio
+    async def test_rollback_points_alias_at_previous_version(
+        self, vehicle_index, aliases
+    ):
+        """Test rollback swaps back to the newest older version."""
+        await vehicle_index.rebuild(AsyncMock(return_value={}))
+
+        live = await vehicle_index.rollback()
+
+        assert live == "vehicles_v1"
+        assert aliases.alias_targets("vehicles") == ["vehicles_v1"]
+
+    @pytest.mark.asyncio
+    async def test_rollback_without_previous_version_fails(self, vehicle_index):
+        """Test rollback refuses when there is nothing to go back to."""
+        with pytest.raises(VehicleIndexError) as exc_info:
+            await vehicle_index.rollback()
+
+        assert exc_info.value.code == "NO_PREVIOUS_INDEX"
+
+
+# ============================================================================
+# Unit Tests - Dual Writes
+# ============================================================================
+
+
+class TestDualWrites:
+    """Test document writes while a rebuild runs."""
+
+    @pytest.fixture
+    def rebuilding(self, aliases):
+        """Mark vehicles_v2 as being built."""
+        aliases.indices["vehicles_v2"] = {VehicleIndex.BUILD_ALIAS}
+
+    @pytest.mark.asyncio
+    async def test_index_document_writes_live_alias_only(
+        self, vehicle_index, mock_es_client
+    ):
+        """Test writes go through the alias when no rebuild runs."""
+        await vehicle_index.index_document("v-1", {"make": "Honda"})
+
+        indexed = [c.kwargs["index"] for c in mock_es_client.client.index.await_args_list]
+        assert indexed == ["vehicles"]
+
+    @pytest.mark.asyncio
+    async def test_index_document_writes_both_during_rebuild(
+        self, vehicle_index, mock_es_client, rebuilding
+    ):
+        """Test writes reach the live alias and the version being built."""
+        await vehicle_index.index_document("v-1", {"make": "Honda"})
+
+        indexed = [c.kwargs["index"] for c in mock_es_client.client.index.await_args_list]
+        assert indexed == ["vehicles", "vehicles_v2"]
+
+    @pytest.mark.asyncio
+    async def test_delete_document_reaches_new_version(
+        self, vehicle_index, mock_es_client, rebuilding
+    ):
+        """Test a delete missing from the live index still reaches the new one."""
+        mock_es_client.client.delete = AsyncMock(side_effect=[not_found(), None])
+
+        await vehicle_index.delete_document("v-1")
+
+        deleted = [c.kwargs["index"] for c in mock_es_client.client.delete.await_args_list]
+        assert deleted == ["vehicles", "vehicles_v2"]
+
+    @pytest.mark.asyncio
+    async def test_update_of_unloaded_document_is_ignored(
+        self, vehicle_index, mock_es_client, rebuilding
+    ):
+        """Test updates of documents not yet loaded into the new version pass."""
+        mock_es_client.client.update = AsyncMock(side_effect=[None, not_found()])
+
+        await vehicle_index.update_document("v-1", {"base_price": 30000})
+
+        assert mock_es_client.client.update.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_targets_fall_back_to_live_alias(
+        self, vehicle_index, mock_es_client
+    ):
+        """Test an alias lookup failure does not block writes."""
+        mock_es_client.get_aliases = AsyncMock(side_effect=RuntimeError("timeout"))
+
+        await vehicle_index.index_document("v-1", {"make": "Honda"})
+
+        indexed = [c.kwargs["index"] for c in mock_es_client.client.index.await_args_list]
+        assert indexed == ["vehicles"]
+
+    @pytest.mark.asyncio
+    async def test_create_only_load_counts_conflicts_as_skipped(self, vehicle_index):
+        """Test documents already written by dual writes are not overwritten."""
+        conflict = {"create": {"_id": "v-2", "status": 409}}
+        with patch(
+            "elasticsearch.helpers.async_bulk",
+            AsyncMock(return_value=(1, [conflict])),
+        ) as bulk:
+            result = await vehicle_index.bulk_index_documents(
+                [("v-1", {}), ("v-2", {})],
+                index_name="vehicles_v2",
+                op_type="create",
+            )
+
+        actions = bulk.await_args.args[1]
+        assert {action["_op_type"] for action in actions} == {"create"}
+        assert {action["_index"] for action in actions} == {"vehicles_v2"}
+        assert result["success"] == 1
+        assert result["skipped"] == 1
+        assert result["failed"] == 0
@@ -0,0 +1,321 @@
+"""
+Test suite for the streaming vehicle reindexer.
+
+Tests cover batching, resume checkpoints, out-of-order batch completion,
+backpressure between the database stream and the bulk workers, and failure
+handling.
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.cache.redis_client import RedisClient
+from src.services.search.reindexer import VehicleReindexer
+from src.services.search.vehicle_index import VehicleIndex, VehicleIndexError
+
+
+def make_vehicles(count: int) -> list[SimpleNamespace]:
+    """Create vehicle stand-ins with ascending ids."""
+    return [SimpleNamespace(id=uuid.UUID(int=i + 1)) for i in range(count)]
+
+
+class FakeRepository:
+    """Repository streaming a fixed vehicle list in id order."""
+
+    def __init__(self, vehicles):
+        self.vehicles = vehicles
+        self.streamed = 0
+        self.after_ids = []
+
+    async def stream_for_indexing(self, after_id=None, batch_size=1000):
+        self.after_ids.append(after_id)
+        for vehicle in self.vehicles:
+            if after_id is not None and vehicle.id <= after_id:
+                continue
+            self.streamed += 1
+            yield vehicle
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_redis_client():
+    """
+    Create a mock Redis client backed by a dict.
+
+    Returns:
+        AsyncMock: Mocked Redis client
+    """
+    store: dict[str, str] = {}
+
+    async def set_(key, value, ex=None):
+        store[key] = value
+        return True
+
+    async def delete(*keys):
+        return sum(store.pop(key, None) is not None for key in keys)
+
+    mock_client = AsyncMock(spec=RedisClient)
+    mock_client.store = store
+    mock_client.get = AsyncMock(side_effect=lambda key: store.get(key))
+    mock_client.set = AsyncMock(side_effect=set_)
+    mock_client.delete = AsyncMock(side_effect=delete)
+    return mock_client
+
+
+@pytest.fixture
+def mock_index():
+    """
+    Create a mock vehicle index that accepts every document.
+
+    Returns:
+        MagicMock: Mocked VehicleIndex
+    """
+    index = MagicMock(spec=VehicleIndex)
+    index.index_name = "vehicles"
+
+    async def bulk(documents, index_name=None, op_type="index"):
+        return {"total": len(documents), "success": len(documents), "failed": 0}
+
+    index.bulk_index_documents = AsyncMock(side_effect=bulk)
+    return index
+
+
+def make_reindexer(repository, index, redis, **overrides):
+    """Create a reindexer with small batches."""
+    options = {"batch_size": 2, "workers": 3, "queue_size": 2}
+    options.update(overrides)
+    return VehicleReindexer(
+        repository=repository,
+        index=index,
+        build_document=lambda vehicle: {"id": str(vehicle.id)},
+        redis_client=redis,
+        **options,
+    )
+
+
+# ============================================================================
+# Unit Tests - Reindex Runs
+# ============================================================================
+
+
+class TestReindexRun:
+    """Test full reindex runs."""
+
+    @pytest.mark.asyncio
+    async def test_indexes_every_vehicle_in_batches(
+        self, mock_index, mock_redis_client
+    ):
+        """Test all vehicles are sent in batch_size bulk requests."""
+        repository = FakeRepository(make_vehicles(5))
+        reindexer = make_reindexer(repository, mock_index, mock_redis_client)
+
+        stats = await reindexer.run()
+
+        assert stats["indexed"] == 5
+        assert stats["failed"] == 0
+        assert stats["docs_per_second"] > 0
+        sizes = sorted(
+            len(call.args[0]) for call in mock_index.bulk_index_documents.await_args_list
+        )
+        assert sizes == [1, 2, 2]
+        assert reindexer.checkpoint_key not in mock_redis_client.store
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_checkpoint(self, mock_index, mock_redis_client):
+        """Test an interrupted run continues after the stored checkpoint."""
+        vehicles = make_vehicles(6)
+        repository = FakeRepository(vehicles)
+        reindexer = make_reindexer(repository, mock_index, mock_redis_client)
+        mock_redis_client.store[reindexer.checkpoint_key] = str(vehicles[3].id)
+
+        stats = await reindexer.run()
+
+        assert repository.after_ids == [vehicles[3].id]
+        assert stats["indexed"] == 2
+        assert stats["resumed_from"] == str(vehicles[3].id)
+
+    @pytest.mark.asyncio
+    async def test_no_resume_starts_over(self, mock_index, mock_redis_client):
+        """Test resume=False ignores and clears the checkpoint."""
+        vehicles = make_vehicles(3)
+        repository = FakeRepository(vehicles)
+        reindexer = make_reindexer(repository, mock_index, mock_redis_client)
+        mock_redis_client.store[reindexer.checkpoint_key] = str(vehicles[1].id)
+
+        stats = await reindexer.run(resume=False)
+
+        assert repository.after_ids == [None]
+        assert stats["indexed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_document_build_failures_are_counted(
+        self, mock_index, mock_redis_client
+    ):
+        """Test rows that cannot be converted are skipped and counted."""
+        vehicles = make_vehicles(4)
+        repository = FakeRepository(vehicles)
+
+        def build(vehicle):
+            if vehicle.id == vehicles[1].id:
+                raise ValueError("invalid specifications")
+            return {"id": str(vehicle.id)}
+
+        reindexer = make_reindexer(repository, mock_index, mock_redis_client)
+        reindexer.build_document = build
+
+        stats = await reindexer.run()
+
+        assert stats["indexed"] == 3
+        assert stats["failed"] == 1
+        assert reindexer.checkpoint_key not in mock_redis_client.store
+
+    @pytest.mark.asyncio
+    async def test_rejected_documents_hold_checkpoint(
+        self, mock_index, mock_redis_client
+    ):
+        """Test a run with rejected documents resumes at their batch next time."""
+        vehicles = make_vehicles(6)
+        repository = FakeRepository(vehicles)
+
+        async def bulk(documents):
+            rejected = int(documents[0][0] == str(vehicles[2].id))
+            return {
+                "total": len(documents),
+                "success": len(documents) - rejected,
+                "failed": rejected,
+            }
+
+        mock_index.bulk_index_documents = AsyncMock(side_effect=bulk)
+        reindexer = make_reindexer(repository, mock_index, mock_redis_client)
+
+        stats = await reindexer.run()
+
+        assert stats["failed"] == 1
+        assert mock_redis_client.store[reindexer.checkpoint_key] == str(
+            vehicles[1].id
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_failure_stops_run_and_keeps_checkpoint(
+        self, mock_index, mock_redis_client
+    ):
+        """Test a failed bulk request aborts the run and leaves a resume point."""
+        vehicles = make_vehicles(8)
+        repository = FakeRepository(vehicles)
+        calls = 0
+
+        async def bulk(documents):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise VehicleIndexError("cluster unavailable")
+            return {"total": len(documents), "success": len(documents), "failed": 0}
+
+        mock_index.bulk_index_documents = AsyncMock(side_effect=bulk)
+        reindexer = make_reindexer(
+            repository, mock_index, mock_redis_client, workers=1, queue_size=1
+        )
+
+        with pytest.raises(VehicleIndexError):
+            await reindexer.run()
+
+        assert mock_redis_client.store[reindexer.checkpoint_key] == str(
+            vehicles[1].id
+        )
+
+
+# ============================================================================
+# Unit Tests - Pipeline Mechanics
+# ============================================================================
+
+
+class TestPipeline:
+    """Test checkpoint ordering and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_waits_for_contiguous_batches(
+        self, mock_index, mock_redis_client
+    ):
+        """Test the checkpoint never skips over an unfinished batch."""
+        reindexer = make_reindexer(FakeRepository([]), mock_index, mock_redis_client)
+        ids = [uuid.UUID(int=i) for i in (10, 20, 30)]
+
+        await reindexer._complete_batch(1, ids[1])
+        assert reindexer.checkpoint_key not in mock_redis_client.store
+
+        await reindexer._complete_batch(0, ids[0])
+        assert mock_redis_client.store[reindexer.checkpoint_key] == str(ids[1])
+
+        await reindexer._complete_batch(2, ids[2])
+        assert mock_redis_client.store[reindexer.checkpoint_key] == str(ids[2])
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_stops_at_failed_batch(
+        self, mock_index, mock_redis_client
+    ):
+        """Test later batches never move the checkpoint past a failed one."""
+        reindexer = make_reindexer(FakeRepository([]), mock_index, mock_redis_client)
+        ids = [uuid.UUID(int=i) for i in (10, 20, 30)]
+
+        await reindexer._complete_batch(0, ids[0])
+        await reindexer._complete_batch(1, ids[1], succeeded=False)
+        await reindexer._complete_batch(2, ids[2])
+
+        assert mock_redis_client.store[reindexer.checkpoint_key] == str(ids[0])
+
+    @pytest.mark.asyncio
+    async def test_producer_waits_for_slow_workers(
+        self, mock_index, mock_redis_client
+    ):
+        """Test a full queue stops the database stream from running ahead."""
+        repository = FakeRepository(make_vehicles(20))
+        release = asyncio.Event()
+
+        async def blocked_bulk(documents):
+            await release.wait()
+            return {"total": len(documents), "success": len(documents), "failed": 0}
+
+        mock_index.bulk_index_documents = AsyncMock(side_effect=blocked_bulk)
+        reindexer = make_reindexer(
+            repository,
+            mock_index,
+            mock_redis_client,
+            batch_size=1,
+            workers=1,
+            queue_size=1,
+        )
+
+        run = asyncio.create_task(reindexer.run())
+        await asyncio.sleep(0.05)
+
+        # One batch in flight, one queued and one waiting to be queued
+        assert repository.streamed <= 3
+
+        release.set()
+        stats = await run
+        assert stats["indexed"] == 20
+
+    @pytest.mark.asyncio
+    async def test_target_index_is_loaded_create_only(
+        self, mock_index, mock_redis_client
+    ):
+        """Test a rebuild load creates documents in the concrete new version."""
+        repository = FakeRepository(make_vehicles(3))
+        reindexer = make_reindexer(
+            repository, mock_index, mock_redis_client, target_index="vehicles_v2"
+        )
+
+        stats = await reindexer.run(resume=False)
+
+        assert stats["indexed"] == 3
+        assert reindexer.checkpoint_key.endswith(":vehicles_v2")
+        for call in mock_index.bulk_index_documents.await_args_list:
+            assert call.kwargs == {"index_name": "vehicles_v2", "op_type": "create"}
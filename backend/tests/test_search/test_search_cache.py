@@ -0,0 +1,226 @@
+"""
+Test suite for search result and facet caching.
+
+Tests cover canonical request fingerprints, price bucketing, serving pages
+and facets from the cache, and keeping facets separate from hit pages.
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.cache.redis_client import CacheKeyManager, RedisClient
+from src.schemas.vehicles import VehicleSearchRequest
+from src.services.cache.vehicle_cache import VehicleCache
+from src.services.search.elasticsearch_client import ElasticsearchClient
+from src.services.search.fingerprint import (
+    bucket_price_range,
+    fingerprint_search,
+)
+from src.services.search.search_service import SearchQueryError, VehicleSearchService
+from src.services.search.vehicle_index import VehicleIndex
+
+
+def make_response(total, aggregations=None):
+    """Build an Elasticsearch response without hits."""
+    response = {"hits": {"total": {"value": total, "relation": "eq"}, "hits": []}}
+    if aggregations is not None:
+        response["aggregations"] = aggregations
+    return response
+
+
+def facet_calls(mock_es_client):
+    """Get the aggregation-only searches sent to Elasticsearch."""
+    return [
+        call
+        for call in mock_es_client.client.search.await_args_list
+        if call.kwargs.get("size") == 0
+    ]
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def redis_store():
+    """Create the dictionary backing the mock Redis client."""
+    return {}
+
+
+@pytest.fixture
+def mock_redis_client(redis_store):
+    """
+    Create a mock Redis client storing JSON values in a dictionary.
+
+    Returns:
+        AsyncMock: Mocked Redis client
+    """
+    client = AsyncMock(spec=RedisClient)
+
+    async def get_json(key):
+        return redis_store.get(key)
+
+    async def set_json(key, value, ex=None, tags=None):
+        redis_store[key] = value
+        return True
+
+    client.get_json = AsyncMock(side_effect=get_json)
+    client.set_json = AsyncMock(side_effect=set_json)
+    return client
+
+
+@pytest.fixture
+def vehicle_cache(mock_redis_client):
+    """Create a vehicle cache over the mock Redis client."""
+    return VehicleCache(
+        redis_client=mock_redis_client,
+        key_manager=CacheKeyManager("test"),
+    )
+
+
+@pytest.fixture
+def mock_es_client():
+    """Create mock Elasticsearch client."""
+    client = MagicMock(spec=ElasticsearchClient)
+    client.client = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def search_service(mock_es_client, vehicle_cache):
+    """Create a cached search service with $1000 price buckets."""
+    index = MagicMock(spec=VehicleIndex)
+    index.index_name = "vehicles"
+    return VehicleSearchService(
+        client=mock_es_client,
+        index=index,
+        cache=vehicle_cache,
+        price_bucket=1000,
+    )
+
+
+# ============================================================================
+# Unit Tests - Fingerprints
+# ============================================================================
+
+
+class TestFingerprint:
+    """Test canonical request fingerprints."""
+
+    def test_equivalent_requests_share_fingerprint(self):
+        """Test query case, whitespace, decimals and key order are ignored."""
+        first = VehicleSearchRequest(
+            search_query="Toyota  Camry",
+            price_max=Decimal("30000"),
+            custom_attributes={"turbo": True, "doors": 4},
+        )
+        second = VehicleSearchRequest(
+            search_query="toyota camry",
+            price_max=Decimal("30000.00"),
+            custom_attributes={"doors": 4, "turbo": True},
+        )
+
+        assert fingerprint_search(first, 500) == fingerprint_search(second, 500)
+
+    def test_keyword_filters_keep_case(self):
+        """Test case-sensitive keyword filters are not merged."""
+        upper = fingerprint_search(VehicleSearchRequest(make="Toyota"), 500)
+        lower = fingerprint_search(VehicleSearchRequest(make="toyota"), 500)
+
+        assert upper.page_filters != lower.page_filters
+
+    def test_facets_ignore_page_and_sort(self):
+        """Test facet filters do not depend on the page or sort."""
+        first = fingerprint_search(VehicleSearchRequest(make="Ford", page=1), 500)
+        second = fingerprint_search(
+            VehicleSearchRequest(make="Ford", page=4, sort_by="year"), 500
+        )
+
+        assert first.facet_filters == second.facet_filters
+        assert first.page_filters != second.page_filters
+
+    def test_price_bounds_widen_to_buckets(self):
+        """Test price bounds snap outward to whole buckets."""
+        assert bucket_price_range(Decimal("23450"), Decimal("30100"), 500) == (
+            Decimal("23000"),
+            Decimal("30500"),
+        )
+        assert bucket_price_range(Decimal("23450"), None, 0) == (Decimal("23450"), None)
+
+
+# ============================================================================
+# Integration Tests - Cached Search
+# ============================================================================
+
+
+class TestCachedSearch:
+    """Test serving searches from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_page_served_from_cache(self, search_service, mock_es_client):
+        """Test an equivalent request does not reach Elasticsearch again."""
+        mock_es_client.client.search.return_value = make_response(3)
+
+        first = await search_service.search(
+            VehicleSearchRequest(search_query="Toyota Camry")
+        )
+        second = await search_service.search(
+            VehicleSearchRequest(search_query="toyota   camry")
+        )
+
+        assert mock_es_client.client.search.await_count == 1
+        assert second.total == first.total == 3
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_bypass_cache(self, search_service, mock_redis_client):
+        """Test cursor pages are neither read from nor written to the cache."""
+        with pytest.raises(SearchQueryError):
+            await search_service.search(VehicleSearchRequest(cursor="garbled"))
+
+        mock_redis_client.get_json.assert_not_called()
+        mock_redis_client.set_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_facets_cached_separately_with_longer_ttl(
+        self, search_service, mock_es_client, mock_redis_client
+    ):
+        """Test facets get their own entry and outlive hit pages."""
+        aggregations = {"makes": {"buckets": [{"key": "Ford", "doc_count": 2}]}}
+        mock_es_client.client.search.side_effect = lambda **kwargs: (
+            make_response(0, aggregations) if kwargs["size"] == 0 else make_response(2)
+        )
+
+        result = await search_service.faceted_search(VehicleSearchRequest(make="Ford"))
+
+        assert result["facets"]["makes"] == [{"value": "Ford", "count": 2}]
+        ttls = sorted(
+            call.kwargs["ex"] for call in mock_redis_client.set_json.await_args_list
+        )
+        assert ttls == [VehicleCache.SEARCH_RESULTS_TTL, VehicleCache.SEARCH_FACETS_TTL]
+        assert len(facet_calls(mock_es_client)) == 1
+
+    @pytest.mark.asyncio
+    async def test_next_page_reuses_cached_facets(self, search_service, mock_es_client):
+        """Test paging and nearby price bounds only fetch the hit page."""
+        mock_es_client.client.search.side_effect = lambda **kwargs: (
+            make_response(0, {}) if kwargs["size"] == 0 else make_response(40)
+        )
+
+        await search_service.faceted_search(
+            VehicleSearchRequest(make="Ford", price_max=Decimal("30100"))
+        )
+        await search_service.faceted_search(
+            VehicleSearchRequest(make="Ford", price_max=Decimal("30900"), page=2)
+        )
+
+        assert mock_es_client.client.search.await_count == 3
+        [facet_call] = facet_calls(mock_es_client)
+        price_filter = [
+            clause
+            for clause in facet_call.kwargs["query"]["bool"]["filter"]
+            if "range" in clause
+        ][0]
+        assert price_filter["range"]["base_price"] == {"lte": 31000.0}
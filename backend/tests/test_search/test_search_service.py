@@ -23,6 +23,11 @@ from src.services.search.elasticsearch_client import (
     ElasticsearchClient,
     ElasticsearchError,
 )
+from src.services.search.pagination import (
+    SearchCursor,
+    decode_search_cursor,
+    encode_search_cursor,
+)
 from src.services.search.search_service import (
     SearchError,
     SearchExecutionError,
@@ -746,6 +751,214 @@ class TestSearchFunctionality:
         assert "Unexpected search error" in str(exc_info.value)
 
 
+# ============================================================================
+# Integration Tests - Cursor Pagination
+# ============================================================================
+
+
+def make_page_response(sample_vehicle_data, count, total, relation="eq"):
+    """Build a search response of identical hits carrying sort values."""
+    hits = [
+        {
+            "_id": f"vehicle-{i}",
+            "_score": 1.0,
+            "_source": sample_vehicle_data,
+            "sort": [28500, f"vehicle-{i}"],
+        }
+        for i in range(count)
+    ]
+    return {"hits": {"total": {"value": total, "relation": relation}, "hits": hits}}
+
+
+@pytest.fixture
+def constructed_hits():
+    """Turn hits into responses without validating the sample source."""
+    with patch.object(
+        VehicleSearchService,
+        "_process_search_hit",
+        lambda self, hit: VehicleResponse.model_construct(make=hit["_id"]),
+    ):
+        yield
+
+
+@pytest.mark.usefixtures("constructed_hits")
+class TestCursorPagination:
+    """Test point-in-time cursor pagination and total tracking."""
+
+    @pytest.mark.asyncio
+    async def test_total_tracked_up_to_threshold(
+        self, mock_es_client, mock_vehicle_index, sample_vehicle_data
+    ):
+        """Test totals beyond the threshold are reported as a lower bound."""
+        service = VehicleSearchService(
+            client=mock_es_client,
+            index=mock_vehicle_index,
+            track_total_hits=1000,
+        )
+        mock_es_client.client.search.return_value = make_page_response(
+            sample_vehicle_data, 1, 1000, relation="gte"
+        )
+
+        result = await service.search(VehicleSearchRequest(page=1, page_size=20))
+
+        call_args = mock_es_client.client.search.call_args
+        assert call_args.kwargs["track_total_hits"] == 1000
+        assert call_args.kwargs["sort"][-1] == {"id": {"order": "asc"}}
+        assert result.total == 1000
+        assert result.total_is_estimate is True
+
+    @pytest.mark.asyncio
+    async def test_full_page_returns_cursor(
+        self, search_service, mock_es_client, sample_vehicle_data
+    ):
+        """Test a full first page issues a cursor without opening a PIT."""
+        mock_es_client.client.search.return_value = make_page_response(
+            sample_vehicle_data, 2, 5
+        )
+
+        result = await search_service.search(
+            VehicleSearchRequest(page=1, page_size=2, sort_by="price")
+        )
+
+        cursor = decode_search_cursor(result.next_cursor, "price", "asc")
+        assert cursor.page == 2
+        assert cursor.pit_id is None
+        assert cursor.search_after == [28500, "vehicle-1"]
+        assert cursor.total == 5
+        mock_es_client.client.open_point_in_time.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(
+        self, search_service, mock_es_client, sample_vehicle_data
+    ):
+        """Test a page reaching the exact total issues no cursor."""
+        mock_es_client.client.search.return_value = make_page_response(
+            sample_vehicle_data, 2, 4
+        )
+
+        result = await search_service.search(
+            VehicleSearchRequest(page=2, page_size=2)
+        )
+
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_continues_in_point_in_time(
+        self, search_service, mock_es_client, sample_vehicle_data
+    ):
+        """Test a cursor opens a PIT and searches after the last hit."""
+        mock_es_client.client.open_point_in_time.return_value = {"id": "pit-1"}
+        response = make_page_response(sample_vehicle_data, 2, 0)
+        response["pit_id"] = "pit-2"
+        mock_es_client.client.search.return_value = response
+        first = SearchCursor("price", "asc", [28500, "vehicle-1"], None, 2, 6, False)
+
+        result = await search_service.search(
+            VehicleSearchRequest(
+                sort_by="price",
+                page_size=2,
+                cursor=encode_search_cursor(first),
+            )
+        )
+
+        call_args = mock_es_client.client.search.call_args
+        assert call_args.kwargs["pit"]["id"] == "pit-1"
+        assert call_args.kwargs["search_after"] == [28500, "vehicle-1"]
+        assert call_args.kwargs["track_total_hits"] is False
+        assert "index" not in call_args.kwargs
+        assert "from_" not in call_args.kwargs
+        assert result.page == 2
+        assert result.total == 6
+
+        cursor = decode_search_cursor(result.next_cursor, "price", "asc")
+        assert cursor.pit_id == "pit-2"
+        assert cursor.page == 3
+
+    @pytest.mark.asyncio
+    async def test_last_cursor_page_closes_point_in_time(
+        self, search_service, mock_es_client, sample_vehicle_data
+    ):
+        """Test the PIT is released once the last page is served."""
+        mock_es_client.client.search.return_value = make_page_response(
+            sample_vehicle_data, 1, 0
+        )
+        cursor = SearchCursor("relevance", "asc", [1.0, "vehicle-1"], "pit-1", 3, 5, False)
+
+        result = await search_service.search(
+            VehicleSearchRequest(page_size=2, cursor=encode_search_cursor(cursor))
+        )
+
+        assert result.next_cursor is None
+        mock_es_client.client.open_point_in_time.assert_not_called()
+        mock_es_client.client.close_point_in_time.assert_awaited_once_with(id="pit-1")
+
+    @pytest.mark.asyncio
+    async def test_expired_point_in_time_is_reopened(
+        self, search_service, mock_es_client, sample_vehicle_data
+    ):
+        """Test an expired PIT is replaced and the page still served."""
+        mock_es_client.client.open_point_in_time.return_value = {"id": "pit-new"}
+        mock_es_client.client.search.side_effect = [
+            NotFoundError(message="expired", meta=MagicMock(status=404), body={}),
+            make_page_response(sample_vehicle_data, 1, 0),
+        ]
+        cursor = SearchCursor("relevance", "asc", [1.0, "vehicle-1"], "pit-old", 2, 3, False)
+
+        result = await search_service.search(
+            VehicleSearchRequest(page_size=2, cursor=encode_search_cursor(cursor))
+        )
+
+        assert len(result.items) == 1
+        call_args = mock_es_client.client.search.call_args
+        assert call_args.kwargs["pit"]["id"] == "pit-new"
+
+    @pytest.mark.asyncio
+    async def test_estimated_total_covers_returned_hits(
+        self, search_service, mock_es_client, sample_vehicle_data
+    ):
+        """Test a lower-bound total grows to cover pages past it."""
+        mock_es_client.client.search.return_value = make_page_response(
+            sample_vehicle_data, 2, 0
+        )
+        cursor = SearchCursor("relevance", "asc", [1.0, "vehicle-1"], "pit-1", 6, 10, True)
+
+        result = await search_service.search(
+            VehicleSearchRequest(page_size=2, cursor=encode_search_cursor(cursor))
+        )
+
+        assert result.total == 12
+        assert result.total_is_estimate is True
+        assert result.next_cursor is not None
+
+    @pytest.mark.asyncio
+    async def test_cursor_for_other_sort_rejected(self, search_service, mock_es_client):
+        """Test a cursor cannot be reused with a different sort."""
+        cursor = SearchCursor("price", "asc", [28500, "vehicle-1"], None, 2, 5, False)
+
+        with pytest.raises(SearchQueryError) as exc_info:
+            await search_service.search(
+                VehicleSearchRequest(sort_by="year", cursor=encode_search_cursor(cursor))
+            )
+
+        assert exc_info.value.code == "INVALID_QUERY"
+        mock_es_client.client.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_rejected(self, search_service):
+        """Test a garbled cursor is an invalid query."""
+        with pytest.raises(SearchQueryError):
+            await search_service.search(VehicleSearchRequest(cursor="not-a-cursor"))
+
+    @pytest.mark.asyncio
+    async def test_deep_offset_page_rejected(self, search_service, mock_es_client):
+        """Test offset pages past max_result_window point to cursors."""
+        with pytest.raises(SearchQueryError) as exc_info:
+            await search_service.search(VehicleSearchRequest(page=600, page_size=20))
+
+        assert "next_cursor" in str(exc_info.value)
+        mock_es_client.client.search.assert_not_called()
+
+
 # ============================================================================
 # Integration Tests - Faceted Search
 # ============================================================================
@@ -0,0 +1,237 @@
+"""
+Test suite for precomputed vehicle facet counts.
+
+Tests cover shaping GROUPING SETS rows like Elasticsearch facets, choosing
+between the materialized view and live grouping, and debounced refreshes
+of the view.
+"""
+
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services.vehicles.facet_counts import FacetCountRefresher
+from src.services.vehicles.repository import VehicleRepository
+
+
+def facet_row(**values):
+    """Build a facet query row with unset dimensions as NULL."""
+    row = {
+        "make": None,
+        "model": None,
+        "body_style": None,
+        "fuel_type": None,
+        "drivetrain": None,
+        "price_bucket": None,
+        "year_min": None,
+        "year_max": None,
+        "year_sum": None,
+        "price_min": None,
+        "price_max": None,
+        "price_sum": None,
+    }
+    row.update(values)
+    return row
+
+
+def compiled(statement) -> str:
+    """Compile a statement for PostgreSQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_session():
+    """Create mock async database session returning no facet rows."""
+    session = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    result.mappings.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.fixture
+def vehicle_repository(mock_session):
+    """Create VehicleRepository instance with mocked session."""
+    return VehicleRepository(session=mock_session)
+
+
+# ============================================================================
+# Unit Tests - Facet Shape
+# ============================================================================
+
+
+class TestFacetShape:
+    """Test shaping facet rows."""
+
+    def test_matches_elasticsearch_facets(self):
+        """Test terms, stats and histogram have the _process_facets shape."""
+        rows = [
+            facet_row(
+                make="Toyota", vehicle_count=3, year_min=2020, year_max=2024,
+                year_sum=6066, price_min=Decimal("21000"),
+                price_max=Decimal("39000"), price_sum=Decimal("90000"),
+            ),
+            facet_row(
+                make="Ford", vehicle_count=1, year_min=2019, year_max=2019,
+                year_sum=2019, price_min=Decimal("30000"),
+                price_max=Decimal("30000"), price_sum=Decimal("30000"),
+            ),
+            facet_row(model="Camry", vehicle_count=3),
+            facet_row(fuel_type="Hybrid", vehicle_count=4),
+            facet_row(price_bucket=Decimal("35000"), vehicle_count=1),
+            facet_row(price_bucket=Decimal("20000"), vehicle_count=3),
+        ]
+
+        facets = VehicleRepository._facets_from_rows(rows)
+
+        assert facets["makes"] == [
+            {"value": "Toyota", "count": 3},
+            {"value": "Ford", "count": 1},
+        ]
+        assert facets["models"] == [{"value": "Camry", "count": 3}]
+        assert facets["fuel_types"] == [{"value": "Hybrid", "count": 4}]
+        assert facets["body_styles"] == []
+        assert facets["year_range"] == {
+            "min": 2019.0, "max": 2024.0, "avg": 2021.25, "count": 4,
+        }
+        assert facets["price_range"] == {
+            "min": 21000.0, "max": 39000.0, "avg": 30000.0, "count": 4,
+        }
+        assert facets["price_histogram"] == [
+            {"range": 20000.0, "count": 3},
+            {"range": 35000.0, "count": 1},
+        ]
+
+    def test_term_sizes_and_ties(self):
+        """Test buckets are capped and ties ordered by value."""
+        rows = [
+            facet_row(fuel_type=f"Fuel {i:02d}", vehicle_count=1) for i in range(15)
+        ]
+
+        facets = VehicleRepository._facets_from_rows(rows)
+
+        assert len(facets["fuel_types"]) == 10
+        assert facets["fuel_types"][0]["value"] == "Fuel 00"
+
+    def test_empty_catalog(self):
+        """Test empty stats match Elasticsearch's empty stats."""
+        facets = VehicleRepository._facets_from_rows([])
+
+        assert facets["price_range"] == {
+            "min": None, "max": None, "avg": None, "count": 0,
+        }
+        assert facets["price_histogram"] == []
+
+
+# ============================================================================
+# Unit Tests - Query Source
+# ============================================================================
+
+
+class TestFacetSource:
+    """Test choosing the facet query source."""
+
+    @pytest.mark.asyncio
+    async def test_view_filters(self, vehicle_repository, mock_session):
+        """Test dimension filters read the view with bucketed prices."""
+        await vehicle_repository.get_facet_counts(
+            make="Toy", body_style="SUV", max_price=Decimal("30000")
+        )
+
+        sql = compiled(mock_session.execute.await_args.args[0])
+        assert "FROM vehicle_facet_counts" in sql
+        assert "GROUPING SETS" in sql
+        assert "vehicle_facet_counts.price_bucket <=" in sql
+        assert "FROM vehicles" not in sql
+
+    @pytest.mark.asyncio
+    async def test_query_groups_live(self, vehicle_repository, mock_session):
+        """Test free-text filters group matching vehicles instead."""
+        await vehicle_repository.get_facet_counts(query="camry hybrid")
+
+        sql = compiled(mock_session.execute.await_args.args[0])
+        assert "FROM vehicles" in sql
+        assert "search_vector" in sql
+        assert "vehicle_facet_counts" not in sql
+
+    @pytest.mark.asyncio
+    async def test_database_error(self, vehicle_repository, mock_session):
+        """Test database errors propagate."""
+        mock_session.execute.side_effect = SQLAlchemyError("down")
+
+        with pytest.raises(SQLAlchemyError):
+            await vehicle_repository.get_facet_counts()
+
+
+# ============================================================================
+# Unit Tests - Refresh
+# ============================================================================
+
+
+class TestFacetCountRefresher:
+    """Test debounced view refreshes."""
+
+    @pytest.fixture
+    def refresher(self, mock_session):
+        """Create a refresher over the mock session."""
+
+        @asynccontextmanager
+        async def factory():
+            yield mock_session
+
+        return FacetCountRefresher(
+            session_factory=factory, min_interval=60, max_age=3600
+        )
+
+    @pytest.mark.asyncio
+    async def test_refresh_runs_concurrently(self, refresher, mock_session):
+        """Test the view is refreshed without blocking readers."""
+        await refresher.refresh()
+
+        statement = str(mock_session.execute.await_args.args[0])
+        assert statement == "REFRESH MATERIALIZED VIEW CONCURRENTLY vehicle_facet_counts"
+        assert refresher.get_statistics()["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_view_waits_for_min_interval(self, refresher):
+        """Test bursts of changes cost one refresh per interval."""
+        assert refresher.needs_refresh()
+        await refresher.refresh()
+        refreshed_at = refresher._refreshed_at
+
+        refresher.mark_stale()
+
+        assert not refresher.needs_refresh(now=refreshed_at + 30)
+        assert refresher.needs_refresh(now=refreshed_at + 60)
+
+    @pytest.mark.asyncio
+    async def test_max_age_without_changes(self, refresher):
+        """Test an unchanged view is refreshed after its maximum age."""
+        await refresher.refresh()
+
+        assert not refresher.needs_refresh(now=refresher._refreshed_at + 600)
+        assert refresher.needs_refresh(now=refresher._refreshed_at + 3600)
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_stays_stale(self, refresher, mock_session):
+        """Test a failed refresh is retried."""
+        mock_session.execute.side_effect = SQLAlchemyError("down")
+
+        with pytest.raises(SQLAlchemyError):
+            await refresher.refresh()
+
+        assert refresher.get_statistics() == {
+            "refreshes": 0,
+            "failed_refreshes": 1,
+            "is_stale": True,
+        }
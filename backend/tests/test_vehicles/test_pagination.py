@@ -0,0 +1,102 @@
+"""
+Test suite for vehicle keyset pagination cursors.
+
+Tests cover cursor round trips for each keyset sort field, sort mismatch
+detection and rejection of malformed cursors.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.services.vehicles.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    supports_keyset,
+)
+
+
+# ============================================================================
+# Unit Tests - Cursor Encoding
+# ============================================================================
+
+
+class TestCursorEncoding:
+    """Test cursors round-trip the key they were issued for."""
+
+    @pytest.mark.parametrize(
+        "sort_by,value",
+        [
+            ("year", 2024),
+            ("make", "Toyota"),
+            ("base_price", Decimal("32500.00")),
+            ("created_at", datetime(2024, 1, 8, 10, 30, tzinfo=timezone.utc)),
+            ("id", uuid.UUID("6f1c2a9e-0d4b-4c1e-9a51-3f0f2d8b7c11")),
+        ],
+    )
+    def test_round_trip(self, sort_by, value):
+        """Test each keyset field decodes to its original typed value."""
+        vehicle_id = uuid.uuid4()
+
+        cursor = encode_cursor(sort_by, "desc", value, vehicle_id)
+
+        assert decode_cursor(cursor, sort_by, "desc") == (value, vehicle_id)
+
+    def test_cursor_is_url_safe(self):
+        """Test cursors need no escaping in query strings."""
+        cursor = encode_cursor("make", "asc", "Å+/?&", uuid.uuid4())
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    def test_supports_keyset(self):
+        """Test only non-nullable sort fields can be paged by key."""
+        assert supports_keyset("year")
+        assert not supports_keyset("horsepower")
+
+
+# ============================================================================
+# Unit Tests - Cursor Validation
+# ============================================================================
+
+
+class TestCursorValidation:
+    """Test cursors are rejected when they cannot be honored."""
+
+    def test_rejects_other_sort_field(self):
+        """Test a cursor cannot be reused with a different sort field."""
+        cursor = encode_cursor("year", "asc", 2024, uuid.uuid4())
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "base_price", "asc")
+
+    def test_rejects_other_sort_order(self):
+        """Test a cursor cannot be reused with the opposite direction."""
+        cursor = encode_cursor("year", "asc", 2024, uuid.uuid4())
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "year", "desc")
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            "e30",
+            encode_cursor("year", "asc", "abc", uuid.uuid4()),
+        ],
+    )
+    def test_rejects_malformed_cursor(self, cursor):
+        """Test tampered or garbled cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "year", "asc")
+
+    def test_rejects_field_without_keyset_support(self):
+        """Test cursors for nullable sort fields are never honored."""
+        cursor = encode_cursor("horsepower", "asc", 300, uuid.uuid4())
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "horsepower", "asc")
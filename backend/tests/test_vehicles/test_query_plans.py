@@ -0,0 +1,120 @@
+"""
+Query plan benchmark for vehicle search filters.
+
+Runs VehicleRepository.search against a real PostgreSQL database migrated to
+head and checks with EXPLAIN that each filter is answered from its
+index rather than a sequential scan. Sequential scans are disabled for the
+session so the check does not depend on table size or statistics.
+
+Set QUERY_PLAN_DATABASE_URL to an asyncpg URL to run these tests.
+"""
+
+import json
+import os
+from typing import AsyncGenerator
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.services.vehicles.repository import VehicleRepository
+
+DATABASE_URL = os.environ.get("QUERY_PLAN_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not DATABASE_URL,
+    reason="QUERY_PLAN_DATABASE_URL not set",
+)
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+async def plan_session() -> AsyncGenerator[tuple[AsyncSession, list], None]:
+    """
+    Create a session that records executed SQL with sequential scans disabled.
+
+    Yields:
+        tuple: Session and the list of recorded (statement, parameters)
+    """
+    engine = create_async_engine(DATABASE_URL)
+    statements: list = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    async with AsyncSession(engine) as session:
+        await session.execute(text("SET enable_seqscan = off"))
+        yield session, statements
+        await session.rollback()
+
+    await engine.dispose()
+
+
+async def explain_count_query(session: AsyncSession, statements: list) -> str:
+    """
+    Explain the recorded COUNT query of a search.
+
+    Args:
+        session: Session the search ran in
+        statements: Recorded (statement, parameters) pairs
+
+    Returns:
+        JSON text of the query plan
+    """
+    statement, parameters = next(
+        (sql, params) for sql, params in statements if "count(" in sql
+    )
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    plan = result.scalar_one()
+    return plan if isinstance(plan, str) else json.dumps(plan)
+
+
+# ============================================================================
+# Benchmark Tests - Index Usage
+# ============================================================================
+
+
+class TestSearchQueryPlans:
+    """Test search filters are planned as index scans."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "filters,index_name",
+        [
+            ({"make": "oyot"}, "ix_vehicles_make_trgm"),
+            ({"model": "amr"}, "ix_vehicles_model_trgm"),
+            ({"body_style": "suv"}, "ix_vehicles_body_style_lower"),
+            ({"fuel_type": "Electric"}, "ix_vehicles_fuel_type_lower"),
+            ({"query": "toyota cam"}, "ix_vehicles_search_vector"),
+            (
+                {"specifications": {"drivetrain": "AWD"}},
+                "ix_vehicles_specifications_path_ops",
+            ),
+            (
+                {"spec_ranges": {"horsepower": (300, None)}},
+                "ix_vehicles_spec_horsepower",
+            ),
+            (
+                {"spec_ranges": {"mpg_city": (20, 30)}},
+                "ix_vehicles_spec_mpg_city",
+            ),
+        ],
+    )
+    async def test_filter_uses_index(self, plan_session, filters, index_name):
+        """Test each filter is answered from its index."""
+        session, statements = plan_session
+        repository = VehicleRepository(session=session)
+
+        await repository.search(**filters, limit=10)
+
+        plan = await explain_count_query(session, statements)
+        assert index_name in plan
+        assert "Seq Scan" not in plan
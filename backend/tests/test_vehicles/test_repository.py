@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -236,6 +237,83 @@ async def test_get_by_id_excludes_deleted(
     assert result is None
 
 
+# ============================================================================
+# Unit Tests - get_many_by_ids
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_get_many_by_ids_single_query(
+    vehicle_repository: VehicleRepository,
+    mock_session: AsyncMock,
+    sample_vehicles: list[Vehicle],
+):
+    """Test bulk retrieval uses one IN query for all IDs."""
+    # Arrange
+    vehicle_ids = [v.id for v in sample_vehicles]
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = sample_vehicles
+    mock_session.execute.return_value = mock_result
+
+    # Act
+    result = await vehicle_repository.get_many_by_ids(
+        vehicle_ids, include_inventory=True
+    )
+
+    # Assert
+    assert result == sample_vehicles
+    mock_session.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_many_by_ids_chunks_large_requests(
+    vehicle_repository: VehicleRepository,
+    mock_session: AsyncMock,
+):
+    """Test IDs beyond the chunk size are fetched in several queries."""
+    # Arrange
+    vehicle_ids = [uuid.uuid4() for _ in range(5)]
+    vehicle_repository.BULK_FETCH_CHUNK_SIZE = 2
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = []
+    mock_session.execute.return_value = mock_result
+
+    # Act
+    result = await vehicle_repository.get_many_by_ids(vehicle_ids + vehicle_ids)
+
+    # Assert
+    assert result == []
+    assert mock_session.execute.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_many_by_ids_empty(
+    vehicle_repository: VehicleRepository,
+    mock_session: AsyncMock,
+):
+    """Test bulk retrieval without IDs does not query."""
+    # Act
+    result = await vehicle_repository.get_many_by_ids([])
+
+    # Assert
+    assert result == []
+    mock_session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_many_by_ids_database_error(
+    vehicle_repository: VehicleRepository,
+    mock_session: AsyncMock,
+):
+    """Test bulk retrieval propagates database errors."""
+    # Arrange
+    mock_session.execute.side_effect = SQLAlchemyError("Database error")
+
+    # Act & Assert
+    with pytest.raises(SQLAlchemyError, match="Database error"):
+        await vehicle_repository.get_many_by_ids([uuid.uuid4()])
+
+
 # ============================================================================
 # Unit Tests - get_by_vin
 # ============================================================================
@@ -723,6 +801,69 @@ async def test_search_available_only(
     assert total == 2
 
 
+@pytest.mark.asyncio
+async def test_search_enumerated_filters_use_normalized_equality(
+    vehicle_repository: VehicleRepository,
+    mock_session: AsyncMock,
+):
+    """Test body style and fuel type compare lower-cased whole values."""
+    # Arrange
+    mock_count_result = MagicMock()
+    mock_count_result.scalar_one.return_value = 0
+    mock_search_result = MagicMock()
+    mock_search_result.scalars.return_value.all.return_value = []
+    mock_session.execute.side_effect = [
+        mock_count_result,
+        mock_search_result,
+    ]
+
+    # Act
+    await vehicle_repository.search(body_style=" SUV ", fuel_type="Electric")
+
+    # Assert
+    count_stmt = mock_session.execute.call_args_list[0][0][0]
+    compiled = count_stmt.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "lower(vehicles.body_style) =" in sql
+    assert "lower(vehicles.fuel_type) =" in sql
+    assert "ILIKE" not in sql
+    assert {"suv", "electric"} <= set(compiled.params.values())
+
+
+@pytest.mark.asyncio
+async def test_search_free_text_query_uses_search_vector(
+    vehicle_repository: VehicleRepository,
+    mock_session: AsyncMock,
+):
+    """Test free-text queries match word prefixes on the search vector."""
+    # Arrange
+    mock_count_result = MagicMock()
+    mock_count_result.scalar_one.return_value = 0
+    mock_search_result = MagicMock()
+    mock_search_result.scalars.return_value.all.return_value = []
+    mock_session.execute.side_effect = [
+        mock_count_result,
+        mock_search_result,
+    ]
+
+    # Act
+    await vehicle_repository.search(query="Toyota Cam")
+
+    # Assert
+    count_stmt = mock_session.execute.call_args_list[0][0][0]
+    compiled = count_stmt.compile(dialect=postgresql.dialect())
+    assert "vehicles.search_vector @@ to_tsquery" in str(compiled)
+    assert "toyota:* & cam:*" in compiled.params.values()
+
+
+def test_prefix_tsquery_drops_operators():
+    """Test tsquery operators in user input are discarded."""
+    assert VehicleRepository._to_prefix_tsquery("f-150 | !(x)") == (
+        "f:* & 150:* & x:*"
+    )
+    assert VehicleRepository._to_prefix_tsquery("&|!") == ""
+
+
 @pytest.mark.asyncio
 async def test_search_by_specifications(
     vehicle_repository: VehicleRepository,
@@ -752,6 +893,118 @@ async def test_search_by_specifications(
     assert total == 1
 
 
+@pytest.mark.asyncio
+async def test_search_specifications_use_single_containment(
+    vehicle_repository: VehicleRepository,
+    mock_session: AsyncMock,
+):
+    """Test all specification filters become one @> predicate."""
+    # Arrange
+    mock_count_result = MagicMock()
+    mock_count_result.scalar_one.return_value = 0
+    mock_search_result = MagicMock()
+    mock_search_result.scalars.return_value.all.return_value = []
+    mock_session.execute.side_effect = [
+        mock_count_result,
+        mock_search_result,
+    ]
+    specifications = {"drivetrain": "AWD", "horsepower": 300}
+
+    # Act
+    await vehicle_repository.search(specifications=specifications)
+
+    # Assert
+    count_stmt = mock_session.execute.call_args_list[0][0][0]
+    compiled = count_stmt.compile(dialect=postgresql.dialect())
+    assert str(compiled).count("vehicles.specifications @>") == 1
+    assert "->>" not in str(compiled)
+    assert specifications in compiled.params.values()
+
+
+@pytest.mark.asyncio
+async def test_search_spec_ranges_match_expression_indexes(
+    vehicle_repository: VehicleRepository,
+    mock_session: AsyncMock,
+):
+    """Test range filters cast literal keys like the expression indexes."""
+    # Arrange
+    mock_count_result = MagicMock()
+    mock_count_result.scalar_one.return_value = 0
+    mock_search_result = MagicMock()
+    mock_search_result.scalars.return_value.all.return_value = []
+    mock_session.execute.side_effect = [
+        mock_count_result,
+        mock_search_result,
+    ]
+
+    # Act
+    await vehicle_repository.search(
+        spec_ranges={"horsepower": (300, None), "mpg_city": (20, 30)}
+    )
+
+    # Assert
+    count_stmt = mock_session.execute.call_args_list[0][0][0]
+    sql = str(count_stmt.compile(dialect=postgresql.dialect()))
+    assert "CAST(vehicles.specifications ->> 'horsepower' AS INTEGER) >=" in sql
+    assert "CAST(vehicles.specifications ->> 'mpg_city' AS INTEGER) <=" in sql
+    assert sql.count("'mpg_city'") == 2
+
+
+@pytest.mark.asyncio
+async def test_search_spec_range_unknown_key(
+    vehicle_repository: VehicleRepository,
+    mock_session: AsyncMock,
+):
+    """Test range filters reject keys without numeric values."""
+    with pytest.raises(ValueError):
+        await vehicle_repository.search(spec_ranges={"engine": (1, None)})
+
+    mock_session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("filters", "bound_value"),
+    [
+        ({"query": "Toyota Cam"}, "toyota:* & cam:*"),
+        (
+            {"specifications": {"drivetrain": "AWD", "horsepower": 300}},
+            {"drivetrain": "AWD", "horsepower": 300},
+        ),
+    ],
+)
+async def test_search_estimated_total_binds_filter_values(
+    vehicle_repository: VehicleRepository,
+    mock_session: AsyncMock,
+    sample_vehicles: list[Vehicle],
+    filters: dict,
+    bound_value: object,
+):
+    """Test estimated totals explain tsquery and JSONB filters with bound values."""
+    # Arrange
+    mock_search_result = MagicMock()
+    mock_search_result.scalars.return_value.all.return_value = sample_vehicles[:2]
+    mock_explain_result = MagicMock()
+    mock_explain_result.scalar_one.return_value = '[{"Plan": {"Plan Rows": 840}}]'
+    mock_session.execute.side_effect = [
+        mock_search_result,
+        mock_explain_result,
+    ]
+
+    # Act
+    vehicles, total = await vehicle_repository.search(
+        **filters, limit=2, count_mode=VehicleRepository.COUNT_ESTIMATED
+    )
+
+    # Assert
+    assert len(vehicles) == 2
+    assert total == 840
+    explain_stmt = mock_session.execute.call_args_list[1][0][0]
+    compiled = explain_stmt.compile(dialect=postgresql.dialect())
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT vehicles.id")
+    assert bound_value in compiled.params.values()
+
+
 @pytest.mark.asyncio
 async def test_search_no_results(
     vehicle_repository: VehicleRepository,
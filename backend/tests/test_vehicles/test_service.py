@@ -34,6 +34,7 @@ from src.schemas.vehicles import (
     VehicleSpecifications,
     VehicleUpdate,
 )
+from src.services.vehicles.pagination import decode_cursor, encode_cursor
 from src.services.vehicles.repository import VehicleRepository
 from src.services.vehicles.service import (
     VehicleNotFoundError,
@@ -1005,6 +1006,65 @@ class TestSearchVehicles:
 
         assert exc_info.value.code == "VEHICLE_SEARCH_ERROR"
 
+    @pytest.mark.asyncio
+    async def test_search_vehicles_full_page_returns_cursor(
+        self,
+        vehicle_service,
+        sample_vehicle_model,
+    ):
+        """Test a full page sorted by a keyset field returns a next cursor."""
+        search_request = VehicleSearchRequest(page=1, page_size=1, sort_order="desc")
+
+        vehicle_service.repository.search = AsyncMock(
+            return_value=([sample_vehicle_model], 5)
+        )
+
+        result = await vehicle_service.search_vehicles(search_request)
+
+        assert result.next_cursor is not None
+        assert decode_cursor(result.next_cursor, "year", "desc") == (
+            2024,
+            sample_vehicle_model.id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_vehicles_with_cursor(
+        self,
+        vehicle_service,
+        sample_vehicle_model,
+    ):
+        """Test a cursor is passed to the repository as a keyset position."""
+        cursor = encode_cursor("year", "asc", 2022, sample_vehicle_model.id)
+        search_request = VehicleSearchRequest(
+            cursor=cursor,
+            total_mode="estimated",
+            page_size=20,
+        )
+
+        vehicle_service.repository.search = AsyncMock(
+            return_value=([sample_vehicle_model], 40)
+        )
+
+        result = await vehicle_service.search_vehicles(search_request)
+
+        call_kwargs = vehicle_service.repository.search.call_args[1]
+        assert call_kwargs["after"] == (2022, sample_vehicle_model.id)
+        assert call_kwargs["count_mode"] == "estimated"
+        assert result.total_is_estimate is True
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_search_vehicles_cursor_for_other_sort(self, vehicle_service):
+        """Test a cursor issued for another sort is rejected."""
+        cursor = encode_cursor("base_price", "asc", Decimal("100"), uuid.uuid4())
+        search_request = VehicleSearchRequest(cursor=cursor, page_size=20)
+        vehicle_service.repository.search = AsyncMock()
+
+        with pytest.raises(VehicleValidationError):
+            await vehicle_service.search_vehicles(search_request)
+
+        vehicle_service.repository.search.assert_not_called()
+
 
 # ============================================================================
 # Get Available Vehicles Tests